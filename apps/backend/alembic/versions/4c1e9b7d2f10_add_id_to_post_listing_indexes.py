@@ -0,0 +1,69 @@
+"""extend post listing indexes with id for keyset pagination
+
+Revision ID: 4c1e9b7d2f10
+Revises: 873a45ae827f
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e9b7d2f10'
+down_revision: Union[str, Sequence[str], None] = '873a45ae827f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Make every post listing index end in (created_at, id)."""
+    op.drop_index('idx_posts_scope_status_created_at', table_name='posts')
+    op.create_index(
+        'idx_posts_scope_status_created_at',
+        'posts',
+        ['scope', 'status', 'created_at', 'id'],
+        unique=False,
+    )
+    op.drop_index('idx_posts_city_status_created_at', table_name='posts')
+    op.create_index(
+        'idx_posts_city_status_created_at',
+        'posts',
+        ['city_code', 'status', 'created_at', 'id'],
+        unique=False,
+    )
+    # Global feed filters on status only
+    op.create_index(
+        'idx_posts_status_created_at',
+        'posts',
+        ['status', 'created_at', 'id'],
+        unique=False,
+    )
+    op.drop_index('idx_posts_owner_id', table_name='posts')
+    op.create_index(
+        'idx_posts_owner_created_at',
+        'posts',
+        ['owner_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Restore the original listing indexes."""
+    op.drop_index('idx_posts_owner_created_at', table_name='posts')
+    op.create_index('idx_posts_owner_id', 'posts', ['owner_id'], unique=False)
+    op.drop_index('idx_posts_status_created_at', table_name='posts')
+    op.drop_index('idx_posts_city_status_created_at', table_name='posts')
+    op.create_index(
+        'idx_posts_city_status_created_at',
+        'posts',
+        ['city_code', 'status', 'created_at'],
+        unique=False,
+    )
+    op.drop_index('idx_posts_scope_status_created_at', table_name='posts')
+    op.create_index(
+        'idx_posts_scope_status_created_at',
+        'posts',
+        ['scope', 'status', 'created_at'],
+        unique=False,
+    )
@@ -0,0 +1,54 @@
+"""add denormalized like/comment counters to posts
+
+Revision ID: 873a45ae827f
+Revises: a6a0ab113730
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '873a45ae827f'
+down_revision: Union[str, Sequence[str], None] = 'a6a0ab113730'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add posts.like_count / posts.comment_count and backfill from existing rows."""
+    op.add_column(
+        'posts',
+        sa.Column('like_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'posts',
+        sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False),
+    )
+
+    # Backfill counters from the source tables
+    op.execute(
+        """
+        UPDATE posts p
+        SET like_count = l.cnt
+        FROM (SELECT post_id, COUNT(*) AS cnt FROM post_likes GROUP BY post_id) l
+        WHERE p.id = l.post_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE posts p
+        SET comment_count = c.cnt
+        FROM (SELECT post_id, COUNT(*) AS cnt FROM post_comments GROUP BY post_id) c
+        WHERE p.id = c.post_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop denormalized counters."""
+    op.drop_column('posts', 'comment_count')
+    op.drop_column('posts', 'like_count')
@@ -0,0 +1,68 @@
+"""add full-text search vector and trigram indexes to posts
+
+Revision ID: 9d3f6a2b7c41
+Revises: 4c1e9b7d2f10
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f6a2b7c41'
+down_revision: Union[str, Sequence[str], None] = '4c1e9b7d2f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a generated tsvector column with GIN index plus trigram indexes on idol names."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 'simple' config: no stemming or stop words, so idol names and CJK tokens
+    # are matched as written. Idol names rank above title, title above content.
+    op.execute(
+        """
+        ALTER TABLE posts ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(idol, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(idol_group, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(title, '')), 'B')
+            || setweight(to_tsvector('simple', coalesce(content, '')), 'C')
+        ) STORED
+        """
+    )
+    op.create_index(
+        'idx_posts_search_vector',
+        'posts',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+    # Trigram fallback for misspelled idol / group names
+    op.create_index(
+        'idx_posts_idol_trgm',
+        'posts',
+        ['idol'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'idol': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_posts_idol_group_trgm',
+        'posts',
+        ['idol_group'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'idol_group': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Drop search indexes and the generated column."""
+    op.drop_index('idx_posts_idol_group_trgm', table_name='posts')
+    op.drop_index('idx_posts_idol_trgm', table_name='posts')
+    op.drop_index('idx_posts_search_vector', table_name='posts')
+    op.drop_column('posts', 'search_vector')
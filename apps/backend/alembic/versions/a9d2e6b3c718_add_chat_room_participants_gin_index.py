@@ -0,0 +1,32 @@
+"""add GIN index on chat_rooms.participant_ids
+
+Revision ID: a9d2e6b3c718
+Revises: e8a3c5f1d294
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d2e6b3c718'
+down_revision: Union[str, Sequence[str], None] = 'e8a3c5f1d294'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index participant_ids for containment so a user's rooms are not a seq scan."""
+    op.create_index(
+        'idx_chat_room_participant_ids_gin',
+        'chat_rooms',
+        ['participant_ids'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Drop the participant_ids GIN index."""
+    op.drop_index('idx_chat_room_participant_ids_gin', table_name='chat_rooms')
@@ -0,0 +1,78 @@
+"""drop the default partitions of messages and thread_messages
+
+Revision ID: b3e8d1f6a592
+Revises: f1c7b3e9d425
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d1f6a592'
+down_revision: Union[str, Sequence[str], None] = 'f1c7b3e9d425'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('messages', 'thread_messages')
+
+
+def _add_months(start: datetime, months: int) -> datetime:
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _give_months_to_default_rows(table: str) -> None:
+    """Create a month partition for every month still parked in the default"""
+    months = op.get_bind().execute(
+        sa.text(
+            f"""
+            SELECT DISTINCT date_trunc('month', created_at, 'UTC') AS start
+            FROM {table}_default
+            ORDER BY start
+            """
+        )
+    ).scalars().all()
+    for start in months:
+        name = f'{table}_{start:%Y_%m}'
+        lower, upper = start.isoformat(), _add_months(start, 1).isoformat()
+        op.execute(f'CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)')
+        op.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {table}_default
+                WHERE created_at >= '{lower}' AND created_at < '{upper}'
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+            """
+        )
+        op.execute(
+            f"""
+            ALTER TABLE {table} ATTACH PARTITION {name}
+            FOR VALUES FROM ('{lower}') TO ('{upper}')
+            """
+        )
+
+
+def upgrade() -> None:
+    """Move rows out of the default partitions, then drop them.
+
+    Postgres refuses DETACH PARTITION ... CONCURRENTLY on a table with a
+    default partition, and retention needs it to expire a month without an
+    ACCESS EXCLUSIVE lock on the whole table. Months are pre-created ahead
+    of the clock by the maintenance job instead.
+    """
+    for table in TABLES:
+        _give_months_to_default_rows(table)
+        op.execute(f'DROP TABLE {table}_default')
+
+
+def downgrade() -> None:
+    """Recreate the empty default partitions."""
+    for table in TABLES:
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
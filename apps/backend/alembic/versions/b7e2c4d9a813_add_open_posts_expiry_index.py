@@ -0,0 +1,34 @@
+"""add partial index on expires_at for open posts
+
+Revision ID: b7e2c4d9a813
+Revises: 9d3f6a2b7c41
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c4d9a813'
+down_revision: Union[str, Sequence[str], None] = '9d3f6a2b7c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index only open posts by expiry so the sweeper never scans closed/expired rows."""
+    op.create_index(
+        'idx_posts_open_expires_at',
+        'posts',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'open'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial expiry index."""
+    op.drop_index('idx_posts_open_expires_at', table_name='posts')
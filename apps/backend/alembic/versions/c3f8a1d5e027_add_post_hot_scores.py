@@ -0,0 +1,94 @@
+"""add precomputed post hot scores
+
+Revision ID: c3f8a1d5e027
+Revises: b7e2c4d9a813
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a1d5e027'
+down_revision: Union[str, Sequence[str], None] = 'b7e2c4d9a813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match PostHotScoreService.EPOCH / HALF_LIFE_HOURS and its weights
+HOT_SCORE_EPOCH = '2025-01-01 00:00:00+00'
+HOT_SCORE_HALF_LIFE_SECONDS = 12 * 3600
+
+TOP_N_INDEXES = {
+    'idx_post_hot_scores_city_category': ['city_code', 'category'],
+    'idx_post_hot_scores_city': ['city_code'],
+    'idx_post_hot_scores_category': ['category'],
+    'idx_post_hot_scores_score': [],
+}
+
+
+def upgrade() -> None:
+    """Create post_hot_scores and backfill it for currently open posts."""
+    op.create_table(
+        'post_hot_scores',
+        sa.Column('post_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('city_code', sa.String(length=20), nullable=True),
+        sa.Column('category', sa.String(length=20), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('base_score', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('post_id'),
+    )
+    for name, leading_columns in TOP_N_INDEXES.items():
+        op.create_index(
+            name,
+            'post_hot_scores',
+            [
+                *leading_columns,
+                sa.text('score DESC'),
+                sa.text('created_at DESC'),
+                sa.text('post_id DESC'),
+            ],
+            unique=False,
+        )
+
+    # Existing engagement has no event times; count it at the post's creation
+    op.execute(
+        f"""
+        INSERT INTO post_hot_scores (
+            post_id, city_code, category, score, base_score, created_at, updated_at
+        )
+        SELECT
+            p.id,
+            CASE WHEN p.scope = 'city' THEN p.city_code END,
+            p.category,
+            base.value + ln(
+                1 + p.like_count + 2 * p.comment_count
+                + 3 * coalesce(interests.count, 0)
+            ) / ln(2),
+            base.value,
+            p.created_at,
+            now()
+        FROM posts AS p
+        CROSS JOIN LATERAL (
+            SELECT extract(epoch FROM p.created_at - '{HOT_SCORE_EPOCH}'::timestamptz)
+                   / {HOT_SCORE_HALF_LIFE_SECONDS} AS value
+        ) AS base
+        LEFT JOIN (
+            SELECT post_id, count(*) AS count FROM post_interests GROUP BY post_id
+        ) AS interests ON interests.post_id = p.id
+        WHERE p.status = 'open'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop post_hot_scores."""
+    for name in TOP_N_INDEXES:
+        op.drop_index(name, table_name='post_hot_scores')
+    op.drop_table('post_hot_scores')
@@ -0,0 +1,59 @@
+"""add per-user read cursors for message threads
+
+Revision ID: d4b9e2f6a071
+Revises: c3f8a1d5e027
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b9e2f6a071'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a1d5e027'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create thread_read_cursors and seed them from each user's own messages."""
+    op.create_table(
+        'thread_read_cursors',
+        sa.Column('thread_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('last_read_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_read_message_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['thread_id'], ['message_threads.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('thread_id', 'user_id'),
+    )
+    op.create_index(
+        'idx_thread_read_cursor_user', 'thread_read_cursors', ['user_id'], unique=False
+    )
+
+    # Without read history, a user has read a thread up to their own latest
+    # message in it; threads they never wrote in start fully unread
+    op.execute(
+        """
+        INSERT INTO thread_read_cursors (
+            thread_id, user_id, last_read_at, last_read_message_id, updated_at
+        )
+        SELECT DISTINCT ON (thread_id, sender_id)
+            thread_id, sender_id, created_at, id, now()
+        FROM thread_messages
+        ORDER BY thread_id, sender_id, created_at DESC, id DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop thread_read_cursors."""
+    op.drop_index('idx_thread_read_cursor_user', table_name='thread_read_cursors')
+    op.drop_table('thread_read_cursors')
@@ -0,0 +1,165 @@
+"""partition messages and thread_messages by month on created_at
+
+Revision ID: e8a3c5f1d294
+Revises: d4b9e2f6a071
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a3c5f1d294'
+down_revision: Union[str, Sequence[str], None] = 'd4b9e2f6a071'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Old tables are parked here while their rows are copied into the new layout
+SCRATCH_SCHEMA = 'message_partitioning'
+
+# Months created past the current one; the maintenance job keeps this topped up
+MONTHS_AHEAD = 3
+
+MESSAGES_COLUMNS = """
+    id UUID NOT NULL,
+    room_id UUID NOT NULL REFERENCES chat_rooms (id) ON DELETE CASCADE,
+    sender_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    status VARCHAR(50) DEFAULT 'sent' NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE
+"""
+
+THREAD_MESSAGES_COLUMNS = """
+    id UUID NOT NULL,
+    thread_id UUID NOT NULL REFERENCES message_threads (id) ON DELETE CASCADE,
+    sender_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    post_id UUID REFERENCES posts (id) ON DELETE SET NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL
+"""
+
+MESSAGES_INDEXES = [
+    ('idx_message_room_created', ['room_id', 'created_at']),
+    ('idx_message_room_id', ['room_id', 'id']),
+    ('idx_message_status_sender', ['room_id', 'status', 'sender_id']),
+    ('ix_messages_created_at', ['created_at']),
+    ('ix_messages_room_id', ['room_id']),
+    ('ix_messages_sender_id', ['sender_id']),
+    ('ix_messages_status', ['status']),
+]
+
+THREAD_MESSAGES_INDEXES = [
+    ('idx_thread_message_thread_created', ['thread_id', 'created_at']),
+    ('ix_thread_messages_sender_id', ['sender_id']),
+    ('ix_thread_messages_thread_id', ['thread_id']),
+]
+
+# messages.created_at used to be nullable; such rows keep their last known time
+MESSAGES_COPY = (
+    'id, room_id, sender_id, content, status, '
+    'COALESCE(created_at, updated_at, now()), updated_at'
+)
+THREAD_MESSAGES_COPY = 'id, thread_id, sender_id, content, post_id, created_at'
+
+
+def _add_months(start: datetime, months: int) -> datetime:
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _month_starts(table: str) -> list:
+    """Every month holding rows of `table`, through MONTHS_AHEAD past this one"""
+    now = datetime.now(timezone.utc)
+    current = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    oldest = op.get_bind().execute(
+        sa.text(f"SELECT date_trunc('month', min(created_at), 'UTC') FROM {table}")
+    ).scalar()
+    start = min(oldest.astimezone(timezone.utc), current) if oldest else current
+
+    months = []
+    while start <= _add_months(current, MONTHS_AHEAD):
+        months.append(start)
+        start = _add_months(start, 1)
+    return months
+
+
+def _set_aside(table: str) -> str:
+    """Move `table` out of public so the rebuilt one can reuse every name"""
+    op.execute(f'CREATE SCHEMA IF NOT EXISTS {SCRATCH_SCHEMA}')
+    op.execute(f'ALTER TABLE {table} SET SCHEMA {SCRATCH_SCHEMA}')
+    return f'{SCRATCH_SCHEMA}.{table}'
+
+
+def _partition(table: str, columns: str, copy: str, indexes: list) -> None:
+    old = _set_aside(table)
+
+    # The partition key has to be part of the primary key
+    op.execute(
+        f"""
+        CREATE TABLE {table} ({columns},
+            CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    for start in _month_starts(old):
+        op.execute(
+            f"""
+            CREATE TABLE {table}_{start:%Y_%m} PARTITION OF {table}
+            FOR VALUES FROM ('{start.isoformat()}')
+            TO ('{_add_months(start, 1).isoformat()}')
+            """
+        )
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+    for name, index_columns in indexes:
+        op.create_index(name, table, index_columns, unique=False)
+
+    op.execute(f'INSERT INTO {table} SELECT {copy} FROM {old}')
+    op.execute(f'DROP TABLE {old}')
+
+
+def _unpartition(table: str, columns: str, indexes: list) -> None:
+    old = _set_aside(table)
+
+    op.execute(
+        f"""
+        CREATE TABLE {table} ({columns},
+            CONSTRAINT {table}_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    for name, index_columns in indexes:
+        op.create_index(name, table, index_columns, unique=False)
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    op.execute(f'DROP TABLE {old}')
+
+
+def upgrade() -> None:
+    """Rebuild both message tables as monthly range partitions on created_at.
+
+    Months with existing rows and the next few are created up front; a
+    DEFAULT partition catches anything outside them until the maintenance
+    job attaches the right month. Nothing references either table by
+    foreign key, so the wider primary key does not ripple out.
+    """
+    _partition('messages', MESSAGES_COLUMNS, MESSAGES_COPY, MESSAGES_INDEXES)
+    _partition(
+        'thread_messages',
+        THREAD_MESSAGES_COLUMNS,
+        THREAD_MESSAGES_COPY,
+        THREAD_MESSAGES_INDEXES,
+    )
+    op.execute(f'DROP SCHEMA {SCRATCH_SCHEMA}')
+
+
+def downgrade() -> None:
+    """Fold the partitions back into plain tables keyed by id."""
+    _unpartition('thread_messages', THREAD_MESSAGES_COLUMNS, THREAD_MESSAGES_INDEXES)
+    _unpartition('messages', MESSAGES_COLUMNS, MESSAGES_INDEXES)
+    op.alter_column('messages', 'created_at', nullable=True)
+    op.execute(f'DROP SCHEMA {SCRATCH_SCHEMA}')
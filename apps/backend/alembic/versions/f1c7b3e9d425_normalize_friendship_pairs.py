@@ -0,0 +1,167 @@
+"""normalize friendships to one row per user pair with block flags
+
+Revision ID: f1c7b3e9d425
+Revises: a9d2e6b3c718
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c7b3e9d425'
+down_revision: Union[str, Sequence[str], None] = 'a9d2e6b3c718'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every entity column, so pair checks and per-user listings are index-only
+COVERED_COLUMNS = (
+    'id, user_id, friend_id, status, blocked_by_a, blocked_by_b, '
+    'created_at, updated_at'
+)
+
+# Rows of a pair ranked so the one kept is its block, else friendship, else
+# request; ties go to the oldest row
+RANKED_PAIRS = """
+    WITH ranked AS (
+        SELECT id,
+               row_number() OVER (
+                   PARTITION BY user_a_id, user_b_id
+                   ORDER BY CASE status WHEN 'blocked' THEN 0
+                                        WHEN 'accepted' THEN 1
+                                        ELSE 2 END,
+                            created_at, id
+               ) AS rank,
+               bool_or(blocked_by_a) OVER (PARTITION BY user_a_id, user_b_id)
+                   AS any_blocked_by_a,
+               bool_or(blocked_by_b) OVER (PARTITION BY user_a_id, user_b_id)
+                   AS any_blocked_by_b
+        FROM friendships
+    )
+"""
+
+
+def upgrade() -> None:
+    """Key friendships by the ordered user pair and record blocks per side.
+
+    user_a_id/user_b_id hold the smaller/larger of user_id and friend_id
+    (generated, so every writer gets them for free), and blocked_by_a/b say
+    which side blocks the other. Existing blocks are attributed to user_id,
+    the blocker by convention. Pairs with several rows are folded into one,
+    keeping the strongest status and every block, before the pair becomes
+    unique.
+    """
+    op.add_column(
+        'friendships',
+        sa.Column(
+            'user_a_id',
+            sa.UUID(),
+            sa.Computed('LEAST(user_id, friend_id)', persisted=True),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'friendships',
+        sa.Column(
+            'user_b_id',
+            sa.UUID(),
+            sa.Computed('GREATEST(user_id, friend_id)', persisted=True),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'friendships',
+        sa.Column(
+            'blocked_by_a', sa.Boolean(), server_default='false', nullable=False
+        ),
+    )
+    op.add_column(
+        'friendships',
+        sa.Column(
+            'blocked_by_b', sa.Boolean(), server_default='false', nullable=False
+        ),
+    )
+
+    op.execute(
+        """
+        UPDATE friendships
+        SET blocked_by_a = (user_id = user_a_id),
+            blocked_by_b = (user_id = user_b_id)
+        WHERE status = 'blocked'
+        """
+    )
+    op.execute(
+        RANKED_PAIRS
+        + """
+        UPDATE friendships
+        SET blocked_by_a = ranked.any_blocked_by_a,
+            blocked_by_b = ranked.any_blocked_by_b
+        FROM ranked
+        WHERE friendships.id = ranked.id AND ranked.rank = 1
+        """
+    )
+    op.execute(
+        RANKED_PAIRS
+        + """
+        DELETE FROM friendships
+        USING ranked
+        WHERE friendships.id = ranked.id AND ranked.rank > 1
+        """
+    )
+
+    op.execute(
+        f"""
+        CREATE UNIQUE INDEX uq_friendship_pair ON friendships (user_a_id, user_b_id)
+        INCLUDE ({COVERED_COLUMNS})
+        """
+    )
+    op.execute(
+        f"""
+        CREATE INDEX idx_friendship_user_b ON friendships (user_b_id, user_a_id)
+        INCLUDE ({COVERED_COLUMNS})
+        """
+    )
+    op.drop_index('idx_friendship_users', table_name='friendships')
+
+
+def downgrade() -> None:
+    """Drop the pair key and block flags; folded duplicate rows stay merged.
+
+    The old schema reads a blocked row as a block by user_id, so each block
+    is first turned back into a directed row: a block by the b side swaps
+    user_id/friend_id, and a mutual block is split into one row per blocker.
+    """
+    op.create_index(
+        'idx_friendship_users', 'friendships', ['user_id', 'friend_id'], unique=False
+    )
+    op.drop_index('idx_friendship_user_b', table_name='friendships')
+    op.drop_index('uq_friendship_pair', table_name='friendships')
+
+    op.execute(
+        """
+        INSERT INTO friendships (
+            id, user_id, friend_id, status, created_at, updated_at
+        )
+        SELECT gen_random_uuid(), user_b_id, user_a_id, 'blocked',
+               created_at, updated_at
+        FROM friendships
+        WHERE blocked_by_a AND blocked_by_b
+        """
+    )
+    op.execute(
+        """
+        UPDATE friendships
+        SET user_id = CASE WHEN blocked_by_a THEN user_a_id ELSE user_b_id END,
+            friend_id = CASE WHEN blocked_by_a THEN user_b_id ELSE user_a_id END,
+            status = 'blocked'
+        WHERE blocked_by_a OR blocked_by_b
+        """
+    )
+
+    op.drop_column('friendships', 'blocked_by_b')
+    op.drop_column('friendships', 'blocked_by_a')
+    op.drop_column('friendships', 'user_b_id')
+    op.drop_column('friendships', 'user_a_id')
@@ -60,6 +60,14 @@ class Settings:
 
     # FCM (Firebase Cloud Messaging)
     FCM_CREDENTIALS_PATH: str | None = os.getenv("FCM_CREDENTIALS_PATH")
+    # Threads running the blocking SDK sends (concurrent FCM requests per worker)
+    FCM_MAX_WORKERS: int = int(os.getenv("FCM_MAX_WORKERS", "4"))
+    # Tokens per multicast request (FCM allows at most 500)
+    FCM_BATCH_SIZE: int = int(os.getenv("FCM_BATCH_SIZE", "500"))
+    # Seconds shutdown waits for scheduled pushes before abandoning them
+    FCM_SHUTDOWN_TIMEOUT_SECONDS: float = float(
+        os.getenv("FCM_SHUTDOWN_TIMEOUT_SECONDS", "5")
+    )
 
     # File Upload Limits
     MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "2"))
@@ -81,6 +89,69 @@ class Settings:
         "GOOGLE_PLAY_SERVICE_ACCOUNT_KEY_PATH"
     )
 
+    # Background Jobs (run in-process from the FastAPI lifespan)
+    BACKGROUND_JOBS_ENABLED: bool = (
+        os.getenv("BACKGROUND_JOBS_ENABLED", "true").lower() == "true"
+    )
+    POST_COUNTER_RECONCILE_INTERVAL_SECONDS: int = int(
+        os.getenv("POST_COUNTER_RECONCILE_INTERVAL_SECONDS", "600")
+    )
+    POST_COUNTER_RECONCILE_BATCH_SIZE: int = int(
+        os.getenv("POST_COUNTER_RECONCILE_BATCH_SIZE", "500")
+    )
+    POST_COUNTER_RECONCILE_MAX_BATCHES: int = int(
+        os.getenv("POST_COUNTER_RECONCILE_MAX_BATCHES", "10")
+    )
+    POST_EXPIRY_SWEEP_INTERVAL_SECONDS: int = int(
+        os.getenv("POST_EXPIRY_SWEEP_INTERVAL_SECONDS", "60")
+    )
+    POST_EXPIRY_SWEEP_BATCH_SIZE: int = int(
+        os.getenv("POST_EXPIRY_SWEEP_BATCH_SIZE", "1000")
+    )
+    POST_EXPIRY_SWEEP_MAX_BATCHES: int = int(
+        os.getenv("POST_EXPIRY_SWEEP_MAX_BATCHES", "10")
+    )
+    MESSAGE_PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = int(
+        os.getenv("MESSAGE_PARTITION_MAINTENANCE_INTERVAL_SECONDS", "3600")
+    )
+    MESSAGE_PARTITION_MONTHS_AHEAD: int = int(
+        os.getenv("MESSAGE_PARTITION_MONTHS_AHEAD", "3")
+    )
+    MESSAGE_RETENTION_DAYS: int = int(os.getenv("MESSAGE_RETENTION_DAYS", "30"))
+
+    # In-process caches (per worker; 0 disables)
+    POST_FEED_CACHE_TTL_SECONDS: int = int(
+        os.getenv("POST_FEED_CACHE_TTL_SECONDS", "15")
+    )
+    PROFILE_SUMMARY_CACHE_TTL_SECONDS: int = int(
+        os.getenv("PROFILE_SUMMARY_CACHE_TTL_SECONDS", "60")
+    )
+    PROFILE_SUMMARY_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("PROFILE_SUMMARY_CACHE_MAX_ENTRIES", "10000")
+    )
+    CHAT_ACCESS_CACHE_TTL_SECONDS: int = int(
+        os.getenv("CHAT_ACCESS_CACHE_TTL_SECONDS", "5")
+    )
+    CHAT_ACCESS_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("CHAT_ACCESS_CACHE_MAX_ENTRIES", "10000")
+    )
+
+    # Realtime delivery (WebSocket/SSE, fanned out with Postgres LISTEN/NOTIFY)
+    REALTIME_ENABLED: bool = os.getenv("REALTIME_ENABLED", "true").lower() == "true"
+    REALTIME_MAX_PENDING_EVENTS: int = int(
+        os.getenv("REALTIME_MAX_PENDING_EVENTS", "100")
+    )
+    REALTIME_HEARTBEAT_SECONDS: int = int(
+        os.getenv("REALTIME_HEARTBEAT_SECONDS", "25")
+    )
+    # Long-poll GET /chats/{room_id}/messages?wait= (parked requests per worker)
+    CHAT_LONG_POLL_MAX_WAIT_SECONDS: int = int(
+        os.getenv("CHAT_LONG_POLL_MAX_WAIT_SECONDS", "30")
+    )
+    CHAT_LONG_POLL_MAX_WAITERS: int = int(
+        os.getenv("CHAT_LONG_POLL_MAX_WAITERS", "1000")
+    )
+
     # API
     API_VERSION: str = "v1"
     API_PREFIX: str = f"/api/{API_VERSION}"
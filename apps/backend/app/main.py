@@ -6,12 +6,16 @@ Main entry point for the backend service following modular DDD architecture.
 import logging
 import sys
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .injector import injector
+from .shared.infrastructure.background.periodic_task import PeriodicTask
+from .shared.infrastructure.realtime.event_hub import event_hub
+from .shared.infrastructure.realtime.pg_notify import PgNotifyListener
 from .shared.presentation.middleware.error_handler import register_exception_handlers
 
 # Configure logging
@@ -26,6 +30,63 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _create_background_tasks() -> list[PeriodicTask]:
+    """Build the periodic jobs run by every worker (all jobs are idempotent)."""
+    if not settings.BACKGROUND_JOBS_ENABLED:
+        return []
+
+    from .modules.posts.infrastructure.jobs.post_counter_reconciliation_job import (
+        PostCounterReconciliationJob,
+    )
+    from .modules.posts.infrastructure.jobs.post_expiry_sweep_job import (
+        PostExpirySweepJob,
+        post_expiry_sweep_metrics,
+    )
+    from .modules.social.infrastructure.jobs.message_partition_maintenance_job import (
+        MessagePartitionMaintenanceJob,
+    )
+
+    counter_job = PostCounterReconciliationJob(
+        batch_size=settings.POST_COUNTER_RECONCILE_BATCH_SIZE,
+        max_batches=settings.POST_COUNTER_RECONCILE_MAX_BATCHES,
+    )
+    expiry_job = PostExpirySweepJob(
+        batch_size=settings.POST_EXPIRY_SWEEP_BATCH_SIZE,
+        max_batches=settings.POST_EXPIRY_SWEEP_MAX_BATCHES,
+        metrics=post_expiry_sweep_metrics,
+    )
+    partition_job = MessagePartitionMaintenanceJob(
+        retention_days=settings.MESSAGE_RETENTION_DAYS,
+        months_ahead=settings.MESSAGE_PARTITION_MONTHS_AHEAD,
+    )
+    return [
+        PeriodicTask(
+            name="post_counter_reconciliation",
+            interval_seconds=settings.POST_COUNTER_RECONCILE_INTERVAL_SECONDS,
+            func=counter_job.run,
+            initial_delay_seconds=60,
+        ),
+        PeriodicTask(
+            name="post_expiry_sweep",
+            interval_seconds=settings.POST_EXPIRY_SWEEP_INTERVAL_SECONDS,
+            func=expiry_job.run,
+        ),
+        PeriodicTask(
+            name="message_partition_maintenance",
+            interval_seconds=settings.MESSAGE_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+            func=partition_job.run,
+        ),
+    ]
+
+
+def _create_realtime_listener() -> PgNotifyListener | None:
+    """Build this worker's LISTEN connection feeding realtime subscribers."""
+    if not settings.REALTIME_ENABLED:
+        return None
+
+    return PgNotifyListener(dsn=settings.DATABASE_URL, hub=event_hub)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI.
@@ -39,9 +100,28 @@ async def lifespan(app: FastAPI):
     # Injector is already initialized in app/injector.py
     # No wiring needed with python-injector
 
+    # Startup: schedule in-process background jobs
+    background_tasks = _create_background_tasks()
+    for task in background_tasks:
+        task.start()
+
+    realtime_listener = _create_realtime_listener()
+    if realtime_listener:
+        realtime_listener.start()
+
     yield
 
     # Shutdown: cleanup resources
+    if realtime_listener:
+        await realtime_listener.stop()
+
+    for task in background_tasks:
+        await task.stop()
+
+    from .shared.infrastructure.external.fcm_service import close_fcm_service
+
+    await close_fcm_service(timeout=settings.FCM_SHUTDOWN_TIMEOUT_SECONDS)
+
     from .shared.infrastructure.database.connection import db_connection
 
     db_connection.close()
@@ -86,12 +166,24 @@ def create_application() -> FastAPI:
 
     @app.get(f"{settings.API_PREFIX}/health")
     async def api_health_check():
-        """API health check endpoint."""
+        """API health check endpoint (this worker's caches, realtime, push, jobs)."""
+        from app.modules.identity.application.services.profile_summary_cache import (
+            profile_summary_cache,
+        )
+        from app.modules.posts.infrastructure.jobs.post_expiry_sweep_job import (
+            post_expiry_sweep_metrics,
+        )
+        from app.shared.infrastructure.external.fcm_service import get_fcm_service
+
         return {
             "data": {
                 "status": "healthy",
                 "service": "kcardswap-backend",
                 "version": "0.1.0",
+                "caches": {"profile_summaries": profile_summary_cache.stats()},
+                "realtime": event_hub.stats(),
+                "push": get_fcm_service().stats(),
+                "jobs": {"post_expiry_sweep": asdict(post_expiry_sweep_metrics)},
             },
             "error": None,
         }
@@ -178,6 +270,13 @@ def create_application() -> FastAPI:
     app.include_router(message_requests_router, prefix=settings.API_PREFIX)
     app.include_router(threads_router, prefix=settings.API_PREFIX)
 
+    # Realtime delivery of new messages (WebSocket/SSE)
+    from .modules.social.presentation.routers.realtime_router import (
+        router as realtime_router,
+    )
+
+    app.include_router(realtime_router, prefix=settings.API_PREFIX)
+
     return app
 
 
@@ -4,14 +4,18 @@ Profile Query Service Implementation
 Implements IProfileQueryService from shared contracts.
 """
 
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 
+from app.modules.identity.application.services.profile_summary_cache import (
+    ProfileSummaryCache,
+)
 from app.modules.identity.domain.repositories.i_profile_repository import (
     IProfileRepository,
 )
 from app.shared.domain.contracts.i_profile_query_service import (
     IProfileQueryService,
+    ProfileSummary,
     UserLocationInfo,
     UserProfileInfo,
 )
@@ -25,8 +29,13 @@ class ProfileQueryServiceImpl(IProfileQueryService):
     for other bounded contexts.
     """
 
-    def __init__(self, profile_repository: IProfileRepository):
+    def __init__(
+        self,
+        profile_repository: IProfileRepository,
+        summary_cache: Optional[ProfileSummaryCache] = None,
+    ):
         self.profile_repository = profile_repository
+        self.summary_cache = summary_cache
 
     async def get_user_location(self, user_id: UUID) -> Optional[UserLocationInfo]:
         """Get user location and basic info."""
@@ -58,6 +67,35 @@ class ProfileQueryServiceImpl(IProfileQueryService):
             stealth_mode=profile.stealth_mode,
         )
 
+    async def get_profile_summaries(
+        self, user_ids: Iterable[UUID]
+    ) -> Dict[UUID, ProfileSummary]:
+        """
+        Get display fields for many users in a single query.
+
+        With a summary cache, only users missing from it are queried.
+        """
+        wanted = set(user_ids)
+        summaries = self.summary_cache.get_many(wanted) if self.summary_cache else {}
+        missing = [user_id for user_id in wanted if user_id not in summaries]
+        if not missing:
+            return summaries
+
+        profiles = await self.profile_repository.get_by_user_ids(missing)
+        loaded = {
+            profile.user_id: ProfileSummary(
+                user_id=profile.user_id,
+                nickname=profile.nickname,
+                avatar_url=profile.avatar_url,
+                privacy_flags=profile.privacy_flags,
+            )
+            for profile in profiles
+        }
+        if self.summary_cache:
+            self.summary_cache.set_many(loaded)
+        summaries.update(loaded)
+        return summaries
+
     async def update_user_location(
         self, user_id: UUID, latitude: float, longitude: float
     ) -> bool:
@@ -0,0 +1,78 @@
+"""Profile Summary Cache - Process-wide cache of user display fields.
+
+Nicknames, avatars and privacy flags are rendered on nearly every response
+but change rarely. ProfileQueryServiceImpl.get_profile_summaries serves them
+from this cache and only queries the profiles table for misses.
+
+Each worker holds its own copy: UpdateProfileUseCase invalidates the local
+entry once its transaction commits, other workers pick the change up once
+their entry expires. Privacy decisions therefore read the profile itself,
+never this cache.
+"""
+
+from typing import Dict, Iterable, Union
+from uuid import UUID
+
+from app.config import settings
+from app.shared.domain.contracts.i_profile_query_service import ProfileSummary
+from app.shared.infrastructure.cache.ttl_cache import TTLCache
+
+
+class ProfileSummaryCache:
+    """
+    LRU + TTL cache of ProfileSummary keyed by user ID, with hit-rate stats
+
+    Only existing profiles are cached, so a profile created after a miss is
+    visible on the next read.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self._cache: TTLCache[UUID, ProfileSummary] = TTLCache(
+            ttl_seconds=ttl_seconds, max_entries=max_entries
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, user_ids: Iterable[UUID]) -> Dict[UUID, ProfileSummary]:
+        """Return the cached summaries among user_ids; absent ids are misses"""
+        found = {}
+        for user_id in user_ids:
+            summary = self._cache.get(user_id)
+            if summary is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                found[user_id] = summary
+        return found
+
+    def set_many(self, summaries: Dict[UUID, ProfileSummary]) -> None:
+        """Store freshly loaded summaries"""
+        for user_id, summary in summaries.items():
+            self._cache.set(user_id, summary)
+
+    def invalidate(self, user_id: Union[UUID, str]) -> None:
+        """Drop a user's entry after their profile changed"""
+        self._cache.delete(user_id if isinstance(user_id, UUID) else UUID(user_id))
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters since start (or the last clear) and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._cache),
+        }
+
+
+# Process-wide instance shared by all requests
+profile_summary_cache = ProfileSummaryCache(
+    ttl_seconds=settings.PROFILE_SUMMARY_CACHE_TTL_SECONDS,
+    max_entries=settings.PROFILE_SUMMARY_CACHE_MAX_ENTRIES,
+)
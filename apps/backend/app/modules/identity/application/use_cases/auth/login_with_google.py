@@ -8,6 +8,9 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
+from app.modules.identity.application.services.profile_summary_cache import (
+    ProfileSummaryCache,
+)
 from app.modules.identity.domain.entities.profile import Profile
 from app.modules.identity.domain.entities.refresh_token import RefreshToken
 from app.modules.identity.domain.entities.user import User
@@ -21,6 +24,7 @@ from app.modules.identity.domain.repositories.i_user_repository import IUserRepo
 from app.modules.identity.infrastructure.external.google_oauth_service import (
     GoogleOAuthService,
 )
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 from app.shared.infrastructure.security.jwt_service import JWTService
 
 
@@ -41,12 +45,16 @@ class GoogleLoginUseCase:
         refresh_token_repo: IRefreshTokenRepository,
         google_oauth_service: GoogleOAuthService,
         jwt_service: JWTService,
+        summary_cache: Optional[ProfileSummaryCache] = None,
+        after_commit: AfterCommit = run_now,
     ):
         self._user_repo = user_repo
         self._profile_repo = profile_repo
         self._refresh_token_repo = refresh_token_repo
         self._google_oauth = google_oauth_service
         self._jwt_service = jwt_service
+        self._summary_cache = summary_cache
+        self._after_commit = after_commit
         self._logger = logging.getLogger(__name__)
 
     async def execute(self, google_token: str) -> Optional[Tuple[str, str, User]]:
@@ -106,6 +114,10 @@ class GoogleLoginUseCase:
                         avatar_url=avatar_to_set,
                     )
                     await self._profile_repo.save(profile)
+                    if self._summary_cache:
+                        # Feeds and inboxes show the filled-in name/avatar
+                        summary_cache, user_id = self._summary_cache, user.id
+                        self._after_commit(lambda: summary_cache.invalidate(user_id))
 
         # Step 3: Generate JWT tokens
         access_token = self._jwt_service.create_access_token(
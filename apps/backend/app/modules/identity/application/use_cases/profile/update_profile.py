@@ -5,17 +5,28 @@ Update Profile Use Case
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+from app.modules.identity.application.services.profile_summary_cache import (
+    ProfileSummaryCache,
+)
 from app.modules.identity.domain.entities.profile import Profile
 from app.modules.identity.domain.repositories.i_profile_repository import (
     IProfileRepository,
 )
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 
 
 class UpdateProfileUseCase:
     """Use case for updating user profile"""
 
-    def __init__(self, profile_repo: IProfileRepository):
+    def __init__(
+        self,
+        profile_repo: IProfileRepository,
+        summary_cache: Optional[ProfileSummaryCache] = None,
+        after_commit: AfterCommit = run_now,
+    ):
         self.profile_repo = profile_repo
+        self.summary_cache = summary_cache
+        self.after_commit = after_commit
 
     async def execute(
         self,
@@ -72,4 +83,12 @@ class UpdateProfileUseCase:
             profile.update_privacy_settings(privacy_flags)
 
         # Save profile
-        return await self.profile_repo.save(profile)
+        saved = await self.profile_repo.save(profile)
+
+        # Nickname, avatar and privacy flags are cached for other responses;
+        # drop them once the new row is committed, so no read re-caches the old
+        if self.summary_cache:
+            summary_cache = self.summary_cache
+            self.after_commit(lambda: summary_cache.invalidate(user_id))
+
+        return saved
@@ -2,7 +2,7 @@
 Profile Repository Interface
 """
 
-from typing import Optional, Protocol
+from typing import List, Optional, Protocol
 from uuid import UUID
 
 from ..entities.profile import Profile
@@ -18,6 +18,10 @@ class IProfileRepository(Protocol):
         """Get profile by user ID"""
         ...
 
+    async def get_by_user_ids(self, user_ids: List[UUID]) -> List[Profile]:
+        """Get the profiles of many users in one query"""
+        ...
+
     async def save(self, profile: Profile) -> Profile:
         """Save or update profile"""
         ...
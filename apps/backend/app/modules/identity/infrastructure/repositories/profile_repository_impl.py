@@ -2,7 +2,7 @@
 SQLAlchemy Profile Repository Implementation
 """
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
@@ -30,6 +30,15 @@ class ProfileRepositoryImpl(IProfileRepository):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    async def get_by_user_ids(self, user_ids: List[UUID]) -> List[Profile]:
+        """Get the profiles of many users in one query"""
+        if not user_ids:
+            return []
+        result = await self.session.execute(
+            select(ProfileModel).where(ProfileModel.user_id.in_(set(user_ids)))
+        )
+        return [self._to_entity(model) for model in result.scalars().all()]
+
     async def save(self, profile: Profile) -> Profile:
         """Save or update profile"""
         # Check if profile exists
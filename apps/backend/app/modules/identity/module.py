@@ -10,6 +10,9 @@ from app.config import Settings
 from app.modules.identity.application.services.profile_query_service_impl import (
     ProfileQueryServiceImpl,
 )
+from app.modules.identity.application.services.profile_summary_cache import (
+    profile_summary_cache,
+)
 from app.modules.identity.application.services.subscription_query_service_impl import (
     SubscriptionQueryServiceImpl,
 )
@@ -76,6 +79,7 @@ from app.shared.domain.contracts.i_subscription_query_service import (
     ISubscriptionQueryService,
 )
 from app.shared.domain.contracts.i_user_basic_info_service import IUserBasicInfoService
+from app.shared.infrastructure.database.transaction_hooks import after_commit_of
 from app.shared.infrastructure.security.jwt_service import JWTService
 
 
@@ -109,6 +113,8 @@ class IdentityModule(Module):
             refresh_token_repo=refresh_token_repo,
             google_oauth_service=google_oauth_service,
             jwt_service=jwt_service,
+            summary_cache=profile_summary_cache,
+            after_commit=after_commit_of(session),
         )
 
     @provider
@@ -128,6 +134,8 @@ class IdentityModule(Module):
             refresh_token_repo=refresh_token_repo,
             google_oauth_service=google_oauth_service,
             jwt_service=jwt_service,
+            summary_cache=profile_summary_cache,
+            after_commit=after_commit_of(session),
         )
 
     @provider
@@ -147,6 +155,8 @@ class IdentityModule(Module):
             refresh_token_repo=refresh_token_repo,
             google_oauth_service=google_oauth_service,
             jwt_service=jwt_service,
+            summary_cache=profile_summary_cache,
+            after_commit=after_commit_of(session),
         )
 
     @provider
@@ -194,7 +204,11 @@ class IdentityModule(Module):
     ) -> UpdateProfileUseCase:
         """Provide UpdateProfileUseCase with dependencies."""
         profile_repo = ProfileRepositoryImpl(session)
-        return UpdateProfileUseCase(profile_repo=profile_repo)
+        return UpdateProfileUseCase(
+            profile_repo=profile_repo,
+            summary_cache=profile_summary_cache,
+            after_commit=after_commit_of(session),
+        )
 
     # Subscription Use Cases
     @provider
@@ -259,7 +273,9 @@ class IdentityModule(Module):
     ) -> IProfileQueryService:
         """Provide IProfileQueryService implementation."""
         profile_repo = ProfileRepositoryImpl(session)
-        return ProfileQueryServiceImpl(profile_repository=profile_repo)
+        return ProfileQueryServiceImpl(
+            profile_repository=profile_repo, summary_cache=profile_summary_cache
+        )
 
     @provider
     def provide_user_basic_info_service(
@@ -1,6 +1,6 @@
 """Media repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from app.modules.media.domain.entities.media_asset import MediaAsset
@@ -83,3 +83,19 @@ class IMediaRepository(ABC):
             List of MediaAsset entities attached to the target
         """
         pass
+
+    @abstractmethod
+    async def get_by_targets(
+        self, target_type: str, target_ids: List[UUID]
+    ) -> Dict[UUID, List[MediaAsset]]:
+        """Get media assets attached to any of several targets in one query.
+
+        Args:
+            target_type: Type of target entity ("post" or "gallery_card")
+            target_ids: IDs of the target entities
+
+        Returns:
+            Dict mapping target_id to its attached MediaAsset entities;
+            targets without media are omitted
+        """
+        pass
@@ -1,5 +1,5 @@
 """SQLAlchemy Media Repository Implementation."""
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import extract, func, select
@@ -104,6 +104,29 @@ class MediaRepositoryImpl(IMediaRepository):
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
+    async def get_by_targets(
+        self, target_type: str, target_ids: List[UUID]
+    ) -> Dict[UUID, List[MediaAsset]]:
+        """Get media assets attached to any of several targets in one query."""
+        if not target_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(MediaAssetModel)
+            .where(
+                MediaAssetModel.target_type == target_type,
+                MediaAssetModel.target_id.in_(target_ids),
+                MediaAssetModel.status == MediaStatus.ATTACHED.value,
+            )
+            .order_by(MediaAssetModel.created_at)
+        )
+        media_by_target: Dict[UUID, List[MediaAsset]] = {}
+        for model in result.scalars().all():
+            media_by_target.setdefault(model.target_id, []).append(
+                self._to_entity(model)
+            )
+        return media_by_target
+
     def _to_entity(self, model: MediaAssetModel) -> MediaAsset:
         """Convert ORM model to domain entity."""
         return MediaAsset(
@@ -0,0 +1,93 @@
+"""Post Feed Cache - Shared first page of the posts feed.
+
+The first page of GET /posts is identical for every viewer apart from
+liked_by_me and can_message. This cache keeps the viewer-independent part
+(posts and owner profiles) per (city_code, category) for a few seconds; the
+per-viewer fields are computed on top of it by the caller.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from app.config import settings
+from app.modules.posts.domain.entities.post import Post
+from app.modules.posts.domain.entities.post_enums import PostCategory
+from app.shared.infrastructure.cache.ttl_cache import TTLCache
+
+FeedKey = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass(frozen=True)
+class FeedPageSkeleton:
+    """Viewer-independent first page of a feed"""
+
+    posts: List[Post]
+    owner_profiles: Dict[str, Dict[str, Optional[str]]]
+    limit: int
+
+
+class PostFeedCache:
+    """
+    Short-TTL cache of first feed pages keyed by (city_code, category)
+
+    A page fetched with a given limit also serves smaller limits. Writers call
+    invalidate_post once the created or changed post is committed; the TTL
+    bounds staleness for everything else (like counters, other workers' writes).
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self._cache: TTLCache[FeedKey, FeedPageSkeleton] = TTLCache(
+            ttl_seconds=ttl_seconds, max_entries=max_entries
+        )
+
+    @staticmethod
+    def _key(
+        city_code: Optional[str], category: Optional[Union[PostCategory, str]]
+    ) -> FeedKey:
+        category_value = (
+            category.value if isinstance(category, PostCategory) else category
+        )
+        return (city_code or None, category_value or None)
+
+    def get(
+        self,
+        city_code: Optional[str],
+        category: Optional[Union[PostCategory, str]],
+        limit: int,
+    ) -> Optional[FeedPageSkeleton]:
+        """Return the cached first page truncated to limit, if one covers it"""
+        skeleton = self._cache.get(self._key(city_code, category))
+        if skeleton is None or limit > skeleton.limit:
+            return None
+        return FeedPageSkeleton(
+            posts=skeleton.posts[:limit],
+            owner_profiles=skeleton.owner_profiles,
+            limit=limit,
+        )
+
+    def set(
+        self,
+        city_code: Optional[str],
+        category: Optional[Union[PostCategory, str]],
+        skeleton: FeedPageSkeleton,
+    ) -> None:
+        """Store the first page for a feed"""
+        self._cache.set(self._key(city_code, category), skeleton)
+
+    def invalidate_post(self, post: Post) -> None:
+        """Drop every cached feed the post can appear in"""
+        city_codes = [None]
+        if post.city_code:
+            city_codes.append(post.city_code)
+
+        for city_code in city_codes:
+            for category in (None, post.category):
+                self._cache.delete(self._key(city_code, category))
+
+    def clear(self) -> None:
+        """Drop all cached feeds (e.g. after a bulk status change)"""
+        self._cache.clear()
+
+
+# Process-wide instance shared by all requests
+post_feed_cache = PostFeedCache(ttl_seconds=settings.POST_FEED_CACHE_TTL_SECONDS)
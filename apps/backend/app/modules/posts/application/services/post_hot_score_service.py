@@ -0,0 +1,89 @@
+"""Post Hot Score Service - Incrementally maintained trending scores.
+
+A post's hotness is the sum of its engagement events, each weighted and
+decayed with a fixed half-life. Instead of decaying every score as time passes,
+each event is stored relative to a fixed epoch:
+
+    score = log2( sum_i weight_i * 2^((t_i - EPOCH) / HALF_LIFE) )
+
+Decaying all scores by the same factor never changes their order, so this
+value ranks posts exactly like the decayed sum would, and an event only ever
+touches its own post's row. The log keeps the numbers small; adding an event
+is a log-sum-exp update done in the database.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.modules.posts.domain.entities.post import Post
+from app.modules.posts.domain.repositories.i_post_hot_score_repository import (
+    IPostHotScoreRepository,
+)
+
+
+class PostHotScoreService:
+    """Translate post engagement events into hot score updates"""
+
+    # Changing either constant requires rescoring every row (see the
+    # c3f8a1d5e027 migration for the backfill query)
+    EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    HALF_LIFE_HOURS = 12
+
+    POST_WEIGHT = 1.0
+    LIKE_WEIGHT = 1.0
+    COMMENT_WEIGHT = 2.0
+    INTEREST_WEIGHT = 3.0
+
+    def __init__(self, hot_score_repository: IPostHotScoreRepository):
+        self.hot_score_repository = hot_score_repository
+
+    @classmethod
+    def term(cls, weight: float, at: datetime) -> float:
+        """log2 of an event's contribution: log2(weight) + (at - EPOCH) / half-life"""
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        half_lives = (at - cls.EPOCH).total_seconds() / (cls.HALF_LIFE_HOURS * 3600)
+        return math.log2(weight) + half_lives
+
+    async def on_post_created(self, post: Post) -> None:
+        """Start the post at its own (decaying) base score"""
+        await self.hot_score_repository.create(
+            post, self.term(self.POST_WEIGHT, post.created_at)
+        )
+
+    async def on_post_closed(self, post_id: str) -> None:
+        """Take a post out of the hot ranking"""
+        await self.hot_score_repository.delete(post_id)
+
+    async def on_like_added(
+        self, post_id: str, at: Optional[datetime] = None
+    ) -> None:
+        await self._add(post_id, self.LIKE_WEIGHT, at)
+
+    async def on_like_removed(self, post_id: str, liked_at: datetime) -> None:
+        """Remove exactly the contribution the like added when it was created"""
+        await self.hot_score_repository.subtract(
+            post_id, self.term(self.LIKE_WEIGHT, liked_at)
+        )
+
+    async def on_comment_added(
+        self, post_id: str, at: Optional[datetime] = None
+    ) -> None:
+        await self._add(post_id, self.COMMENT_WEIGHT, at)
+
+    async def on_interest_added(
+        self, post_id: str, at: Optional[datetime] = None
+    ) -> None:
+        await self._add(post_id, self.INTEREST_WEIGHT, at)
+
+    async def prune(self, limit: int = 1000) -> int:
+        """Drop rows of posts that are no longer open"""
+        return await self.hot_score_repository.delete_inactive(limit=limit)
+
+    async def _add(
+        self, post_id: str, weight: float, at: Optional[datetime]
+    ) -> None:
+        await self.hot_score_repository.add(
+            post_id, self.term(weight, at or datetime.now(timezone.utc))
+        )
@@ -0,0 +1,96 @@
+"""Post List Hydrator - Turn a page of posts into feed items.
+
+Shared by every listing that renders like the feed (GET /posts, GET
+/posts/search): owner profiles are loaded in one batch through the profile
+query service (backed by the profile summary cache) and liked_by_me in one
+bulk lookup, whatever the page size.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from app.modules.posts.domain.entities.post import Post
+from app.modules.posts.domain.repositories.i_post_like_repository import (
+    IPostLikeRepository,
+)
+from app.shared.domain.contracts.i_profile_query_service import IProfileQueryService
+
+
+@dataclass
+class PostWithLikes:
+    """Post with like information"""
+
+    post: Post
+    like_count: int
+    liked_by_me: bool
+    owner_nickname: Optional[str] = None
+    owner_avatar_url: Optional[str] = None
+
+
+class PostListHydrator:
+    """Attach owner profiles and per-viewer like state to a list of posts"""
+
+    def __init__(
+        self,
+        like_repository: IPostLikeRepository,
+        profile_service: IProfileQueryService,
+    ):
+        self.like_repository = like_repository
+        self.profile_service = profile_service
+
+    async def fetch_owner_profiles(
+        self, owner_ids: List[str]
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Fetch profile information for multiple owners in one batch.
+
+        Returns:
+            Dict mapping owner_id to {nickname, avatar_url}
+        """
+        if not owner_ids:
+            return {}
+
+        # Convert to UUIDs
+        uuid_ids = [UUID(owner_id) for owner_id in owner_ids]
+
+        summaries = await self.profile_service.get_profile_summaries(uuid_ids)
+        return {
+            str(user_id): {
+                "nickname": summary.nickname,
+                "avatar_url": summary.avatar_url,
+            }
+            for user_id, summary in summaries.items()
+        }
+
+    async def hydrate(
+        self,
+        posts: List[Post],
+        owner_profiles: Dict[str, Dict[str, Optional[str]]],
+        current_user_id: Optional[str] = None,
+    ) -> List[PostWithLikes]:
+        """
+        Build feed items for posts whose owner profiles are already loaded
+
+        like_count is denormalized on posts; only the viewer's likes need a query.
+        """
+        liked_post_ids = set()
+        if current_user_id:
+            liked_post_ids = await self.like_repository.get_liked_post_ids(
+                [post.id for post in posts], current_user_id
+            )
+
+        posts_with_likes = []
+        for post in posts:
+            profile = owner_profiles.get(post.owner_id, {})
+            posts_with_likes.append(
+                PostWithLikes(
+                    post=post,
+                    like_count=post.like_count,
+                    liked_by_me=post.id in liked_post_ids,
+                    owner_nickname=profile.get("nickname"),
+                    owner_avatar_url=profile.get("avatar_url"),
+                )
+            )
+
+        return posts_with_likes
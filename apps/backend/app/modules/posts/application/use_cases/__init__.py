@@ -7,6 +7,9 @@ from app.modules.posts.application.use_cases.close_post_use_case import ClosePos
 from app.modules.posts.application.use_cases.create_post_use_case import (
     CreatePostUseCase,
 )
+from app.modules.posts.application.use_cases.expire_posts_use_case import (
+    ExpirePostsUseCase,
+)
 from app.modules.posts.application.use_cases.express_interest_use_case import (
     ExpressInterestUseCase,
 )
@@ -16,6 +19,9 @@ from app.modules.posts.application.use_cases.list_board_posts_use_case import (
 from app.modules.posts.application.use_cases.list_post_interests_use_case import (
     ListPostInterestsUseCase,
 )
+from app.modules.posts.application.use_cases.reconcile_post_counters_use_case import (
+    ReconcilePostCountersUseCase,
+)
 from app.modules.posts.application.use_cases.reject_interest_use_case import (
     RejectInterestUseCase,
 )
@@ -24,8 +30,10 @@ __all__ = [
     "AcceptInterestUseCase",
     "ClosePostUseCase",
     "CreatePostUseCase",
+    "ExpirePostsUseCase",
     "ExpressInterestUseCase",
     "ListBoardPostsUseCase",
     "ListPostInterestsUseCase",
+    "ReconcilePostCountersUseCase",
     "RejectInterestUseCase",
 ]
@@ -1,6 +1,13 @@
 """Close Post Use Case - Manually close a post"""
 
+from typing import Optional
+
+from app.modules.posts.application.services.post_feed_cache import PostFeedCache
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
 from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 
 
 class ClosePostUseCase:
@@ -12,8 +19,17 @@ class ClosePostUseCase:
     - Post must be open
     """
 
-    def __init__(self, post_repository: IPostRepository):
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        feed_cache: Optional[PostFeedCache] = None,
+        hot_score_service: Optional[PostHotScoreService] = None,
+        after_commit: AfterCommit = run_now,
+    ):
         self.post_repository = post_repository
+        self.feed_cache = feed_cache
+        self.hot_score_service = hot_score_service
+        self.after_commit = after_commit
 
     async def execute(self, post_id: str, current_user_id: str) -> None:
         """
@@ -42,3 +58,11 @@ class ClosePostUseCase:
         # Close the post
         post.close()
         await self.post_repository.update(post)
+
+        if self.hot_score_service:
+            await self.hot_score_service.on_post_closed(post.id)
+
+        # Invalidate once committed, or a concurrent read re-caches the old page
+        if self.feed_cache:
+            feed_cache = self.feed_cache
+            self.after_commit(lambda: feed_cache.invalidate_post(post))
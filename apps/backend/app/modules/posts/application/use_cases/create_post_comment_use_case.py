@@ -6,7 +6,11 @@ Business logic for creating a comment on a post.
 
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
 
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
 from app.modules.posts.domain.entities.comment import Comment
 from app.modules.posts.domain.repositories.i_comment_repository import ICommentRepository
 from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
@@ -19,9 +23,11 @@ class CreatePostCommentUseCase:
         self,
         comment_repository: ICommentRepository,
         post_repository: IPostRepository,
+        hot_score_service: Optional[PostHotScoreService] = None,
     ):
         self.comment_repository = comment_repository
         self.post_repository = post_repository
+        self.hot_score_service = hot_score_service
 
     async def execute(self, post_id: str, user_id: str, content: str) -> Comment:
         """
@@ -54,5 +60,13 @@ class CreatePostCommentUseCase:
         
         # Persist the comment
         created_comment = await self.comment_repository.create(comment)
+
+        # Keep the denormalized comment counter in sync (same transaction)
+        await self.post_repository.increment_comment_count(post_id, 1)
+
+        if self.hot_score_service:
+            await self.hot_score_service.on_comment_added(
+                post_id, created_comment.created_at
+            )
         
         return created_comment
@@ -5,6 +5,10 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
+from app.modules.posts.application.services.post_feed_cache import PostFeedCache
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
 from app.modules.posts.application.services.post_quota_service import PostQuotaService
 from app.modules.posts.domain.entities.post import Post, PostStatus
 from app.modules.posts.domain.entities.post_enums import PostCategory, PostScope
@@ -12,6 +16,7 @@ from app.modules.posts.domain.repositories.i_post_repository import IPostReposit
 from app.shared.domain.contracts.i_subscription_query_service import (
     ISubscriptionQueryService,
 )
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 
 
 class CreatePostUseCase:
@@ -34,10 +39,16 @@ class CreatePostUseCase:
         post_repository: IPostRepository,
         subscription_repository: ISubscriptionQueryService,
         quota_service: Optional[PostQuotaService] = None,
+        feed_cache: Optional[PostFeedCache] = None,
+        hot_score_service: Optional[PostHotScoreService] = None,
+        after_commit: AfterCommit = run_now,
     ):
         self.post_repository = post_repository
         self.subscription_repository = subscription_repository
         self.quota_service = quota_service or PostQuotaService(subscription_repository)
+        self.feed_cache = feed_cache
+        self.hot_score_service = hot_score_service
+        self.after_commit = after_commit
 
     async def execute(
         self,
@@ -114,4 +125,14 @@ class CreatePostUseCase:
             created_at=datetime.now(timezone.utc),
         )
 
-        return await self.post_repository.create(post)
+        created_post = await self.post_repository.create(post)
+
+        if self.hot_score_service:
+            await self.hot_score_service.on_post_created(created_post)
+
+        # Invalidate once committed, or a concurrent read re-caches the old page
+        if self.feed_cache:
+            feed_cache = self.feed_cache
+            self.after_commit(lambda: feed_cache.invalidate_post(created_post))
+
+        return created_post
@@ -0,0 +1,99 @@
+"""
+Expire Posts Use Case - For periodic background tasks
+
+Flips open posts past their expires_at to status=expired in bounded chunks.
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from app.modules.posts.application.services.post_feed_cache import PostFeedCache
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
+from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ExpirePostsUseCase:
+    """
+    Use case for sweeping expired posts.
+
+    Each run expires at most `max_batches * batch_size` posts, one set-based
+    UPDATE per batch, and stops early as soon as a batch comes back short.
+    A capped run leaves the rest to the next run.
+
+    With `commit` given, every batch is committed on its own, so row locks
+    are held for one batch rather than the whole run, and cached feeds are
+    cleared only once the expired posts are committed.
+    """
+
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        feed_cache: Optional[PostFeedCache] = None,
+        hot_score_service: Optional[PostHotScoreService] = None,
+        commit: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self.post_repository = post_repository
+        self.feed_cache = feed_cache
+        self.hot_score_service = hot_score_service
+        self.commit = commit
+
+    async def execute(self, batch_size: int = 1000, max_batches: int = 10) -> dict:
+        """
+        Expire a bounded number of posts.
+
+        Returns:
+            dict with:
+            - expired_count: Number of posts marked as expired
+            - hot_scores_pruned: Hot score rows dropped for posts no longer open
+            - batches: Number of UPDATE statements issued
+            - capped: Whether the run stopped at the row cap (backlog remains)
+            - duration_ms: Wall time of the run
+            - processed_at: Timestamp of processing
+        """
+        now = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        expired_count = 0
+        batches = 0
+        capped = True
+
+        while batches < max_batches:
+            expired = await self.post_repository.mark_expired_posts(limit=batch_size)
+            if self.commit is not None:
+                await self.commit()
+            batches += 1
+            expired_count += expired
+            if expired < batch_size:
+                capped = False
+                break
+
+        if expired_count and self.feed_cache:
+            self.feed_cache.clear()
+
+        hot_scores_pruned = 0
+        if self.hot_score_service:
+            hot_scores_pruned = await self.hot_score_service.prune(
+                limit=batch_size * max_batches
+            )
+            if self.commit is not None:
+                await self.commit()
+
+        result = {
+            "expired_count": expired_count,
+            "hot_scores_pruned": hot_scores_pruned,
+            "batches": batches,
+            "capped": capped,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "processed_at": now.isoformat(),
+        }
+
+        if capped:
+            logger.warning(f"Post expiry sweep hit its row cap: {result}")
+        else:
+            logger.info(f"Post expiry sweep completed: {result}")
+        return result
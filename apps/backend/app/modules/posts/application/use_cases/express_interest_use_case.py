@@ -2,7 +2,11 @@
 
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
 
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
 from app.modules.posts.domain.entities.post_interest import (
     PostInterest,
     PostInterestStatus,
@@ -27,9 +31,11 @@ class ExpressInterestUseCase:
         self,
         post_repository: IPostRepository,
         post_interest_repository: IPostInterestRepository,
+        hot_score_service: Optional[PostHotScoreService] = None,
     ):
         self.post_repository = post_repository
         self.post_interest_repository = post_interest_repository
+        self.hot_score_service = hot_score_service
 
     async def execute(self, post_id: str, user_id: str) -> PostInterest:
         """
@@ -75,4 +81,11 @@ class ExpressInterestUseCase:
             created_at=datetime.now(timezone.utc),
         )
 
-        return await self.post_interest_repository.create(interest)
+        created_interest = await self.post_interest_repository.create(interest)
+
+        if self.hot_score_service:
+            await self.hot_score_service.on_interest_added(
+                post_id, created_interest.created_at
+            )
+
+        return created_interest
@@ -54,9 +54,9 @@ class GetPostUseCase:
             logger.debug(f"Post not found: {post_id}")
             return None
 
-        # Get like count and current user's like status
+        # Like count is denormalized on the post; only the viewer's like needs a query
         like_repo = PostLikeRepositoryImpl(self.session)
-        like_count = await like_repo.count_by_post(post_id)
+        like_count = post.like_count
 
         liked_by_me = False
         if current_user_id:
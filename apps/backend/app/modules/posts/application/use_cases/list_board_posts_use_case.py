@@ -4,6 +4,7 @@ from typing import List, Optional
 
 from app.modules.posts.domain.entities.post import Post, PostStatus
 from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 class ListBoardPostsUseCase:
@@ -14,7 +15,8 @@ class ListBoardPostsUseCase:
     - city_code is required
     - Only show posts with status=open and not expired
     - Support filtering by idol and idol_group
-    - Results ordered by created_at DESC (newest first)
+    - Results ordered by created_at DESC, id DESC (newest first)
+    - Pagination by opaque (created_at, id) cursor, or offset for legacy clients
     """
 
     def __init__(self, post_repository: IPostRepository):
@@ -27,6 +29,7 @@ class ListBoardPostsUseCase:
         idol_group: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Post]:
         """
         List posts for a city board
@@ -36,17 +39,20 @@ class ListBoardPostsUseCase:
             idol: Optional idol name filter
             idol_group: Optional idol group filter
             limit: Maximum number of results (default 50)
-            offset: Pagination offset (default 0)
+            offset: Pagination offset (default 0, ignored when cursor is given)
+            cursor: Opaque cursor (see KeysetCursor) of the last post already seen
 
         Returns:
             List of Post entities
 
         Raises:
-            ValueError: If city_code is not provided
+            ValueError: If city_code is not provided or the cursor is malformed
         """
         if not city_code:
             raise ValueError("City code is required")
 
+        keyset_cursor = KeysetCursor.decode(cursor) if cursor else None
+
         # Only show open posts
         posts = await self.post_repository.list_by_city(
             city_code=city_code,
@@ -55,11 +61,12 @@ class ListBoardPostsUseCase:
             idol_group=idol_group,
             limit=limit,
             offset=offset,
+            cursor=keyset_cursor,
         )
 
         # Filter out expired posts (business logic check)
-        # Note: expired posts should be marked by a scheduled job,
-        # but we do a runtime check here for safety
+        # Note: expired posts are marked by the expiry sweeper and excluded in SQL,
+        # this runtime check only guards against clock skew
         valid_posts = [post for post in posts if not post.is_expired()]
 
         return valid_posts
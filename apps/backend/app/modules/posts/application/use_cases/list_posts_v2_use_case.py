@@ -2,29 +2,34 @@
 
 from dataclasses import dataclass
 from typing import Dict, List, Optional
-from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.modules.identity.infrastructure.database.models.profile_model import ProfileModel
-from app.modules.posts.domain.entities.post import Post, PostStatus
-from app.modules.posts.domain.entities.post_enums import PostCategory
+from app.modules.posts.application.services.post_feed_cache import (
+    FeedPageSkeleton,
+    PostFeedCache,
+)
+from app.modules.posts.application.services.post_list_hydrator import (
+    PostListHydrator,
+    PostWithLikes,
+)
+from app.modules.posts.domain.entities.post import PostStatus
+from app.modules.posts.domain.entities.post_enums import PostCategory, PostSort
+from app.modules.posts.domain.repositories.i_post_hot_score_repository import (
+    IPostHotScoreRepository,
+)
 from app.modules.posts.domain.repositories.i_post_like_repository import (
     IPostLikeRepository,
 )
 from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
+from app.shared.domain.contracts.i_profile_query_service import IProfileQueryService
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 @dataclass
-class PostWithLikes:
-    """Post with like information"""
+class PostListPage:
+    """One page of the posts feed"""
 
-    post: Post
-    like_count: int
-    liked_by_me: bool
-    owner_nickname: Optional[str] = None
-    owner_avatar_url: Optional[str] = None
+    posts: List[PostWithLikes]
+    next_cursor: Optional[str] = None
 
 
 class ListPostsV2UseCase:
@@ -36,54 +41,33 @@ class ListPostsV2UseCase:
     - City view (city_code provided): shows only posts for that city
     - Only show posts with status=open and not expired
     - Support filtering by category
-    - Results ordered by created_at DESC (newest first)
+    - Results ordered by created_at DESC, id DESC (newest first), or with
+      sort=hot by the precomputed hot score (see PostHotScoreService)
+    - Pagination by opaque (created_at, id) cursor, or offset for legacy clients
     - Include like_count and liked_by_me for each post
+    - The first page is shared between viewers via PostFeedCache when provided;
+      liked_by_me is always computed per viewer; hot pages are never cached
     """
 
     def __init__(
         self,
         post_repository: IPostRepository,
         like_repository: IPostLikeRepository,
-        session: AsyncSession,
+        profile_service: IProfileQueryService,
+        feed_cache: Optional[PostFeedCache] = None,
+        hot_score_repository: Optional[IPostHotScoreRepository] = None,
     ):
         self.post_repository = post_repository
         self.like_repository = like_repository
-        self.session = session
+        self.feed_cache = feed_cache
+        self.hot_score_repository = hot_score_repository
+        self.hydrator = PostListHydrator(like_repository, profile_service)
 
     async def _fetch_owner_profiles(
         self, owner_ids: List[str]
     ) -> Dict[str, Dict[str, Optional[str]]]:
-        """
-        Fetch profile information for multiple owners in a single query.
-        
-        Returns:
-            Dict mapping owner_id to {nickname, avatar_url}
-        """
-        if not owner_ids:
-            return {}
-        
-        # Convert to UUIDs
-        uuid_ids = [UUID(owner_id) for owner_id in owner_ids]
-        
-        # Query profiles
-        result = await self.session.execute(
-            select(
-                ProfileModel.user_id,
-                ProfileModel.nickname,
-                ProfileModel.avatar_url,
-            ).where(ProfileModel.user_id.in_(uuid_ids))
-        )
-        
-        # Build mapping
-        profiles = {}
-        for row in result:
-            user_id_str = str(row[0])
-            profiles[user_id_str] = {
-                "nickname": row[1],
-                "avatar_url": row[2],
-            }
-        
-        return profiles
+        """Fetch profile information for multiple owners in a single query"""
+        return await self.hydrator.fetch_owner_profiles(owner_ids)
 
     async def execute(
         self,
@@ -92,7 +76,9 @@ class ListPostsV2UseCase:
         category: Optional[PostCategory] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> List[PostWithLikes]:
+        cursor: Optional[str] = None,
+        sort: PostSort = PostSort.LATEST,
+    ) -> PostListPage:
         """
         List posts with flexible filtering (V2)
 
@@ -101,11 +87,107 @@ class ListPostsV2UseCase:
             city_code: Optional city filter (None = global view, includes all posts)
             category: Optional category filter
             limit: Maximum number of results (default 50)
-            offset: Pagination offset (default 0)
+            offset: Pagination offset (default 0, ignored when cursor is given)
+            cursor: Opaque cursor from a previous page's next_cursor
+            sort: latest (newest first) or hot (trending first)
 
         Returns:
-            List of PostWithLikes
+            PostListPage with the posts and the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor is malformed or does not match the sort
         """
+        keyset_cursor = KeysetCursor.decode(cursor) if cursor else None
+
+        if sort == PostSort.HOT:
+            return await self._list_hot(
+                current_user_id, city_code, category, limit, offset, keyset_cursor
+            )
+        if keyset_cursor is not None and keyset_cursor.score is not None:
+            raise ValueError("Invalid pagination cursor")
+
+        is_first_page = keyset_cursor is None and offset == 0
+
+        skeleton = None
+        if self.feed_cache and is_first_page:
+            skeleton = self.feed_cache.get(city_code, category, limit)
+
+        if skeleton is None:
+            skeleton = await self._load_page(
+                city_code, category, limit, offset, keyset_cursor
+            )
+            if self.feed_cache and is_first_page:
+                self.feed_cache.set(city_code, category, skeleton)
+
+        posts = skeleton.posts
+        owner_profiles = skeleton.owner_profiles
+
+        # A full page means there may be more; resume after the last row fetched
+        # (not the last row kept) so expired posts are never fetched twice
+        next_cursor = None
+        if posts and len(posts) >= limit:
+            last = posts[-1]
+            next_cursor = KeysetCursor.from_row(last.created_at, last.id).encode()
+
+        # Filter out expired posts (runtime safety check, also for cached pages)
+        valid_posts = [post for post in posts if not post.is_expired()]
+
+        # Enrich with like information and owner profiles
+        posts_with_likes = await self.hydrator.hydrate(
+            valid_posts, owner_profiles, current_user_id
+        )
+
+        return PostListPage(posts=posts_with_likes, next_cursor=next_cursor)
+
+    async def _list_hot(
+        self,
+        current_user_id: Optional[str],
+        city_code: Optional[str],
+        category: Optional[PostCategory],
+        limit: int,
+        offset: int,
+        cursor: Optional[KeysetCursor],
+    ) -> PostListPage:
+        """Read the hot feed from the precomputed score table"""
+        if self.hot_score_repository is None:
+            raise ValueError("Hot sort is not available")
+        if cursor is not None and cursor.score is None:
+            raise ValueError("Invalid pagination cursor")
+
+        results = await self.hot_score_repository.list_hot(
+            city_code=city_code,
+            category=category,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+        next_cursor = None
+        if results and len(results) >= limit:
+            last_post, last_score = results[-1]
+            next_cursor = KeysetCursor.from_row(
+                last_post.created_at, last_post.id, score=last_score
+            ).encode()
+
+        posts = [post for post, _ in results]
+        owner_profiles = await self._fetch_owner_profiles(
+            list(set(post.owner_id for post in posts))
+        )
+        posts_with_likes = await self.hydrator.hydrate(
+            posts, owner_profiles, current_user_id
+        )
+
+        return PostListPage(posts=posts_with_likes, next_cursor=next_cursor)
+
+    async def _load_page(
+        self,
+        city_code: Optional[str],
+        category: Optional[PostCategory],
+        limit: int,
+        offset: int,
+        cursor: Optional[KeysetCursor],
+    ) -> FeedPageSkeleton:
+        """Fetch the viewer-independent part of a page from the database"""
         # Use new list_posts method with flexible filtering
         posts = await self.post_repository.list_posts(
             city_code=city_code,
@@ -113,39 +195,13 @@ class ListPostsV2UseCase:
             status=PostStatus.OPEN,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
-        # Filter out expired posts (runtime safety check)
-        valid_posts = [post for post in posts if not post.is_expired()]
-
         # Fetch all owner profiles in a single query
-        owner_ids = list(set(post.owner_id for post in valid_posts))
+        owner_ids = list(set(post.owner_id for post in posts))
         owner_profiles = await self._fetch_owner_profiles(owner_ids)
 
-        # Enrich with like information and owner profiles
-        posts_with_likes = []
-        for post in valid_posts:
-            like_count = await self.like_repository.count_by_post(post.id)
-            liked_by_me = False
-            if current_user_id:
-                existing_like = await self.like_repository.get_by_post_and_user(
-                    post.id, current_user_id
-                )
-                liked_by_me = existing_like is not None
-
-            # Get owner profile info
-            profile = owner_profiles.get(post.owner_id, {})
-            owner_nickname = profile.get("nickname")
-            owner_avatar_url = profile.get("avatar_url")
-
-            posts_with_likes.append(
-                PostWithLikes(
-                    post=post,
-                    like_count=like_count,
-                    liked_by_me=liked_by_me,
-                    owner_nickname=owner_nickname,
-                    owner_avatar_url=owner_avatar_url,
-                )
-            )
-
-        return posts_with_likes
+        return FeedPageSkeleton(
+            posts=posts, owner_profiles=owner_profiles, limit=limit
+        )
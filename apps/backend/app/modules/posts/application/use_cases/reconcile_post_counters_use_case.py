@@ -0,0 +1,80 @@
+"""
+Reconcile Post Counters Use Case - For periodic background tasks
+
+Repairs drift between the denormalized posts.like_count / posts.comment_count
+columns and the actual post_likes / post_comments rows.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ReconcilePostCountersUseCase:
+    """
+    Use case for reconciling denormalized post counters.
+
+    Each run walks at most `max_batches * batch_size` posts in id order,
+    starting after `after_id`, so a single run never scans the whole table.
+    The returned next_cursor is fed into the next run; None means the scan
+    reached the end and the next run starts over from the beginning.
+
+    With `commit` given, every batch is committed on its own, so repaired
+    posts are row-locked for one batch rather than the whole run.
+    """
+
+    def __init__(self, post_repository: IPostRepository):
+        self.post_repository = post_repository
+
+    async def execute(
+        self,
+        after_id: Optional[str] = None,
+        batch_size: int = 500,
+        max_batches: int = 10,
+        commit: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> dict:
+        """
+        Reconcile counters for a bounded number of post batches.
+
+        Returns:
+            dict with:
+            - scanned_batches: Number of batches processed
+            - repaired_count: Number of posts whose counters were fixed
+            - next_cursor: Post ID to resume from, or None when the scan wrapped
+            - processed_at: Timestamp of processing
+        """
+        now = datetime.now(timezone.utc)
+        cursor = after_id
+        repaired_count = 0
+        scanned_batches = 0
+
+        while scanned_batches < max_batches:
+            last_id, repaired = await self.post_repository.reconcile_counters(
+                after_id=cursor, limit=batch_size
+            )
+            if last_id is None:
+                cursor = None
+                break
+            if commit is not None:
+                await commit()
+
+            scanned_batches += 1
+            repaired_count += repaired
+            cursor = last_id
+
+        result = {
+            "scanned_batches": scanned_batches,
+            "repaired_count": repaired_count,
+            "next_cursor": cursor,
+            "processed_at": now.isoformat(),
+        }
+
+        if repaired_count:
+            logger.warning(f"Post counter reconciliation repaired drift: {result}")
+        else:
+            logger.info(f"Post counter reconciliation completed: {result}")
+        return result
@@ -0,0 +1,108 @@
+"""Search Posts Use Case - Ranked full-text search over open posts"""
+
+from typing import Optional
+
+from app.modules.posts.application.services.post_list_hydrator import (
+    PostListHydrator,
+)
+from app.modules.posts.application.use_cases.list_posts_v2_use_case import (
+    PostListPage,
+)
+from app.modules.posts.domain.entities.post_enums import PostCategory
+from app.modules.posts.domain.repositories.i_post_like_repository import (
+    IPostLikeRepository,
+)
+from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
+from app.shared.domain.contracts.i_profile_query_service import IProfileQueryService
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_LENGTH = 100
+
+
+class SearchPostsUseCase:
+    """
+    Use case for searching posts
+
+    Business Rules:
+    - Matches title, content, idol and idol_group (full-text), with trigram
+      similarity on idol/idol_group so misspelled names still match
+    - Only open, unexpired posts; same city/category filters as the feed
+    - Results ordered by relevance, then newest first
+    - Pagination by opaque (score, created_at, id) cursor
+    - Items are hydrated exactly like the feed (like info, owner profile)
+    """
+
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        like_repository: IPostLikeRepository,
+        profile_service: IProfileQueryService,
+    ):
+        self.post_repository = post_repository
+        self.hydrator = PostListHydrator(like_repository, profile_service)
+
+    async def execute(
+        self,
+        query: str,
+        current_user_id: Optional[str] = None,
+        city_code: Optional[str] = None,
+        category: Optional[PostCategory] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> PostListPage:
+        """
+        Search posts
+
+        Args:
+            query: Search text
+            current_user_id: Current user ID (for liked_by_me)
+            city_code: Optional city filter (None = global view)
+            category: Optional category filter
+            limit: Maximum number of results (default 20)
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            PostListPage with the matching posts and the cursor of the next page
+
+        Raises:
+            ValueError: If the query is too short/long or the cursor is malformed
+        """
+        query = query.strip()
+        if len(query) < MIN_QUERY_LENGTH:
+            raise ValueError(
+                f"Search query must be at least {MIN_QUERY_LENGTH} characters"
+            )
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValueError(
+                f"Search query must be at most {MAX_QUERY_LENGTH} characters"
+            )
+
+        keyset_cursor = KeysetCursor.decode(cursor) if cursor else None
+        if keyset_cursor is not None and keyset_cursor.score is None:
+            raise ValueError("Invalid pagination cursor")
+
+        results = await self.post_repository.search_posts(
+            query=query,
+            city_code=city_code,
+            category=category,
+            limit=limit,
+            cursor=keyset_cursor,
+        )
+
+        next_cursor = None
+        if results and len(results) >= limit:
+            last_post, last_score = results[-1]
+            next_cursor = KeysetCursor.from_row(
+                last_post.created_at, last_post.id, score=last_score
+            ).encode()
+
+        posts = [post for post, _ in results]
+        owner_profiles = await self.hydrator.fetch_owner_profiles(
+            list(set(post.owner_id for post in posts))
+        )
+        posts_with_likes = await self.hydrator.hydrate(
+            posts, owner_profiles, current_user_id
+        )
+
+        return PostListPage(posts=posts_with_likes, next_cursor=next_cursor)
@@ -5,7 +5,11 @@ Idempotent like/unlike: if liked, unlike; if not liked, like (FR-008, FR-009)
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
 from app.modules.posts.domain.entities.post_like import PostLike
 from app.modules.posts.domain.repositories.i_post_like_repository import (
     IPostLikeRepository,
@@ -36,9 +40,11 @@ class ToggleLikeUseCase:
         self,
         post_repository: IPostRepository,
         like_repository: IPostLikeRepository,
+        hot_score_service: Optional[PostHotScoreService] = None,
     ):
         self.post_repository = post_repository
         self.like_repository = like_repository
+        self.hot_score_service = hot_score_service
 
     async def execute(self, post_id: str, user_id: str) -> ToggleLikeResult:
         """
@@ -66,17 +72,31 @@ class ToggleLikeUseCase:
 
         if existing_like:
             # Unlike: remove the like
-            await self.like_repository.delete_by_post_and_user(post_id, user_id)
+            deleted = await self.like_repository.delete_by_post_and_user(
+                post_id, user_id
+            )
+            like_delta = -1 if deleted else 0
             liked = False
+            if deleted and self.hot_score_service:
+                await self.hot_score_service.on_like_removed(
+                    post_id, existing_like.created_at
+                )
             logger.info(f"User {user_id} unliked post {post_id}")
         else:
             # Like: create a new like
             new_like = PostLike.create(post_id=post_id, user_id=user_id)
             await self.like_repository.create(new_like)
+            like_delta = 1
             liked = True
+            if self.hot_score_service:
+                await self.hot_score_service.on_like_added(
+                    post_id, new_like.created_at
+                )
             logger.info(f"User {user_id} liked post {post_id}")
 
-        # Get updated like count
-        like_count = await self.like_repository.count_by_post(post_id)
+        # Atomically update the denormalized counter and get the new like count
+        like_count = await self.post_repository.increment_like_count(
+            post_id, like_delta
+        )
 
         return ToggleLikeResult(liked=liked, like_count=like_count)
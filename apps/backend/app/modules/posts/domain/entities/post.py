@@ -43,6 +43,8 @@ class Post:
         idol_group: Optional[str] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        like_count: int = 0,
+        comment_count: int = 0,
     ):
         self.id = id
         self.owner_id = owner_id
@@ -57,6 +59,9 @@ class Post:
         self.expires_at = expires_at
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or self.created_at
+        # Denormalized counters maintained by the like/comment use cases
+        self.like_count = like_count
+        self.comment_count = comment_count
 
         # FR-004: Validate scope and city_code relationship
         if self.scope == PostScope.CITY and not self.city_code:
@@ -23,3 +23,10 @@ class PostScope(str, Enum):
 
     GLOBAL = "global"
     CITY = "city"
+
+
+class PostSort(str, Enum):
+    """Post feed ordering"""
+
+    LATEST = "latest"  # created_at DESC
+    HOT = "hot"  # precomputed time-decayed engagement score DESC
@@ -0,0 +1,68 @@
+"""
+PostHotScore Repository Interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from app.modules.posts.domain.entities.post import Post
+from app.modules.posts.domain.entities.post_enums import PostCategory
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+class IPostHotScoreRepository(ABC):
+    """
+    Repository interface for precomputed post hot scores
+
+    Scores are stored in log2 space (see PostHotScoreService), so adding an
+    engagement event is a log-sum-exp update of a single row.
+    """
+
+    @abstractmethod
+    async def create(self, post: Post, base_score: float) -> None:
+        """Insert the score row of a new post (no-op if it already exists)"""
+        pass
+
+    @abstractmethod
+    async def add(self, post_id: str, term: float) -> Optional[float]:
+        """Add an event term to a post's score. Returns the new score, None if the post has no row."""
+        pass
+
+    @abstractmethod
+    async def subtract(self, post_id: str, term: float) -> Optional[float]:
+        """Remove a previously added event term, never going below the base score"""
+        pass
+
+    @abstractmethod
+    async def delete(self, post_id: str) -> None:
+        """Remove a post from the hot ranking"""
+        pass
+
+    @abstractmethod
+    async def list_hot(
+        self,
+        city_code: Optional[str] = None,
+        category: Optional[PostCategory] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
+    ) -> List[Tuple[Post, float]]:
+        """
+        List open, unexpired posts by score DESC, created_at DESC, id DESC
+
+        Args:
+            city_code: Optional city filter (None = global view)
+            category: Optional category filter
+            limit: Maximum number of results
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: Keyset cursor carrying the last row's score
+
+        Returns:
+            List of (post, score) pairs
+        """
+        pass
+
+    @abstractmethod
+    async def delete_inactive(self, limit: int = 1000) -> int:
+        """Drop up to `limit` rows whose post is no longer open. Returns the number removed."""
+        pass
@@ -3,7 +3,7 @@ PostLike Repository Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Set
 
 from app.modules.posts.domain.entities.post_like import PostLike
 
@@ -32,3 +32,8 @@ class IPostLikeRepository(ABC):
     async def count_by_post(self, post_id: str) -> int:
         """Count total likes for a post"""
         pass
+
+    @abstractmethod
+    async def get_liked_post_ids(self, post_ids: List[str], user_id: str) -> Set[str]:
+        """Return the subset of post_ids that user_id has liked"""
+        pass
@@ -5,10 +5,11 @@ Domain layer repository interface - defines contract for post persistence
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.modules.posts.domain.entities.post import Post, PostStatus
 from app.modules.posts.domain.entities.post_enums import PostCategory
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 class IPostRepository(ABC):
@@ -33,17 +34,19 @@ class IPostRepository(ABC):
         idol_group: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[Post]:
         """
         List posts for a specific city with optional filters
 
         Args:
             city_code: City code (required)
-            status: Filter by post status
+            status: Filter by post status (OPEN also excludes posts past expires_at)
             idol: Filter by idol name
             idol_group: Filter by idol group
             limit: Maximum number of results
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: Keyset cursor; returns posts strictly after it
         """
         pass
 
@@ -55,6 +58,7 @@ class IPostRepository(ABC):
         status: Optional[PostStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[Post]:
         """
         List posts with flexible filtering (V2: supports global/city filtering)
@@ -66,9 +70,39 @@ class IPostRepository(ABC):
         Args:
             city_code: Optional city filter (None = global view, includes all posts)
             category: Optional category filter
-            status: Filter by post status (defaults to OPEN)
+            status: Filter by post status (defaults to OPEN; OPEN also excludes
+                posts past expires_at that are not swept yet)
             limit: Maximum number of results
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: Keyset cursor; returns posts strictly after it
+        """
+        pass
+
+    @abstractmethod
+    async def search_posts(
+        self,
+        query: str,
+        city_code: Optional[str] = None,
+        category: Optional[PostCategory] = None,
+        limit: int = 20,
+        cursor: Optional[KeysetCursor] = None,
+    ) -> List[Tuple[Post, float]]:
+        """
+        Full-text search over open, unexpired posts
+
+        Matches title/content/idol/idol_group via the search_vector column and
+        falls back to trigram similarity on idol/idol_group for misspellings.
+        Results are ordered by (score, created_at, id) descending.
+
+        Args:
+            query: User search text (websearch syntax)
+            city_code: Optional city filter (same semantics as list_posts)
+            category: Optional category filter
+            limit: Maximum number of results
+            cursor: Keyset cursor carrying the score; returns rows strictly after it
+
+        Returns:
+            List of (post, relevance score) tuples
         """
         pass
 
@@ -92,15 +126,55 @@ class IPostRepository(ABC):
 
     @abstractmethod
     async def get_by_owner_id(
-        self, owner_id: str, limit: int = 50, offset: int = 0
+        self,
+        owner_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[Post]:
         """Get posts by owner ID"""
         pass
 
     @abstractmethod
-    async def mark_expired_posts(self) -> int:
+    async def mark_expired_posts(self, limit: int = 1000) -> int:
         """
-        Mark all open posts that have passed their expiry time as expired
+        Mark open posts that have passed their expiry time as expired
+
+        Processes at most `limit` posts per call; callers loop until it
+        returns less than `limit`.
+
         Returns the number of posts marked as expired
         """
         pass
+
+    @abstractmethod
+    async def increment_like_count(self, post_id: str, delta: int) -> int:
+        """
+        Atomically adjust the denormalized like counter of a post
+        Returns the new like count (never below 0)
+        """
+        pass
+
+    @abstractmethod
+    async def increment_comment_count(self, post_id: str, delta: int) -> int:
+        """
+        Atomically adjust the denormalized comment counter of a post
+        Returns the new comment count (never below 0)
+        """
+        pass
+
+    @abstractmethod
+    async def reconcile_counters(
+        self, after_id: Optional[str] = None, limit: int = 500
+    ) -> Tuple[Optional[str], int]:
+        """
+        Recompute like/comment counters for one batch of posts
+
+        Scans up to `limit` posts ordered by id, starting after `after_id`,
+        and rewrites counters that drifted from the post_likes/post_comments rows.
+
+        Returns:
+            Tuple of (last scanned post ID or None when no posts remain,
+            number of posts whose counters were repaired)
+        """
+        pass
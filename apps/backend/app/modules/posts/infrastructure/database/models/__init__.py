@@ -1,6 +1,7 @@
 """Posts module database models"""
 
 from .post_comment_model import PostCommentModel
+from .post_hot_score_model import PostHotScoreModel
 from .post_interest_model import PostInterestModel
 from .post_like_model import PostLikeModel
 from .post_model import PostModel
@@ -10,4 +11,5 @@ __all__ = [
     "PostLikeModel",
     "PostInterestModel",
     "PostCommentModel",
+    "PostHotScoreModel",
 ]
@@ -0,0 +1,71 @@
+"""
+PostHotScore ORM model for Posts module
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.shared.infrastructure.database.connection import Base
+
+
+class PostHotScoreModel(Base):
+    """
+    Precomputed hot score of an open post
+
+    One row per open post, kept up to date by the like/comment/interest write
+    paths. city_code is only set for scope=city posts so the city feed can be
+    read straight from the (city_code, ...) index.
+    """
+
+    __tablename__ = "post_hot_scores"
+
+    post_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("posts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    city_code = Column(String(20), nullable=True)
+    category = Column(String(20), nullable=False)
+    score = Column(Float, nullable=False)
+    base_score = Column(Float, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    # Top-N reads for every feed shape: city+category, city, category, global
+    __table_args__ = (
+        Index(
+            "idx_post_hot_scores_city_category",
+            "city_code",
+            "category",
+            score.desc(),
+            created_at.desc(),
+            post_id.desc(),
+        ),
+        Index(
+            "idx_post_hot_scores_city",
+            "city_code",
+            score.desc(),
+            created_at.desc(),
+            post_id.desc(),
+        ),
+        Index(
+            "idx_post_hot_scores_category",
+            "category",
+            score.desc(),
+            created_at.desc(),
+            post_id.desc(),
+        ),
+        Index(
+            "idx_post_hot_scores_score",
+            score.desc(),
+            created_at.desc(),
+            post_id.desc(),
+        ),
+    )
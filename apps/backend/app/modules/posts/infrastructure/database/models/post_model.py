@@ -5,8 +5,18 @@ Post ORM model for Posts module
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 
 from app.shared.infrastructure.database.connection import Base
 
@@ -38,17 +48,57 @@ class PostModel(Base):
         index=True,
     )  # open, closed, expired, deleted
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Denormalized counters (kept in sync by ToggleLikeUseCase / CreatePostCommentUseCase,
+    # drift repaired by ReconcilePostCountersUseCase)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # Full-text search document maintained by Postgres (used by search_posts)
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(idol, '')), 'A') "
+            "|| setweight(to_tsvector('simple', coalesce(idol_group, '')), 'A') "
+            "|| setweight(to_tsvector('simple', coalesce(title, '')), 'B') "
+            "|| setweight(to_tsvector('simple', coalesce(content, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
+    )
 
     # Compound indexes for efficient queries
     __table_args__ = (
-        Index("idx_posts_scope_status_created_at", "scope", "status", "created_at"),
-        Index("idx_posts_city_status_created_at", "city_code", "status", "created_at"),
+        Index(
+            "idx_posts_scope_status_created_at", "scope", "status", "created_at", "id"
+        ),
+        Index(
+            "idx_posts_city_status_created_at", "city_code", "status", "created_at", "id"
+        ),
+        Index("idx_posts_status_created_at", "status", "created_at", "id"),
         Index("idx_posts_category_status", "category", "status"),
-        Index("idx_posts_owner_id", "owner_id"),
+        # Expiry sweeper: oldest expired open posts first
+        Index(
+            "idx_posts_open_expires_at",
+            "expires_at",
+            postgresql_where=text("status = 'open'"),
+        ),
+        Index("idx_posts_owner_created_at", "owner_id", "created_at", "id"),
+        Index("idx_posts_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_posts_idol_trgm",
+            "idol",
+            postgresql_using="gin",
+            postgresql_ops={"idol": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_posts_idol_group_trgm",
+            "idol_group",
+            postgresql_using="gin",
+            postgresql_ops={"idol_group": "gin_trgm_ops"},
+        ),
     )
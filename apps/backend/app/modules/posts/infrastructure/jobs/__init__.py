@@ -0,0 +1 @@
+"""Posts module background jobs"""
@@ -0,0 +1,45 @@
+"""
+Post counter reconciliation job
+
+Periodically runs ReconcilePostCountersUseCase in its own database session,
+committing each batch and remembering where the previous run stopped so the
+whole posts table is covered over consecutive runs.
+"""
+
+import logging
+from typing import Optional
+
+from app.modules.posts.application.use_cases.reconcile_post_counters_use_case import (
+    ReconcilePostCountersUseCase,
+)
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from app.shared.infrastructure.database.connection import db_connection
+
+logger = logging.getLogger(__name__)
+
+
+class PostCounterReconciliationJob:
+    """Bounded, resumable reconciliation of posts.like_count / comment_count"""
+
+    def __init__(self, batch_size: int = 500, max_batches: int = 10):
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self._cursor: Optional[str] = None
+
+    async def run(self) -> dict:
+        """Reconcile the next slice of posts and advance the cursor"""
+        async with db_connection.get_async_session() as session:
+            use_case = ReconcilePostCountersUseCase(
+                post_repository=PostRepositoryImpl(session)
+            )
+            result = await use_case.execute(
+                after_id=self._cursor,
+                batch_size=self.batch_size,
+                max_batches=self.max_batches,
+                commit=session.commit,
+            )
+
+        self._cursor = result["next_cursor"]
+        return result
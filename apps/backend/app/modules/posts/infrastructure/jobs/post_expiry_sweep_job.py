@@ -0,0 +1,82 @@
+"""
+Post expiry sweep job
+
+Periodically runs ExpirePostsUseCase in its own database session, committing
+each chunk, and keeps running totals of what it did for logs and the
+/api/v1/health endpoint.
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from app.modules.posts.application.services.post_feed_cache import post_feed_cache
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
+from app.modules.posts.application.use_cases.expire_posts_use_case import (
+    ExpirePostsUseCase,
+)
+from app.modules.posts.infrastructure.repositories.post_hot_score_repository_impl import (
+    PostHotScoreRepositoryImpl,
+)
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from app.shared.infrastructure.database.connection import db_connection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostExpirySweepMetrics:
+    """Cumulative sweeper counters for this worker"""
+
+    runs: int = 0
+    capped_runs: int = 0
+    expired_total: int = 0
+    last_expired_count: int = 0
+    last_duration_ms: float = 0.0
+    last_run_at: Optional[str] = None
+
+
+# Totals of the job scheduled by this worker, reported by the health check
+post_expiry_sweep_metrics = PostExpirySweepMetrics()
+
+
+class PostExpirySweepJob:
+    """Bounded, set-based expiry of open posts past expires_at"""
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        max_batches: int = 10,
+        metrics: Optional[PostExpirySweepMetrics] = None,
+    ):
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.metrics = metrics or PostExpirySweepMetrics()
+
+    async def run(self) -> dict:
+        """Expire the next slice of posts and update the metrics"""
+        async with db_connection.get_async_session() as session:
+            use_case = ExpirePostsUseCase(
+                post_repository=PostRepositoryImpl(session),
+                feed_cache=post_feed_cache,
+                hot_score_service=PostHotScoreService(
+                    PostHotScoreRepositoryImpl(session)
+                ),
+                commit=session.commit,
+            )
+            result = await use_case.execute(
+                batch_size=self.batch_size, max_batches=self.max_batches
+            )
+
+        self.metrics.runs += 1
+        self.metrics.capped_runs += int(result["capped"])
+        self.metrics.expired_total += result["expired_count"]
+        self.metrics.last_expired_count = result["expired_count"]
+        self.metrics.last_duration_ms = result["duration_ms"]
+        self.metrics.last_run_at = result["processed_at"]
+        logger.debug(f"Post expiry sweep metrics: {asdict(self.metrics)}")
+        return result
@@ -7,12 +7,13 @@ SQLAlchemy implementation of the ICommentRepository interface.
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.posts.domain.entities.comment import Comment
 from app.modules.posts.domain.repositories.i_comment_repository import ICommentRepository
 from app.modules.posts.infrastructure.database.models.post_comment_model import PostCommentModel
+from app.modules.posts.infrastructure.database.models.post_model import PostModel
 
 
 class CommentRepositoryImpl(ICommentRepository):
@@ -65,10 +66,8 @@ class CommentRepositoryImpl(ICommentRepository):
         return self._to_entity(model)
 
     async def count_by_post(self, post_id: str) -> int:
-        """Count total comments for a post"""
-        stmt = select(func.count()).select_from(PostCommentModel).where(
-            PostCommentModel.post_id == UUID(post_id)
-        )
+        """Count total comments for a post (reads the denormalized posts.comment_count)"""
+        stmt = select(PostModel.comment_count).where(PostModel.id == UUID(post_id))
         result = await self.session.execute(stmt)
         return result.scalar() or 0
 
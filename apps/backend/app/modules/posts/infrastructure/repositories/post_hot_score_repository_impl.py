@@ -0,0 +1,189 @@
+"""
+SQLAlchemy PostHotScore Repository Implementation
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    Float,
+    and_,
+    case,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.posts.domain.entities.post import Post, PostStatus
+from app.modules.posts.domain.entities.post_enums import PostCategory, PostScope
+from app.modules.posts.domain.repositories.i_post_hot_score_repository import (
+    IPostHotScoreRepository,
+)
+from app.modules.posts.infrastructure.database.models.post_hot_score_model import (
+    PostHotScoreModel,
+)
+from app.modules.posts.infrastructure.database.models.post_model import PostModel
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+# 2^-60 is below double precision relative to 1, so smaller terms change nothing
+_MIN_EXPONENT = -60.0
+
+
+class PostHotScoreRepositoryImpl(IPostHotScoreRepository):
+    """SQLAlchemy implementation of PostHotScore repository"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, post: Post, base_score: float) -> None:
+        """Insert the score row of a new post (no-op if it already exists)"""
+        scope = post.scope.value if isinstance(post.scope, PostScope) else post.scope
+        category = (
+            post.category.value
+            if isinstance(post.category, PostCategory)
+            else post.category
+        )
+        await self.session.execute(
+            insert(PostHotScoreModel)
+            .values(
+                post_id=UUID(post.id),
+                city_code=post.city_code if scope == PostScope.CITY.value else None,
+                category=category,
+                score=base_score,
+                base_score=base_score,
+                created_at=post.created_at,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .on_conflict_do_nothing(index_elements=[PostHotScoreModel.post_id])
+        )
+
+    async def add(self, post_id: str, term: float) -> Optional[float]:
+        """
+        score = log2(2^score + 2^term), computed in the UPDATE itself
+
+        Written as max + log2(1 + 2^(min - max)) so it never overflows, and
+        applied in the database so concurrent events never lose updates.
+        """
+        score = PostHotScoreModel.score
+        x = literal(term, Float)
+        high = func.greatest(score, x)
+        low = func.least(score, x)
+        new_score = high + func.ln(
+            1 + func.power(2.0, func.greatest(low - high, _MIN_EXPONENT))
+        ) / func.ln(2.0)
+        return await self._set_score(post_id, new_score)
+
+    async def subtract(self, post_id: str, term: float) -> Optional[float]:
+        """
+        score = log2(2^score - 2^term), floored at base_score
+
+        Removing a term at least as large as the whole score (rounding, or a
+        backfilled row that never saw the event) falls back to the base score.
+        """
+        score = PostHotScoreModel.score
+        x = literal(term, Float)
+        remaining = score + func.ln(
+            1 - func.power(2.0, func.greatest(x - score, _MIN_EXPONENT))
+        ) / func.ln(2.0)
+        new_score = func.greatest(
+            PostHotScoreModel.base_score,
+            case(
+                (x < score - 1e-9, remaining),
+                else_=PostHotScoreModel.base_score,
+            ),
+        )
+        return await self._set_score(post_id, new_score)
+
+    async def _set_score(self, post_id: str, new_score) -> Optional[float]:
+        result = await self.session.execute(
+            update(PostHotScoreModel)
+            .where(PostHotScoreModel.post_id == UUID(post_id))
+            .values(score=new_score, updated_at=datetime.now(timezone.utc))
+            .returning(PostHotScoreModel.score)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete(self, post_id: str) -> None:
+        """Remove a post from the hot ranking"""
+        await self.session.execute(
+            delete(PostHotScoreModel).where(
+                PostHotScoreModel.post_id == UUID(post_id)
+            )
+        )
+
+    async def list_hot(
+        self,
+        city_code: Optional[str] = None,
+        category: Optional[PostCategory] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
+    ) -> List[Tuple[Post, float]]:
+        """
+        Top-N read from the idx_post_hot_scores_* index matching the filters
+
+        The posts join only rechecks status/expiry of the rows already picked
+        in score order; nothing is computed at query time.
+        """
+        hot = PostHotScoreModel
+        stmt = select(PostModel, hot.score).join(hot, hot.post_id == PostModel.id)
+
+        if city_code:
+            stmt = stmt.where(hot.city_code == city_code)
+        if category:
+            category_value = (
+                category.value if isinstance(category, PostCategory) else category
+            )
+            stmt = stmt.where(hot.category == category_value)
+
+        stmt = stmt.where(
+            and_(
+                PostModel.status == PostStatus.OPEN.value,
+                PostModel.expires_at > datetime.now(timezone.utc),
+            )
+        ).order_by(hot.score.desc(), hot.created_at.desc(), hot.post_id.desc())
+
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(hot.score, hot.created_at, hot.post_id)
+                < tuple_(cursor.score or 0.0, cursor.created_at, UUID(cursor.id))
+            ).limit(limit)
+        else:
+            stmt = stmt.limit(limit).offset(offset)
+
+        result = await self.session.execute(stmt)
+        return [
+            (PostRepositoryImpl._to_entity(model), score) for model, score in result
+        ]
+
+    async def delete_inactive(self, limit: int = 1000) -> int:
+        """Drop up to `limit` rows of closed, expired or deleted posts"""
+        inactive = (
+            select(PostHotScoreModel.post_id)
+            .join(PostModel, PostModel.id == PostHotScoreModel.post_id)
+            .where(
+                or_(
+                    PostModel.status != PostStatus.OPEN.value,
+                    PostModel.expires_at <= datetime.now(timezone.utc),
+                )
+            )
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            delete(PostHotScoreModel)
+            .where(PostHotScoreModel.post_id.in_(inactive))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -2,7 +2,7 @@
 SQLAlchemy PostLike Repository Implementation
 """
 
-from typing import Optional
+from typing import List, Optional, Set
 from uuid import UUID
 
 from sqlalchemy import and_, delete, func, select
@@ -73,6 +73,21 @@ class PostLikeRepositoryImpl(IPostLikeRepository):
         )
         return result.scalar() or 0
 
+    async def get_liked_post_ids(self, post_ids: List[str], user_id: str) -> Set[str]:
+        """Return the subset of post_ids liked by user_id (uq_post_likes_post_user lookup)"""
+        if not post_ids:
+            return set()
+
+        result = await self.session.execute(
+            select(PostLikeModel.post_id).where(
+                and_(
+                    PostLikeModel.post_id.in_([UUID(post_id) for post_id in post_ids]),
+                    PostLikeModel.user_id == UUID(user_id),
+                )
+            )
+        )
+        return {str(post_id) for post_id in result.scalars().all()}
+
     def _to_entity(self, model: PostLikeModel) -> PostLike:
         """Convert ORM model to domain entity"""
         return PostLike(
@@ -3,16 +3,23 @@ SQLAlchemy Post Repository Implementation
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Float, and_, cast, func, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.posts.domain.entities.post import Post, PostStatus
 from app.modules.posts.domain.entities.post_enums import PostCategory, PostScope
 from app.modules.posts.domain.repositories.i_post_repository import IPostRepository
+from app.modules.posts.infrastructure.database.models.post_comment_model import (
+    PostCommentModel,
+)
+from app.modules.posts.infrastructure.database.models.post_like_model import (
+    PostLikeModel,
+)
 from app.modules.posts.infrastructure.database.models.post_model import PostModel
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 class PostRepositoryImpl(IPostRepository):
@@ -69,6 +76,7 @@ class PostRepositoryImpl(IPostRepository):
         status: Optional[PostStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[Post]:
         """
         List posts with flexible filtering (V2: supports global/city filtering)
@@ -77,38 +85,62 @@ class PostRepositoryImpl(IPostRepository):
         - When city_code is None: returns all posts (both scope=global and scope=city)
         - When city_code is provided: returns only posts with that city_code AND scope=city
         """
-        query = select(PostModel)
+        query = self._apply_feed_filters(
+            select(PostModel), city_code, category, status
+        )
+        query = self._paginate(query, limit, offset, cursor)
 
-        # FR-005: City filtering
-        if city_code:
-            # City-specific view: only show posts for this city
-            query = query.where(
-                and_(
-                    PostModel.scope == PostScope.CITY.value,
-                    PostModel.city_code == city_code,
-                )
-            )
-        # else: Global view includes all posts (both scope=global and scope=city)
+        result = await self.session.execute(query)
+        models = result.scalars().all()
+        return [self._to_entity(model) for model in models]
 
-        # Category filter
-        if category:
-            category_value = (
-                category.value if isinstance(category, PostCategory) else category
+    async def search_posts(
+        self,
+        query: str,
+        city_code: Optional[str] = None,
+        category: Optional[PostCategory] = None,
+        limit: int = 20,
+        cursor: Optional[KeysetCursor] = None,
+    ) -> List[Tuple[Post, float]]:
+        """
+        Full-text search with trigram fallback, ranked by relevance
+
+        The tsquery match is served by idx_posts_search_vector and the `%`
+        similarity matches by the idol/idol_group trigram indexes, so Postgres
+        can combine them with a BitmapOr. Score is ts_rank plus the best trigram
+        similarity, cast to double precision so it round-trips through cursors.
+        """
+        ts_query = func.websearch_to_tsquery("simple", query)
+        trigram_score = func.greatest(
+            func.coalesce(func.similarity(PostModel.idol, query), 0),
+            func.coalesce(func.similarity(PostModel.idol_group, query), 0),
+        )
+        score = cast(
+            func.ts_rank(PostModel.search_vector, ts_query) + trigram_score, Float
+        ).label("score")
+
+        stmt = self._apply_feed_filters(
+            select(PostModel, score), city_code, category, PostStatus.OPEN
+        ).where(
+            or_(
+                PostModel.search_vector.op("@@")(ts_query),
+                PostModel.idol.op("%")(query),
+                PostModel.idol_group.op("%")(query),
             )
-            query = query.where(PostModel.category == category_value)
+        )
 
-        # Status filter (defaults to OPEN if not specified)
-        if status:
-            status_value = status.value if isinstance(status, PostStatus) else status
-            query = query.where(PostModel.status == status_value)
-        else:
-            query = query.where(PostModel.status == PostStatus.OPEN.value)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(score, PostModel.created_at, PostModel.id)
+                < tuple_(cursor.score or 0.0, cursor.created_at, UUID(cursor.id))
+            )
 
-        query = query.order_by(PostModel.created_at.desc()).limit(limit).offset(offset)
+        stmt = stmt.order_by(
+            score.desc(), PostModel.created_at.desc(), PostModel.id.desc()
+        ).limit(limit)
 
-        result = await self.session.execute(query)
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        result = await self.session.execute(stmt)
+        return [(self._to_entity(model), row_score) for model, row_score in result]
 
     async def list_by_city(
         self,
@@ -118,6 +150,7 @@ class PostRepositoryImpl(IPostRepository):
         idol_group: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[Post]:
         """
         List posts for a specific city with optional filters (Legacy method)
@@ -127,6 +160,7 @@ class PostRepositoryImpl(IPostRepository):
         if status:
             status_value = status.value if isinstance(status, PostStatus) else status
             query = query.where(PostModel.status == status_value)
+            query = self._exclude_expired(query, status_value)
 
         if idol:
             query = query.where(PostModel.idol == idol)
@@ -134,7 +168,7 @@ class PostRepositoryImpl(IPostRepository):
         if idol_group:
             query = query.where(PostModel.idol_group == idol_group)
 
-        query = query.order_by(PostModel.created_at.desc()).limit(limit).offset(offset)
+        query = self._paginate(query, limit, offset, cursor)
 
         result = await self.session.execute(query)
         models = result.scalars().all()
@@ -209,52 +243,199 @@ class PostRepositoryImpl(IPostRepository):
             await self.session.flush()
 
     async def get_by_owner_id(
-        self, owner_id: str, limit: int = 50, offset: int = 0
+        self,
+        owner_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[Post]:
         """Get posts by owner ID"""
         owner_uuid = UUID(owner_id) if isinstance(owner_id, str) else owner_id
 
-        query = (
-            select(PostModel)
-            .where(PostModel.owner_id == owner_uuid)
-            .order_by(PostModel.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-        )
+        query = select(PostModel).where(PostModel.owner_id == owner_uuid)
+        query = self._paginate(query, limit, offset, cursor)
 
         result = await self.session.execute(query)
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
-    async def mark_expired_posts(self) -> int:
+    @staticmethod
+    def _apply_feed_filters(
+        query,
+        city_code: Optional[str],
+        category: Optional[PostCategory],
+        status: Optional[PostStatus],
+    ):
+        """Apply the feed's city/category/status filters (FR-005)"""
+        # FR-005: City filtering
+        if city_code:
+            # City-specific view: only show posts for this city
+            query = query.where(
+                and_(
+                    PostModel.scope == PostScope.CITY.value,
+                    PostModel.city_code == city_code,
+                )
+            )
+        # else: Global view includes all posts (both scope=global and scope=city)
+
+        # Category filter
+        if category:
+            category_value = (
+                category.value if isinstance(category, PostCategory) else category
+            )
+            query = query.where(PostModel.category == category_value)
+
+        # Status filter (defaults to OPEN if not specified)
+        status_value = PostStatus.OPEN.value
+        if status:
+            status_value = status.value if isinstance(status, PostStatus) else status
+        query = query.where(PostModel.status == status_value)
+
+        return PostRepositoryImpl._exclude_expired(query, status_value)
+
+    @staticmethod
+    def _exclude_expired(query, status_value: Optional[str]):
         """
-        Mark all open posts that have passed their expiry time as expired
+        Hide open posts past expires_at that the sweeper has not flipped yet
+
+        Filtering in SQL keeps pages full instead of dropping rows after the fetch.
+        """
+        if status_value == PostStatus.OPEN.value:
+            query = query.where(PostModel.expires_at > datetime.now(timezone.utc))
+        return query
+
+    @staticmethod
+    def _paginate(
+        query, limit: int, offset: int, cursor: Optional[KeysetCursor]
+    ):
+        """
+        Apply newest-first ordering and either keyset or offset pagination
+
+        The (created_at, id) row comparison matches the trailing columns of the
+        idx_posts_*_created_at indexes, so cursor pages are a single index range
+        scan regardless of depth.
+        """
+        query = query.order_by(PostModel.created_at.desc(), PostModel.id.desc())
+        if cursor is not None:
+            query = query.where(
+                tuple_(PostModel.created_at, PostModel.id)
+                < tuple_(cursor.created_at, UUID(cursor.id))
+            )
+            return query.limit(limit)
+        return query.limit(limit).offset(offset)
+
+    async def mark_expired_posts(self, limit: int = 1000) -> int:
+        """
+        Mark up to `limit` open posts that have passed their expiry time as expired
+
+        A single set-based UPDATE ... RETURNING id over the oldest expired rows
+        (idx_posts_open_expires_at). SKIP LOCKED lets concurrent sweepers in
+        other workers take disjoint chunks instead of waiting on each other.
         Returns the number of posts marked as expired
         """
         now = datetime.now(timezone.utc)
 
-        # Find all open posts that have expired
-        result = await self.session.execute(
-            select(PostModel).where(
+        chunk = (
+            select(PostModel.id)
+            .where(
                 and_(
                     PostModel.status == PostStatus.OPEN.value,
                     PostModel.expires_at <= now,
                 )
             )
+            .order_by(PostModel.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(PostModel)
+            .where(PostModel.id.in_(chunk))
+            .values(status=PostStatus.EXPIRED.value, updated_at=now)
+            .returning(PostModel.id)
+            .execution_options(synchronize_session=False)
         )
-        expired_posts = result.scalars().all()
+        return len(result.scalars().all())
 
-        # Mark them as expired
-        count = 0
-        for model in expired_posts:
-            model.status = PostStatus.EXPIRED.value
-            model.updated_at = now
-            count += 1
+    async def increment_like_count(self, post_id: str, delta: int) -> int:
+        """Atomically adjust the like counter and return the new value"""
+        return await self._increment_counter(post_id, PostModel.like_count, delta)
 
-        if count > 0:
-            await self.session.flush()
+    async def increment_comment_count(self, post_id: str, delta: int) -> int:
+        """Atomically adjust the comment counter and return the new value"""
+        return await self._increment_counter(post_id, PostModel.comment_count, delta)
+
+    async def _increment_counter(self, post_id: str, column, delta: int) -> int:
+        """
+        Apply `column = GREATEST(column + delta, 0)` in a single UPDATE ... RETURNING
+
+        The increment happens in the database so concurrent likes/comments never
+        lose updates. updated_at is pinned so counter bumps don't look like edits.
+        """
+        result = await self.session.execute(
+            update(PostModel)
+            .where(PostModel.id == UUID(post_id))
+            .values(
+                {
+                    column: func.greatest(column + delta, 0),
+                    PostModel.updated_at: PostModel.updated_at,
+                }
+            )
+            .returning(column)
+        )
+        return result.scalar() or 0
+
+    async def reconcile_counters(
+        self, after_id: Optional[str] = None, limit: int = 500
+    ) -> Tuple[Optional[str], int]:
+        """
+        Recompute like/comment counters for one batch of posts ordered by id
+
+        Only rows whose stored counters differ from the actual post_likes /
+        post_comments totals are rewritten.
+        """
+        batch_query = select(PostModel.id).order_by(PostModel.id).limit(limit)
+        if after_id:
+            batch_query = batch_query.where(PostModel.id > UUID(after_id))
+
+        result = await self.session.execute(batch_query)
+        post_ids = result.scalars().all()
+        if not post_ids:
+            return None, 0
+
+        actual_likes = (
+            select(func.count(PostLikeModel.id))
+            .where(PostLikeModel.post_id == PostModel.id)
+            .correlate(PostModel)
+            .scalar_subquery()
+        )
+        actual_comments = (
+            select(func.count(PostCommentModel.id))
+            .where(PostCommentModel.post_id == PostModel.id)
+            .correlate(PostModel)
+            .scalar_subquery()
+        )
+
+        result = await self.session.execute(
+            update(PostModel)
+            .where(
+                and_(
+                    PostModel.id.in_(post_ids),
+                    or_(
+                        PostModel.like_count != actual_likes,
+                        PostModel.comment_count != actual_comments,
+                    ),
+                )
+            )
+            .values(
+                like_count=actual_likes,
+                comment_count=actual_comments,
+                updated_at=PostModel.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-        return count
+        return str(post_ids[-1]), result.rowcount
 
     @staticmethod
     def _to_entity(model: PostModel) -> Post:
@@ -273,6 +454,8 @@ class PostRepositoryImpl(IPostRepository):
             expires_at=model.expires_at,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            like_count=model.like_count or 0,
+            comment_count=model.comment_count or 0,
         )
 
 
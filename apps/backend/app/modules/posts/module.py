@@ -3,9 +3,16 @@
 Provides city board posts related use cases using python-injector.
 """
 
-from injector import Module, provider
+from injector import Module, provider, singleton
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.modules.posts.application.services.post_feed_cache import (
+    PostFeedCache,
+    post_feed_cache,
+)
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
 from app.modules.posts.application.use_cases.accept_interest_use_case import (
     AcceptInterestUseCase,
 )
@@ -37,11 +44,17 @@ from app.modules.posts.application.use_cases.list_posts_v2_use_case import (
 from app.modules.posts.application.use_cases.reject_interest_use_case import (
     RejectInterestUseCase,
 )
+from app.modules.posts.application.use_cases.search_posts_use_case import (
+    SearchPostsUseCase,
+)
 from app.modules.posts.application.use_cases.toggle_like import ToggleLikeUseCase
 from app.modules.posts.application.use_cases.get_post_use_case import GetPostUseCase
 from app.modules.posts.infrastructure.repositories.comment_repository_impl import (
     CommentRepositoryImpl,
 )
+from app.modules.posts.infrastructure.repositories.post_hot_score_repository_impl import (
+    PostHotScoreRepositoryImpl,
+)
 from app.modules.posts.infrastructure.repositories.post_interest_repository_impl import (
     PostInterestRepositoryImpl,
 )
@@ -53,9 +66,11 @@ from app.modules.posts.infrastructure.repositories.post_repository_impl import (
 )
 from app.shared.domain.contracts.i_chat_room_service import IChatRoomService
 from app.shared.domain.contracts.i_friendship_service import IFriendshipService
+from app.shared.domain.contracts.i_profile_query_service import IProfileQueryService
 from app.shared.domain.contracts.i_subscription_query_service import (
     ISubscriptionQueryService,
 )
+from app.shared.infrastructure.database.transaction_hooks import after_commit_of
 
 
 class PostsModule(Module):
@@ -64,14 +79,35 @@ class PostsModule(Module):
     Provides city board posts related dependencies.
     """
 
+    @provider
+    @singleton
+    def provide_post_feed_cache(self) -> PostFeedCache:
+        """Provide the process-wide first-page feed cache."""
+        return post_feed_cache
+
+    @provider
+    def provide_post_hot_score_service(
+        self, session: AsyncSession
+    ) -> PostHotScoreService:
+        """Provide PostHotScoreService bound to the request session."""
+        return PostHotScoreService(PostHotScoreRepositoryImpl(session))
+
     @provider
     def provide_create_post_use_case(
-        self, session: AsyncSession, subscription_query_service: ISubscriptionQueryService
+        self,
+        session: AsyncSession,
+        subscription_query_service: ISubscriptionQueryService,
+        feed_cache: PostFeedCache,
+        hot_score_service: PostHotScoreService,
     ) -> CreatePostUseCase:
         """Provide CreatePostUseCase with dependencies."""
         post_repo = PostRepositoryImpl(session)
         return CreatePostUseCase(
-            post_repository=post_repo, subscription_repository=subscription_query_service
+            post_repository=post_repo,
+            subscription_repository=subscription_query_service,
+            feed_cache=feed_cache,
+            hot_score_service=hot_score_service,
+            after_commit=after_commit_of(session),
         )
 
     @provider
@@ -84,13 +120,15 @@ class PostsModule(Module):
 
     @provider
     def provide_express_interest_use_case(
-        self, session: AsyncSession
+        self, session: AsyncSession, hot_score_service: PostHotScoreService
     ) -> ExpressInterestUseCase:
         """Provide ExpressInterestUseCase with dependencies."""
         post_repo = PostRepositoryImpl(session)
         post_interest_repo = PostInterestRepositoryImpl(session)
         return ExpressInterestUseCase(
-            post_repository=post_repo, post_interest_repository=post_interest_repo
+            post_repository=post_repo,
+            post_interest_repository=post_interest_repo,
+            hot_score_service=hot_score_service,
         )
 
     @provider
@@ -123,10 +161,20 @@ class PostsModule(Module):
         )
 
     @provider
-    def provide_close_post_use_case(self, session: AsyncSession) -> ClosePostUseCase:
+    def provide_close_post_use_case(
+        self,
+        session: AsyncSession,
+        feed_cache: PostFeedCache,
+        hot_score_service: PostHotScoreService,
+    ) -> ClosePostUseCase:
         """Provide ClosePostUseCase with dependencies."""
         post_repo = PostRepositoryImpl(session)
-        return ClosePostUseCase(post_repository=post_repo)
+        return ClosePostUseCase(
+            post_repository=post_repo,
+            feed_cache=feed_cache,
+            hot_score_service=hot_score_service,
+            after_commit=after_commit_of(session),
+        )
 
     @provider
     def provide_list_post_interests_use_case(
@@ -141,24 +189,46 @@ class PostsModule(Module):
 
     @provider
     def provide_list_posts_v2_use_case(
-        self, session: AsyncSession
+        self,
+        session: AsyncSession,
+        feed_cache: PostFeedCache,
+        profile_service: IProfileQueryService,
     ) -> ListPostsV2UseCase:
         """Provide ListPostsV2UseCase with dependencies."""
         post_repo = PostRepositoryImpl(session)
         like_repo = PostLikeRepositoryImpl(session)
         return ListPostsV2UseCase(
-            post_repository=post_repo, like_repository=like_repo, session=session
+            post_repository=post_repo,
+            like_repository=like_repo,
+            profile_service=profile_service,
+            feed_cache=feed_cache,
+            hot_score_repository=PostHotScoreRepositoryImpl(session),
+        )
+
+    @provider
+    def provide_search_posts_use_case(
+        self, session: AsyncSession, profile_service: IProfileQueryService
+    ) -> SearchPostsUseCase:
+        """Provide SearchPostsUseCase with dependencies."""
+        post_repo = PostRepositoryImpl(session)
+        like_repo = PostLikeRepositoryImpl(session)
+        return SearchPostsUseCase(
+            post_repository=post_repo,
+            like_repository=like_repo,
+            profile_service=profile_service,
         )
 
     @provider
     def provide_toggle_like_use_case(
-        self, session: AsyncSession
+        self, session: AsyncSession, hot_score_service: PostHotScoreService
     ) -> ToggleLikeUseCase:
         """Provide ToggleLikeUseCase with dependencies."""
         post_repo = PostRepositoryImpl(session)
         like_repo = PostLikeRepositoryImpl(session)
         return ToggleLikeUseCase(
-            post_repository=post_repo, like_repository=like_repo
+            post_repository=post_repo,
+            like_repository=like_repo,
+            hot_score_service=hot_score_service,
         )
 
     @provider
@@ -171,13 +241,15 @@ class PostsModule(Module):
 
     @provider
     def provide_create_post_comment_use_case(
-        self, session: AsyncSession
+        self, session: AsyncSession, hot_score_service: PostHotScoreService
     ) -> CreatePostCommentUseCase:
         """Provide CreatePostCommentUseCase with dependencies."""
         comment_repo = CommentRepositoryImpl(session)
         post_repo = PostRepositoryImpl(session)
         return CreatePostCommentUseCase(
-            comment_repository=comment_repo, post_repository=post_repo
+            comment_repository=comment_repo,
+            post_repository=post_repo,
+            hot_score_service=hot_score_service,
         )
 
     @provider
@@ -37,6 +37,9 @@ from app.modules.posts.application.use_cases.list_posts_v2_use_case import (
 from app.modules.posts.application.use_cases.reject_interest_use_case import (
     RejectInterestUseCase,
 )
+from app.modules.posts.application.use_cases.search_posts_use_case import (
+    SearchPostsUseCase,
+)
 from app.modules.posts.application.use_cases.toggle_like import ToggleLikeUseCase
 from app.modules.posts.application.use_cases.get_post_use_case import GetPostUseCase
 from app.shared.infrastructure.database.connection import get_db_session
@@ -80,6 +83,17 @@ async def get_list_posts_v2_use_case(
     return child.get(ListPostsV2UseCase)
 
 
+async def get_search_posts_use_case(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    request: Request = None,
+) -> SearchPostsUseCase:
+    """Get SearchPostsUseCase from injector with request-scoped session."""
+    injector = _get_injector(request)
+    child = injector.create_child_injector()
+    child.binder.bind(AsyncSession, to=session)
+    return child.get(SearchPostsUseCase)
+
+
 async def get_express_interest_use_case(
     session: Annotated[AsyncSession, Depends(get_db_session)],
     request: Request = None,
@@ -9,7 +9,6 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.modules.media.infrastructure.repositories.media_repository_impl import (
     MediaRepositoryImpl,
@@ -27,9 +26,13 @@ from app.modules.posts.application.use_cases.list_post_comments_use_case import
 )
 from app.modules.posts.application.use_cases.list_posts_v2_use_case import (
     ListPostsV2UseCase,
+    PostListPage,
+)
+from app.modules.posts.application.use_cases.search_posts_use_case import (
+    SearchPostsUseCase,
 )
 from app.modules.posts.application.use_cases.toggle_like import ToggleLikeUseCase
-from app.modules.posts.domain.entities.post_enums import PostCategory
+from app.modules.posts.domain.entities.post_enums import PostCategory, PostSort
 from app.modules.posts.presentation.dependencies.use_case_deps import (
     get_close_post_use_case,
     get_create_post_comment_use_case,
@@ -37,6 +40,7 @@ from app.modules.posts.presentation.dependencies.use_case_deps import (
     get_get_post_use_case,
     get_list_post_comments_use_case,
     get_list_posts_v2_use_case,
+    get_search_posts_use_case,
     get_toggle_like_use_case,
 )
 from app.modules.posts.presentation.schemas.comment_schemas import (
@@ -64,20 +68,15 @@ from app.shared.presentation.exceptions.api_exceptions import (
     UnprocessableEntityException,
 )
 from app.shared.presentation.deps.require_user import require_user
-from app.modules.social.infrastructure.repositories.friendship_repository_impl import (
-    FriendshipRepositoryImpl,
-)
-from app.modules.social.infrastructure.repositories.message_request_repository import (
-    MessageRequestRepository,
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
 )
-from app.modules.social.infrastructure.repositories.thread_repository import (
-    ThreadRepository,
+from app.shared.presentation.dependencies.services import get_profile_summary_loader
+from app.modules.social.infrastructure.services.relationship_query_service_impl import (
+    RelationshipQueryServiceImpl,
 )
-from app.modules.identity.infrastructure.repositories.profile_repository_impl import (
-    ProfileRepositoryImpl,
-)
-from app.modules.identity.infrastructure.database.models.profile_model import (
-    ProfileModel,
+from app.shared.domain.contracts.i_relationship_query_service import (
+    RelationshipStateDTO,
 )
 
 logger = logging.getLogger(__name__)
@@ -101,50 +100,25 @@ async def _calculate_can_message(
     - Not blocked by either user
     - Owner allows stranger messages OR users are already friends
     """
-    # Rule 1: Cannot message own posts
-    if current_user_id == post_owner_id:
-        return False
+    result = await _calculate_can_message_batch(
+        current_user_id, [(post_owner_id, post_owner_id)], session
+    )
+    return result[post_owner_id]
 
-    friendship_repo = FriendshipRepositoryImpl(session)
-    message_request_repo = MessageRequestRepository(session)
-    thread_repo = ThreadRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
 
-    # Rule 2: Check if thread already exists
-    existing_thread = await thread_repo.find_by_users(current_user_id, post_owner_id)
-    if existing_thread:
+def _can_message_from_state(state: Optional[RelationshipStateDTO]) -> bool:
+    """Apply the can_message rules 2-5 to a relationship state."""
+    if state is None:
         return False
 
-    # Rule 3: Check if pending message request exists
-    pending_request = await message_request_repo.find_pending_between_users(
-        current_user_id, post_owner_id
-    )
-    if pending_request:
+    # Rule 2: No existing thread / Rule 3: No pending request / Rule 4: Not blocked
+    if state.has_thread or state.has_pending_request or state.is_blocked:
         return False
 
-    # Rule 4: Check if blocked (either direction)
-    is_blocked_by_owner = await friendship_repo.is_blocked(
-        current_user_id, post_owner_id
-    )
-    is_blocking_owner = await friendship_repo.is_blocked(post_owner_id, current_user_id)
-    if is_blocked_by_owner or is_blocking_owner:
+    # Rule 5: Owner needs a profile; friends or stranger chat allowed
+    if state.allow_stranger_chat is None:
         return False
-
-    # Rule 5: Check privacy settings and friendship status
-    # Get owner's profile to check allow_stranger_chat
-    owner_profile = await profile_repo.get_by_user_id(UUID(post_owner_id))
-    if not owner_profile:
-        # If no profile found, default to not allowing messages
-        return False
-
-    # Check if users are already friends
-    are_friends = await friendship_repo.are_friends(current_user_id, post_owner_id)
-
-    # Allow if owner allows stranger chat OR users are already friends
-    allow_stranger_chat = owner_profile.privacy_flags.get("allow_stranger_chat", True)
-    can_message = are_friends or allow_stranger_chat
-
-    return can_message
+    return state.is_friend or state.allow_stranger_chat
 
 
 async def _calculate_can_message_batch(
@@ -154,115 +128,59 @@ async def _calculate_can_message_batch(
 ) -> dict[str, bool]:
     """
     Batch calculate can_message for multiple posts to avoid N+1 queries.
-    
+
+    Relationship state is read for the distinct post owners only, in a single
+    query, independent of how many threads or friendships the viewer has.
+
     Returns a dict mapping post_id to can_message boolean.
     """
     result = {}
     owner_ids = set()
-    
-    # First pass: Check own posts
+
+    # First pass: Check own posts (Rule 1)
     for post_id, owner_id in posts_with_owner_ids:
         if current_user_id == owner_id:
             result[post_id] = False
         else:
             owner_ids.add(owner_id)
-    
+
     # If all posts are own posts, return early
     if not owner_ids:
         return result
-    
-    # Initialize repositories
-    friendship_repo = FriendshipRepositoryImpl(session)
-    message_request_repo = MessageRequestRepository(session)
-    thread_repo = ThreadRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
-    
-    # Batch fetch threads for current user
-    # Note: Using a high limit (10000) as a pragmatic approach. In practice, most users
-    # will have far fewer threads. If this becomes an issue, we can add a targeted query
-    # to check specific thread existence or implement streaming/pagination.
-    threads = await thread_repo.get_threads_for_user(current_user_id, limit=10000)
-    thread_user_ids = set()
-    for thread in threads:
-        if thread.user_a_id == current_user_id:
-            thread_user_ids.add(thread.user_b_id)
-        else:
-            thread_user_ids.add(thread.user_a_id)
-    
-    # Batch fetch pending requests (both sent and received)
-    sent_requests = await message_request_repo.get_requests_for_sender(
-        current_user_id
-    )
-    received_requests = await message_request_repo.get_requests_for_recipient(
-        current_user_id
+
+    relationship_service = RelationshipQueryServiceImpl(session)
+    states = await relationship_service.get_relationship_states(
+        UUID(current_user_id), [UUID(owner_id) for owner_id in owner_ids]
     )
-    pending_user_ids = set()
-    for req in sent_requests + received_requests:
-        if req.status.value == "pending":
-            other_id = (
-                req.recipient_id if req.sender_id == current_user_id else req.sender_id
-            )
-            pending_user_ids.add(other_id)
-    
-    # Batch fetch friendships to check blocks and friend status
-    friendships = await friendship_repo.get_friends_by_user_id(current_user_id)
-    blocked_user_ids = set()
-    friend_user_ids = set()
-    for friendship in friendships:
-        other_id = (
-            friendship.friend_id
-            if friendship.user_id == current_user_id
-            else friendship.user_id
-        )
-        if friendship.status.value == "blocked":
-            blocked_user_ids.add(other_id)
-        elif friendship.status.value == "accepted":
-            friend_user_ids.add(other_id)
-    
-    # Batch fetch profiles for privacy settings using a single query
-    profiles = {}
-    if owner_ids:
-        owner_uuids = [UUID(oid) for oid in owner_ids]
-        profiles_query_result = await session.execute(
-            select(ProfileModel).where(ProfileModel.user_id.in_(owner_uuids))
-        )
-        profile_models = profiles_query_result.scalars().all()
-        for model in profile_models:
-            profiles[str(model.user_id)] = ProfileRepositoryImpl._to_entity(model)
-    
+
     # Second pass: Calculate can_message for non-own posts
     for post_id, owner_id in posts_with_owner_ids:
         if post_id in result:  # Already determined (own post)
             continue
-        
-        # Rule 2: No existing thread
-        if owner_id in thread_user_ids:
-            result[post_id] = False
-            continue
-        
-        # Rule 3: No pending request
-        if owner_id in pending_user_ids:
-            result[post_id] = False
-            continue
-        
-        # Rule 4: Not blocked
-        if owner_id in blocked_user_ids:
-            result[post_id] = False
-            continue
-        
-        # Rule 5: Check privacy and friendship
-        profile = profiles.get(owner_id)
-        if not profile:
-            result[post_id] = False
-            continue
-        
-        is_friend = owner_id in friend_user_ids
-        allow_stranger_chat = profile.privacy_flags.get("allow_stranger_chat", True)
-        result[post_id] = is_friend or allow_stranger_chat
-    
+        result[post_id] = _can_message_from_state(states.get(UUID(owner_id)))
+
     return result
 
 
+async def _fetch_media_asset_ids_batch(
+    post_ids: list[str],
+    session: AsyncSession,
+) -> dict[str, List[UUID]]:
+    """
+    Batch fetch attached media asset IDs for multiple posts in one query.
+
+    Returns a dict mapping post_id to its media asset IDs (empty list if none).
+    """
+    media_repo = MediaRepositoryImpl(session)
+    media_by_target = await media_repo.get_by_targets(
+        "post", [UUID(post_id) for post_id in post_ids]
+    )
+    return {
+        post_id: [media.id for media in media_by_target.get(UUID(post_id), [])]
+        for post_id in post_ids
+    }
+
+
 @router.get(
     "/categories",
     response_model=PostCategoryListResponseWrapper,
@@ -300,12 +218,17 @@ async def _post_to_response(
     media_asset_ids: Optional[List[UUID]] = None,
     owner_nickname: Optional[str] = None,
     owner_avatar_url: Optional[str] = None,
+    owner_resolved: bool = False,
 ) -> PostResponse:
     """Helper to convert Post entity to PostResponse with media_asset_ids and owner info.
 
     Phase 9: Includes media_asset_ids for image display.
     Includes owner_nickname and owner_avatar_url from profile.
     Includes can_message flag to control "Message Author" button visibility.
+
+    List endpoints pass media_asset_ids and owner_resolved=True after batch
+    hydration so no per-post query is issued (an owner without nickname or
+    avatar would otherwise trigger the profile fallback).
     """
     # If media_asset_ids not provided, fetch from database
     if media_asset_ids is None:
@@ -314,7 +237,7 @@ async def _post_to_response(
         media_asset_ids = [media.id for media in media_list]
 
     # If owner info not provided, fetch from profile
-    if owner_nickname is None or owner_avatar_url is None:
+    if not owner_resolved and (owner_nickname is None or owner_avatar_url is None):
         from sqlalchemy import select
         from app.modules.identity.infrastructure.database.models.profile_model import (
             ProfileModel,
@@ -426,6 +349,52 @@ async def create_post(
         )
 
 
+async def _build_post_list_response(
+    page: PostListPage,
+    current_user_id: UUID,
+    session: AsyncSession,
+) -> PostListResponse:
+    """Render a page of hydrated posts with batched can_message and media lookups"""
+    posts_with_likes = page.posts
+
+    # Batch calculate can_message for all posts
+    posts_with_owner_ids = [(pwl.post.id, pwl.post.owner_id) for pwl in posts_with_likes]
+    can_message_map = await _calculate_can_message_batch(
+        str(current_user_id),
+        posts_with_owner_ids,
+        session,
+    )
+
+    # Batch fetch media for the whole page
+    media_map = await _fetch_media_asset_ids_batch(
+        [pwl.post.id for pwl in posts_with_likes],
+        session,
+    )
+
+    # Build responses from the batched data; owners were resolved by the use case
+    post_responses = []
+    for pwl in posts_with_likes:
+        can_message = can_message_map.get(pwl.post.id, False)
+        post_response = await _post_to_response(
+            pwl.post,
+            session,
+            like_count=pwl.like_count,
+            liked_by_me=pwl.liked_by_me,
+            can_message=can_message,
+            media_asset_ids=media_map.get(pwl.post.id, []),
+            owner_nickname=pwl.owner_nickname,
+            owner_avatar_url=pwl.owner_avatar_url,
+            owner_resolved=True,
+        )
+        post_responses.append(post_response)
+
+    return PostListResponse(
+        posts=post_responses,
+        total=len(post_responses),
+        next_cursor=page.next_cursor,
+    )
+
+
 @router.get(
     "",
     response_model=PostListResponseWrapper,
@@ -450,60 +419,108 @@ async def list_posts(
     ] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum results")] = 50,
     offset: Annotated[int, Query(ge=0, description="Pagination offset")] = 0,
+    cursor: Annotated[
+        Optional[str],
+        Query(description="Opaque cursor from next_cursor; takes precedence over offset"),
+    ] = None,
+    sort: Annotated[
+        PostSort,
+        Query(description="latest = newest first; hot = trending by recent likes, comments and interests"),
+    ] = PostSort.LATEST,
 ) -> PostListResponseWrapper:
     """
     List posts (V2: supports global/city filtering).
 
     FR-005:
     - Global view (city_code=None): shows all posts (scope=global + scope=city)
-    - City view (city_code provided): shows only posts for that city
+    - City view (city_code provided): shows only posts for that city (city board)
 
     Only shows posts with status=open and not expired.
-    Results ordered by created_at DESC (newest first).
+    Results ordered by created_at DESC (newest first), or by hot score with
+    sort=hot. Cursors are only valid for the sort that produced them.
+    Pass the returned next_cursor as `cursor` to fetch the following page.
     """
     try:
-        posts_with_likes = await use_case.execute(
+        page = await use_case.execute(
             current_user_id=str(current_user_id),
             city_code=city_code,
             category=category,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            sort=sort,
         )
+        data = await _build_post_list_response(page, current_user_id, session)
+        return PostListResponseWrapper(data=data, meta=None, error=None)
 
-        # Batch calculate can_message for all posts
-        posts_with_owner_ids = [(pwl.post.id, pwl.post.owner_id) for pwl in posts_with_likes]
-        can_message_map = await _calculate_can_message_batch(
-            str(current_user_id),
-            posts_with_owner_ids,
-            session,
+    except ValueError as e:
+        logger.warning(f"Post list validation failed: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error listing posts: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list posts",
         )
 
-        # Build responses with calculated can_message values
-        post_responses = []
-        for pwl in posts_with_likes:
-            can_message = can_message_map.get(pwl.post.id, False)
-            post_response = await _post_to_response(
-                pwl.post,
-                session,
-                like_count=pwl.like_count,
-                liked_by_me=pwl.liked_by_me,
-                can_message=can_message,
-                owner_nickname=pwl.owner_nickname,
-                owner_avatar_url=pwl.owner_avatar_url,
-            )
-            post_responses.append(post_response)
 
-        data = PostListResponse(posts=post_responses, total=len(post_responses))
+@router.get(
+    "/search",
+    response_model=PostListResponseWrapper,
+    responses={
+        200: {"description": "Search results retrieved successfully"},
+        401: {"description": "Unauthorized (not logged in)"},
+        400: {"description": "Bad request"},
+        500: {"description": "Internal server error"},
+    },
+    summary="Search posts",
+    description="Full-text search over title, content, idol and idol group, tolerant of misspelled idol names. Results are ranked by relevance and paginated by cursor.",
+)
+async def search_posts(
+    current_user_id: Annotated[UUID, Depends(require_user)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    use_case: Annotated[SearchPostsUseCase, Depends(get_search_posts_use_case)],
+    q: Annotated[
+        str, Query(min_length=2, max_length=100, description="Search text")
+    ],
+    city_code: Annotated[
+        Optional[str], Query(description="Optional city filter (omit for global view)")
+    ] = None,
+    category: Annotated[
+        Optional[PostCategory], Query(description="Optional category filter")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50, description="Maximum results")] = 20,
+    cursor: Annotated[
+        Optional[str], Query(description="Opaque cursor from next_cursor")
+    ] = None,
+) -> PostListResponseWrapper:
+    """
+    Search open posts.
+
+    Same filters and item shape as GET /posts; results ordered by relevance
+    (idol/group matches first), then newest first.
+    Pass the returned next_cursor as `cursor` to fetch the following page.
+    """
+    try:
+        page = await use_case.execute(
+            query=q,
+            current_user_id=str(current_user_id),
+            city_code=city_code,
+            category=category,
+            limit=limit,
+            cursor=cursor,
+        )
+        data = await _build_post_list_response(page, current_user_id, session)
         return PostListResponseWrapper(data=data, meta=None, error=None)
 
     except ValueError as e:
-        logger.warning(f"Post list validation failed: {e}")
+        logger.warning(f"Post search validation failed: {e}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Error listing posts: {e}", exc_info=True)
+        logger.error(f"Error searching posts: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to list posts",
+            detail="Failed to search posts",
         )
 
 
@@ -703,7 +720,7 @@ async def list_post_comments(
     use_case: Annotated[
         ListPostCommentsUseCase, Depends(get_list_post_comments_use_case)
     ],
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    profiles: Annotated[ProfileSummaryLoader, Depends(get_profile_summary_loader)],
     limit: int = Query(
         50, ge=1, le=100, description="Maximum number of comments to return"
     ),
@@ -722,36 +739,24 @@ async def list_post_comments(
             offset=offset,
         )
 
-        # Fetch user profiles for all commenters
-        from sqlalchemy import select
-        from app.modules.identity.infrastructure.database.models.profile_model import (
-            ProfileModel,
-        )
-
-        user_ids = [UUID(comment.user_id) for comment in comments]
-        if user_ids:
-            result = await session.execute(
-                select(
-                    ProfileModel.user_id, ProfileModel.nickname, ProfileModel.avatar_url
-                ).where(ProfileModel.user_id.in_(user_ids))
-            )
-            profiles = {row[0]: (row[1], row[2]) for row in result.all()}
-        else:
-            profiles = {}
-
-        comment_responses = [
-            CommentResponse(
-                id=UUID(comment.id),
-                post_id=UUID(comment.post_id),
-                user_id=UUID(comment.user_id),
-                user_nickname=profiles.get(UUID(comment.user_id), (None, None))[0],
-                user_avatar_url=profiles.get(UUID(comment.user_id), (None, None))[1],
-                content=comment.content,
-                created_at=comment.created_at,
-                updated_at=comment.updated_at,
+        # Fetch user profiles for all commenters (one lookup, mostly cached)
+        await profiles.load_many(comment.user_id for comment in comments)
+
+        comment_responses = []
+        for comment in comments:
+            commenter = await profiles.load(comment.user_id)
+            comment_responses.append(
+                CommentResponse(
+                    id=UUID(comment.id),
+                    post_id=UUID(comment.post_id),
+                    user_id=UUID(comment.user_id),
+                    user_nickname=commenter.nickname if commenter else None,
+                    user_avatar_url=commenter.avatar_url if commenter else None,
+                    content=comment.content,
+                    created_at=comment.created_at,
+                    updated_at=comment.updated_at,
+                )
             )
-            for comment in comments
-        ]
 
         data = CommentListResponse(comments=comment_responses, total=total)
         return CommentListResponseWrapper(data=data, meta=None, error=None)
@@ -146,6 +146,9 @@ class PostListResponse(BaseModel):
 
     posts: List[PostResponse] = Field(..., description="List of posts")
     total: int = Field(..., description="Total number of posts")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (null when there are no more posts)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -168,6 +171,7 @@ class PostListResponse(BaseModel):
                     }
                 ],
                 "total": 1,
+                "next_cursor": None,
             }
         }
 
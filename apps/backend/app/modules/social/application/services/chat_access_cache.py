@@ -0,0 +1,95 @@
+"""Chat Access Cache - Short-lived cache of chat authorization facts.
+
+Every message poll re-checks that the room exists, that the caller takes
+part in it, and that the two participants are friends and not blocked.
+Participants poll every few seconds, so GetMessagesUseCase keeps these
+answers here for a few seconds and a warm poll only runs the message query.
+
+Each worker holds its own copy: BlockUserUseCase, UnblockUserUseCase and
+friendship changes invalidate the pair locally once their transaction
+commits, other workers pick the change up once their entry expires.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from app.config import settings
+from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
+from app.shared.infrastructure.cache.ttl_cache import TTLCache
+
+
+class ChatAccessCache:
+    """
+    LRU + TTL cache of chat rooms and pair relationships, with hit-rate stats
+
+    Rooms never change participants, so only existing rooms are cached.
+    Pair state is seen from one side (blocking is one-sided) and keyed by
+    (viewer_id, other_user_id); invalidating a pair drops both directions.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self._rooms: TTLCache[str, ChatRoom] = TTLCache(
+            ttl_seconds=ttl_seconds, max_entries=max_entries
+        )
+        self._pairs: TTLCache[Tuple[str, str], FriendshipPairState] = TTLCache(
+            ttl_seconds=ttl_seconds, max_entries=max_entries
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get_room(self, room_id: str) -> Optional[ChatRoom]:
+        """Return the cached room, or None on a miss"""
+        return self._count(self._rooms.get(str(room_id)))
+
+    def set_room(self, room: ChatRoom) -> None:
+        """Store a freshly loaded room"""
+        self._rooms.set(str(room.id), room)
+
+    def get_pair(
+        self, viewer_id: str, other_user_id: str
+    ) -> Optional[FriendshipPairState]:
+        """Return the cached state as seen by viewer_id, or None on a miss"""
+        return self._count(self._pairs.get((str(viewer_id), str(other_user_id))))
+
+    def set_pair(self, viewer_id: str, state: FriendshipPairState) -> None:
+        """Store a freshly loaded state as seen by viewer_id"""
+        self._pairs.set((str(viewer_id), str(state.user_id)), state)
+
+    def invalidate_pair(self, user_id: str, other_user_id: str) -> None:
+        """Drop both directions of a pair after their friendship changed"""
+        self._pairs.delete((str(user_id), str(other_user_id)))
+        self._pairs.delete((str(other_user_id), str(user_id)))
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        self._rooms.clear()
+        self._pairs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters since start (or the last clear) and current sizes"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "rooms": len(self._rooms),
+            "pairs": len(self._pairs),
+        }
+
+    def _count(self, value):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+
+# Process-wide instance shared by all requests
+chat_access_cache = ChatAccessCache(
+    ttl_seconds=settings.CHAT_ACCESS_CACHE_TTL_SECONDS,
+    max_entries=settings.CHAT_ACCESS_CACHE_MAX_ENTRIES,
+)
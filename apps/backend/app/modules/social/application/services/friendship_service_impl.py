@@ -9,6 +9,9 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
 from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
 from app.modules.social.domain.repositories.i_friendship_repository import (
     IFriendshipRepository,
@@ -18,6 +21,7 @@ from app.shared.domain.contracts.i_friendship_service import (
     FriendshipStatusDTO,
     IFriendshipService,
 )
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 
 
 class FriendshipServiceImpl(IFriendshipService):
@@ -27,8 +31,15 @@ class FriendshipServiceImpl(IFriendshipService):
     Provides friendship management functionality for other bounded contexts.
     """
 
-    def __init__(self, friendship_repository: IFriendshipRepository):
+    def __init__(
+        self,
+        friendship_repository: IFriendshipRepository,
+        access_cache: Optional[ChatAccessCache] = None,
+        after_commit: AfterCommit = run_now,
+    ):
         self.friendship_repository = friendship_repository
+        self.access_cache = access_cache
+        self.after_commit = after_commit
 
     def _to_dto(self, friendship: Friendship) -> FriendshipDTO:
         """Convert domain entity to DTO."""
@@ -86,4 +97,9 @@ class FriendshipServiceImpl(IFriendshipService):
         )
 
         created = await self.friendship_repository.create(friendship)
+        if self.access_cache:
+            access_cache = self.access_cache
+            self.after_commit(
+                lambda: access_cache.invalidate_pair(str(user_id), str(friend_id))
+            )
         return self._to_dto(created)
@@ -1,9 +1,11 @@
 """Chat use cases"""
 
 from .get_messages_use_case import GetMessagesUseCase
+from .mark_rooms_read_use_case import MarkRoomsReadUseCase
 from .send_message_use_case import SendMessageUseCase
 
 __all__ = [
     "SendMessageUseCase",
     "GetMessagesUseCase",
+    "MarkRoomsReadUseCase",
 ]
@@ -2,6 +2,13 @@
 
 from typing import List, Optional
 
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
+from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 from app.modules.social.domain.entities.message import Message
 from app.modules.social.domain.repositories.i_chat_room_repository import (
     IChatRoomRepository,
@@ -12,6 +19,7 @@ from app.modules.social.domain.repositories.i_friendship_repository import (
 from app.modules.social.domain.repositories.i_message_repository import (
     IMessageRepository,
 )
+from app.shared.domain.keyset_cursor import decode_window_cursors
 
 
 class GetMessagesUseCase:
@@ -25,14 +33,18 @@ class GetMessagesUseCase:
     - Returns messages in ascending order by created_at
 
     Polling Mechanism:
-    - Client provides after_message_id to get only new messages
-    - If after_message_id is None, returns recent messages (up to limit)
-    - Recommended polling interval: 3-5 seconds when chat screen is active
-    - Client should implement backoff to avoid excessive API calls
+    - Without a cursor, returns the most recent messages (up to limit)
+    - `before` cursors page back through older history
+    - `after` cursors (or the legacy after_message_id) return only new messages
+    - Prefer the realtime stream (/realtime/ws or /realtime/events) while the
+      chat screen is open; poll only to catch up after (re)connecting
+    - Clients that must poll should back off to avoid excessive API calls
+    - With an access_cache, the room and friendship checks are reused for a
+      few seconds, so a warm poll costs only the message query
 
     Message Retention:
     - Messages are retained for 30 days on server (FR-CHAT-006)
-    - Cleanup job implementation is deferred (T125A)
+    - Expired months are dropped by MessagePartitionMaintenanceJob (T125A)
     """
 
     def __init__(
@@ -40,10 +52,12 @@ class GetMessagesUseCase:
         message_repository: IMessageRepository,
         chat_room_repository: IChatRoomRepository,
         friendship_repository: IFriendshipRepository,
+        access_cache: Optional[ChatAccessCache] = None,
     ):
         self.message_repository = message_repository
         self.chat_room_repository = chat_room_repository
         self.friendship_repository = friendship_repository
+        self.access_cache = access_cache
 
     async def execute(
         self,
@@ -51,6 +65,8 @@ class GetMessagesUseCase:
         requesting_user_id: str,
         after_message_id: Optional[str] = None,
         limit: int = 50,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
     ) -> List[Message]:
         """
         Get messages for a chat room with optional cursor-based pagination
@@ -58,17 +74,22 @@ class GetMessagesUseCase:
         Args:
             room_id: ID of the chat room
             requesting_user_id: ID of the user requesting messages
-            after_message_id: Optional cursor - return messages after this ID
+            after_message_id: Legacy cursor - return messages after this ID
             limit: Maximum number of messages to return (default 50)
+            before: Opaque cursor - return messages older than this one
+            after: Opaque cursor - return messages newer than this one
 
         Returns:
             List of Message entities ordered by created_at ascending
 
         Raises:
-            ValueError: If user not authorized or chat room doesn't exist
+            ValueError: If a cursor is invalid, user not authorized or chat
+                room doesn't exist
         """
+        before_cursor, after_cursor = decode_window_cursors(before, after)
+
         # Verify chat room exists
-        chat_room = await self.chat_room_repository.get_by_id(room_id)
+        chat_room = await self._get_room(room_id)
         if not chat_room:
             raise ValueError("Chat room not found")
 
@@ -80,19 +101,44 @@ class GetMessagesUseCase:
         other_participant_id = chat_room.get_other_participant(requesting_user_id)
 
         # Verify users are still friends and not blocked
-        if not await self.friendship_repository.are_friends(
-            requesting_user_id, other_participant_id
-        ):
+        pair = await self._get_pair_state(requesting_user_id, other_participant_id)
+        if not pair.are_friends:
             raise ValueError("Users must be friends to access messages")
 
-        if await self.friendship_repository.is_blocked(
-            requesting_user_id, other_participant_id
-        ):
+        if pair.blocked_by_them:
             raise ValueError("Cannot access messages - user is blocked")
 
         # Get messages with cursor-based pagination
         messages = await self.message_repository.get_messages_by_room_id(
-            room_id=room_id, after_message_id=after_message_id, limit=limit
+            room_id=room_id,
+            after_message_id=after_message_id,
+            limit=limit,
+            before=before_cursor,
+            after=after_cursor,
         )
 
         return messages
+
+    async def _get_room(self, room_id: str) -> Optional[ChatRoom]:
+        if self.access_cache:
+            chat_room = self.access_cache.get_room(room_id)
+            if chat_room:
+                return chat_room
+
+        chat_room = await self.chat_room_repository.get_by_id(room_id)
+        if chat_room and self.access_cache:
+            self.access_cache.set_room(chat_room)
+        return chat_room
+
+    async def _get_pair_state(
+        self, user_id: str, other_user_id: str
+    ) -> FriendshipPairState:
+        if self.access_cache:
+            pair = self.access_cache.get_pair(user_id, other_user_id)
+            if pair:
+                return pair
+
+        pair = await self.friendship_repository.get_pair_state(user_id, other_user_id)
+        if self.access_cache:
+            self.access_cache.set_pair(user_id, pair)
+        return pair
@@ -0,0 +1,41 @@
+"""Mark Chat Rooms as Read Use Case"""
+
+from typing import Dict, Optional
+
+from app.modules.social.domain.repositories.i_message_repository import (
+    IMessageRepository,
+)
+
+
+class MarkRoomsReadUseCase:
+    """
+    Use case for acknowledging read receipts of several chat rooms at once
+
+    Business Rules:
+    - Only messages received by the user are marked (never their own)
+    - Rooms the user is not a participant of are left untouched
+    - A receipt marks the room up to and including its message, or the
+      whole room when it names none
+
+    Clients batch receipts (e.g. when leaving the chat list or coming back
+    online); all of them are applied by one UPDATE, so they commit together.
+    """
+
+    def __init__(self, message_repository: IMessageRepository):
+        self.message_repository = message_repository
+
+    async def execute(
+        self, user_id: str, receipts: Dict[str, Optional[str]]
+    ) -> Dict[str, int]:
+        """
+        Apply read receipts
+
+        Args:
+            user_id: ID of the reading user
+            receipts: Room ID -> last message read (None for the whole room)
+
+        Returns:
+            Number of messages marked as read for every room in receipts
+        """
+        marked = await self.message_repository.mark_rooms_as_read(user_id, receipts)
+        return {room_id: marked.get(room_id, 0) for room_id in receipts}
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from app.modules.social.domain.entities.message import Message, MessageStatus
 from app.modules.social.domain.repositories.i_chat_room_repository import (
@@ -13,6 +14,9 @@ from app.modules.social.domain.repositories.i_friendship_repository import (
 from app.modules.social.domain.repositories.i_message_repository import (
     IMessageRepository,
 )
+from app.modules.social.domain.services.i_message_event_publisher import (
+    IMessageEventPublisher,
+)
 
 
 class SendMessageUseCase:
@@ -24,6 +28,12 @@ class SendMessageUseCase:
     - Users cannot send messages if either has blocked the other
     - Chat room must exist
     - Message triggers FCM push notification (handled by presentation layer)
+    - Connected participants get the message in realtime once the
+      transaction commits (via the optional event publisher)
+
+    The rules are enforced by the insert itself (one round trip per send);
+    the individual checks only run after a refused send, to report which
+    rule failed.
 
     Note: FCM notification triggering is handled after successful message creation
     in the presentation layer (router), not in this use case. This keeps the
@@ -35,10 +45,12 @@ class SendMessageUseCase:
         message_repository: IMessageRepository,
         chat_room_repository: IChatRoomRepository,
         friendship_repository: IFriendshipRepository,
+        event_publisher: Optional[IMessageEventPublisher] = None,
     ):
         self.message_repository = message_repository
         self.chat_room_repository = chat_room_repository
         self.friendship_repository = friendship_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, room_id: str, sender_id: str, content: str) -> Message:
         """
@@ -55,6 +67,27 @@ class SendMessageUseCase:
         Raises:
             ValueError: If chat room doesn't exist, user not authorized, or blocked
         """
+        message = Message(
+            id=str(uuid.uuid4()),
+            room_id=room_id,
+            sender_id=sender_id,
+            content=content,
+            status=MessageStatus.SENT,
+            created_at=datetime.utcnow(),
+        )
+
+        sent = await self.message_repository.create_in_room(message)
+        if sent is None:
+            await self._raise_refusal(room_id, sender_id)
+        created_message, chat_room = sent
+
+        if self.event_publisher:
+            await self.event_publisher.publish_chat_message(chat_room, created_message)
+
+        return created_message
+
+    async def _raise_refusal(self, room_id: str, sender_id: str) -> None:
+        """Raise the ValueError for the first business rule the send broke"""
         # Verify chat room exists
         chat_room = await self.chat_room_repository.get_by_id(room_id)
         if not chat_room:
@@ -68,20 +101,12 @@ class SendMessageUseCase:
         recipient_id = chat_room.get_other_participant(sender_id)
 
         # Verify users are friends and not blocked
-        if not await self.friendship_repository.are_friends(sender_id, recipient_id):
+        pair = await self.friendship_repository.get_pair_state(sender_id, recipient_id)
+        if not pair.are_friends:
             raise ValueError("Users must be friends to send messages")
 
-        if await self.friendship_repository.is_blocked(sender_id, recipient_id):
+        if pair.blocked_by_them:
             raise ValueError("Cannot send message - user is blocked")
 
-        # Create message
-        message = Message(
-            id=str(uuid.uuid4()),
-            room_id=room_id,
-            sender_id=sender_id,
-            content=content,
-            status=MessageStatus.SENT,
-            created_at=datetime.utcnow(),
-        )
-
-        return await self.message_repository.create(message)
+        # The friendship changed between the insert and these checks
+        raise ValueError("Message could not be sent, please retry")
@@ -2,7 +2,11 @@
 
 import uuid
 from datetime import datetime
+from typing import Optional
 
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
 from app.modules.social.domain.entities.chat_room import ChatRoom
 from app.modules.social.domain.repositories.i_chat_room_repository import (
     IChatRoomRepository,
@@ -10,6 +14,7 @@ from app.modules.social.domain.repositories.i_chat_room_repository import (
 from app.modules.social.domain.repositories.i_friendship_repository import (
     IFriendshipRepository,
 )
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 
 
 class AcceptFriendRequestUseCase:
@@ -20,15 +25,20 @@ class AcceptFriendRequestUseCase:
     - Only the recipient of the request can accept it
     - Request must be in pending status
     - Automatically creates a chat room for the two friends
+    - Cached chat access for the pair is invalidated once the change commits
     """
 
     def __init__(
         self,
         friendship_repository: IFriendshipRepository,
         chat_room_repository: IChatRoomRepository,
+        access_cache: Optional[ChatAccessCache] = None,
+        after_commit: AfterCommit = run_now,
     ):
         self.friendship_repository = friendship_repository
         self.chat_room_repository = chat_room_repository
+        self.access_cache = access_cache
+        self.after_commit = after_commit
 
     async def execute(self, friendship_id: str, accepting_user_id: str) -> tuple:
         """
@@ -63,6 +73,13 @@ class AcceptFriendRequestUseCase:
         # Accept the friendship
         friendship.accept()
         updated_friendship = await self.friendship_repository.update(friendship)
+        if self.access_cache:
+            access_cache = self.access_cache
+            self.after_commit(
+                lambda: access_cache.invalidate_pair(
+                    friendship.user_id, friendship.friend_id
+                )
+            )
 
         # Create chat room for the two friends (if doesn't exist)
         existing_room = await self.chat_room_repository.get_by_participants(
@@ -2,11 +2,16 @@
 
 import uuid
 from datetime import datetime
+from typing import Optional
 
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
 from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
 from app.modules.social.domain.repositories.i_friendship_repository import (
     IFriendshipRepository,
 )
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 
 
 class BlockUserUseCase:
@@ -17,11 +22,21 @@ class BlockUserUseCase:
     - User can block any other user
     - Blocking prevents all future interactions (friend requests, messages, trades)
     - If existing friendship exists, it's converted to blocked status
+    - Both users may block each other; each block is recorded separately
     - User cannot block themselves
+    - Cached chat access for the pair is invalidated once the block commits,
+      so polls on this worker stop at once
     """
 
-    def __init__(self, friendship_repository: IFriendshipRepository):
+    def __init__(
+        self,
+        friendship_repository: IFriendshipRepository,
+        access_cache: Optional[ChatAccessCache] = None,
+        after_commit: AfterCommit = run_now,
+    ):
         self.friendship_repository = friendship_repository
+        self.access_cache = access_cache
+        self.after_commit = after_commit
 
     async def execute(self, blocker_user_id: str, blocked_user_id: str) -> Friendship:
         """
@@ -48,8 +63,8 @@ class BlockUserUseCase:
 
         if existing_friendship:
             # Update existing friendship to blocked
-            existing_friendship.block()
-            return await self.friendship_repository.update(existing_friendship)
+            existing_friendship.block(blocker_user_id)
+            blocked = await self.friendship_repository.update(existing_friendship)
         else:
             # Create new blocked relationship
             # Note: blocker_user_id is the initiator who blocks
@@ -60,4 +75,15 @@ class BlockUserUseCase:
                 status=FriendshipStatus.BLOCKED,
                 created_at=datetime.utcnow(),
             )
-            return await self.friendship_repository.create(friendship)
+            blocked = await self.friendship_repository.create(friendship)
+            if blocked.id != friendship.id:
+                # A request for this pair was created concurrently; block it
+                blocked.block(blocker_user_id)
+                blocked = await self.friendship_repository.update(blocked)
+
+        if self.access_cache:
+            access_cache = self.access_cache
+            self.after_commit(
+                lambda: access_cache.invalidate_pair(blocker_user_id, blocked_user_id)
+            )
+        return blocked
@@ -40,21 +40,16 @@ class SendFriendRequestUseCase:
         if user_id == friend_id:
             raise ValueError("Cannot send friend request to yourself")
 
-        # Check if friendship already exists (any direction)
-        existing_friendship = await self.friendship_repository.get_by_users(
-            user_id, friend_id
-        )
-
-        if existing_friendship:
-            if existing_friendship.is_accepted():
-                raise ValueError("Users are already friends")
-            elif existing_friendship.is_pending():
-                raise ValueError("Friend request already pending")
-            elif existing_friendship.is_blocked():
-                raise ValueError("Cannot send friend request - user is blocked")
+        # Check for an existing friendship (any direction)
+        pair = await self.friendship_repository.get_pair_state(user_id, friend_id)
 
-        # Check if blocked in reverse direction
-        if await self.friendship_repository.is_blocked(user_id, friend_id):
+        if pair.are_friends:
+            raise ValueError("Users are already friends")
+        elif pair.request_pending:
+            raise ValueError("Friend request already pending")
+        elif pair.blocked_by_me:
+            raise ValueError("Cannot send friend request - user is blocked")
+        elif pair.blocked_by_them:
             raise ValueError(
                 "Cannot send friend request - you are blocked by this user"
             )
@@ -68,4 +63,8 @@ class SendFriendRequestUseCase:
             created_at=datetime.utcnow(),
         )
 
-        return await self.friendship_repository.create(friendship)
+        created = await self.friendship_repository.create(friendship)
+        if created.id != friendship.id:
+            # The other user's request for this pair was created concurrently
+            raise ValueError("Friend request already pending")
+        return created
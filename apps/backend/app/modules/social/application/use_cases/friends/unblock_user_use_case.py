@@ -1,8 +1,14 @@
 """Unblock User Use Case"""
 
+from typing import Optional
+
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
 from app.modules.social.domain.repositories.i_friendship_repository import (
     IFriendshipRepository,
 )
+from app.shared.infrastructure.database.transaction_hooks import AfterCommit, run_now
 
 
 class UnblockUserUseCase:
@@ -11,15 +17,24 @@ class UnblockUserUseCase:
 
     Business Rules:
     - User can unblock a previously blocked user
-    - Unblocking removes the blocked relationship entirely
+    - Unblocking removes the blocked relationship entirely, unless the other
+      user blocks too, in which case only this user's block is lifted
     - After unblocking, users can interact again (send friend requests, chat)
     - Unblocking does not automatically make them friends
     - User cannot unblock themselves
     - Can only unblock if a blocked relationship exists
+    - Cached chat access for the pair is invalidated once the change commits
     """
 
-    def __init__(self, friendship_repository: IFriendshipRepository):
+    def __init__(
+        self,
+        friendship_repository: IFriendshipRepository,
+        access_cache: Optional[ChatAccessCache] = None,
+        after_commit: AfterCommit = run_now,
+    ):
         self.friendship_repository = friendship_repository
+        self.access_cache = access_cache
+        self.after_commit = after_commit
 
     async def execute(self, unblocker_user_id: str, unblocked_user_id: str) -> None:
         """
@@ -53,10 +68,22 @@ class UnblockUserUseCase:
                 f"Cannot unblock: relationship status is {existing_friendship.status.value}, not blocked"
             )
 
-        # Verify the current user is the blocker (user_id in the friendship)
-        # The blocker is always stored as user_id in the blocked relationship
-        if existing_friendship.user_id != unblocker_user_id:
+        # Verify the current user is a blocker
+        if not existing_friendship.is_blocked_by(unblocker_user_id):
             raise ValueError("You are not the one who blocked this user")
 
-        # Delete the blocked relationship to allow future interactions
-        await self.friendship_repository.delete(existing_friendship.id)
+        existing_friendship.unblock(unblocker_user_id)
+        if existing_friendship.blocked_by:
+            # The other user still blocks this one
+            await self.friendship_repository.update(existing_friendship)
+        else:
+            # Delete the blocked relationship to allow future interactions
+            await self.friendship_repository.delete(existing_friendship.id)
+
+        if self.access_cache:
+            access_cache = self.access_cache
+            self.after_commit(
+                lambda: access_cache.invalidate_pair(
+                    unblocker_user_id, unblocked_user_id
+                )
+            )
@@ -66,27 +66,22 @@ class CreateMessageRequestUseCase:
         if sender_id == recipient_id:
             raise ValueError("Cannot send message request to yourself")
 
+        pair = await self.friendship_repository.get_pair_state(sender_id, recipient_id)
+
         # Check privacy: recipient must allow stranger messages (FR-013)
         if not recipient_allows_stranger_messages:
             # Check if they're friends first
-            are_friends = await self.friendship_repository.are_friends(
-                sender_id, recipient_id
-            )
-            if not are_friends:
+            if not pair.are_friends:
                 raise ValueError(
                     "Recipient does not accept messages from strangers"
                 )
 
         # Check blocking (FR-025)
-        is_blocked = await self.friendship_repository.is_blocked(sender_id, recipient_id)
-        if is_blocked:
+        if pair.blocked_by_them:
             raise ValueError("Cannot send message request - you are blocked by this user")
 
         # Check reverse blocking
-        is_sender_blocking = await self.friendship_repository.is_blocked(
-            recipient_id, sender_id
-        )
-        if is_sender_blocking:
+        if pair.blocked_by_me:
             raise ValueError("Cannot send message request - you have blocked this user")
 
         # Check uniqueness: no existing thread or pending request (FR-014)
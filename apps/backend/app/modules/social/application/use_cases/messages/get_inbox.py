@@ -0,0 +1,63 @@
+"""Get Inbox Use Case"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.modules.social.domain.entities.inbox_thread import InboxThread
+from app.modules.social.domain.repositories.i_thread_repository import IThreadRepository
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+@dataclass
+class InboxPage:
+    """One page of the inbox"""
+
+    threads: List[InboxThread] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class GetInboxUseCase:
+    """
+    Use case for the inbox screen.
+
+    Unlike GetThreadsUseCase, every thread comes with its last message, the
+    other participant's profile and an unread count, so the app renders the
+    inbox from this single call instead of fetching each thread's messages.
+    """
+
+    def __init__(self, thread_repository: IThreadRepository):
+        self.thread_repository = thread_repository
+
+    async def execute(
+        self, user_id: str, limit: int = 20, cursor: Optional[str] = None
+    ) -> InboxPage:
+        """
+        Get one page of the user's inbox.
+
+        Args:
+            user_id: ID of the user
+            limit: Maximum number of threads to return
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            InboxPage ordered by most recent activity
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        keyset_cursor = KeysetCursor.decode(cursor) if cursor else None
+        if keyset_cursor is not None and keyset_cursor.score is not None:
+            raise ValueError("Invalid pagination cursor")
+
+        threads = await self.thread_repository.get_inbox_for_user(
+            user_id, limit=limit, cursor=keyset_cursor
+        )
+
+        next_cursor = None
+        if threads and len(threads) >= limit:
+            last = threads[-1]
+            next_cursor = KeysetCursor.from_row(
+                last.activity_at, last.thread.id
+            ).encode()
+
+        return InboxPage(threads=threads, next_cursor=next_cursor)
@@ -1,17 +1,21 @@
 """Get Messages in Thread Use Case"""
 
-from typing import List
+from typing import List, Optional
 
 from app.modules.social.domain.entities.thread_message import ThreadMessage
 from app.modules.social.domain.repositories.i_thread_message_repository import (
     IThreadMessageRepository,
 )
 from app.modules.social.domain.repositories.i_thread_repository import IThreadRepository
+from app.shared.domain.keyset_cursor import decode_window_cursors
 
 
 class GetThreadMessagesUseCase:
     """
     Use case for getting messages in a thread.
+
+    Opening a thread returns its newest messages; `before` cursors page back
+    through history and `after` cursors fetch what arrived since.
     """
 
     def __init__(
@@ -23,23 +27,34 @@ class GetThreadMessagesUseCase:
         self.thread_message_repository = thread_message_repository
 
     async def execute(
-        self, thread_id: str, user_id: str, limit: int = 50, offset: int = 0
+        self,
+        thread_id: str,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
     ) -> List[ThreadMessage]:
         """
-        Get messages in a thread.
+        Get one window of messages in a thread.
 
         Args:
             thread_id: ID of the thread
             user_id: ID of the requesting user (must be part of thread)
             limit: Maximum number of messages to return
-            offset: Pagination offset
+            offset: Deprecated - number of newer messages to skip
+            before: Opaque cursor - return messages older than this one
+            after: Opaque cursor - return messages newer than this one
 
         Returns:
             List of ThreadMessage entities ordered by created_at ascending
 
         Raises:
-            ValueError: If thread not found or user not authorized
+            ValueError: If a cursor is invalid, thread not found or user not
+                authorized
         """
+        before_cursor, after_cursor = decode_window_cursors(before, after)
+
         # Verify thread exists
         thread = await self.thread_repository.get_by_id(thread_id)
         if not thread:
@@ -50,5 +65,9 @@ class GetThreadMessagesUseCase:
             raise ValueError("You are not authorized to view this thread")
 
         return await self.thread_message_repository.get_messages_by_thread(
-            thread_id, limit=limit, offset=offset
+            thread_id,
+            limit=limit,
+            offset=offset,
+            before=before_cursor,
+            after=after_cursor,
         )
@@ -0,0 +1,31 @@
+"""Get Unread Counts for All Threads Use Case"""
+
+from typing import Dict
+
+from app.modules.social.domain.repositories.i_thread_read_cursor_repository import (
+    IThreadReadCursorRepository,
+)
+
+
+class GetUnreadCountsUseCase:
+    """
+    Use case for the app's badge refresh.
+
+    Returns the unread count of every thread of the user from one query.
+    """
+
+    def __init__(self, read_cursor_repository: IThreadReadCursorRepository):
+        self.read_cursor_repository = read_cursor_repository
+
+    async def execute(self, user_id: str) -> Dict[str, int]:
+        """
+        Get unread counts per thread.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Mapping of thread_id to unread count; threads with nothing unread
+            are omitted
+        """
+        return await self.read_cursor_repository.count_unread_for_user(user_id)
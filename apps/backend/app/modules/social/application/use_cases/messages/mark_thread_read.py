@@ -0,0 +1,83 @@
+"""Mark Thread as Read Use Case"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from app.modules.social.domain.entities.thread_read_cursor import ThreadReadCursor
+from app.modules.social.domain.repositories.i_thread_message_repository import (
+    IThreadMessageRepository,
+)
+from app.modules.social.domain.repositories.i_thread_read_cursor_repository import (
+    IThreadReadCursorRepository,
+)
+from app.modules.social.domain.repositories.i_thread_repository import IThreadRepository
+
+
+@dataclass
+class ThreadReadState:
+    """The user's read cursor after marking, and what is still unread"""
+
+    cursor: ThreadReadCursor
+    unread_count: int
+
+
+class MarkThreadReadUseCase:
+    """
+    Use case for moving a user's read cursor in a thread.
+
+    The cursor only moves forward, so out-of-order requests from several
+    devices never resurrect unread messages.
+    """
+
+    def __init__(
+        self,
+        thread_repository: IThreadRepository,
+        thread_message_repository: IThreadMessageRepository,
+        read_cursor_repository: IThreadReadCursorRepository,
+    ):
+        self.thread_repository = thread_repository
+        self.thread_message_repository = thread_message_repository
+        self.read_cursor_repository = read_cursor_repository
+
+    async def execute(
+        self, thread_id: str, user_id: str, message_id: Optional[str] = None
+    ) -> ThreadReadState:
+        """
+        Mark a thread as read.
+
+        Args:
+            thread_id: ID of the thread
+            user_id: ID of the reading user (must be part of thread)
+            message_id: Last message the user has seen; the latest message
+                of the thread when omitted
+
+        Returns:
+            ThreadReadState with the stored cursor and remaining unread count
+
+        Raises:
+            ValueError: If thread not found, user not authorized, or the
+                message does not belong to the thread
+        """
+        thread = await self.thread_repository.get_by_id(thread_id)
+        if not thread:
+            raise ValueError("Thread not found")
+
+        if not thread.has_user(user_id):
+            raise ValueError("You are not authorized to view this thread")
+
+        if message_id:
+            message = await self.thread_message_repository.get_by_id(message_id)
+            if not message or message.thread_id != thread_id:
+                raise ValueError("Message not found in this thread")
+            read_at = message.created_at
+        else:
+            # last_message_at is the created_at of the latest message
+            read_at = thread.last_message_at or thread.created_at
+
+        cursor = await self.read_cursor_repository.mark_read(
+            thread_id, user_id, read_at=read_at, message_id=message_id
+        )
+        unread_count = await self.read_cursor_repository.count_unread(
+            thread_id, user_id
+        )
+        return ThreadReadState(cursor=cursor, unread_count=unread_count)
@@ -9,6 +9,9 @@ from app.modules.social.domain.repositories.i_thread_message_repository import (
     IThreadMessageRepository,
 )
 from app.modules.social.domain.repositories.i_thread_repository import IThreadRepository
+from app.modules.social.domain.services.i_message_event_publisher import (
+    IMessageEventPublisher,
+)
 
 
 class SendMessageUseCase:
@@ -16,15 +19,21 @@ class SendMessageUseCase:
     Use case for sending a message in a thread.
 
     Supports FR-015: Messages can reference post_id.
+
+    The membership check, the insert, the thread's last_message_at and the
+    sender's read cursor are a single statement; the thread is only looked
+    up again when the send was refused, to tell the caller why.
     """
 
     def __init__(
         self,
         thread_repository: IThreadRepository,
         thread_message_repository: IThreadMessageRepository,
+        event_publisher: Optional[IMessageEventPublisher] = None,
     ):
         self.thread_repository = thread_repository
         self.thread_message_repository = thread_message_repository
+        self.event_publisher = event_publisher
 
     async def execute(
         self,
@@ -48,16 +57,6 @@ class SendMessageUseCase:
         Raises:
             ValueError: If thread not found or user not authorized
         """
-        # Verify thread exists
-        thread = await self.thread_repository.get_by_id(thread_id)
-        if not thread:
-            raise ValueError("Thread not found")
-
-        # Verify sender is part of thread
-        if not thread.has_user(sender_id):
-            raise ValueError("You are not authorized to send messages in this thread")
-
-        # Create message
         message = ThreadMessage(
             id=str(uuid.uuid4()),
             thread_id=thread_id,
@@ -66,10 +65,17 @@ class SendMessageUseCase:
             post_id=post_id,
             created_at=datetime.utcnow(),
         )
-        created_message = await self.thread_message_repository.create(message)
+        # Also bumps last_message_at and marks the thread read for the sender
+        sent = await self.thread_message_repository.create_in_thread(message)
+        if sent is None:
+            # Nothing was written: only a missing thread or non-member get here
+            if not await self.thread_repository.get_by_id(thread_id):
+                raise ValueError("Thread not found")
+            raise ValueError("You are not authorized to send messages in this thread")
+        created_message, thread = sent
 
-        # Update thread's last_message_at
-        thread.update_last_message_time(created_message.created_at)
-        await self.thread_repository.update(thread)
+        # Pushed to connected participants once the transaction commits
+        if self.event_publisher:
+            await self.event_publisher.publish_thread_message(thread, created_message)
 
         return created_message
@@ -0,0 +1,39 @@
+"""
+ChatRoomSummary - A chat room as shown in the viewer's room list
+
+Read model combining a ChatRoom with what the list row renders: every
+participant's profile, the latest message and the viewer's unread count.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.message import Message
+
+
+@dataclass
+class ChatRoomParticipant:
+    """A participant's public profile; nickname/avatar are None without one"""
+
+    user_id: str
+    nickname: Optional[str]
+    avatar_url: Optional[str]
+
+
+@dataclass
+class ChatRoomSummary:
+    """One room list row, from the point of view of one participant"""
+
+    room: ChatRoom
+    participants: List[ChatRoomParticipant]
+    last_message: Optional[Message]
+    unread_count: int
+
+    @property
+    def activity_at(self) -> datetime:
+        """List sort key: the last message time, or creation for empty rooms"""
+        if self.last_message is not None:
+            return self.last_message.created_at
+        return self.room.created_at
@@ -6,7 +6,7 @@ Domain Entity following DDD principles - framework independent
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class FriendshipStatus(str, Enum):
@@ -23,6 +23,10 @@ class Friendship:
 
     Represents a friend relationship between two users.
     Includes status tracking for pending requests, accepted friendships, and blocks.
+
+    A pair of users has at most one Friendship. user_id is the user who sent
+    the request (or blocked first); blocked_by holds whoever currently blocks
+    the other, possibly both.
     """
 
     def __init__(
@@ -33,6 +37,7 @@ class Friendship:
         status: FriendshipStatus,
         created_at: datetime,
         updated_at: Optional[datetime] = None,
+        blocked_by: Optional[Iterable[str]] = None,
     ):
         self.id = id
         self.user_id = user_id
@@ -40,6 +45,10 @@ class Friendship:
         self.status = status
         self.created_at = created_at
         self.updated_at = updated_at or created_at
+        self.blocked_by = set(blocked_by or ())
+        # Without an explicit blocker, a block is user_id's
+        if status == FriendshipStatus.BLOCKED and not self.blocked_by:
+            self.blocked_by.add(user_id)
 
     def accept(self) -> None:
         """Accept a pending friend request"""
@@ -48,11 +57,19 @@ class Friendship:
         self.status = FriendshipStatus.ACCEPTED
         self.updated_at = datetime.utcnow()
 
-    def block(self) -> None:
-        """Block a user"""
+    def block(self, blocker_id: Optional[str] = None) -> None:
+        """Block the other user of the pair (blocker_id defaults to user_id)"""
+        self.blocked_by.add(blocker_id or self.user_id)
         self.status = FriendshipStatus.BLOCKED
         self.updated_at = datetime.utcnow()
 
+    def unblock(self, unblocker_id: str) -> None:
+        """Lift unblocker_id's block; the pair stays blocked if both blocked"""
+        if unblocker_id not in self.blocked_by:
+            raise ValueError("You are not the one who blocked this user")
+        self.blocked_by.discard(unblocker_id)
+        self.updated_at = datetime.utcnow()
+
     def is_pending(self) -> bool:
         """Check if friendship is pending"""
         return self.status == FriendshipStatus.PENDING
@@ -65,6 +82,10 @@ class Friendship:
         """Check if user is blocked"""
         return self.status == FriendshipStatus.BLOCKED
 
+    def is_blocked_by(self, user_id: str) -> bool:
+        """Check if user_id blocks the other user of the pair"""
+        return user_id in self.blocked_by
+
     def __repr__(self) -> str:
         return (
             f"Friendship(id={self.id}, user_id={self.user_id}, "
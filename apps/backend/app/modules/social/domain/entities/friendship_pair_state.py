@@ -0,0 +1,25 @@
+"""
+FriendshipPairState - How two users are related, from one side
+
+Read model folding every friendship row between a viewer and another user
+into the flags the social rules check: friends, a pending request, and a
+block in either direction.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FriendshipPairState:
+    """Relationship between the viewer and user_id; all False for strangers"""
+
+    user_id: str
+    are_friends: bool = False
+    request_pending: bool = False
+    blocked_by_me: bool = False
+    blocked_by_them: bool = False
+
+    @property
+    def is_blocked(self) -> bool:
+        """Either user blocked the other"""
+        return self.blocked_by_me or self.blocked_by_them
@@ -0,0 +1,30 @@
+"""
+InboxThread - A thread as shown in the viewer's inbox
+
+Read model combining a MessageThread with what the inbox row renders: the
+other participant's profile, the latest message and the viewer's unread count.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.modules.social.domain.entities.thread import MessageThread
+from app.modules.social.domain.entities.thread_message import ThreadMessage
+
+
+@dataclass
+class InboxThread:
+    """One inbox row, from the point of view of one participant"""
+
+    thread: MessageThread
+    other_user_id: str
+    other_nickname: Optional[str]
+    other_avatar_url: Optional[str]
+    last_message: Optional[ThreadMessage]
+    unread_count: int
+
+    @property
+    def activity_at(self) -> datetime:
+        """Inbox sort key: the last message time, or creation for empty threads"""
+        return self.thread.last_message_at or self.thread.created_at
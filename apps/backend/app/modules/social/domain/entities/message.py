@@ -25,7 +25,7 @@ class Message:
     Tracks delivery status and supports polling with after_message_id cursor.
 
     Note: Messages are retained for 30 days on the server (FR-CHAT-006).
-    Cleanup implementation is deferred (T125A).
+    Expired months are dropped by MessagePartitionMaintenanceJob (T125A).
     """
 
     def __init__(
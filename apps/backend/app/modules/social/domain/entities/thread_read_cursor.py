@@ -0,0 +1,21 @@
+"""
+ThreadReadCursor - How far a participant has read a message thread
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class ThreadReadCursor:
+    """
+    Read position of one user in one thread
+
+    Everything the other participant sent after last_read_at is unread.
+    """
+
+    thread_id: str
+    user_id: str
+    last_read_at: datetime
+    last_read_message_id: Optional[str] = None
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.chat_room_summary import ChatRoomSummary
 
 
 class IChatRoomRepository(ABC):
@@ -35,6 +36,22 @@ class IChatRoomRepository(ABC):
         """Get all chat rooms for a user"""
         pass
 
+    @abstractmethod
+    async def get_room_summaries_for_user(self, user_id: str) -> List[ChatRoomSummary]:
+        """
+        Get the user's room list: rooms with preview data, in one query
+
+        Each row carries every participant's profile, the latest message and
+        the number of messages from others the user has not read yet.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Room summaries ordered by most recent activity
+        """
+        pass
+
     @abstractmethod
     async def delete(self, room_id: str) -> None:
         """Delete a chat room"""
@@ -5,9 +5,12 @@ Domain layer repository interface - defines contract for friendship persistence
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 
 
 class IFriendshipRepository(ABC):
@@ -15,7 +18,7 @@ class IFriendshipRepository(ABC):
 
     @abstractmethod
     async def create(self, friendship: Friendship) -> Friendship:
-        """Create a new friendship record"""
+        """Create a new friendship record, or return the pair's existing one"""
         pass
 
     @abstractmethod
@@ -54,3 +57,22 @@ class IFriendshipRepository(ABC):
     async def are_friends(self, user_id: str, other_user_id: str) -> bool:
         """Check if two users are friends (accepted status)"""
         pass
+
+    @abstractmethod
+    async def get_pair_state(
+        self, viewer_id: str, other_user_id: str
+    ) -> FriendshipPairState:
+        """Get friendship and block state between two users in one lookup"""
+        pass
+
+    @abstractmethod
+    async def get_pair_states(
+        self, viewer_id: str, other_user_ids: List[str]
+    ) -> Dict[str, FriendshipPairState]:
+        """
+        Get friendship and block state between a viewer and each other user
+
+        Returns a state for every requested ID (duplicates ignored), all
+        flags False where no friendship row exists, from a single query.
+        """
+        pass
@@ -5,9 +5,11 @@ Domain layer repository interface - defines contract for message persistence
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from app.modules.social.domain.entities.chat_room import ChatRoom
 from app.modules.social.domain.entities.message import Message
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 class IMessageRepository(ABC):
@@ -18,6 +20,23 @@ class IMessageRepository(ABC):
         """Create a new message"""
         pass
 
+    @abstractmethod
+    async def create_in_room(
+        self, message: Message
+    ) -> Optional[Tuple[Message, ChatRoom]]:
+        """
+        Create a message only if its sender may write to the room
+
+        Authorization and the insert are one statement: the sender must be a
+        participant, friends with the other participant and not blocked by
+        them.
+
+        Returns:
+            The created message and its chat room, or None (nothing written)
+            if the room does not exist or any check fails
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, message_id: str) -> Optional[Message]:
         """Get message by ID"""
@@ -25,21 +44,29 @@ class IMessageRepository(ABC):
 
     @abstractmethod
     async def get_messages_by_room_id(
-        self, room_id: str, after_message_id: Optional[str] = None, limit: int = 50
+        self,
+        room_id: str,
+        after_message_id: Optional[str] = None,
+        limit: int = 50,
+        before: Optional[KeysetCursor] = None,
+        after: Optional[KeysetCursor] = None,
     ) -> List[Message]:
         """
-        Get messages for a chat room
+        Get one window of a chat room's messages
 
-        Supports incremental polling using after_message_id cursor.
-        Returns messages newer than after_message_id, ordered by created_at ASC.
+        Without a cursor this is the newest `limit` messages; `before` pages
+        back through older history and `after` (or the legacy
+        after_message_id) returns the messages sent after that position.
 
         Args:
             room_id: Chat room ID
-            after_message_id: Optional cursor - return messages with ID > this
+            after_message_id: Legacy cursor - messages sent after this message
             limit: Maximum number of messages to return
+            before: Return messages older than this position
+            after: Return messages newer than this position
 
         Returns:
-            List of messages ordered by created_at ascending
+            List of messages ordered by (created_at, id) ascending
         """
         pass
 
@@ -59,11 +86,37 @@ class IMessageRepository(ABC):
         pass
 
     @abstractmethod
-    async def mark_messages_as_read(self, room_id: str, user_id: str) -> int:
+    async def mark_messages_as_read(
+        self, room_id: str, user_id: str, up_to_message_id: Optional[str] = None
+    ) -> int:
         """
-        Mark all messages in a room as read for a user
+        Mark the messages a user received in a room as read
+
+        Args:
+            room_id: Chat room ID
+            user_id: Reading user (must be a participant)
+            up_to_message_id: Only mark messages up to and including this
+                one; every message when omitted
 
         Returns:
             Number of messages marked as read
         """
         pass
+
+    @abstractmethod
+    async def mark_rooms_as_read(
+        self, user_id: str, receipts: Dict[str, Optional[str]]
+    ) -> Dict[str, int]:
+        """
+        Apply read receipts for several rooms at once
+
+        Args:
+            user_id: Reading user; rooms they are not a participant of are
+                left untouched
+            receipts: Room ID -> last message read in that room (None marks
+                the whole room read)
+
+        Returns:
+            Number of messages marked as read, per room that had any
+        """
+        pass
@@ -5,9 +5,11 @@ Domain layer repository interface - defines contract for thread message persiste
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from app.modules.social.domain.entities.thread import MessageThread
 from app.modules.social.domain.entities.thread_message import ThreadMessage
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 class IThreadMessageRepository(ABC):
@@ -18,6 +20,23 @@ class IThreadMessageRepository(ABC):
         """Create a new message in a thread"""
         pass
 
+    @abstractmethod
+    async def create_in_thread(
+        self, message: ThreadMessage
+    ) -> Optional[Tuple[ThreadMessage, MessageThread]]:
+        """
+        Create a message only if its sender is a participant of the thread
+
+        One statement inserts the message, moves the thread's last_message_at
+        forward and advances the sender's read cursor to the message
+        (replying means they have read the thread).
+
+        Returns:
+            The created message and the updated thread, or None (nothing
+            written) if the thread does not exist or the sender is not in it
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, message_id: str) -> Optional[ThreadMessage]:
         """Get message by ID"""
@@ -25,15 +44,25 @@ class IThreadMessageRepository(ABC):
 
     @abstractmethod
     async def get_messages_by_thread(
-        self, thread_id: str, limit: int = 50, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        before: Optional[KeysetCursor] = None,
+        after: Optional[KeysetCursor] = None,
     ) -> List[ThreadMessage]:
         """
-        Get messages for a thread
+        Get one window of a thread's messages
+
+        Without a cursor this is the newest `limit` messages; `before` pages
+        back through older history and `after` returns newer messages.
 
         Args:
             thread_id: Thread ID
             limit: Maximum number of messages to return
-            offset: Pagination offset
+            offset: Deprecated - number of newer messages to skip
+            before: Return messages older than this position
+            after: Return messages newer than this position
 
         Returns:
             List of messages ordered by created_at ascending (oldest first)
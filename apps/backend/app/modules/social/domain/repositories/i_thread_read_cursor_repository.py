@@ -0,0 +1,52 @@
+"""
+ThreadReadCursor Repository Interface
+
+Domain layer repository interface - defines contract for per-user read state
+of message threads
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.modules.social.domain.entities.thread_read_cursor import ThreadReadCursor
+
+
+class IThreadReadCursorRepository(ABC):
+    """Repository interface for thread read cursors and unread counts"""
+
+    @abstractmethod
+    async def get(self, thread_id: str, user_id: str) -> Optional[ThreadReadCursor]:
+        """Get the user's read cursor in a thread, if they ever read it"""
+        pass
+
+    @abstractmethod
+    async def mark_read(
+        self,
+        thread_id: str,
+        user_id: str,
+        read_at: datetime,
+        message_id: Optional[str] = None,
+    ) -> ThreadReadCursor:
+        """
+        Move the user's cursor forward to read_at
+
+        The cursor never moves backwards: marking an older position keeps the
+        current one. Returns the cursor as stored.
+        """
+        pass
+
+    @abstractmethod
+    async def count_unread(self, thread_id: str, user_id: str) -> int:
+        """Count messages from the other participant after the user's cursor"""
+        pass
+
+    @abstractmethod
+    async def count_unread_for_user(self, user_id: str) -> Dict[str, int]:
+        """
+        Count unread messages in every thread of the user, in one query
+
+        Returns:
+            Mapping of thread_id to unread count (threads with none omitted)
+        """
+        pass
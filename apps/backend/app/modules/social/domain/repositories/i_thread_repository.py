@@ -7,7 +7,9 @@ Domain layer repository interface - defines contract for thread persistence
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+from app.modules.social.domain.entities.inbox_thread import InboxThread
 from app.modules.social.domain.entities.thread import MessageThread
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 class IThreadRepository(ABC):
@@ -52,6 +54,31 @@ class IThreadRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_inbox_for_user(
+        self,
+        user_id: str,
+        limit: int = 20,
+        cursor: Optional[KeysetCursor] = None,
+    ) -> List[InboxThread]:
+        """
+        Get the user's inbox: threads with preview data, in one query
+
+        Each row carries the other participant's profile, the latest message
+        and the number of messages from the other participant the user has
+        not seen yet.
+
+        Args:
+            user_id: ID of the user
+            limit: Maximum number of threads to return
+            cursor: Resume strictly after this (activity_at, id) position
+
+        Returns:
+            List of inbox threads ordered by last_message_at (creation time for
+            threads without messages) descending, then id descending
+        """
+        pass
+
     @abstractmethod
     async def update(self, thread: MessageThread) -> MessageThread:
         """Update an existing thread"""
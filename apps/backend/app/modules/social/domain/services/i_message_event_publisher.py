@@ -0,0 +1,37 @@
+"""
+Message Event Publisher Interface
+
+Domain service contract for announcing new messages to connected
+participants (realtime delivery over WebSocket/SSE)
+"""
+
+from abc import ABC, abstractmethod
+
+from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.message import Message
+from app.modules.social.domain.entities.thread import MessageThread
+from app.modules.social.domain.entities.thread_message import ThreadMessage
+
+
+class IMessageEventPublisher(ABC):
+    """Publishes message events to the participants of a conversation"""
+
+    @abstractmethod
+    async def publish_thread_message(
+        self, thread: MessageThread, message: ThreadMessage
+    ) -> None:
+        """
+        Announce a new thread message to both participants
+
+        Delivery happens once the current transaction commits.
+        """
+        pass
+
+    @abstractmethod
+    async def publish_chat_message(self, chat_room: ChatRoom, message: Message) -> None:
+        """
+        Announce a new chat message to the room's participants
+
+        Delivery happens once the current transaction commits.
+        """
+        pass
@@ -8,6 +8,7 @@ from .message_request_model import MessageRequestModel
 from .report_model import ReportModel
 from .thread_message_model import ThreadMessageModel
 from .thread_model import MessageThreadModel
+from .thread_read_cursor_model import ThreadReadCursorModel
 
 __all__ = [
     "GalleryCardModel",
@@ -17,5 +18,6 @@ __all__ = [
     "MessageRequestModel",
     "MessageThreadModel",
     "ThreadMessageModel",
+    "ThreadReadCursorModel",
     "ReportModel",
 ]
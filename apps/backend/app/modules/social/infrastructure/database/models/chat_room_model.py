@@ -5,8 +5,8 @@ ChatRoom ORM model for Social module
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ARRAY, Column, DateTime, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, Index
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
 from app.shared.infrastructure.database.connection import Base
 
@@ -21,5 +21,13 @@ class ChatRoomModel(Base):
     participant_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
-    # Index on participant_ids for efficient lookups
-    __table_args__ = (Index("idx_chat_room_participants", "participant_ids"),)
+    __table_args__ = (
+        # Exact pair lookups (participant_ids = sorted pair)
+        Index("idx_chat_room_participants", "participant_ids"),
+        # A user's rooms (participant_ids @> ARRAY[user_id])
+        Index(
+            "idx_chat_room_participant_ids_gin",
+            "participant_ids",
+            postgresql_using="gin",
+        ),
+    )
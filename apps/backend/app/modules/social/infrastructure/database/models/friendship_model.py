@@ -5,11 +5,22 @@ Friendship ORM model for Social module
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String
+from sqlalchemy import Boolean, Column, Computed, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.shared.infrastructure.database.connection import Base
 
+COVERED_COLUMNS = [
+    "id",
+    "user_id",
+    "friend_id",
+    "status",
+    "blocked_by_a",
+    "blocked_by_b",
+    "created_at",
+    "updated_at",
+]
+
 
 class FriendshipModel(Base):
     """Friendship ORM model"""
@@ -36,6 +47,24 @@ class FriendshipModel(Base):
         server_default="pending",
         index=True,
     )  # pending, accepted, blocked
+    # The pair ordered smaller id first, so either direction is one key
+    user_a_id = Column(
+        UUID(as_uuid=True),
+        Computed("LEAST(user_id, friend_id)", persisted=True),
+        nullable=False,
+    )
+    user_b_id = Column(
+        UUID(as_uuid=True),
+        Computed("GREATEST(user_id, friend_id)", persisted=True),
+        nullable=False,
+    )
+    # Which side of the pair blocks the other (both may)
+    blocked_by_a = Column(
+        Boolean, nullable=False, default=False, server_default="false"
+    )
+    blocked_by_b = Column(
+        Boolean, nullable=False, default=False, server_default="false"
+    )
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(
         DateTime(timezone=True),
@@ -43,8 +72,21 @@ class FriendshipModel(Base):
         onupdate=datetime.utcnow,
     )
 
-    # Compound index for efficient friendship lookups
+    # One row per pair; both pair indexes cover every entity column so pair
+    # checks and per-user listings are index-only scans
     __table_args__ = (
-        Index("idx_friendship_users", "user_id", "friend_id"),
+        Index(
+            "uq_friendship_pair",
+            "user_a_id",
+            "user_b_id",
+            unique=True,
+            postgresql_include=COVERED_COLUMNS,
+        ),
+        Index(
+            "idx_friendship_user_b",
+            "user_b_id",
+            "user_a_id",
+            postgresql_include=COVERED_COLUMNS,
+        ),
         Index("idx_friendship_status", "status"),
     )
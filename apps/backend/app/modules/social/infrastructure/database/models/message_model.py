@@ -12,7 +12,13 @@ from app.shared.infrastructure.database.connection import Base
 
 
 class MessageModel(Base):
-    """Message ORM model"""
+    """
+    Message ORM model
+
+    Range-partitioned by month on created_at (see
+    app.shared.infrastructure.database.partitions), so created_at is part of
+    the primary key.
+    """
 
     __tablename__ = "messages"
 
@@ -37,7 +43,12 @@ class MessageModel(Base):
         server_default="sent",
         index=True,
     )  # sent, delivered, read
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=datetime.utcnow,
+        index=True,
+    )
     updated_at = Column(
         DateTime(timezone=True),
         default=datetime.utcnow,
@@ -51,4 +62,5 @@ class MessageModel(Base):
         Index("idx_message_room_id", "room_id", "id"),
         # For unread count queries
         Index("idx_message_status_sender", "room_id", "status", "sender_id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
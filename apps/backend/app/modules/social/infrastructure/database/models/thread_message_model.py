@@ -12,7 +12,13 @@ from app.shared.infrastructure.database.connection import Base
 
 
 class ThreadMessageModel(Base):
-    """ThreadMessage ORM model - messages in a conversation thread"""
+    """
+    ThreadMessage ORM model - messages in a conversation thread
+
+    Range-partitioned by month on created_at (see
+    app.shared.infrastructure.database.partitions), so created_at is part of
+    the primary key.
+    """
 
     __tablename__ = "thread_messages"
 
@@ -35,8 +41,11 @@ class ThreadMessageModel(Base):
         ForeignKey("posts.id", ondelete="SET NULL"),
         nullable=True,
     )
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), primary_key=True, default=datetime.utcnow
+    )
 
     __table_args__ = (
         Index("idx_thread_message_thread_created", "thread_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
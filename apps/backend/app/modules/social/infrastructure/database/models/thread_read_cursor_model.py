@@ -0,0 +1,44 @@
+"""
+ThreadReadCursor ORM model for Social module
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.shared.infrastructure.database.connection import Base
+
+
+class ThreadReadCursorModel(Base):
+    """
+    How far one participant has read a thread
+
+    Messages in the thread created after last_read_at and sent by the other
+    participant are unread; counting them is a range scan on
+    idx_thread_message_thread_created. The cursor only ever moves forward.
+    """
+
+    __tablename__ = "thread_read_cursors"
+
+    thread_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("message_threads.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    last_read_at = Column(DateTime(timezone=True), nullable=False)
+    # Not a foreign key: the message may be deleted without rewinding the cursor
+    last_read_message_id = Column(UUID(as_uuid=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("idx_thread_read_cursor_user", "user_id"),)
@@ -0,0 +1 @@
+"""Social module background jobs"""
@@ -0,0 +1,115 @@
+"""
+Message partition maintenance job
+
+Keeps the monthly partitions of messages and thread_messages ahead of the
+clock and enforces message retention (FR-CHAT-006) by dropping whole months
+instead of deleting rows.
+
+Every worker schedules the job, but only one runs it at a time: a run first
+takes a Postgres advisory lock and is skipped when another worker holds it.
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+from sqlalchemy import text
+
+from app.shared.infrastructure.database.connection import db_connection
+from app.shared.infrastructure.database.partitions import MonthlyPartitionManager
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_TABLES = ("messages", "thread_messages")
+
+# Advisory lock key shared by every worker ("msgpart" in ASCII)
+MAINTENANCE_LOCK_KEY = 0x6D7367706172
+
+
+@dataclass
+class MessagePartitionMaintenanceMetrics:
+    """Cumulative partition maintenance counters for this worker"""
+
+    runs: int = 0
+    skipped_runs: int = 0
+    partitions_created_total: int = 0
+    partitions_dropped_total: int = 0
+    last_duration_ms: float = 0.0
+    last_run_at: Optional[str] = None
+
+
+class MessagePartitionMaintenanceJob:
+    """Pre-creates future month partitions and drops expired ones"""
+
+    def __init__(
+        self,
+        retention_days: int = 30,
+        months_ahead: int = 3,
+        tables: Sequence[str] = MESSAGE_TABLES,
+    ):
+        self.retention_days = retention_days
+        self.months_ahead = months_ahead
+        self.tables = tables
+        self.metrics = MessagePartitionMaintenanceMetrics()
+
+    async def run(self) -> dict:
+        """
+        Maintain every message table unless another worker already is
+
+        Runs on its own AUTOCOMMIT connection (detaching concurrently cannot
+        happen in a transaction), so the lock is session-level and released
+        when the run ends, or by Postgres if the connection dies.
+        A retention of 0 or less keeps messages forever.
+        """
+        now = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        created, dropped = [], []
+
+        async with db_connection.async_engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            locked = await connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": MAINTENANCE_LOCK_KEY},
+            )
+            if not locked:
+                self.metrics.skipped_runs += 1
+                logger.debug("Message partition maintenance running elsewhere")
+                return {"skipped": True, "processed_at": now.isoformat()}
+
+            try:
+                manager = MonthlyPartitionManager(connection)
+                for table in self.tables:
+                    created += await manager.ensure_partitions(
+                        table, self.months_ahead, now=now
+                    )
+                    if self.retention_days > 0:
+                        dropped += await manager.drop_expired_partitions(
+                            table, self.retention_days, now=now
+                        )
+            finally:
+                await connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": MAINTENANCE_LOCK_KEY},
+                )
+
+        result = {
+            "skipped": False,
+            "created": created,
+            "dropped": dropped,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "processed_at": now.isoformat(),
+        }
+        if created or dropped:
+            logger.info(f"Message partitions created: {created}, dropped: {dropped}")
+
+        self.metrics.runs += 1
+        self.metrics.partitions_created_total += len(created)
+        self.metrics.partitions_dropped_total += len(dropped)
+        self.metrics.last_duration_ms = result["duration_ms"]
+        self.metrics.last_run_at = result["processed_at"]
+        logger.debug(f"Message partition maintenance metrics: {asdict(self.metrics)}")
+        return result
@@ -5,16 +5,29 @@ SQLAlchemy ChatRoom Repository Implementation
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import any_, select
+from sqlalchemy import any_, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.modules.identity.infrastructure.database.models.profile_model import (
+    ProfileModel,
+)
 from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.chat_room_summary import (
+    ChatRoomParticipant,
+    ChatRoomSummary,
+)
+from app.modules.social.domain.entities.message import Message, MessageStatus
 from app.modules.social.domain.repositories.i_chat_room_repository import (
     IChatRoomRepository,
 )
 from app.modules.social.infrastructure.database.models.chat_room_model import (
     ChatRoomModel,
 )
+from app.modules.social.infrastructure.database.models.message_model import MessageModel
+from app.modules.social.infrastructure.repositories.message_repository_impl import (
+    unread_count_query,
+)
 
 
 class ChatRoomRepositoryImpl(IChatRoomRepository):
@@ -76,15 +89,116 @@ class ChatRoomRepositoryImpl(IChatRoomRepository):
         """Get all chat rooms for a user"""
         user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
 
-        # Use ANY operator to find rooms where user is a participant in the array
+        # Array containment (@>) is what idx_chat_room_participant_ids_gin serves
         result = await self.session.execute(
             select(ChatRoomModel)
-            .where(user_uuid == any_(ChatRoomModel.participant_ids))
+            .where(ChatRoomModel.participant_ids.contains([user_uuid]))
             .order_by(ChatRoomModel.created_at.desc())
         )
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
+    async def get_room_summaries_for_user(self, user_id: str) -> List[ChatRoomSummary]:
+        """
+        Get the user's room list in a single query
+
+        Rooms are found through idx_chat_room_participant_ids_gin. Three
+        LATERAL subqueries run per room: the participants' profiles
+        aggregated by user_id lookups, the latest message (LIMIT 1 on
+        idx_message_room_created) and the unread count.
+        """
+        room = ChatRoomModel
+        viewer = UUID(user_id)
+
+        # Participants without a profile are simply absent from the arrays
+        profiled = (
+            select(
+                func.array_agg(ProfileModel.user_id).label("profile_user_ids"),
+                func.array_agg(ProfileModel.nickname).label("nicknames"),
+                func.array_agg(ProfileModel.avatar_url).label("avatar_urls"),
+            )
+            .where(ProfileModel.user_id == any_(room.participant_ids))
+            .lateral("profiled")
+        )
+
+        latest = aliased(MessageModel)
+        last_message = (
+            select(
+                latest.id,
+                latest.sender_id,
+                latest.content,
+                latest.status,
+                latest.created_at,
+                latest.updated_at,
+            )
+            .where(latest.room_id == room.id)
+            .order_by(latest.created_at.desc(), latest.id.desc())
+            .limit(1)
+            .lateral("last_message")
+        )
+
+        unread = unread_count_query(room.id, viewer).lateral("unread")
+        activity_at = func.coalesce(last_message.c.created_at, room.created_at)
+
+        stmt = (
+            select(
+                room,
+                profiled.c.profile_user_ids,
+                profiled.c.nicknames,
+                profiled.c.avatar_urls,
+                last_message.c.id.label("last_message_id"),
+                last_message.c.sender_id.label("last_sender_id"),
+                last_message.c.content.label("last_content"),
+                last_message.c.status.label("last_status"),
+                last_message.c.created_at.label("last_created_at"),
+                last_message.c.updated_at.label("last_updated_at"),
+                unread.c.unread_count,
+            )
+            .select_from(room)
+            .join(profiled, true())
+            .outerjoin(last_message, true())
+            .join(unread, true())
+            .where(room.participant_ids.contains([viewer]))
+            .order_by(activity_at.desc(), room.id.desc())
+        )
+
+        result = await self.session.execute(stmt)
+        summaries = []
+        for row in result:
+            model = row.ChatRoomModel
+            message = None
+            if row.last_message_id is not None:
+                message = Message(
+                    id=str(row.last_message_id),
+                    room_id=str(model.id),
+                    sender_id=str(row.last_sender_id),
+                    content=row.last_content,
+                    status=MessageStatus(row.last_status),
+                    created_at=row.last_created_at,
+                    updated_at=row.last_updated_at,
+                )
+            profiles = dict(
+                zip(
+                    row.profile_user_ids or [],
+                    zip(row.nicknames or [], row.avatar_urls or []),
+                )
+            )
+            summaries.append(
+                ChatRoomSummary(
+                    room=self._to_entity(model),
+                    participants=[
+                        ChatRoomParticipant(
+                            str(participant_id),
+                            *profiles.get(participant_id, (None, None)),
+                        )
+                        for participant_id in model.participant_ids
+                    ],
+                    last_message=message,
+                    unread_count=row.unread_count,
+                )
+            )
+        return summaries
+
     async def delete(self, room_id: str) -> None:
         """Delete a chat room"""
         result = await self.session.execute(
@@ -2,13 +2,30 @@
 SQLAlchemy Friendship Repository Implementation
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    case,
+    column,
+    exists,
+    func,
+    or_,
+    select,
+    union_all,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 from app.modules.social.domain.repositories.i_friendship_repository import (
     IFriendshipRepository,
 )
@@ -17,6 +34,54 @@ from app.modules.social.infrastructure.database.models.friendship_model import (
 )
 
 
+def pair_key(user_id, other_user_id) -> Tuple:
+    """
+    (user_a_id, user_b_id) of two users: the smaller id first
+
+    Ids known in Python are ordered here (UUIDs order the same way in
+    Postgres); columns of an enclosing query are ordered by LEAST/GREATEST.
+    Either way the lookup is a probe of the unique pair index.
+    """
+    if isinstance(user_id, (str, UUID)) and isinstance(other_user_id, (str, UUID)):
+        return tuple(sorted((_as_uuid(user_id), _as_uuid(other_user_id))))
+    return func.least(user_id, other_user_id), func.greatest(user_id, other_user_id)
+
+
+def friends_condition(user_id, other_user_id) -> ColumnElement[bool]:
+    """
+    EXISTS an accepted friendship between two users, in either direction
+
+    The ids may be values or columns of an enclosing query, so writes can be
+    authorized in the statement that performs them.
+    """
+    friendship = aliased(FriendshipModel)
+    user_a_id, user_b_id = pair_key(user_id, other_user_id)
+    return exists().where(
+        friendship.user_a_id == user_a_id,
+        friendship.user_b_id == user_b_id,
+        friendship.status == FriendshipStatus.ACCEPTED.value,
+    )
+
+
+def blocked_condition(user_id, potential_blocker_id) -> ColumnElement[bool]:
+    """EXISTS a block of user_id by potential_blocker_id (values or columns)"""
+    friendship = aliased(FriendshipModel)
+    user_a_id, user_b_id = pair_key(user_id, potential_blocker_id)
+    blocker_id = _as_uuid(potential_blocker_id)
+    return exists().where(
+        friendship.user_a_id == user_a_id,
+        friendship.user_b_id == user_b_id,
+        or_(
+            and_(friendship.user_a_id == blocker_id, friendship.blocked_by_a),
+            and_(friendship.user_b_id == blocker_id, friendship.blocked_by_b),
+        ),
+    )
+
+
+def _as_uuid(value):
+    return UUID(value) if isinstance(value, str) else value
+
+
 class FriendshipRepositoryImpl(IFriendshipRepository):
     """SQLAlchemy implementation of Friendship repository"""
 
@@ -24,7 +89,13 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
         self.session = session
 
     async def create(self, friendship: Friendship) -> Friendship:
-        """Create a new friendship record"""
+        """
+        Create a new friendship record
+
+        A pair has one row whichever side created it; if a concurrent request
+        for the same pair (e.g. B -> A while A -> B is inserted) wins the
+        unique pair index, the row it created is returned instead.
+        """
         model = FriendshipModel(
             id=UUID(friendship.id) if isinstance(friendship.id, str) else friendship.id,
             user_id=UUID(friendship.user_id)
@@ -39,8 +110,16 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
             created_at=friendship.created_at,
             updated_at=friendship.updated_at,
         )
-        self.session.add(model)
-        await self.session.flush()
+        model.blocked_by_a, model.blocked_by_b = self._block_flags(friendship)
+        try:
+            # Savepoint, so a lost race leaves the request transaction usable
+            async with self.session.begin_nested():
+                self.session.add(model)
+        except IntegrityError:
+            existing = await self.get_by_users(friendship.user_id, friendship.friend_id)
+            if existing is None:
+                raise
+            return existing
         await self.session.refresh(model)
         return self._to_entity(model)
 
@@ -54,21 +133,12 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
 
     async def get_by_users(self, user_id: str, friend_id: str) -> Optional[Friendship]:
         """Get friendship between two users (either direction)"""
-        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
-        friend_uuid = UUID(friend_id) if isinstance(friend_id, str) else friend_id
+        user_a_id, user_b_id = pair_key(user_id, friend_id)
 
         result = await self.session.execute(
             select(FriendshipModel).where(
-                or_(
-                    and_(
-                        FriendshipModel.user_id == user_uuid,
-                        FriendshipModel.friend_id == friend_uuid,
-                    ),
-                    and_(
-                        FriendshipModel.user_id == friend_uuid,
-                        FriendshipModel.friend_id == user_uuid,
-                    ),
-                )
+                FriendshipModel.user_a_id == user_a_id,
+                FriendshipModel.user_b_id == user_b_id,
             )
         )
         model = result.scalar_one_or_none()
@@ -77,23 +147,28 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
     async def get_friends_by_user_id(
         self, user_id: str, status: Optional[FriendshipStatus] = None
     ) -> List[Friendship]:
-        """Get all friendships for a user, optionally filtered by status"""
-        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
+        """
+        Get all friendships for a user, optionally filtered by status
 
-        query = select(FriendshipModel).where(
-            or_(
-                FriendshipModel.user_id == user_uuid,
-                FriendshipModel.friend_id == user_uuid,
-            )
-        )
+        The user is on either side of a pair, so the two sides are read from
+        their covering indexes and appended, without touching the table.
+        """
+        user_uuid = _as_uuid(user_id)
 
+        sides = [
+            select(FriendshipModel).where(FriendshipModel.user_a_id == user_uuid),
+            select(FriendshipModel).where(FriendshipModel.user_b_id == user_uuid),
+        ]
         if status:
             status_value = (
                 status.value if isinstance(status, FriendshipStatus) else status
             )
-            query = query.where(FriendshipModel.status == status_value)
+            sides = [
+                side.where(FriendshipModel.status == status_value) for side in sides
+            ]
 
-        query = query.order_by(FriendshipModel.created_at.desc())
+        friendships = aliased(FriendshipModel, union_all(*sides).subquery())
+        query = select(friendships).order_by(friendships.created_at.desc())
 
         result = await self.session.execute(query)
         models = result.scalars().all()
@@ -121,6 +196,7 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
             if isinstance(friendship.status, FriendshipStatus)
             else friendship.status
         )
+        model.blocked_by_a, model.blocked_by_b = self._block_flags(friendship)
         model.updated_at = friendship.updated_at
 
         await self.session.flush()
@@ -140,50 +216,100 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
 
     async def is_blocked(self, user_id: str, potential_blocker_id: str) -> bool:
         """Check if user is blocked by another user"""
-        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
-        blocker_uuid = (
-            UUID(potential_blocker_id)
-            if isinstance(potential_blocker_id, str)
-            else potential_blocker_id
+        user_a_id, user_b_id = pair_key(user_id, potential_blocker_id)
+        blocked_by_blocker = (
+            FriendshipModel.blocked_by_a
+            if user_a_id == _as_uuid(potential_blocker_id)
+            else FriendshipModel.blocked_by_b
         )
 
         result = await self.session.execute(
-            select(FriendshipModel).where(
-                and_(
-                    FriendshipModel.user_id == blocker_uuid,
-                    FriendshipModel.friend_id == user_uuid,
-                    FriendshipModel.status == FriendshipStatus.BLOCKED.value,
-                )
+            select(FriendshipModel.id).where(
+                FriendshipModel.user_a_id == user_a_id,
+                FriendshipModel.user_b_id == user_b_id,
+                blocked_by_blocker,
             )
         )
         return result.scalar_one_or_none() is not None
 
     async def are_friends(self, user_id: str, other_user_id: str) -> bool:
         """Check if two users are friends (accepted status)"""
-        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
-        other_uuid = (
-            UUID(other_user_id) if isinstance(other_user_id, str) else other_user_id
-        )
+        user_a_id, user_b_id = pair_key(user_id, other_user_id)
 
         result = await self.session.execute(
-            select(FriendshipModel).where(
-                and_(
-                    or_(
-                        and_(
-                            FriendshipModel.user_id == user_uuid,
-                            FriendshipModel.friend_id == other_uuid,
-                        ),
-                        and_(
-                            FriendshipModel.user_id == other_uuid,
-                            FriendshipModel.friend_id == user_uuid,
-                        ),
-                    ),
-                    FriendshipModel.status == FriendshipStatus.ACCEPTED.value,
-                )
+            select(FriendshipModel.id).where(
+                FriendshipModel.user_a_id == user_a_id,
+                FriendshipModel.user_b_id == user_b_id,
+                FriendshipModel.status == FriendshipStatus.ACCEPTED.value,
             )
         )
         return result.scalar_one_or_none() is not None
 
+    async def get_pair_state(
+        self, viewer_id: str, other_user_id: str
+    ) -> FriendshipPairState:
+        """Get friendship and block state between two users in one lookup"""
+        states = await self.get_pair_states(viewer_id, [other_user_id])
+        return states[str(other_user_id)]
+
+    async def get_pair_states(
+        self, viewer_id: str, other_user_ids: List[str]
+    ) -> Dict[str, FriendshipPairState]:
+        """
+        Get friendship and block state between a viewer and each other user
+
+        The pair keys are ordered in Python and joined as a VALUES list
+        against the unique pair columns. Restricting to the viewer's rows
+        lets the planner read the viewer's two index ranges once and hash
+        join them to the list instead of probing the index per pair. Flags
+        are swapped to the viewer's point of view.
+        """
+        unique_ids = list(dict.fromkeys(str(user_id) for user_id in other_user_ids))
+        if not unique_ids:
+            return {}
+
+        viewer_uuid = _as_uuid(viewer_id)
+        pairs = values(
+            column("user_a_id", PG_UUID(as_uuid=True)),
+            column("user_b_id", PG_UUID(as_uuid=True)),
+            name="pairs",
+        ).data([pair_key(viewer_uuid, user_id) for user_id in unique_ids])
+        friendship = FriendshipModel
+        viewer_is_a = friendship.user_a_id == viewer_uuid
+        query = select(
+            case((viewer_is_a, friendship.user_b_id), else_=friendship.user_a_id).label(
+                "other_id"
+            ),
+            friendship.status,
+            case(
+                (viewer_is_a, friendship.blocked_by_a), else_=friendship.blocked_by_b
+            ).label("blocked_by_me"),
+            case(
+                (viewer_is_a, friendship.blocked_by_b), else_=friendship.blocked_by_a
+            ).label("blocked_by_them"),
+        ).join(
+            pairs,
+            and_(
+                friendship.user_a_id == pairs.c.user_a_id,
+                friendship.user_b_id == pairs.c.user_b_id,
+            ),
+        ).where(or_(viewer_is_a, friendship.user_b_id == viewer_uuid))
+
+        result = await self.session.execute(query)
+
+        states = {
+            user_id: FriendshipPairState(user_id=user_id) for user_id in unique_ids
+        }
+        for row in result:
+            states[str(row.other_id)] = FriendshipPairState(
+                user_id=str(row.other_id),
+                are_friends=row.status == FriendshipStatus.ACCEPTED.value,
+                request_pending=row.status == FriendshipStatus.PENDING.value,
+                blocked_by_me=row.blocked_by_me,
+                blocked_by_them=row.blocked_by_them,
+            )
+        return states
+
     async def find_by_user_and_status(
         self, user_id: str, status: str
     ) -> List[Friendship]:
@@ -194,9 +320,21 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
         status_enum = FriendshipStatus(status) if status else None
         return await self.get_friends_by_user_id(user_id, status_enum)
 
+    @staticmethod
+    def _block_flags(friendship: Friendship) -> Tuple[bool, bool]:
+        """(blocked_by_a, blocked_by_b) for the entity's blockers"""
+        user_a_id, user_b_id = pair_key(friendship.user_id, friendship.friend_id)
+        blockers = {_as_uuid(user_id) for user_id in friendship.blocked_by}
+        return user_a_id in blockers, user_b_id in blockers
+
     @staticmethod
     def _to_entity(model: FriendshipModel) -> Friendship:
         """Convert ORM model to domain entity"""
+        blocked_by = []
+        if model.blocked_by_a:
+            blocked_by.append(str(model.user_a_id))
+        if model.blocked_by_b:
+            blocked_by.append(str(model.user_b_id))
         return Friendship(
             id=str(model.id),
             user_id=str(model.user_id),
@@ -204,6 +342,7 @@ class FriendshipRepositoryImpl(IFriendshipRepository):
             status=FriendshipStatus(model.status),
             created_at=model.created_at,
             updated_at=model.updated_at,
+            blocked_by=blocked_by,
         )
 
 
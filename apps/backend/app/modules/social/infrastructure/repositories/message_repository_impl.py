@@ -2,17 +2,57 @@
 SQLAlchemy Message Repository Implementation
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    Select,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.modules.social.domain.entities.chat_room import ChatRoom
 from app.modules.social.domain.entities.message import Message, MessageStatus
 from app.modules.social.domain.repositories.i_message_repository import (
     IMessageRepository,
 )
+from app.modules.social.infrastructure.database.models.chat_room_model import (
+    ChatRoomModel,
+)
 from app.modules.social.infrastructure.database.models.message_model import MessageModel
+from app.modules.social.infrastructure.repositories.friendship_repository_impl import (
+    blocked_condition,
+    friends_condition,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+from app.shared.infrastructure.database.keyset_window import keyset_window
+
+
+def unread_count_query(room_id, user_id: UUID) -> Select:
+    """
+    Count of the messages a user received in one room and has not read
+
+    `room_id` may be a value or a column of an enclosing query (use
+    `.lateral()`). The count is served by idx_message_status_sender.
+    """
+    message = aliased(MessageModel)
+    return select(func.count().label("unread_count")).where(
+        message.room_id == room_id,
+        message.sender_id != user_id,
+        message.status != MessageStatus.READ.value,
+    )
 
 
 class MessageRepositoryImpl(IMessageRepository):
@@ -43,6 +83,75 @@ class MessageRepositoryImpl(IMessageRepository):
         await self.session.refresh(model)
         return self._to_entity(model)
 
+    async def create_in_room(
+        self, message: Message
+    ) -> Optional[Tuple[Message, ChatRoom]]:
+        """
+        Create a message only if its sender may write to the room
+
+        A single INSERT ... SELECT: the room CTE matches only if the sender
+        is a participant, the friendship checks filter it further, and the
+        insert reads from what is left, so a refused send writes nothing.
+        """
+        room = ChatRoomModel
+        sender_id = UUID(message.sender_id)
+        recipient_id = func.array_remove(
+            room.participant_ids,
+            literal(sender_id, PG_UUID(as_uuid=True)),
+            type_=ARRAY(PG_UUID(as_uuid=True)),
+        )[1]
+        allowed = (
+            select(room.id, room.participant_ids, room.created_at)
+            .where(
+                room.id == UUID(message.room_id),
+                room.participant_ids.any(sender_id),
+                friends_condition(sender_id, recipient_id),
+                ~blocked_condition(sender_id, recipient_id),
+            )
+            .cte("allowed")
+        )
+
+        model = MessageModel
+        inserted = (
+            insert(model)
+            .from_select(
+                [
+                    "id",
+                    "room_id",
+                    "sender_id",
+                    "content",
+                    "status",
+                    "created_at",
+                    "updated_at",
+                ],
+                select(
+                    literal(UUID(message.id), model.id.type),
+                    allowed.c.id,
+                    literal(sender_id, model.sender_id.type),
+                    literal(message.content, model.content.type),
+                    literal(message.status.value, model.status.type),
+                    literal(message.created_at, model.created_at.type),
+                    literal(message.updated_at, model.updated_at.type),
+                ),
+            )
+            .returning(model)
+            .cte("inserted")
+        )
+        stmt = select(
+            inserted,
+            allowed.c.participant_ids,
+            allowed.c.created_at.label("room_created_at"),
+        ).select_from(inserted.join(allowed, inserted.c.room_id == allowed.c.id))
+
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return self._to_entity(row), ChatRoom(
+            id=str(row.room_id),
+            participant_ids=[str(pid) for pid in row.participant_ids],
+            created_at=row.room_created_at,
+        )
+
     async def get_by_id(self, message_id: str) -> Optional[Message]:
         """Get message by ID"""
         result = await self.session.execute(
@@ -52,40 +161,61 @@ class MessageRepositoryImpl(IMessageRepository):
         return self._to_entity(model) if model else None
 
     async def get_messages_by_room_id(
-        self, room_id: str, after_message_id: Optional[str] = None, limit: int = 50
+        self,
+        room_id: str,
+        after_message_id: Optional[str] = None,
+        limit: int = 50,
+        before: Optional[KeysetCursor] = None,
+        after: Optional[KeysetCursor] = None,
     ) -> List[Message]:
         """
-        Get messages for a chat room
+        Get one window of a chat room's messages
 
-        Supports incremental polling using after_message_id cursor.
-        Returns messages newer than after_message_id, ordered by created_at ASC.
+        Without a cursor this is the newest `limit` messages; `before` pages
+        back through older history and `after` (or the legacy
+        after_message_id) returns the messages sent after that position.
+        Every window is a single range scan on idx_message_room_created.
 
         Args:
             room_id: Chat room ID
-            after_message_id: Optional cursor - return messages with ID > this
+            after_message_id: Legacy cursor - messages sent after this message
             limit: Maximum number of messages to return
+            before: Return messages older than this position
+            after: Return messages newer than this position
 
         Returns:
-            List of messages ordered by created_at ascending
+            List of messages ordered by (created_at, id) ascending
         """
         room_uuid = UUID(room_id) if isinstance(room_id, str) else room_id
-
-        query = select(MessageModel).where(MessageModel.room_id == room_uuid)
-
-        # Apply cursor-based pagination if after_message_id is provided
-        if after_message_id:
-            after_uuid = (
-                UUID(after_message_id)
-                if isinstance(after_message_id, str)
-                else after_message_id
+        message = MessageModel
+
+        query = select(message).where(message.room_id == room_uuid)
+
+        if after is None and after_message_id:
+            # Legacy id cursor: resume after that message's (created_at, id)
+            anchor = aliased(MessageModel)
+            position = (
+                select(anchor.created_at, anchor.id)
+                .where(
+                    anchor.id == UUID(str(after_message_id)),
+                    anchor.room_id == room_uuid,
+                )
+                .scalar_subquery()
+            )
+            query = (
+                query.where(tuple_(message.created_at, message.id) > position)
+                .order_by(message.created_at.asc(), message.id.asc())
+                .limit(limit)
+            )
+        else:
+            query = keyset_window(
+                query, message.created_at, message.id, limit, before=before, after=after
             )
-            query = query.where(MessageModel.id > after_uuid)
-
-        # Order by created_at ASC for incremental polling
-        query = query.order_by(MessageModel.created_at.asc()).limit(limit)
 
         result = await self.session.execute(query)
         models = result.scalars().all()
+        if after is None and not after_message_id:
+            models = reversed(models)
         return [self._to_entity(model) for model in models]
 
     async def update(self, message: Message) -> Message:
@@ -129,55 +259,83 @@ class MessageRepositoryImpl(IMessageRepository):
         room_uuid = UUID(room_id) if isinstance(room_id, str) else room_id
         user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
 
-        # Count messages that are not sent by user and not read
-        result = await self.session.execute(
-            select(func.count(MessageModel.id)).where(
-                and_(
-                    MessageModel.room_id == room_uuid,
-                    MessageModel.sender_id != user_uuid,
-                    MessageModel.status != MessageStatus.READ.value,
-                )
-            )
-        )
-        count = result.scalar_one()
-        return count or 0
+        result = await self.session.execute(unread_count_query(room_uuid, user_uuid))
+        return result.scalar_one()
 
-    async def mark_messages_as_read(self, room_id: str, user_id: str) -> int:
+    async def mark_messages_as_read(
+        self, room_id: str, user_id: str, up_to_message_id: Optional[str] = None
+    ) -> int:
         """
-        Mark all messages in a room as read for a user
+        Mark the messages a user received in a room as read
 
         Returns:
             Number of messages marked as read
         """
-        room_uuid = UUID(room_id) if isinstance(room_id, str) else room_id
-        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
+        marked = await self.mark_rooms_as_read(user_id, {room_id: up_to_message_id})
+        return marked.get(str(room_id), 0)
 
-        # Find all unread messages not sent by user
-        result = await self.session.execute(
-            select(MessageModel).where(
-                and_(
-                    MessageModel.room_id == room_uuid,
-                    MessageModel.sender_id != user_uuid,
-                    MessageModel.status != MessageStatus.READ.value,
-                )
+    async def mark_rooms_as_read(
+        self, user_id: str, receipts: Dict[str, Optional[str]]
+    ) -> Dict[str, int]:
+        """
+        Apply read receipts for several rooms in one UPDATE
+
+        The receipts are joined in as a VALUES list together with the rooms
+        the user takes part in, so rows never leave the database; the
+        per-room counts come from the UPDATE's RETURNING.
+        """
+        if not receipts:
+            return {}
+        user_uuid = UUID(user_id) if isinstance(user_id, str) else user_id
+        receipt = values(
+            column("room_id", PG_UUID(as_uuid=True)),
+            column("up_to_id", PG_UUID(as_uuid=True)),
+            name="receipts",
+        ).data(
+            [
+                (UUID(str(room_id)), UUID(str(up_to)) if up_to else None)
+                for room_id, up_to in receipts.items()
+            ]
+        )
+        # An all-NULL VALUES column would be typed text, not uuid
+        up_to_id = cast(receipt.c.up_to_id, PG_UUID(as_uuid=True))
+        message = MessageModel
+        room = ChatRoomModel
+        anchor = aliased(MessageModel)
+        up_to_position = (
+            select(anchor.created_at, anchor.id)
+            .where(
+                anchor.id == up_to_id,
+                anchor.room_id == receipt.c.room_id,
             )
+            .scalar_subquery()
         )
-        models = result.scalars().all()
-
-        # Mark them as read
-        count = 0
-        for model in models:
-            model.status = MessageStatus.READ.value
-            count += 1
 
-        if count > 0:
-            await self.session.flush()
-
-        return count
+        marked = (
+            update(message)
+            .where(
+                message.room_id == receipt.c.room_id,
+                room.id == receipt.c.room_id,
+                room.participant_ids.any(user_uuid),
+                message.sender_id != user_uuid,
+                message.status != MessageStatus.READ.value,
+                or_(
+                    up_to_id.is_(None),
+                    tuple_(message.created_at, message.id) <= up_to_position,
+                ),
+            )
+            .values(status=MessageStatus.READ.value, updated_at=func.now())
+            .returning(message.room_id)
+            .cte("marked")
+        )
+        result = await self.session.execute(
+            select(marked.c.room_id, func.count()).group_by(marked.c.room_id)
+        )
+        return {str(room_id): count for room_id, count in result}
 
     @staticmethod
-    def _to_entity(model: MessageModel) -> Message:
-        """Convert ORM model to domain entity"""
+    def _to_entity(model) -> Message:
+        """Convert an ORM model or result row to a domain entity"""
         return Message(
             id=str(model.id),
             room_id=str(model.room_id),
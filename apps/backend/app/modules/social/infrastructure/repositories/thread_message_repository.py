@@ -1,11 +1,13 @@
 """ThreadMessage Repository Implementation"""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.modules.social.domain.entities.thread import MessageThread
 from app.modules.social.domain.entities.thread_message import ThreadMessage
 from app.modules.social.domain.repositories.i_thread_message_repository import (
     IThreadMessageRepository,
@@ -13,6 +15,14 @@ from app.modules.social.domain.repositories.i_thread_message_repository import (
 from app.modules.social.infrastructure.database.models.thread_message_model import (
     ThreadMessageModel,
 )
+from app.modules.social.infrastructure.database.models.thread_model import (
+    MessageThreadModel,
+)
+from app.modules.social.infrastructure.database.models.thread_read_cursor_model import (
+    ThreadReadCursorModel,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+from app.shared.infrastructure.database.keyset_window import keyset_window
 
 
 class ThreadMessageRepository(IThreadMessageRepository):
@@ -21,8 +31,8 @@ class ThreadMessageRepository(IThreadMessageRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    def _to_entity(self, model: ThreadMessageModel) -> ThreadMessage:
-        """Convert ORM model to domain entity"""
+    def _to_entity(self, model) -> ThreadMessage:
+        """Convert an ORM model or result row to a domain entity"""
         return ThreadMessage(
             id=str(model.id),
             thread_id=str(model.thread_id),
@@ -51,6 +61,122 @@ class ThreadMessageRepository(IThreadMessageRepository):
         await self.session.refresh(model)
         return self._to_entity(model)
 
+    async def create_in_thread(
+        self, message: ThreadMessage
+    ) -> Optional[Tuple[ThreadMessage, MessageThread]]:
+        """
+        Create a message only if its sender is a participant of the thread
+
+        A single statement with data-modifying CTEs: the thread UPDATE doubles
+        as the authorization check (it matches no row for a non-participant),
+        the INSERT selects from its RETURNING, and the sender's read cursor is
+        upserted from the new message.
+        """
+        thread = MessageThreadModel
+        sender_id = UUID(message.sender_id)
+        sent_at = literal(message.created_at, ThreadMessageModel.created_at.type)
+
+        bumped = (
+            update(thread)
+            .where(
+                thread.id == UUID(message.thread_id),
+                or_(thread.user_a_id == sender_id, thread.user_b_id == sender_id),
+            )
+            # GREATEST ignores NULL and never moves the thread back in time
+            .values(
+                last_message_at=func.greatest(thread.last_message_at, sent_at),
+                updated_at=sent_at,
+            )
+            .returning(
+                thread.id,
+                thread.user_a_id,
+                thread.user_b_id,
+                thread.created_at,
+                thread.updated_at,
+                thread.last_message_at,
+            )
+            .cte("bumped")
+        )
+
+        message_model = ThreadMessageModel
+        inserted = (
+            insert(message_model)
+            .from_select(
+                ["id", "thread_id", "sender_id", "content", "post_id", "created_at"],
+                select(
+                    literal(UUID(message.id), message_model.id.type),
+                    bumped.c.id,
+                    literal(sender_id, message_model.sender_id.type),
+                    literal(message.content, message_model.content.type),
+                    literal(
+                        UUID(message.post_id) if message.post_id else None,
+                        message_model.post_id.type,
+                    ),
+                    sent_at,
+                ),
+            )
+            .returning(
+                message_model.id,
+                message_model.thread_id,
+                message_model.sender_id,
+                message_model.content,
+                message_model.post_id,
+                message_model.created_at,
+            )
+            .cte("inserted")
+        )
+
+        cursor = ThreadReadCursorModel
+        read = insert(cursor).from_select(
+            [
+                "thread_id",
+                "user_id",
+                "last_read_at",
+                "last_read_message_id",
+                "updated_at",
+            ],
+            select(
+                inserted.c.thread_id,
+                inserted.c.sender_id,
+                inserted.c.created_at,
+                inserted.c.id,
+                func.now(),
+            ),
+        )
+        read = read.on_conflict_do_update(
+            index_elements=[cursor.thread_id, cursor.user_id],
+            set_={
+                "last_read_at": read.excluded.last_read_at,
+                "last_read_message_id": read.excluded.last_read_message_id,
+                "updated_at": read.excluded.updated_at,
+            },
+            where=cursor.last_read_at < read.excluded.last_read_at,
+        ).cte("read")
+
+        stmt = (
+            select(
+                inserted,
+                bumped.c.user_a_id,
+                bumped.c.user_b_id,
+                bumped.c.created_at.label("thread_created_at"),
+                bumped.c.updated_at.label("thread_updated_at"),
+                bumped.c.last_message_at,
+            )
+            .select_from(inserted.join(bumped, inserted.c.thread_id == bumped.c.id))
+            .add_cte(read)
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return self._to_entity(row), MessageThread(
+            id=str(row.thread_id),
+            user_a_id=str(row.user_a_id),
+            user_b_id=str(row.user_b_id),
+            created_at=row.thread_created_at,
+            updated_at=row.thread_updated_at,
+            last_message_at=row.last_message_at,
+        )
+
     async def get_by_id(self, message_id: str) -> Optional[ThreadMessage]:
         """Get message by ID"""
         stmt = select(ThreadMessageModel).where(
@@ -61,18 +187,34 @@ class ThreadMessageRepository(IThreadMessageRepository):
         return self._to_entity(model) if model else None
 
     async def get_messages_by_thread(
-        self, thread_id: str, limit: int = 50, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        before: Optional[KeysetCursor] = None,
+        after: Optional[KeysetCursor] = None,
     ) -> List[ThreadMessage]:
-        """Get messages for a thread (ordered by created_at ascending)"""
-        stmt = (
-            select(ThreadMessageModel)
-            .where(ThreadMessageModel.thread_id == UUID(thread_id))
-            .order_by(ThreadMessageModel.created_at.asc())
-            .limit(limit)
-            .offset(offset)
+        """
+        Get one window of a thread's messages (ordered by created_at ascending)
+
+        The window is the newest `limit` messages, or the ones right before or
+        after a cursor, read from idx_thread_message_thread_created.
+        """
+        message = ThreadMessageModel
+        stmt = keyset_window(
+            select(message).where(message.thread_id == UUID(thread_id)),
+            message.created_at,
+            message.id,
+            limit,
+            before=before,
+            after=after,
         )
+        if offset:
+            stmt = stmt.offset(offset)
         result = await self.session.execute(stmt)
         models = result.scalars().all()
+        if after is None:
+            models = reversed(models)
         return [self._to_entity(model) for model in models]
 
     async def delete(self, message_id: str) -> None:
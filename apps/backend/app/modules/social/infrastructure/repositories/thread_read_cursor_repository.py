@@ -0,0 +1,147 @@
+"""ThreadReadCursor Repository Implementation"""
+
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, literal_column, or_, select, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.modules.social.domain.entities.thread_read_cursor import ThreadReadCursor
+from app.modules.social.domain.repositories.i_thread_read_cursor_repository import (
+    IThreadReadCursorRepository,
+)
+from app.modules.social.infrastructure.database.models.thread_message_model import (
+    ThreadMessageModel,
+)
+from app.modules.social.infrastructure.database.models.thread_model import (
+    MessageThreadModel,
+)
+from app.modules.social.infrastructure.database.models.thread_read_cursor_model import (
+    ThreadReadCursorModel,
+)
+
+
+def unread_count_query(thread_id, last_read_at, user_id: UUID) -> Select:
+    """
+    Count of a user's unread messages in one thread
+
+    `thread_id` and `last_read_at` may be values or columns of an enclosing
+    query (use `.lateral()`; the cursor is usually LEFT JOINed, so a missing
+    cursor means nothing was read). The count is a range scan on
+    idx_thread_message_thread_created starting right after the cursor.
+    """
+    message = aliased(ThreadMessageModel)
+    return select(func.count().label("unread_count")).where(
+        message.thread_id == thread_id,
+        message.created_at
+        > func.coalesce(last_read_at, literal_column("'-infinity'::timestamptz")),
+        message.sender_id != user_id,
+    )
+
+
+class ThreadReadCursorRepository(IThreadReadCursorRepository):
+    """Repository implementation for ThreadReadCursor using SQLAlchemy"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, thread_id: str, user_id: str) -> Optional[ThreadReadCursor]:
+        """Get the user's read cursor in a thread"""
+        cursor = ThreadReadCursorModel
+        result = await self.session.execute(
+            select(cursor).where(
+                cursor.thread_id == UUID(thread_id), cursor.user_id == UUID(user_id)
+            )
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def mark_read(
+        self,
+        thread_id: str,
+        user_id: str,
+        read_at: datetime,
+        message_id: Optional[str] = None,
+    ) -> ThreadReadCursor:
+        """Upsert the cursor; the conflict update only applies if it moves forward"""
+        cursor = ThreadReadCursorModel
+        stmt = insert(cursor).values(
+            thread_id=UUID(thread_id),
+            user_id=UUID(user_id),
+            last_read_at=read_at,
+            last_read_message_id=UUID(message_id) if message_id else None,
+            updated_at=datetime.now(timezone.utc),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cursor.thread_id, cursor.user_id],
+            set_={
+                "last_read_at": stmt.excluded.last_read_at,
+                "last_read_message_id": stmt.excluded.last_read_message_id,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=cursor.last_read_at < stmt.excluded.last_read_at,
+        ).returning(
+            cursor.thread_id,
+            cursor.user_id,
+            cursor.last_read_at,
+            cursor.last_read_message_id,
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            # Already read past read_at: keep (and return) the newer cursor
+            return await self.get(thread_id, user_id)
+        return self._to_entity(row)
+
+    async def count_unread(self, thread_id: str, user_id: str) -> int:
+        """Count unread messages in one thread"""
+        viewer = UUID(user_id)
+        read_until = (
+            select(ThreadReadCursorModel.last_read_at)
+            .where(
+                ThreadReadCursorModel.thread_id == UUID(thread_id),
+                ThreadReadCursorModel.user_id == viewer,
+            )
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            unread_count_query(UUID(thread_id), read_until, viewer)
+        )
+        return result.scalar_one()
+
+    async def count_unread_for_user(self, user_id: str) -> Dict[str, int]:
+        """Count unread messages in all of the user's threads in one query"""
+        thread = MessageThreadModel
+        cursor = ThreadReadCursorModel
+        viewer = UUID(user_id)
+        unread = unread_count_query(thread.id, cursor.last_read_at, viewer).lateral(
+            "unread"
+        )
+
+        stmt = (
+            select(thread.id, unread.c.unread_count)
+            .outerjoin(
+                cursor, and_(cursor.thread_id == thread.id, cursor.user_id == viewer)
+            )
+            .join(unread, true())
+            .where(
+                or_(thread.user_a_id == viewer, thread.user_b_id == viewer),
+                unread.c.unread_count > 0,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return {str(thread_id): count for thread_id, count in result}
+
+    @staticmethod
+    def _to_entity(row) -> ThreadReadCursor:
+        """Convert an ORM model or result row to a domain entity"""
+        return ThreadReadCursor(
+            thread_id=str(row.thread_id),
+            user_id=str(row.user_id),
+            last_read_at=row.last_read_at,
+            last_read_message_id=(
+                str(row.last_read_message_id) if row.last_read_message_id else None
+            ),
+        )
@@ -3,14 +3,30 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import and_, case, func, or_, select, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.modules.identity.infrastructure.database.models.profile_model import (
+    ProfileModel,
+)
+from app.modules.social.domain.entities.inbox_thread import InboxThread
 from app.modules.social.domain.entities.thread import MessageThread
+from app.modules.social.domain.entities.thread_message import ThreadMessage
 from app.modules.social.domain.repositories.i_thread_repository import IThreadRepository
+from app.modules.social.infrastructure.database.models.thread_message_model import (
+    ThreadMessageModel,
+)
 from app.modules.social.infrastructure.database.models.thread_model import (
     MessageThreadModel,
 )
+from app.modules.social.infrastructure.database.models.thread_read_cursor_model import (
+    ThreadReadCursorModel,
+)
+from app.modules.social.infrastructure.repositories.thread_read_cursor_repository import (
+    unread_count_query,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
 
 
 class ThreadRepository(IThreadRepository):
@@ -92,6 +108,104 @@ class ThreadRepository(IThreadRepository):
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
+    async def get_inbox_for_user(
+        self,
+        user_id: str,
+        limit: int = 20,
+        cursor: Optional[KeysetCursor] = None,
+    ) -> List[InboxThread]:
+        """
+        Get the user's inbox in a single query
+
+        Two LATERAL subqueries run per thread on the page, both served by
+        idx_thread_message_thread_created: the latest message (LIMIT 1) and
+        the count of the other participant's messages after the user's read
+        cursor.
+        """
+        thread = MessageThreadModel
+        viewer = UUID(user_id)
+        other_id = case(
+            (thread.user_a_id == viewer, thread.user_b_id), else_=thread.user_a_id
+        )
+        activity_at = func.coalesce(thread.last_message_at, thread.created_at)
+
+        latest = aliased(ThreadMessageModel)
+        last_message = (
+            select(
+                latest.id,
+                latest.sender_id,
+                latest.content,
+                latest.post_id,
+                latest.created_at,
+            )
+            .where(latest.thread_id == thread.id)
+            .order_by(latest.created_at.desc(), latest.id.desc())
+            .limit(1)
+            .lateral("last_message")
+        )
+
+        read_cursor = ThreadReadCursorModel
+        unread = unread_count_query(
+            thread.id, read_cursor.last_read_at, viewer
+        ).lateral("unread")
+
+        stmt = (
+            select(
+                thread,
+                other_id.label("other_user_id"),
+                ProfileModel.nickname,
+                ProfileModel.avatar_url,
+                last_message.c.id.label("last_message_id"),
+                last_message.c.sender_id.label("last_sender_id"),
+                last_message.c.content.label("last_content"),
+                last_message.c.post_id.label("last_post_id"),
+                last_message.c.created_at.label("last_created_at"),
+                unread.c.unread_count,
+            )
+            .outerjoin(ProfileModel, ProfileModel.user_id == other_id)
+            .outerjoin(
+                read_cursor,
+                and_(
+                    read_cursor.thread_id == thread.id, read_cursor.user_id == viewer
+                ),
+            )
+            .outerjoin(last_message, true())
+            .join(unread, true())
+            .where(or_(thread.user_a_id == viewer, thread.user_b_id == viewer))
+        )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(activity_at, thread.id)
+                < tuple_(cursor.created_at, UUID(cursor.id))
+            )
+        stmt = stmt.order_by(activity_at.desc(), thread.id.desc()).limit(limit)
+
+        result = await self.session.execute(stmt)
+        inbox = []
+        for row in result:
+            model = row.MessageThreadModel
+            message = None
+            if row.last_message_id is not None:
+                message = ThreadMessage(
+                    id=str(row.last_message_id),
+                    thread_id=str(model.id),
+                    sender_id=str(row.last_sender_id),
+                    content=row.last_content,
+                    post_id=str(row.last_post_id) if row.last_post_id else None,
+                    created_at=row.last_created_at,
+                )
+            inbox.append(
+                InboxThread(
+                    thread=self._to_entity(model),
+                    other_user_id=str(row.other_user_id),
+                    other_nickname=row.nickname,
+                    other_avatar_url=row.avatar_url,
+                    last_message=message,
+                    unread_count=row.unread_count,
+                )
+            )
+        return inbox
+
     async def update(self, thread: MessageThread) -> MessageThread:
         """Update an existing thread"""
         stmt = select(MessageThreadModel).where(
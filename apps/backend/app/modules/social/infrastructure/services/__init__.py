@@ -1,8 +1,11 @@
 """Services package for social module infrastructure."""
 
+from app.modules.social.infrastructure.services.relationship_query_service_impl import (
+    RelationshipQueryServiceImpl,
+)
 from app.modules.social.infrastructure.services.search_quota_service import (
     SearchQuotaModel,
     SearchQuotaService,
 )
 
-__all__ = ["SearchQuotaService", "SearchQuotaModel"]
+__all__ = ["SearchQuotaService", "SearchQuotaModel", "RelationshipQueryServiceImpl"]
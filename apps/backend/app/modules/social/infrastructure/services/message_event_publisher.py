@@ -0,0 +1,78 @@
+"""
+Message Event Publisher Implementation
+
+Queues realtime events with Postgres NOTIFY on the request's own session, so
+subscribers on every worker are told about a message only after the
+transaction that wrote it has committed.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.message import Message
+from app.modules.social.domain.entities.thread import MessageThread
+from app.modules.social.domain.entities.thread_message import ThreadMessage
+from app.modules.social.domain.services.i_message_event_publisher import (
+    IMessageEventPublisher,
+)
+from app.shared.infrastructure.realtime.pg_notify import notify
+
+THREAD_MESSAGE_EVENT = "thread.message"
+CHAT_MESSAGE_EVENT = "chat.message"
+
+
+def thread_topic(thread_id: str) -> str:
+    """Topic woken by new messages in a thread"""
+    return f"thread:{thread_id}"
+
+
+def chat_topic(room_id: str) -> str:
+    """Topic woken by new messages in a chat room (long-poll waiters)"""
+    return f"chat:{room_id}"
+
+
+class MessageEventPublisher(IMessageEventPublisher):
+    """IMessageEventPublisher backed by Postgres LISTEN/NOTIFY"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def publish_thread_message(
+        self, thread: MessageThread, message: ThreadMessage
+    ) -> None:
+        """Announce a new thread message to both participants"""
+        await notify(
+            self.session,
+            [thread.user_a_id, thread.user_b_id],
+            {
+                "type": THREAD_MESSAGE_EVENT,
+                "data": {
+                    "id": message.id,
+                    "thread_id": message.thread_id,
+                    "sender_id": message.sender_id,
+                    "content": message.content,
+                    "post_id": message.post_id,
+                    "created_at": message.created_at.isoformat(),
+                },
+            },
+            topic=thread_topic(message.thread_id),
+        )
+
+    async def publish_chat_message(self, chat_room: ChatRoom, message: Message) -> None:
+        """Announce a new chat message to the room's participants"""
+        await notify(
+            self.session,
+            chat_room.participant_ids,
+            {
+                "type": CHAT_MESSAGE_EVENT,
+                "data": {
+                    "id": message.id,
+                    "room_id": message.room_id,
+                    "sender_id": message.sender_id,
+                    "content": message.content,
+                    "status": message.status.value,
+                    "created_at": message.created_at.isoformat(),
+                },
+            },
+            topic=chat_topic(message.room_id),
+        )
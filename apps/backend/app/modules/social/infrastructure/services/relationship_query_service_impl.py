@@ -0,0 +1,125 @@
+"""
+Relationship Query Service Implementation
+
+Implements IRelationshipQueryService from shared contracts with a single
+query scoped to the requested users, so the cost depends on the number of
+users asked about rather than on how many threads, requests or friendships
+the viewer has.
+"""
+
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy import and_, column, exists, or_, select, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.identity.infrastructure.database.models.profile_model import (
+    ProfileModel,
+)
+from app.modules.social.domain.entities.friendship import FriendshipStatus
+from app.modules.social.domain.entities.message_request import RequestStatus
+from app.modules.social.infrastructure.database.models.friendship_model import (
+    FriendshipModel,
+)
+from app.modules.social.infrastructure.database.models.message_request_model import (
+    MessageRequestModel,
+)
+from app.modules.social.infrastructure.database.models.thread_model import (
+    MessageThreadModel,
+)
+from app.modules.social.infrastructure.repositories.friendship_repository_impl import (
+    pair_key,
+)
+from app.shared.domain.contracts.i_relationship_query_service import (
+    IRelationshipQueryService,
+    RelationshipStateDTO,
+)
+
+
+def _between(left_col, right_col, viewer_id: UUID, other_id_col):
+    """Match a row linking the viewer and the other user in either direction"""
+    return or_(
+        and_(left_col == viewer_id, right_col == other_id_col),
+        and_(left_col == other_id_col, right_col == viewer_id),
+    )
+
+
+class RelationshipQueryServiceImpl(IRelationshipQueryService):
+    """SQLAlchemy implementation of the relationship query service"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_relationship_states(
+        self, viewer_id: UUID, other_user_ids: List[UUID]
+    ) -> Dict[UUID, RelationshipStateDTO]:
+        """Get the relationship between a viewer and each of the given users."""
+        unique_ids = list(dict.fromkeys(other_user_ids))
+        if not unique_ids:
+            return {}
+
+        others = values(
+            column("user_id", PGUUID(as_uuid=True)), name="others"
+        ).data([(user_id,) for user_id in unique_ids])
+        other_id = others.c.user_id
+
+        has_thread = exists().where(
+            _between(
+                MessageThreadModel.user_a_id,
+                MessageThreadModel.user_b_id,
+                viewer_id,
+                other_id,
+            )
+        )
+        has_pending_request = exists().where(
+            MessageRequestModel.status == RequestStatus.PENDING.value,
+            _between(
+                MessageRequestModel.sender_id,
+                MessageRequestModel.recipient_id,
+                viewer_id,
+                other_id,
+            ),
+        )
+        user_a_id, user_b_id = pair_key(viewer_id, other_id)
+        is_blocked = exists().where(
+            FriendshipModel.user_a_id == user_a_id,
+            FriendshipModel.user_b_id == user_b_id,
+            or_(FriendshipModel.blocked_by_a, FriendshipModel.blocked_by_b),
+        )
+        is_friend = exists().where(
+            FriendshipModel.user_a_id == user_a_id,
+            FriendshipModel.user_b_id == user_b_id,
+            FriendshipModel.status == FriendshipStatus.ACCEPTED.value,
+        )
+
+        query = select(
+            other_id,
+            has_thread.label("has_thread"),
+            has_pending_request.label("has_pending_request"),
+            is_blocked.label("is_blocked"),
+            is_friend.label("is_friend"),
+            ProfileModel.user_id.label("profile_user_id"),
+            ProfileModel.privacy_flags,
+        ).select_from(
+            others.outerjoin(ProfileModel, ProfileModel.user_id == other_id)
+        )
+
+        result = await self.session.execute(query)
+
+        states = {}
+        for row in result:
+            allow_stranger_chat = None
+            if row.profile_user_id is not None:
+                allow_stranger_chat = (row.privacy_flags or {}).get(
+                    "allow_stranger_chat", True
+                )
+            states[row.user_id] = RelationshipStateDTO(
+                user_id=row.user_id,
+                has_thread=row.has_thread,
+                has_pending_request=row.has_pending_request,
+                is_blocked=row.is_blocked,
+                is_friend=row.is_friend,
+                allow_stranger_chat=allow_stranger_chat,
+            )
+        return states
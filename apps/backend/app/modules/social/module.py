@@ -6,6 +6,9 @@ Provides social features related use cases using python-injector.
 from injector import Module, provider
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.modules.social.application.services.chat_access_cache import (
+    chat_access_cache,
+)
 from app.modules.social.application.services.chat_room_service_impl import (
     ChatRoomServiceImpl,
 )
@@ -41,6 +44,7 @@ from app.modules.social.infrastructure.repositories.report_repository_impl impor
 )
 from app.shared.domain.contracts.i_chat_room_service import IChatRoomService
 from app.shared.domain.contracts.i_friendship_service import IFriendshipService
+from app.shared.infrastructure.database.transaction_hooks import after_commit_of
 
 
 class SocialModule(Module):
@@ -66,14 +70,21 @@ class SocialModule(Module):
         friendship_repo = FriendshipRepositoryImpl(session)
         chat_room_repo = ChatRoomRepositoryImpl(session)
         return AcceptFriendRequestUseCase(
-            friendship_repository=friendship_repo, chat_room_repository=chat_room_repo
+            friendship_repository=friendship_repo,
+            chat_room_repository=chat_room_repo,
+            access_cache=chat_access_cache,
+            after_commit=after_commit_of(session),
         )
 
     @provider
     def provide_block_user_use_case(self, session: AsyncSession) -> BlockUserUseCase:
         """Provide BlockUserUseCase with dependencies."""
         friendship_repo = FriendshipRepositoryImpl(session)
-        return BlockUserUseCase(friendship_repository=friendship_repo)
+        return BlockUserUseCase(
+            friendship_repository=friendship_repo,
+            access_cache=chat_access_cache,
+            after_commit=after_commit_of(session),
+        )
 
     # Chat Use Cases
     @provider
@@ -104,7 +115,11 @@ class SocialModule(Module):
     def provide_friendship_service(self, session: AsyncSession) -> IFriendshipService:
         """Provide IFriendshipService implementation."""
         friendship_repo = FriendshipRepositoryImpl(session)
-        return FriendshipServiceImpl(friendship_repository=friendship_repo)
+        return FriendshipServiceImpl(
+            friendship_repository=friendship_repo,
+            access_cache=chat_access_cache,
+            after_commit=after_commit_of(session),
+        )
 
     @provider
     def provide_chat_room_service(self, session: AsyncSession) -> IChatRoomService:
@@ -3,6 +3,7 @@ Chat Router for Social Module
 Handles chat rooms, messages, and FCM push notifications
 """
 
+import asyncio
 import logging
 from typing import Annotated, Optional
 from uuid import UUID
@@ -10,13 +11,20 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.modules.social.application.services.chat_access_cache import (
+    chat_access_cache,
+)
 from app.modules.social.application.use_cases.chat.get_messages_use_case import (
     GetMessagesUseCase,
 )
+from app.modules.social.application.use_cases.chat.mark_rooms_read_use_case import (
+    MarkRoomsReadUseCase,
+)
 from app.modules.social.application.use_cases.chat.send_message_use_case import (
     SendMessageUseCase,
 )
-from app.modules.social.domain.entities.message import MessageStatus
+from app.modules.social.domain.entities.message import Message, MessageStatus
 from app.modules.social.infrastructure.repositories.chat_room_repository_impl import (
     ChatRoomRepositoryImpl,
 )
@@ -26,24 +34,32 @@ from app.modules.social.infrastructure.repositories.friendship_repository_impl i
 from app.modules.social.infrastructure.repositories.message_repository_impl import (
     MessageRepositoryImpl,
 )
+from app.modules.social.infrastructure.services.message_event_publisher import (
+    MessageEventPublisher,
+    chat_topic,
+)
 from app.modules.social.presentation.schemas.chat_schemas import (
     ChatRoomListResponse,
     ChatRoomListResponseWrapper,
+    ChatRoomParticipantResponse,
     ChatRoomResponse,
     MessageResponse,
     MessageResponseWrapper,
     MessagesListResponse,
     MessagesListResponseWrapper,
+    ReadReceiptsRequest,
+    ReadReceiptsResponse,
+    ReadReceiptsResponseWrapper,
     SendMessageRequest,
 )
+from app.shared.domain.keyset_cursor import KeysetCursor
 from app.shared.infrastructure.database.connection import get_db_session
 from app.shared.infrastructure.external.fcm_service import get_fcm_service
-from app.shared.presentation.dependencies.auth import get_current_user_id
-
-# Import ProfileRepositoryImpl for fetching user profiles
-from app.modules.identity.infrastructure.repositories.profile_repository_impl import (
-    ProfileRepositoryImpl,
+from app.shared.infrastructure.realtime.event_hub import (
+    WaiterLimitExceededError,
+    event_hub,
 )
+from app.shared.presentation.dependencies.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +67,18 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chats", tags=["Chat"])
 
 
+def _to_message_response(message: Message) -> MessageResponse:
+    """Map a message entity to its response schema"""
+    return MessageResponse(
+        id=UUID(message.id),
+        room_id=UUID(message.room_id),
+        sender_id=UUID(message.sender_id),
+        content=message.content,
+        status=message.status.value,
+        created_at=message.created_at,
+    )
+
+
 @router.get(
     "",
     response_model=ChatRoomListResponseWrapper,
@@ -70,62 +98,41 @@ async def get_chat_rooms(
     """
     Get all chat rooms for the current user.
 
-    Returns a list of chat rooms with:
+    Returns a list of chat rooms, most recently active first, with:
     - Room details
-    - Participants
+    - Participants (profiles)
     - Last message
-    - Unread count (placeholder)
+    - Unread count
+
+    Everything comes from a single query.
     """
     try:
-        # Initialize repositories
         chat_room_repo = ChatRoomRepositoryImpl(session)
-        profile_repo = ProfileRepositoryImpl(session)
-
-        # Get chat rooms for user
-        chat_rooms = await chat_room_repo.get_rooms_by_user_id(str(current_user_id))
-
-        # Convert to response format
-        # Note: In a real implementation, we would fetch:
-        # - User profiles for participants
-        # - Last message for each room
-        # - Unread count
-        from app.modules.social.presentation.schemas.chat_schemas import (
-            ChatRoomParticipantResponse,
+        summaries = await chat_room_repo.get_room_summaries_for_user(
+            str(current_user_id)
         )
 
-        room_responses = []
-        for room in chat_rooms:
-            participants = []
-            for uid in room.participant_ids:
-                # Fetch profile data for each participant
-                try:
-                    profile = await profile_repo.get_by_user_id(UUID(uid))
-                    participants.append(
-                        ChatRoomParticipantResponse(
-                            user_id=UUID(uid),
-                            nickname=profile.nickname if profile else None,
-                            avatar_url=profile.avatar_url if profile else None,
-                        )
-                    )
-                except Exception:
-                    # If profile fetch fails, still include user_id with None values
-                    participants.append(
-                        ChatRoomParticipantResponse(
-                            user_id=UUID(uid),
-                            nickname=None,
-                            avatar_url=None,
-                        )
+        room_responses = [
+            ChatRoomResponse(
+                id=UUID(summary.room.id),
+                participants=[
+                    ChatRoomParticipantResponse(
+                        user_id=UUID(participant.user_id),
+                        nickname=participant.nickname,
+                        avatar_url=participant.avatar_url,
                     )
-
-            room_responses.append(
-                ChatRoomResponse(
-                    id=UUID(room.id),
-                    participants=participants,
-                    last_message=None,  # TODO: Fetch last message
-                    unread_count=0,  # TODO: Calculate unread count
-                    created_at=room.created_at,
-                )
+                    for participant in summary.participants
+                ],
+                last_message=(
+                    _to_message_response(summary.last_message)
+                    if summary.last_message
+                    else None
+                ),
+                unread_count=summary.unread_count,
+                created_at=summary.room.created_at,
             )
+            for summary in summaries
+        ]
 
         data = ChatRoomListResponse(rooms=room_responses, total=len(room_responses))
         return ChatRoomListResponseWrapper(data=data, meta=None, error=None)
@@ -144,70 +151,129 @@ async def get_chat_rooms(
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Messages retrieved successfully"},
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Unauthorized (not logged in)"},
         403: {"description": "Forbidden (not a participant of this room)"},
         404: {"description": "Chat room not found"},
         500: {"description": "Internal server error"},
+        503: {"description": "Too many parked long-poll requests (see Retry-After)"},
     },
     summary="Get messages",
-    description="Get messages from a chat room (with pagination support via after_message_id)",
+    description=(
+        "Get the newest messages of a chat room (page back with before, poll "
+        "with after; pass wait= to long-poll for new messages)"
+    ),
 )
 async def get_messages(
     room_id: UUID,
     current_user_id: Annotated[UUID, Depends(get_current_user_id)],
     session: Annotated[AsyncSession, Depends(get_db_session)],
     after_message_id: Optional[UUID] = Query(
-        None, description="Get messages after this message ID"
+        None, description="Get messages after this message ID (legacy; prefer after)"
     ),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of messages"),
+    before: Annotated[
+        Optional[str],
+        Query(description="Cursor (before_cursor) - load messages older than it"),
+    ] = None,
+    after: Annotated[
+        Optional[str],
+        Query(description="Cursor (after_cursor) - get messages newer than it"),
+    ] = None,
+    wait: Annotated[
+        int,
+        Query(
+            ge=0,
+            le=settings.CHAT_LONG_POLL_MAX_WAIT_SECONDS,
+            description="Seconds to wait for a new message if there is none yet",
+        ),
+    ] = 0,
 ) -> MessagesListResponseWrapper:
     """
     Get messages from a chat room.
 
-    Supports pagination via after_message_id for polling:
-    - Pass after_message_id to get only new messages since that ID
-    - Useful for implementing polling mechanism in client
+    Without a cursor, returns the newest messages (oldest first within the
+    page). Pagination uses (created_at, id) cursors from the response:
+    - Pass before=before_cursor to load older history
+    - Pass after=after_cursor to get only new messages (polling)
+    - after_message_id is still accepted for older clients
+
+    Long-polling: with wait > 0, a request that finds no messages is parked
+    until a message is sent to the room (on any worker) or `wait` seconds
+    pass, then returns the new messages or an empty list. The DB connection
+    is released while parked. Each worker parks at most
+    CHAT_LONG_POLL_MAX_WAITERS requests; beyond that it answers 503 with
+    Retry-After.
     """
     try:
         # Initialize repositories and use case
         message_repo = MessageRepositoryImpl(session)
         chat_room_repo = ChatRoomRepositoryImpl(session)
         friendship_repo = FriendshipRepositoryImpl(session)
-        use_case = GetMessagesUseCase(message_repo, chat_room_repo, friendship_repo)
-
-        # Execute use case
-        messages = await use_case.execute(
-            room_id=str(room_id),
-            requesting_user_id=str(current_user_id),
-            after_message_id=str(after_message_id) if after_message_id else None,
-            limit=limit,
+        use_case = GetMessagesUseCase(
+            message_repo, chat_room_repo, friendship_repo, chat_access_cache
         )
 
-        # Convert to response format
-        message_responses = [
-            MessageResponse(
-                id=UUID(msg.id),
-                room_id=UUID(msg.room_id),
-                sender_id=UUID(msg.sender_id),
-                content=msg.content,
-                status=msg.status.value,
-                created_at=msg.created_at,
+        async def fetch_messages():
+            return await use_case.execute(
+                room_id=str(room_id),
+                requesting_user_id=str(current_user_id),
+                after_message_id=str(after_message_id) if after_message_id else None,
+                limit=limit,
+                before=before,
+                after=after,
             )
-            for msg in messages
-        ]
+
+        # Without the LISTEN connection nothing would wake a parked request
+        if not wait or not settings.REALTIME_ENABLED:
+            messages = await fetch_messages()
+        else:
+            # Park before reading so a message sent in between still wakes us
+            with event_hub.waiter(chat_topic(str(room_id))) as new_message:
+                messages = await fetch_messages()
+                if not messages:
+                    await session.commit()
+                    try:
+                        await asyncio.wait_for(new_message.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    else:
+                        messages = await fetch_messages()
+
+        # Convert to response format
+        message_responses = [_to_message_response(msg) for msg in messages]
 
         data = MessagesListResponse(
             messages=message_responses,
             total=len(message_responses),
             has_more=len(messages)
             == limit,  # If we got exactly limit, there might be more
+            before_cursor=(
+                KeysetCursor.from_row(messages[0].created_at, messages[0].id).encode()
+                if messages
+                else None
+            ),
+            # An empty poll keeps the caller's position
+            after_cursor=(
+                KeysetCursor.from_row(messages[-1].created_at, messages[-1].id).encode()
+                if messages
+                else after
+            ),
         )
 
         return MessagesListResponseWrapper(data=data, meta=None, error=None)
 
+    except WaiterLimitExceededError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many waiting requests, retry later",
+            headers={"Retry-After": str(wait)},
+        )
     except ValueError as e:
         error_msg = str(e).lower()
-        if "not found" in error_msg:
+        if "cursor" in error_msg:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        elif "not found" in error_msg:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         elif "not a participant" in error_msg or "not authorized" in error_msg:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
@@ -254,7 +320,7 @@ async def send_message(
     - Sender must be a participant in the room
 
     After successful message creation:
-    - Triggers FCM push notification to recipient
+    - Schedules an FCM push notification to the recipient (not awaited)
     - Notification failure does not fail the request
     """
     try:
@@ -263,7 +329,12 @@ async def send_message(
         chat_room_repo = ChatRoomRepositoryImpl(session)
         friendship_repo = FriendshipRepositoryImpl(session)
 
-        use_case = SendMessageUseCase(message_repo, chat_room_repo, friendship_repo)
+        use_case = SendMessageUseCase(
+            message_repo,
+            chat_room_repo,
+            friendship_repo,
+            event_publisher=MessageEventPublisher(session),
+        )
 
         # Execute use case
         message = await use_case.execute(
@@ -273,27 +344,22 @@ async def send_message(
         )
 
         # Convert to response
-        data = MessageResponse(
-            id=UUID(message.id),
-            room_id=UUID(message.room_id),
-            sender_id=UUID(message.sender_id),
-            content=message.content,
-            status=message.status.value,
-            created_at=message.created_at,
-        )
+        data = _to_message_response(message)
 
-        # Send FCM push notification (non-blocking, failures are logged)
+        # Schedule FCM push notification (not awaited, failures are logged)
         try:
             fcm_service = get_fcm_service()
 
-            # Get chat room to find recipient
-            chat_room = await chat_room_repo.get_by_id(str(room_id))
+            # Get chat room to find recipient (usually cached by the sender's polls)
+            chat_room = chat_access_cache.get_room(str(room_id))
+            if chat_room is None:
+                chat_room = await chat_room_repo.get_by_id(str(room_id))
             if chat_room:
                 recipient_id = chat_room.get_other_participant(str(current_user_id))
 
-                # Send notification
+                # Send notification in the background
                 # Note: In production, we would fetch FCM token from user profile
-                await fcm_service.send_notification(
+                fcm_service.schedule_notification(
                     user_id=recipient_id,
                     title="New message",
                     body=message.content[:50]
@@ -410,3 +476,57 @@ async def mark_message_read(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to mark message as read",
         )
+
+
+@router.post(
+    "/read",
+    response_model=ReadReceiptsResponseWrapper,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Read receipts applied"},
+        401: {"description": "Unauthorized (not logged in)"},
+        400: {"description": "Bad request (empty or more than 100 receipts)"},
+        500: {"description": "Internal server error"},
+    },
+    summary="Acknowledge read receipts",
+    description="Mark messages read in several chat rooms in one call",
+)
+async def acknowledge_read_receipts(
+    request: ReadReceiptsRequest,
+    current_user_id: Annotated[UUID, Depends(get_current_user_id)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> ReadReceiptsResponseWrapper:
+    """
+    Acknowledge read receipts for several chat rooms.
+
+    Business rules:
+    - Each receipt marks the room read up to its message (inclusive), or
+      the whole room when no message is given
+    - Only messages received by the current user are marked
+    - Rooms the user is not a participant of are ignored (0 marked)
+    - All receipts are applied in one statement, so they commit together
+    """
+    try:
+        use_case = MarkRoomsReadUseCase(MessageRepositoryImpl(session))
+
+        marked = await use_case.execute(
+            user_id=str(current_user_id),
+            receipts={
+                str(receipt.room_id): (
+                    str(receipt.up_to_message_id)
+                    if receipt.up_to_message_id
+                    else None
+                )
+                for receipt in request.receipts
+            },
+        )
+
+        data = ReadReceiptsResponse(marked=marked, total_marked=sum(marked.values()))
+        return ReadReceiptsResponseWrapper(data=data, meta=None, error=None)
+
+    except Exception as e:
+        logger.error(f"Error acknowledging read receipts: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to acknowledge read receipts",
+        )
@@ -10,6 +10,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.modules.social.application.services.chat_access_cache import (
+    chat_access_cache,
+)
 from app.modules.social.application.use_cases.friends.block_user_use_case import (
     BlockUserUseCase,
 )
@@ -24,6 +27,7 @@ from app.modules.social.presentation.schemas.friends_schemas import (
     UnblockUserRequest,
 )
 from app.shared.infrastructure.database.connection import get_db_session
+from app.shared.infrastructure.database.transaction_hooks import after_commit_of
 from app.shared.presentation.dependencies.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
@@ -59,7 +63,11 @@ async def block_user(
     """
     try:
         friendship_repo = FriendshipRepositoryImpl(session)
-        use_case = BlockUserUseCase(friendship_repository=friendship_repo)
+        use_case = BlockUserUseCase(
+            friendship_repository=friendship_repo,
+            access_cache=chat_access_cache,
+            after_commit=after_commit_of(session),
+        )
 
         await use_case.execute(
             blocker_user_id=str(current_user_id),
@@ -102,7 +110,11 @@ async def unblock_user(
     """
     try:
         friendship_repo = FriendshipRepositoryImpl(session)
-        use_case = UnblockUserUseCase(friendship_repository=friendship_repo)
+        use_case = UnblockUserUseCase(
+            friendship_repository=friendship_repo,
+            access_cache=chat_access_cache,
+            after_commit=after_commit_of(session),
+        )
 
         await use_case.execute(
             unblocker_user_id=str(current_user_id),
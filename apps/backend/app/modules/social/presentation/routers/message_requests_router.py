@@ -45,19 +45,20 @@ from app.modules.social.presentation.schemas.message_schemas import (
     ThreadResponse,
 )
 from app.shared.infrastructure.database.connection import get_db_session
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
+)
+from app.shared.presentation.dependencies.services import get_profile_summary_loader
 from app.shared.presentation.deps.require_user import require_user
 
 router = APIRouter(prefix="/message-requests", tags=["message-requests"])
 
 
-async def _get_user_profile_data(user_id: str, profile_repo: ProfileRepositoryImpl):
-    """Helper to fetch nickname and avatar_url for a user"""
-    try:
-        profile = await profile_repo.get_by_user_id(UUID(user_id))
-        if profile:
-            return profile.nickname, profile.avatar_url
-    except Exception:
-        pass
+async def _get_user_profile_data(user_id: str, profiles: ProfileSummaryLoader):
+    """Helper to fetch nickname and avatar_url for a user (batched per request)"""
+    profile = await profiles.load(user_id)
+    if profile:
+        return profile.nickname, profile.avatar_url
     return None, None
 
 
@@ -68,6 +69,7 @@ async def create_message_request(
     request: CreateMessageRequestRequest,
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Create a message request to another user.
@@ -90,7 +92,9 @@ async def create_message_request(
     )
 
     try:
-        # Get recipient's privacy settings (FR-013)
+        # Get recipient's privacy settings (FR-013) from the profile itself:
+        # the summary loader is cached and tolerates failures, which a privacy
+        # decision must not
         recipient_profile = await profile_repo.get_by_user_id(
             UUID(request.recipient_id)
         )
@@ -108,12 +112,15 @@ async def create_message_request(
             recipient_allows_stranger_messages=recipient_allows_stranger_messages,
         )
 
-        # Fetch profile data for sender and recipient
+        # Fetch profile data for sender and recipient (one query)
+        await profiles.load_many(
+            [message_request.sender_id, message_request.recipient_id]
+        )
         sender_nickname, sender_avatar_url = await _get_user_profile_data(
-            message_request.sender_id, profile_repo
+            message_request.sender_id, profiles
         )
         recipient_nickname, recipient_avatar_url = await _get_user_profile_data(
-            message_request.recipient_id, profile_repo
+            message_request.recipient_id, profiles
         )
 
         return {
@@ -144,6 +151,7 @@ async def get_my_message_requests(
     status_filter: str = "pending",
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Get message requests for the current user.
@@ -154,7 +162,6 @@ async def get_my_message_requests(
     - status_filter: "pending", "accepted", "declined", or "all" (default: "pending")
     """
     message_request_repo = MessageRequestRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
     use_case = GetMessageRequestsUseCase(message_request_repo)
 
     try:
@@ -162,14 +169,18 @@ async def get_my_message_requests(
             recipient_id=str(user_id), status_filter=status_filter
         )
 
+        await profiles.load_many(
+            uid for req in requests for uid in (req.sender_id, req.recipient_id)
+        )
+
         # Build response list with profile data
         response_list = []
         for req in requests:
             sender_nickname, sender_avatar_url = await _get_user_profile_data(
-                req.sender_id, profile_repo
+                req.sender_id, profiles
             )
             recipient_nickname, recipient_avatar_url = await _get_user_profile_data(
-                req.recipient_id, profile_repo
+                req.recipient_id, profiles
             )
             response_list.append(
                 MessageRequestResponse(
@@ -199,6 +210,7 @@ async def get_my_sent_message_requests(
     status_filter: str = "pending",
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Get message requests sent by the current user.
@@ -209,7 +221,6 @@ async def get_my_sent_message_requests(
     - status_filter: "pending", "accepted", "declined", or "all" (default: "pending")
     """
     message_request_repo = MessageRequestRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
     use_case = GetSentMessageRequestsUseCase(message_request_repo)
 
     try:
@@ -217,14 +228,18 @@ async def get_my_sent_message_requests(
             sender_id=str(user_id), status_filter=status_filter
         )
 
+        await profiles.load_many(
+            uid for req in requests for uid in (req.sender_id, req.recipient_id)
+        )
+
         # Build response list with profile data
         response_list = []
         for req in requests:
             sender_nickname, sender_avatar_url = await _get_user_profile_data(
-                req.sender_id, profile_repo
+                req.sender_id, profiles
             )
             recipient_nickname, recipient_avatar_url = await _get_user_profile_data(
-                req.recipient_id, profile_repo
+                req.recipient_id, profiles
             )
             response_list.append(
                 MessageRequestResponse(
@@ -254,6 +269,7 @@ async def accept_message_request(
     request_id: str,
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Accept a message request and create a thread.
@@ -263,7 +279,6 @@ async def accept_message_request(
     """
     message_request_repo = MessageRequestRepository(session)
     thread_repo = ThreadRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
 
     use_case = AcceptMessageRequestUseCase(message_request_repo, thread_repo)
 
@@ -272,20 +287,23 @@ async def accept_message_request(
             request_id=request_id, accepting_user_id=str(user_id)
         )
 
-        # Fetch profile data for message request
+        # Fetch profile data for message request (thread users are the same pair)
+        await profiles.load_many(
+            [updated_request.sender_id, updated_request.recipient_id]
+        )
         sender_nickname, sender_avatar_url = await _get_user_profile_data(
-            updated_request.sender_id, profile_repo
+            updated_request.sender_id, profiles
         )
         recipient_nickname, recipient_avatar_url = await _get_user_profile_data(
-            updated_request.recipient_id, profile_repo
+            updated_request.recipient_id, profiles
         )
 
         # Fetch profile data for thread
         user_a_nickname, user_a_avatar_url = await _get_user_profile_data(
-            thread.user_a_id, profile_repo
+            thread.user_a_id, profiles
         )
         user_b_nickname, user_b_avatar_url = await _get_user_profile_data(
-            thread.user_b_id, profile_repo
+            thread.user_b_id, profiles
         )
 
         return {
@@ -330,6 +348,7 @@ async def decline_message_request(
     request_id: str,
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Decline a message request.
@@ -337,7 +356,6 @@ async def decline_message_request(
     Implements FR-012: Recipient can accept/decline requests.
     """
     message_request_repo = MessageRequestRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
     use_case = DeclineMessageRequestUseCase(message_request_repo)
 
     try:
@@ -346,11 +364,14 @@ async def decline_message_request(
         )
 
         # Fetch profile data
+        await profiles.load_many(
+            [updated_request.sender_id, updated_request.recipient_id]
+        )
         sender_nickname, sender_avatar_url = await _get_user_profile_data(
-            updated_request.sender_id, profile_repo
+            updated_request.sender_id, profiles
         )
         recipient_nickname, recipient_avatar_url = await _get_user_profile_data(
-            updated_request.recipient_id, profile_repo
+            updated_request.recipient_id, profiles
         )
 
         return {
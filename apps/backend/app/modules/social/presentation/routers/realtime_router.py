@@ -0,0 +1,120 @@
+"""
+Realtime Router for Social Module
+Pushes new thread and chat messages to connected participants
+
+- WebSocket: /realtime/ws (token via access cookie or `token` query parameter)
+- Server-Sent Events fallback: GET /realtime/events
+
+Both stream the same JSON events ({"type": ..., "data": ...}):
+- thread.message / chat.message: a message was sent to one of your conversations
+- ping: keepalive while idle
+- resync: the connection fell behind and is closing; refetch over HTTP
+"""
+
+import asyncio
+import json
+import logging
+from typing import Annotated, AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.shared.infrastructure.realtime.event_hub import Subscription, event_hub
+from app.shared.presentation.dependencies.auth import (
+    get_current_user_id,
+    get_websocket_user_id,
+)
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/realtime", tags=["Realtime"])
+
+
+@router.websocket("/ws")
+async def realtime_websocket(websocket: WebSocket) -> None:
+    """
+    Stream message events for the current user over a WebSocket.
+
+    Messages sent by the client are ignored; the socket is closed with
+    1008 (policy violation) if the access token is missing or invalid.
+    """
+    user_id = get_websocket_user_id(websocket)
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    with event_hub.subscription(str(user_id)) as subscription:
+        sender = asyncio.create_task(_send_events(websocket, subscription))
+        receiver = asyncio.create_task(_wait_for_disconnect(websocket))
+        done, pending = await asyncio.wait(
+            {sender, receiver}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    if sender in done and sender.exception() is None:
+        # Stream ended with a resync event: close so the client reconnects
+        await websocket.close()
+
+
+async def _send_events(websocket: WebSocket, subscription: Subscription) -> None:
+    async for event in subscription.stream(settings.REALTIME_HEARTBEAT_SECONDS):
+        await websocket.send_json(event)
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+@router.get(
+    "/events",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Event stream (text/event-stream)",
+            "content": {"text/event-stream": {}},
+        },
+        401: {"description": "Unauthorized (not logged in)"},
+    },
+    summary="Stream message events (SSE)",
+    description="Server-Sent Events fallback for clients that cannot hold a WebSocket",
+)
+async def realtime_events(
+    request: Request,
+    current_user_id: Annotated[UUID, Depends(get_current_user_id)],
+) -> StreamingResponse:
+    """
+    Stream message events for the current user as Server-Sent Events.
+
+    Each event is sent as `event: <type>` with the JSON event as `data`;
+    keepalives are SSE comments.
+    """
+
+    async def event_stream() -> AsyncIterator[str]:
+        with event_hub.subscription(str(current_user_id)) as subscription:
+            yield "retry: 3000\n\n"
+            async for event in subscription.stream(
+                settings.REALTIME_HEARTBEAT_SECONDS
+            ):
+                if await request.is_disconnected():
+                    return
+                if event["type"] == "ping":
+                    yield ": ping\n\n"
+                else:
+                    yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
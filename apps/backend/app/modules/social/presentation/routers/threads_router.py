@@ -1,12 +1,13 @@
 """Threads Router - API endpoints for message threads"""
 
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.identity.infrastructure.repositories.profile_repository_impl import (
-    ProfileRepositoryImpl,
+from app.modules.social.application.use_cases.messages.get_inbox import (
+    GetInboxUseCase,
 )
 from app.modules.social.application.use_cases.messages.get_messages import (
     GetThreadMessagesUseCase,
@@ -14,16 +15,32 @@ from app.modules.social.application.use_cases.messages.get_messages import (
 from app.modules.social.application.use_cases.messages.get_threads import (
     GetThreadsUseCase,
 )
+from app.modules.social.application.use_cases.messages.get_unread_counts import (
+    GetUnreadCountsUseCase,
+)
+from app.modules.social.application.use_cases.messages.mark_thread_read import (
+    MarkThreadReadUseCase,
+)
 from app.modules.social.application.use_cases.messages.send_message import (
     SendMessageUseCase,
 )
 from app.modules.social.infrastructure.repositories.thread_message_repository import (
     ThreadMessageRepository,
 )
+from app.modules.social.infrastructure.repositories.thread_read_cursor_repository import (
+    ThreadReadCursorRepository,
+)
 from app.modules.social.infrastructure.repositories.thread_repository import (
     ThreadRepository,
 )
+from app.modules.social.infrastructure.services.message_event_publisher import (
+    MessageEventPublisher,
+)
 from app.modules.social.presentation.schemas.message_schemas import (
+    InboxPageResponse,
+    InboxPageResponseWrapper,
+    InboxThreadResponse,
+    MarkThreadReadRequest,
     SendMessageRequest,
     ThreadListResponse,
     ThreadListResponseWrapper,
@@ -31,22 +48,28 @@ from app.modules.social.presentation.schemas.message_schemas import (
     ThreadMessageResponseWrapper,
     ThreadMessagesResponse,
     ThreadMessagesResponseWrapper,
+    ThreadReadStateResponse,
+    ThreadReadStateResponseWrapper,
     ThreadResponse,
+    UnreadCountsResponse,
+    UnreadCountsResponseWrapper,
 )
+from app.shared.domain.keyset_cursor import KeysetCursor
 from app.shared.infrastructure.database.connection import get_db_session
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
+)
+from app.shared.presentation.dependencies.services import get_profile_summary_loader
 from app.shared.presentation.deps.require_user import require_user
 
 router = APIRouter(prefix="/threads", tags=["threads"])
 
 
-async def _get_user_profile_data(user_id: str, profile_repo: ProfileRepositoryImpl):
-    """Helper to fetch nickname and avatar_url for a user"""
-    try:
-        profile = await profile_repo.get_by_user_id(UUID(user_id))
-        if profile:
-            return profile.nickname, profile.avatar_url
-    except Exception:
-        pass
+async def _get_user_profile_data(user_id: str, profiles: ProfileSummaryLoader):
+    """Helper to fetch nickname and avatar_url for a user (batched per request)"""
+    profile = await profiles.load(user_id)
+    if profile:
+        return profile.nickname, profile.avatar_url
     return None, None
 
 
@@ -56,6 +79,7 @@ async def get_my_threads(
     offset: int = Query(0, ge=0),
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Get all threads for the current user.
@@ -64,21 +88,23 @@ async def get_my_threads(
     Returns threads ordered by last_message_at descending.
     """
     thread_repo = ThreadRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
     use_case = GetThreadsUseCase(thread_repo)
 
     threads = await use_case.execute(
         user_id=str(user_id), limit=limit, offset=offset
     )
+    await profiles.load_many(
+        uid for thread in threads for uid in (thread.user_a_id, thread.user_b_id)
+    )
 
     # Build response list with profile data
     thread_responses = []
     for thread in threads:
         user_a_nickname, user_a_avatar_url = await _get_user_profile_data(
-            thread.user_a_id, profile_repo
+            thread.user_a_id, profiles
         )
         user_b_nickname, user_b_avatar_url = await _get_user_profile_data(
-            thread.user_b_id, profile_repo
+            thread.user_b_id, profiles
         )
         thread_responses.append(
             ThreadResponse(
@@ -105,23 +131,163 @@ async def get_my_threads(
     }
 
 
+@router.get("/inbox", response_model=InboxPageResponseWrapper)
+async def get_my_inbox(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from next_cursor of the previous page"
+    ),
+    user_id: UUID = Depends(require_user),
+    session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
+):
+    """
+    Get the inbox: threads with last-message preview and unread count.
+
+    Threads are ordered by last_message_at descending (creation time for
+    threads without messages) and paginated by cursor. The whole page,
+    including the other participant's profile, comes from one query.
+    """
+    thread_repo = ThreadRepository(session)
+    use_case = GetInboxUseCase(thread_repo)
+
+    try:
+        page = await use_case.execute(user_id=str(user_id), limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    my_nickname, my_avatar_url = None, None
+    if any(row.last_message for row in page.threads):
+        my_nickname, my_avatar_url = await _get_user_profile_data(
+            str(user_id), profiles
+        )
+
+    thread_responses = []
+    for row in page.threads:
+        last_message = None
+        if row.last_message:
+            msg = row.last_message
+            from_other = msg.sender_id == row.other_user_id
+            last_message = ThreadMessageResponse(
+                id=msg.id,
+                thread_id=msg.thread_id,
+                sender_id=msg.sender_id,
+                sender_nickname=row.other_nickname if from_other else my_nickname,
+                sender_avatar_url=(
+                    row.other_avatar_url if from_other else my_avatar_url
+                ),
+                content=msg.content,
+                post_id=msg.post_id,
+                created_at=msg.created_at,
+            )
+        thread_responses.append(
+            InboxThreadResponse(
+                id=row.thread.id,
+                other_user_id=row.other_user_id,
+                other_nickname=row.other_nickname,
+                other_avatar_url=row.other_avatar_url,
+                last_message=last_message,
+                unread_count=row.unread_count,
+                created_at=row.thread.created_at,
+                last_message_at=row.thread.last_message_at,
+            )
+        )
+
+    return {
+        "data": InboxPageResponse(
+            threads=thread_responses, next_cursor=page.next_cursor
+        ),
+        "meta": None,
+        "error": None,
+    }
+
+
+@router.get("/unread-counts", response_model=UnreadCountsResponseWrapper)
+async def get_unread_counts(
+    user_id: UUID = Depends(require_user),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get unread message counts for all of the current user's threads.
+
+    One query for the whole badge refresh; threads with nothing unread are
+    left out of `counts`.
+    """
+    use_case = GetUnreadCountsUseCase(ThreadReadCursorRepository(session))
+    counts = await use_case.execute(user_id=str(user_id))
+
+    return {
+        "data": UnreadCountsResponse(counts=counts, total=sum(counts.values())),
+        "meta": None,
+        "error": None,
+    }
+
+
+@router.post("/{thread_id}/read", response_model=ThreadReadStateResponseWrapper)
+async def mark_thread_read(
+    thread_id: str,
+    request: Optional[MarkThreadReadRequest] = None,
+    user_id: UUID = Depends(require_user),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Mark a thread as read up to a message (the latest one by default).
+
+    The read cursor never moves backwards; the response carries the stored
+    cursor and how many messages are still unread after it.
+    """
+    use_case = MarkThreadReadUseCase(
+        ThreadRepository(session),
+        ThreadMessageRepository(session),
+        ThreadReadCursorRepository(session),
+    )
+
+    try:
+        state = await use_case.execute(
+            thread_id=thread_id,
+            user_id=str(user_id),
+            message_id=request.message_id if request else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    return {
+        "data": ThreadReadStateResponse(
+            thread_id=state.cursor.thread_id,
+            last_read_at=state.cursor.last_read_at,
+            last_read_message_id=state.cursor.last_read_message_id,
+            unread_count=state.unread_count,
+        ),
+        "meta": None,
+        "error": None,
+    }
+
+
 @router.get("/{thread_id}/messages", response_model=ThreadMessagesResponseWrapper)
 async def get_thread_messages(
     thread_id: str,
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Deprecated: use before cursors"),
+    before: Optional[str] = Query(
+        None, description="Cursor (before_cursor) - load messages older than it"
+    ),
+    after: Optional[str] = Query(
+        None, description="Cursor (after_cursor) - get messages newer than it"
+    ),
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Get messages in a thread.
 
-    Returns messages ordered by created_at ascending (oldest first).
+    Returns the newest messages, ordered by created_at ascending within the
+    page. Pass before=before_cursor to load older history and
+    after=after_cursor to fetch messages sent since.
     User must be part of the thread to view messages.
     """
     thread_repo = ThreadRepository(session)
     thread_message_repo = ThreadMessageRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
 
     use_case = GetThreadMessagesUseCase(thread_repo, thread_message_repo)
 
@@ -131,13 +297,16 @@ async def get_thread_messages(
             user_id=str(user_id),
             limit=limit,
             offset=offset,
+            before=before,
+            after=after,
         )
+        await profiles.load_many(msg.sender_id for msg in messages)
 
         # Build response list with profile data
         message_responses = []
         for msg in messages:
             sender_nickname, sender_avatar_url = await _get_user_profile_data(
-                msg.sender_id, profile_repo
+                msg.sender_id, profiles
             )
             message_responses.append(
                 ThreadMessageResponse(
@@ -156,11 +325,27 @@ async def get_thread_messages(
             "data": ThreadMessagesResponse(
                 messages=message_responses,
                 total=len(message_responses),
+                has_more=len(messages) == limit,
+                before_cursor=(
+                    KeysetCursor.from_row(messages[0].created_at, messages[0].id)
+                    .encode()
+                    if messages
+                    else None
+                ),
+                # An empty poll keeps the caller's position
+                after_cursor=(
+                    KeysetCursor.from_row(messages[-1].created_at, messages[-1].id)
+                    .encode()
+                    if messages
+                    else after
+                ),
             ),
             "meta": None,
             "error": None,
         }
     except ValueError as e:
+        if "cursor" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
 
 
@@ -170,6 +355,7 @@ async def send_message(
     request: SendMessageRequest,
     user_id: UUID = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
+    profiles: ProfileSummaryLoader = Depends(get_profile_summary_loader),
 ):
     """
     Send a message in a thread.
@@ -179,9 +365,12 @@ async def send_message(
     """
     thread_repo = ThreadRepository(session)
     thread_message_repo = ThreadMessageRepository(session)
-    profile_repo = ProfileRepositoryImpl(session)
 
-    use_case = SendMessageUseCase(thread_repo, thread_message_repo)
+    use_case = SendMessageUseCase(
+        thread_repo,
+        thread_message_repo,
+        event_publisher=MessageEventPublisher(session),
+    )
 
     try:
         message = await use_case.execute(
@@ -193,7 +382,7 @@ async def send_message(
 
         # Fetch profile data for sender
         sender_nickname, sender_avatar_url = await _get_user_profile_data(
-            message.sender_id, profile_repo
+            message.sender_id, profiles
         )
 
         return {
@@ -4,7 +4,7 @@ Presentation layer - Request/Response schemas
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -145,6 +145,12 @@ class MessagesListResponse(BaseModel):
     messages: List[MessageResponse] = Field(..., description="List of messages")
     total: int = Field(..., description="Total number of messages")
     has_more: bool = Field(..., description="Whether there are more messages to fetch")
+    before_cursor: Optional[str] = Field(
+        None, description="Pass as before to load older messages"
+    )
+    after_cursor: Optional[str] = Field(
+        None, description="Pass as after to fetch messages sent since this page"
+    )
 
     class Config:
         json_schema_extra = {
@@ -161,10 +167,55 @@ class MessagesListResponse(BaseModel):
                 ],
                 "total": 1,
                 "has_more": False,
+                "before_cursor": "MjAyNC0wMS0wMVQwMDowMDowMCswMDowMHwxMjNl",
+                "after_cursor": "MjAyNC0wMS0wMVQwMDowMDowMCswMDowMHwxMjNl",
+            }
+        }
+
+
+class ReadReceipt(BaseModel):
+    """Read receipt for one chat room"""
+
+    room_id: UUID = Field(..., description="Chat room ID")
+    up_to_message_id: Optional[UUID] = Field(
+        None,
+        description="Last message read; the whole room is marked read when omitted",
+    )
+
+
+class ReadReceiptsRequest(BaseModel):
+    """Request schema for acknowledging read receipts of several rooms"""
+
+    receipts: List[ReadReceipt] = Field(
+        ...,
+        description="Read receipts, at most one per room (the last one wins)",
+        min_length=1,
+        max_length=100,
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "receipts": [
+                    {
+                        "room_id": "987e6543-e21b-12d3-a456-426614174000",
+                        "up_to_message_id": "123e4567-e89b-12d3-a456-426614174000",
+                    },
+                    {"room_id": "456e7890-e12b-34d5-a678-901234567000"},
+                ]
             }
         }
 
 
+class ReadReceiptsResponse(BaseModel):
+    """Response schema for acknowledged read receipts"""
+
+    marked: Dict[str, int] = Field(
+        ..., description="Number of messages marked as read, per room"
+    )
+    total_marked: int = Field(..., description="Messages marked as read in total")
+
+
 class ChatRoomListResponse(BaseModel):
     """Response schema for list of chat rooms"""
 
@@ -203,3 +254,11 @@ class MessagesListResponseWrapper(BaseModel):
     data: MessagesListResponse
     meta: None = None
     error: None = None
+
+
+class ReadReceiptsResponseWrapper(BaseModel):
+    """Response wrapper for read receipts (standardized envelope)"""
+
+    data: ReadReceiptsResponse
+    meta: None = None
+    error: None = None
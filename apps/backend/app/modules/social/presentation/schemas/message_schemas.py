@@ -108,6 +108,66 @@ class ThreadMessagesResponse(BaseModel):
 
     messages: list[ThreadMessageResponse]
     total: int
+    has_more: bool = Field(
+        False, description="Whether more messages exist in the requested direction"
+    )
+    before_cursor: Optional[str] = Field(
+        None, description="Pass as before to load older messages"
+    )
+    after_cursor: Optional[str] = Field(
+        None, description="Pass as after to fetch messages sent since this page"
+    )
+
+
+# Read State Schemas
+class MarkThreadReadRequest(BaseModel):
+    """Request to mark a thread as read"""
+
+    message_id: Optional[str] = Field(
+        None,
+        description="Last message seen; defaults to the latest message in the thread",
+    )
+
+
+class ThreadReadStateResponse(BaseModel):
+    """The user's read cursor in a thread"""
+
+    thread_id: str
+    last_read_at: datetime
+    last_read_message_id: Optional[str] = None
+    unread_count: int
+
+
+class UnreadCountsResponse(BaseModel):
+    """Unread counts of all the user's threads"""
+
+    counts: dict[str, int] = Field(
+        ..., description="thread_id -> unread count; threads with none are omitted"
+    )
+    total: int
+
+
+# Inbox Schemas
+class InboxThreadResponse(BaseModel):
+    """One inbox row: a thread seen from the current user's side"""
+
+    id: str
+    other_user_id: str
+    other_nickname: Optional[str] = None
+    other_avatar_url: Optional[str] = None
+    last_message: Optional[ThreadMessageResponse] = None
+    unread_count: int = 0
+    created_at: datetime
+    last_message_at: Optional[datetime]
+
+
+class InboxPageResponse(BaseModel):
+    """Response for one page of the inbox"""
+
+    threads: list[InboxThreadResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as cursor to fetch the next page; null on the last"
+    )
 
 
 # Inbox Response
@@ -151,6 +211,30 @@ class ThreadListResponseWrapper(BaseModel):
     error: None = None
 
 
+class ThreadReadStateResponseWrapper(BaseModel):
+    """Response wrapper for thread read state (standardized envelope)"""
+
+    data: ThreadReadStateResponse
+    meta: None = None
+    error: None = None
+
+
+class UnreadCountsResponseWrapper(BaseModel):
+    """Response wrapper for unread counts (standardized envelope)"""
+
+    data: UnreadCountsResponse
+    meta: None = None
+    error: None = None
+
+
+class InboxPageResponseWrapper(BaseModel):
+    """Response wrapper for the inbox (standardized envelope)"""
+
+    data: InboxPageResponse
+    meta: None = None
+    error: None = None
+
+
 class ThreadMessageResponseWrapper(BaseModel):
     """Response wrapper for thread message (standardized envelope)"""
 
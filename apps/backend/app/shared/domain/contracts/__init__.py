@@ -8,6 +8,9 @@ These contracts allow modules to depend on abstractions rather than concrete imp
 from app.shared.domain.contracts.i_chat_room_service import IChatRoomService
 from app.shared.domain.contracts.i_friendship_service import IFriendshipService
 from app.shared.domain.contracts.i_profile_query_service import IProfileQueryService
+from app.shared.domain.contracts.i_relationship_query_service import (
+    IRelationshipQueryService,
+)
 from app.shared.domain.contracts.i_subscription_query_service import (
     ISubscriptionQueryService,
 )
@@ -21,4 +24,5 @@ __all__ = [
     "IUserBasicInfoService",
     "IFriendshipService",
     "IChatRoomService",
+    "IRelationshipQueryService",
 ]
@@ -5,7 +5,8 @@ Contract for querying user profile information across bounded contexts.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 
 
@@ -49,6 +50,16 @@ class UserProfileInfo:
         self.stealth_mode = stealth_mode
 
 
+@dataclass(frozen=True)
+class ProfileSummary:
+    """Display fields of a user, as rendered next to posts, messages and rooms"""
+
+    user_id: UUID
+    nickname: Optional[str] = None
+    avatar_url: Optional[str] = None
+    privacy_flags: Dict[str, bool] = field(default_factory=dict)
+
+
 class IProfileQueryService(ABC):
     """
     Interface for querying user profile information.
@@ -83,6 +94,21 @@ class IProfileQueryService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_profile_summaries(
+        self, user_ids: Iterable[UUID]
+    ) -> Dict[UUID, ProfileSummary]:
+        """
+        Get display fields for many users at once.
+
+        Args:
+            user_ids: User UUIDs (duplicates are fine)
+
+        Returns:
+            Mapping of user_id to ProfileSummary; users without a profile are absent
+        """
+        pass
+
     @abstractmethod
     async def update_user_location(
         self, user_id: UUID, latitude: float, longitude: float
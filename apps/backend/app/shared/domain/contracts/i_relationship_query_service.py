@@ -0,0 +1,57 @@
+"""
+Relationship Query Service Interface
+
+Contract for reading the social relationship between a viewer and other users
+across bounded contexts.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from uuid import UUID
+
+
+class RelationshipStateDTO:
+    """DTO for the relationship between a viewer and one other user"""
+
+    def __init__(
+        self,
+        user_id: UUID,
+        has_thread: bool = False,
+        has_pending_request: bool = False,
+        is_blocked: bool = False,
+        is_friend: bool = False,
+        allow_stranger_chat: Optional[bool] = None,
+    ):
+        self.user_id = user_id
+        self.has_thread = has_thread
+        self.has_pending_request = has_pending_request
+        self.is_blocked = is_blocked
+        self.is_friend = is_friend
+        # None when the other user has no profile
+        self.allow_stranger_chat = allow_stranger_chat
+
+
+class IRelationshipQueryService(ABC):
+    """
+    Interface for querying relationship state in bulk.
+
+    This service provides read-only access to threads, message requests,
+    friendships and chat privacy without exposing the Social bounded
+    context's internal implementation.
+    """
+
+    @abstractmethod
+    async def get_relationship_states(
+        self, viewer_id: UUID, other_user_ids: List[UUID]
+    ) -> Dict[UUID, RelationshipStateDTO]:
+        """
+        Get the relationship between a viewer and each of the given users.
+
+        Args:
+            viewer_id: Viewing user UUID
+            other_user_ids: Users to inspect (duplicates are ignored)
+
+        Returns:
+            Dict mapping every requested user ID to its RelationshipStateDTO
+        """
+        pass
@@ -0,0 +1,82 @@
+"""Keyset Cursor Value Object.
+
+Opaque pagination cursor over a ``(created_at, id)`` sort key, optionally led by
+a relevance ``score`` for ranked listings. Listings ordered newest-first (or
+best-first) resume strictly after the last row of the previous page, so deep
+pages cost the same as the first one and concurrent inserts never shift rows
+between pages.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """Position of the last row returned by a ``(created_at, id)`` listing"""
+
+    created_at: datetime
+    id: str
+    score: Optional[float] = None
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque, URL-safe token"""
+        parts = [self.created_at.isoformat(), self.id]
+        if self.score is not None:
+            parts.insert(0, repr(self.score))
+        raw = "|".join(parts).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "KeysetCursor":
+        """
+        Decode a token produced by ``encode``
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            parts = raw.split("|")
+            score = float(parts.pop(0)) if len(parts) == 3 else None
+            created_at_raw, id_raw = parts
+            return cls(
+                created_at=datetime.fromisoformat(created_at_raw),
+                id=str(UUID(id_raw)),
+                score=score,
+            )
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+    @classmethod
+    def from_row(
+        cls, created_at: datetime, id: str, score: Optional[float] = None
+    ) -> "KeysetCursor":
+        """Build the cursor pointing at a given row"""
+        return cls(created_at=created_at, id=str(id), score=score)
+
+
+def decode_window_cursors(
+    before: Optional[str], after: Optional[str]
+) -> Tuple[Optional[KeysetCursor], Optional[KeysetCursor]]:
+    """
+    Decode the `before`/`after` cursors of a message window
+
+    Raises:
+        ValueError: If a token is malformed, ranked, or both are given
+    """
+    if before and after:
+        raise ValueError("Invalid pagination cursor: pass either before or after")
+
+    cursors = []
+    for token in (before, after):
+        cursor = KeysetCursor.decode(token) if token else None
+        if cursor is not None and cursor.score is not None:
+            raise ValueError("Invalid pagination cursor")
+        cursors.append(cursor)
+    return cursors[0], cursors[1]
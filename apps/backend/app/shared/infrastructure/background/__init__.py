@@ -0,0 +1 @@
+"""Background (in-process) task infrastructure"""
@@ -0,0 +1,75 @@
+"""Periodic in-process background task.
+
+Runs an async callable on a fixed interval inside the FastAPI process.
+Started and stopped from the application lifespan (see app/main.py).
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs `func` every `interval_seconds` until stopped.
+
+    Failures are logged and never stop the loop; the next run happens after
+    the regular interval. Each uvicorn worker runs its own copy, so jobs
+    scheduled with this class must be idempotent.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        func: Callable[[], Awaitable[object]],
+        initial_delay_seconds: float = 0,
+    ) -> None:
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.initial_delay_seconds = initial_delay_seconds
+        self._func = func
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop is currently scheduled."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Schedule the loop on the running event loop."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name=f"periodic:{self.name}")
+        logger.info(
+            f"Started periodic task {self.name} (interval={self.interval_seconds}s)"
+        )
+
+    async def stop(self) -> None:
+        """Cancel the loop and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info(f"Stopped periodic task {self.name}")
+
+    async def run_once(self) -> None:
+        """Run the job a single time, logging (not raising) failures."""
+        try:
+            await self._func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Periodic task {self.name} failed: {e}", exc_info=True)
+
+    async def _run(self) -> None:
+        if self.initial_delay_seconds:
+            await asyncio.sleep(self.initial_delay_seconds)
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,48 @@
+"""Keyset windows over ``(created_at, id)`` for message histories.
+
+Chat-style screens open on the newest messages, scroll back with a `before`
+cursor and catch up with an `after` cursor. Both directions are a single range
+scan on a ``(<parent>_id, created_at)`` index; ``id`` only breaks ties between
+rows written in the same microsecond.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+def keyset_window(
+    query: Select,
+    created_at,
+    id,
+    limit: int,
+    before: Optional[KeysetCursor] = None,
+    after: Optional[KeysetCursor] = None,
+) -> Select:
+    """
+    Bound and order a listing to one window of rows
+
+    With `after`, selects the rows right after the cursor, oldest first.
+    Otherwise selects the newest rows (before `before`, if given) newest
+    first; callers reverse them to display oldest first.
+    """
+    position = tuple_(created_at, id)
+    if after is not None:
+        return (
+            query.where(
+                created_at >= after.created_at,
+                position > tuple_(after.created_at, UUID(after.id)),
+            )
+            .order_by(created_at.asc(), id.asc())
+            .limit(limit)
+        )
+
+    if before is not None:
+        query = query.where(
+            created_at <= before.created_at,
+            position < tuple_(before.created_at, UUID(before.id)),
+        )
+    return query.order_by(created_at.desc(), id.desc()).limit(limit)
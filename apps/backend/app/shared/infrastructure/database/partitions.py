@@ -0,0 +1,156 @@
+"""Monthly range partitions over ``created_at``.
+
+Partitioned tables are split by calendar month (UTC) into children named
+``<table>_YYYY_MM``, created ahead of the clock. Retention detaches a month
+once all of it is past the cutoff and drops it, so expiring history is a
+catalog change rather than a bulk DELETE followed by vacuum and index bloat.
+
+The tables have no default partition: Postgres only detaches a partition
+CONCURRENTLY (without an ACCESS EXCLUSIVE lock on the parent, which would
+queue every read and write of the table) when there is none.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant (UTC) of the month containing `moment`"""
+    moment = moment.astimezone(timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(start: datetime, months: int) -> datetime:
+    """Shift a month start by `months` (may be negative)"""
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, start: datetime) -> str:
+    """Name of the partition holding the month starting at `start`"""
+    return f"{table}_{start:%Y_%m}"
+
+
+class MonthlyPartitionManager:
+    """
+    Creates and drops the monthly partitions of a range-partitioned table
+
+    Statements run on the given connection, which must be in AUTOCOMMIT
+    mode: DETACH PARTITION ... CONCURRENTLY cannot run in a transaction.
+    Every step is idempotent, so a run interrupted halfway is completed by
+    the next one; callers serialize runs (see MessagePartitionMaintenanceJob).
+    Table names are trusted identifiers from code, never user input.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        self.connection = connection
+
+    async def list_partitions(self, table: str) -> Dict[datetime, str]:
+        """Monthly partitions attached to `table`, keyed by month start"""
+        result = await self.connection.execute(
+            text(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:table AS regclass)
+                """
+            ),
+            {"table": table},
+        )
+        pattern = re.compile(rf"^{re.escape(table)}_(\d{{4}})_(\d{{2}})$")
+        partitions = {}
+        for (name,) in result:
+            match = pattern.match(name)
+            if match:
+                year, month = int(match.group(1)), int(match.group(2))
+                partitions[datetime(year, month, 1, tzinfo=timezone.utc)] = name
+        return partitions
+
+    async def ensure_partitions(
+        self, table: str, months_ahead: int, now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Create any missing partitions from this month through `months_ahead`
+
+        Returns:
+            Names of the partitions created
+        """
+        current = month_start(now or datetime.now(timezone.utc))
+        existing = await self.list_partitions(table)
+        created = []
+        for offset in range(months_ahead + 1):
+            start = add_months(current, offset)
+            if start in existing:
+                continue
+            await self._create_partition(table, start)
+            created.append(partition_name(table, start))
+        return created
+
+    async def drop_expired_partitions(
+        self, table: str, retention_days: int, now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Detach and drop the partitions whose month is wholly past the retention
+
+        Rows therefore live between `retention_days` and one month longer.
+        The detach waits for running queries on the month instead of
+        blocking the table; the drop then only locks the detached table.
+
+        Returns:
+            Names of the partitions dropped
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=retention_days)
+        dropped = []
+        for start, name in sorted((await self.list_partitions(table)).items()):
+            if add_months(start, 1) > cutoff:
+                break
+            await self._detach_partition(table, name)
+            await self.connection.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+            dropped.append(name)
+        return dropped
+
+    async def _create_partition(self, table: str, start: datetime) -> None:
+        """
+        Build the month as a plain table, then attach it
+
+        ATTACH only takes SHARE UPDATE EXCLUSIVE on the parent, where
+        CREATE TABLE ... PARTITION OF would block the table. A table left
+        unattached by an interrupted run is reused.
+        """
+        name = partition_name(table, start)
+        await self.connection.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" '
+                f'(LIKE "{table}" INCLUDING DEFAULTS)'
+            )
+        )
+        await self.connection.execute(
+            text(
+                f"""
+                ALTER TABLE "{table}" ATTACH PARTITION "{name}"
+                FOR VALUES FROM ('{start.isoformat()}')
+                TO ('{add_months(start, 1).isoformat()}')
+                """
+            )
+        )
+
+    async def _detach_partition(self, table: str, name: str) -> None:
+        """Detach concurrently, or finish a detach an interrupted run started"""
+        pending = await self.connection.scalar(
+            text(
+                """
+                SELECT inhdetachpending FROM pg_inherits
+                WHERE inhrelid = CAST(:name AS regclass)
+                """
+            ),
+            {"name": name},
+        )
+        mode = "FINALIZE" if pending else "CONCURRENTLY"
+        await self.connection.execute(
+            text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}" {mode}')
+        )
@@ -0,0 +1,56 @@
+"""Callbacks that run once a session's transaction commits.
+
+In-process caches in front of the database must be invalidated only after
+the write is visible to other sessions. Invalidating earlier leaves a window
+in which a concurrent read re-caches the old row for the whole TTL.
+
+Use cases receive an `AfterCommit` hook bound to the request session by their
+provider (see `after_commit_of`); callers without a transaction to wait for,
+such as unit tests, get `run_now`.
+"""
+
+import logging
+from functools import partial
+from typing import Callable, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Schedules a callback to run after the current transaction commits
+AfterCommit = Callable[[Callable[[], None]], None]
+
+_CALLBACKS_KEY = "after_commit_callbacks"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run `callback` when the session commits; it is dropped on rollback"""
+    callbacks: List[Callable[[], None]] = session.info.setdefault(_CALLBACKS_KEY, [])
+    callbacks.append(callback)
+
+
+def after_commit_of(session: AsyncSession) -> AfterCommit:
+    """Hook scheduling callbacks on `session`, for use case providers"""
+    return partial(after_commit, session)
+
+
+def run_now(callback: Callable[[], None]) -> None:
+    """Hook for callers that have no pending transaction"""
+    callback()
+
+
+@event.listens_for(Session, "after_commit")
+def _run_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_CALLBACKS_KEY, []):
+        try:
+            callback()
+        except Exception as e:
+            # The commit already happened; a failed callback must not undo it
+            logger.error(f"After-commit callback failed: {e}", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_callbacks(session: Session) -> None:
+    session.info.pop(_CALLBACKS_KEY, None)
@@ -2,10 +2,18 @@
 FCM Push Notification Service
 
 Provides Firebase Cloud Messaging integration for sending push notifications to users.
+
+The firebase-admin SDK is synchronous (one HTTPS round trip per call), so every
+send runs on a small dedicated thread pool instead of the event loop; a slow
+FCM response then only holds one pool thread, never the worker's requests.
+Sends to several users are grouped into multicast batches.
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
 
 try:
     import firebase_admin
@@ -19,13 +27,70 @@ from app.config import config
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 4
+
+# FCM accepts at most 500 tokens per multicast request
+MAX_BATCH_SIZE = 500
+
+
+class PushMetrics:
+    """
+    Latency and failure counters of FCM calls on this worker
+
+    A call is one request to FCM (a single send or a multicast batch); a
+    message is one device token it was addressed to.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.failed_calls = 0
+        self.messages_sent = 0
+        self.messages_failed = 0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
+    def record_call(self, latency_ms: float, failed: bool = False) -> None:
+        """Count one FCM request and how long it took"""
+        self.calls += 1
+        if failed:
+            self.failed_calls += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+
+    def record_messages(self, sent: int, failed: int) -> None:
+        """Count per-token outcomes of a request"""
+        self.messages_sent += sent
+        self.messages_failed += failed
+
+    def stats(self) -> Dict[str, float]:
+        """Counters since start, with mean and max call latency"""
+        return {
+            "calls": self.calls,
+            "failed_calls": self.failed_calls,
+            "messages_sent": self.messages_sent,
+            "messages_failed": self.messages_failed,
+            "avg_latency_ms": (
+                round(self.total_latency_ms / self.calls, 2) if self.calls else 0.0
+            ),
+            "max_latency_ms": round(self.max_latency_ms, 2),
+        }
+
 
 class FCMService:
     """Firebase Cloud Messaging service for push notifications"""
 
-    def __init__(self):
+    def __init__(
+        self, max_workers: int = DEFAULT_MAX_WORKERS, batch_size: int = MAX_BATCH_SIZE
+    ):
         self._initialized = False
         self._app = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fcm"
+        )
+        self._batch_size = min(batch_size, MAX_BATCH_SIZE)
+        # Scheduled sends, referenced until done so they are not collected
+        self._pending: Set[asyncio.Task] = set()
+        self.metrics = PushMetrics()
 
         if not FIREBASE_AVAILABLE:
             logger.warning(
@@ -72,16 +137,7 @@ class FCMService:
         Returns:
             True if notification sent successfully, False otherwise
         """
-        if not FIREBASE_AVAILABLE:
-            logger.debug(
-                f"Skipping notification to user {user_id}: firebase-admin not installed"
-            )
-            return False
-
-        if not self._initialized:
-            logger.debug(
-                f"Skipping notification to user {user_id}: FCM not initialized"
-            )
+        if not self._can_send(f"user {user_id}"):
             return False
 
         if not fcm_token:
@@ -106,31 +162,44 @@ class FCMService:
             )
 
             # Send message
-            response = messaging.send(message)
+            response = await self._call(messaging.send, message)
+            self.metrics.record_messages(sent=1, failed=0)
             logger.info(
                 f"Successfully sent notification to user {user_id}. "
                 f"Message ID: {response}"
             )
             return True
 
-        except messaging.UnregisteredError:
-            logger.warning(
-                f"FCM token for user {user_id} is invalid or unregistered. "
-                "User should re-register their device."
-            )
+        except Exception as e:
+            self.metrics.record_messages(sent=0, failed=1)
+            self._log_send_error(user_id, e)
             return False
 
-        except messaging.SenderIdMismatchError:
-            logger.error(
-                f"FCM token for user {user_id} belongs to a different Firebase project"
-            )
-            return False
+    def schedule_notification(
+        self,
+        user_id: str,
+        title: str,
+        body: str,
+        data: Optional[Dict[str, str]] = None,
+        fcm_token: Optional[str] = None,
+    ) -> asyncio.Task:
+        """
+        Send a push notification in the background
 
-        except Exception as e:
-            logger.error(
-                f"Failed to send notification to user {user_id}: {e}", exc_info=True
+        The caller returns without waiting for FCM; failures are logged and
+        counted like any other send.
+
+        Returns:
+            The task sending the notification (resolves to its success)
+        """
+        task = asyncio.get_running_loop().create_task(
+            self.send_notification(
+                user_id=user_id, title=title, body=body, data=data, fcm_token=fcm_token
             )
-            return False
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
 
     async def send_notification_to_multiple(
         self,
@@ -142,6 +211,9 @@ class FCMService:
         """
         Send push notification to multiple users
 
+        Tokens are sent in multicast batches of up to 500, the batches
+        concurrently (bounded by the service's thread pool).
+
         Args:
             user_tokens: Dict mapping user_id to FCM token
             title: Notification title
@@ -151,16 +223,136 @@ class FCMService:
         Returns:
             Dict mapping user_id to success status
         """
-        results = {}
+        results = {user_id: False for user_id in user_tokens}
+        if not user_tokens or not self._can_send(f"{len(user_tokens)} users"):
+            return results
 
+        user_ids = []
         for user_id, fcm_token in user_tokens.items():
-            success = await self.send_notification(
-                user_id=user_id, title=title, body=body, data=data, fcm_token=fcm_token
+            if fcm_token:
+                user_ids.append(user_id)
+            else:
+                logger.warning(f"No FCM token provided for user {user_id}. Skipping.")
+
+        batches = [
+            user_ids[start : start + self._batch_size]
+            for start in range(0, len(user_ids), self._batch_size)
+        ]
+        for batch_results in await asyncio.gather(
+            *(
+                self._send_batch(batch, user_tokens, title, body, data)
+                for batch in batches
             )
-            results[user_id] = success
+        ):
+            results.update(batch_results)
 
         return results
 
+    def stats(self) -> Dict[str, float]:
+        """Call/message counters and latency, plus sends still in flight"""
+        return {**self.metrics.stats(), "pending": len(self._pending)}
+
+    async def close(self, timeout: float) -> None:
+        """
+        Finish scheduled sends, then release the send threads
+
+        Sends still running after `timeout` seconds are abandoned, and queued
+        SDK calls are cancelled so shutdown is not held up by a slow FCM.
+        """
+        if self._pending:
+            _, unfinished = await asyncio.wait(set(self._pending), timeout=timeout)
+            if unfinished:
+                logger.warning(
+                    f"Abandoning {len(unfinished)} push notifications on shutdown"
+                )
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _send_batch(
+        self,
+        user_ids: List[str],
+        user_tokens: Dict[str, str],
+        title: str,
+        body: str,
+        data: Optional[Dict[str, str]],
+    ) -> Dict[str, bool]:
+        """Send one multicast request; results are per user, in token order"""
+        try:
+            message = messaging.MulticastMessage(
+                notification=messaging.Notification(title=title, body=body),
+                data=data or {},
+                tokens=[user_tokens[user_id] for user_id in user_ids],
+            )
+            response = await self._call(messaging.send_each_for_multicast, message)
+        except Exception as e:
+            self.metrics.record_messages(sent=0, failed=len(user_ids))
+            logger.error(
+                f"Failed to send notification batch to {len(user_ids)} users: {e}",
+                exc_info=True,
+            )
+            return {user_id: False for user_id in user_ids}
+
+        self.metrics.record_messages(
+            sent=response.success_count, failed=response.failure_count
+        )
+        results = {}
+        for user_id, send_response in zip(user_ids, response.responses):
+            results[user_id] = send_response.success
+            if not send_response.success:
+                self._log_send_error(user_id, send_response.exception)
+        logger.info(
+            f"Sent notification batch: {response.success_count} succeeded, "
+            f"{response.failure_count} failed"
+        )
+        return results
+
+    async def _call(self, send: Callable[[Any], Any], message: Any) -> Any:
+        """Run a blocking SDK send on the thread pool, recording its latency"""
+        started = time.perf_counter()
+        failed = False
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, send, message
+            )
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.metrics.record_call(
+                (time.perf_counter() - started) * 1000, failed=failed
+            )
+
+    def _can_send(self, recipient: str) -> bool:
+        """Whether FCM is usable; logs why not (recipient is for the log)"""
+        if not FIREBASE_AVAILABLE:
+            logger.debug(
+                f"Skipping notification to {recipient}: firebase-admin not installed"
+            )
+            return False
+
+        if not self._initialized:
+            logger.debug(f"Skipping notification to {recipient}: FCM not initialized")
+            return False
+
+        return True
+
+    @staticmethod
+    def _log_send_error(user_id: str, error: Optional[Exception]) -> None:
+        """Log a failed send to one token"""
+        if isinstance(error, messaging.UnregisteredError):
+            logger.warning(
+                f"FCM token for user {user_id} is invalid or unregistered. "
+                "User should re-register their device."
+            )
+        elif isinstance(error, messaging.SenderIdMismatchError):
+            logger.error(
+                f"FCM token for user {user_id} belongs to a different Firebase project"
+            )
+        else:
+            logger.error(
+                f"Failed to send notification to user {user_id}: {error}",
+                exc_info=error,
+            )
+
 
 # Singleton instance
 _fcm_service: Optional[FCMService] = None
@@ -170,5 +362,15 @@ def get_fcm_service() -> FCMService:
     """Get or create FCM service singleton"""
     global _fcm_service
     if _fcm_service is None:
-        _fcm_service = FCMService()
+        _fcm_service = FCMService(
+            max_workers=config.FCM_MAX_WORKERS, batch_size=config.FCM_BATCH_SIZE
+        )
     return _fcm_service
+
+
+async def close_fcm_service(timeout: float) -> None:
+    """Close the FCM service singleton, if this worker created one"""
+    global _fcm_service
+    if _fcm_service is not None:
+        await _fcm_service.close(timeout)
+        _fcm_service = None
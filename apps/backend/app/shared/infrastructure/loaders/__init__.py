@@ -0,0 +1 @@
+"""Request-scoped batching loaders"""
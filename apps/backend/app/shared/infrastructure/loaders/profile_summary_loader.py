@@ -0,0 +1,96 @@
+"""Profile summary loader.
+
+A DataLoader-style, request-scoped batcher for user display fields (nickname,
+avatar, privacy flags). Every `load` issued in the same event-loop tick is
+resolved by one IProfileQueryService.get_profile_summaries call (a single
+`IN` query), and results are memoized for the rest of the request, so a
+response that renders N messages or rooms costs one profile query instead of N.
+
+Callers that render in a plain loop should prime the loader with `load_many`
+over every id on the page first; later `load` calls are then served from memory.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional, Union
+from uuid import UUID
+
+from app.shared.domain.contracts.i_profile_query_service import (
+    IProfileQueryService,
+    ProfileSummary,
+)
+
+logger = logging.getLogger(__name__)
+
+UserIdLike = Union[str, UUID]
+
+
+class ProfileSummaryLoader:
+    """Batch and memoize profile summary lookups for one request"""
+
+    def __init__(self, profile_service: IProfileQueryService):
+        self.profile_service = profile_service
+        self._loaded: Dict[str, Optional[ProfileSummary]] = {}
+        self._pending: Dict[str, "asyncio.Future[Optional[ProfileSummary]]"] = {}
+        self._dispatch_task: Optional["asyncio.Task[None]"] = None
+        # The request's AsyncSession must not run two queries at once
+        self._query_lock = asyncio.Lock()
+
+    async def load(self, user_id: Optional[UserIdLike]) -> Optional[ProfileSummary]:
+        """Return the user's summary, or None if the id is invalid or has no profile"""
+        key = self._key(user_id)
+        if key is None:
+            return None
+        if key in self._loaded:
+            return self._loaded[key]
+
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if self._dispatch_task is None:
+                self._dispatch_task = asyncio.ensure_future(self._dispatch())
+        return await future
+
+    async def load_many(
+        self, user_ids: Iterable[Optional[UserIdLike]]
+    ) -> Dict[str, Optional[ProfileSummary]]:
+        """Load several users with a single query; keys are string user ids"""
+        keys = {key for key in map(self._key, user_ids) if key is not None}
+        summaries = await asyncio.gather(*(self.load(key) for key in keys))
+        return dict(zip(keys, summaries))
+
+    async def _dispatch(self) -> None:
+        """Resolve every load queued so far with one bulk lookup"""
+        # Let the rest of the current tick enqueue its loads first
+        await asyncio.sleep(0)
+        batch, self._pending = self._pending, {}
+        self._dispatch_task = None
+
+        try:
+            async with self._query_lock:
+                summaries = await self.profile_service.get_profile_summaries(
+                    [UUID(key) for key in batch]
+                )
+        except Exception as e:
+            # Profiles are decoration: render without them rather than fail
+            logger.warning(f"Failed to load {len(batch)} profile summaries: {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_result(None)
+            return
+
+        by_key = {str(user_id): summary for user_id, summary in summaries.items()}
+        for key, future in batch.items():
+            self._loaded[key] = by_key.get(key)
+            if not future.done():
+                future.set_result(self._loaded[key])
+
+    @staticmethod
+    def _key(user_id: Optional[UserIdLike]) -> Optional[str]:
+        if user_id is None:
+            return None
+        try:
+            return str(user_id if isinstance(user_id, UUID) else UUID(str(user_id)))
+        except ValueError:
+            return None
@@ -0,0 +1 @@
+"""Realtime (WebSocket/SSE) delivery infrastructure"""
@@ -0,0 +1,182 @@
+"""In-process realtime event hub.
+
+Fans events out to the WebSocket/SSE connections held by this worker, keyed
+by user ID, and wakes long-poll requests parked on a topic (one conversation).
+Events are fed in by PgNotifyListener (see pg_notify.py), so an event
+published on any worker reaches subscribers on every worker.
+"""
+
+import asyncio
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Set
+
+from app.config import settings
+
+Event = Dict[str, Any]
+
+# Sent on idle connections so proxies keep them open
+HEARTBEAT_EVENT: Event = {"type": "ping"}
+# Last event of an overflowed subscription: the client should refetch over HTTP
+RESYNC_EVENT: Event = {"type": "resync"}
+
+
+class Subscription:
+    """Queue of pending events for one connection.
+
+    The queue is bounded: a consumer that falls `max_pending` events behind is
+    overflowed, its backlog is dropped and `get` returns None so the
+    connection can be closed and the client can resync over HTTP.
+    """
+
+    def __init__(self, user_id: str, max_pending: int) -> None:
+        self.user_id = user_id
+        self.overflowed = False
+        self._queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(
+            maxsize=max_pending + 1
+        )
+        self._max_pending = max_pending
+
+    def push(self, event: Event) -> None:
+        """Queue an event without blocking the publisher."""
+        if self.overflowed:
+            return
+        if self._queue.qsize() >= self._max_pending:
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+            return
+        self._queue.put_nowait(event)
+
+    async def get(self) -> Optional[Event]:
+        """Wait for the next event; None means the subscription overflowed."""
+        return await self._queue.get()
+
+    async def stream(self, heartbeat_seconds: float) -> AsyncIterator[Event]:
+        """Yield events as they arrive, HEARTBEAT_EVENT while idle.
+
+        Ends with RESYNC_EVENT if the subscription overflowed.
+        """
+        while True:
+            try:
+                event = await asyncio.wait_for(self.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT_EVENT
+                continue
+            if event is None:
+                yield RESYNC_EVENT
+                return
+            yield event
+
+
+class WaiterLimitExceededError(Exception):
+    """Raised when this worker already parks its maximum number of waiters."""
+
+
+class EventHub:
+    """Per-worker registry of realtime subscriptions and long-poll waiters.
+
+    Not thread-safe; intended for use from the asyncio event loop.
+    """
+
+    def __init__(self, max_pending: int = 100, max_waiters: int = 1000) -> None:
+        self.max_pending = max_pending
+        self.max_waiters = max_waiters
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._waiters: Dict[str, Set[asyncio.Event]] = defaultdict(set)
+        self._waiter_count = 0
+
+    def subscribe(self, user_id: str) -> Subscription:
+        """Register a connection for the user's events."""
+        subscription = Subscription(str(user_id), self.max_pending)
+        self._subscriptions[subscription.user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a connection; a no-op if already removed."""
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    @contextmanager
+    def subscription(self, user_id: str) -> Iterator[Subscription]:
+        """Subscribe for the duration of a connection."""
+        subscription = self.subscribe(user_id)
+        try:
+            yield subscription
+        finally:
+            self.unsubscribe(subscription)
+
+    @contextmanager
+    def waiter(self, topic: str) -> Iterator[asyncio.Event]:
+        """Register a waiter that is set by the next event on `topic`.
+
+        Enter before reading the current state so an event published between
+        the read and the wait is not missed.
+
+        Raises:
+            WaiterLimitExceededError: If max_waiters are already parked
+        """
+        if self._waiter_count >= self.max_waiters:
+            raise WaiterLimitExceededError(f"{self.max_waiters} waiters already parked")
+
+        woken = asyncio.Event()
+        self._waiters[topic].add(woken)
+        self._waiter_count += 1
+        try:
+            yield woken
+        finally:
+            self._waiter_count -= 1
+            waiters = self._waiters[topic]
+            waiters.discard(woken)
+            if not waiters:
+                del self._waiters[topic]
+
+    def publish(
+        self, user_ids: Iterable[str], event: Event, topic: Optional[str] = None
+    ) -> int:
+        """Deliver an event to this worker's connections of the given users.
+
+        Waiters parked on `topic` are woken as well.
+
+        Returns:
+            Number of connections the event was queued for
+        """
+        delivered = 0
+        for user_id in set(map(str, user_ids)):
+            for subscription in self._subscriptions.get(user_id, ()):
+                subscription.push(event)
+                delivered += 1
+        if topic is not None:
+            for woken in self._waiters.get(topic, ()):
+                woken.set()
+        return delivered
+
+    @property
+    def connection_count(self) -> int:
+        """Open subscriptions on this worker."""
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    @property
+    def waiter_count(self) -> int:
+        """Parked long-poll waiters on this worker."""
+        return self._waiter_count
+
+    def stats(self) -> Dict[str, int]:
+        """Connected users, open connections and parked waiters on this worker."""
+        return {
+            "users": len(self._subscriptions),
+            "connections": self.connection_count,
+            "waiters": self.waiter_count,
+        }
+
+
+# Process-wide hub shared by all realtime connections of this worker
+event_hub = EventHub(
+    max_pending=settings.REALTIME_MAX_PENDING_EVENTS,
+    max_waiters=settings.CHAT_LONG_POLL_MAX_WAITERS,
+)
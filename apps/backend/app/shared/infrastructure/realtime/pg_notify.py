@@ -0,0 +1,146 @@
+"""Cross-worker realtime fan-out over Postgres LISTEN/NOTIFY.
+
+`notify` queues an event on the caller's transaction: Postgres only delivers
+it once that transaction commits (and drops it on rollback), so listeners
+never see a message that is not yet visible to their own queries.
+PgNotifyListener holds one dedicated connection per worker, LISTENs on the
+channel and hands every event to the worker's EventHub.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.infrastructure.realtime.event_hub import Event, EventHub
+
+logger = logging.getLogger(__name__)
+
+REALTIME_CHANNEL = "kcardswap_realtime"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+
+def encode_event(
+    user_ids: Iterable[str], event: Event, topic: Optional[str] = None
+) -> str:
+    """Serialize an event, its recipients and topic into a NOTIFY payload.
+
+    Events too large for NOTIFY (long message content) are sent without
+    `data.content` and flagged `truncated`; clients fetch the message over HTTP.
+    """
+    envelope = {"to": sorted(set(map(str, user_ids))), "event": event}
+    if topic is not None:
+        envelope["topic"] = topic
+    payload = json.dumps(envelope, separators=(",", ":"))
+    if len(payload.encode()) < MAX_PAYLOAD_BYTES:
+        return payload
+
+    data = {k: v for k, v in event.get("data", {}).items() if k != "content"}
+    envelope["event"] = {**event, "data": data, "truncated": True}
+    return json.dumps(envelope, separators=(",", ":"))
+
+
+async def notify(
+    session: AsyncSession,
+    user_ids: Iterable[str],
+    event: Event,
+    topic: Optional[str] = None,
+) -> None:
+    """Queue an event for the given users; delivered when the session commits."""
+    payload = encode_event(user_ids, event, topic)
+    await session.execute(select(func.pg_notify(REALTIME_CHANNEL, payload)))
+
+
+class PgNotifyListener:
+    """LISTENs on the realtime channel and publishes events to an EventHub.
+
+    Runs as a background task started from the application lifespan. A lost
+    connection is re-established after `reconnect_delay_seconds`; events sent
+    while disconnected are not replayed (clients resync over HTTP).
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        hub: EventHub,
+        channel: str = REALTIME_CHANNEL,
+        reconnect_delay_seconds: float = 1.0,
+        connect: Callable[[str], Awaitable[Any]] = asyncpg.connect,
+    ) -> None:
+        # asyncpg takes plain postgresql:// URLs, not SQLAlchemy driver URLs
+        self.dsn = dsn.replace("postgresql+asyncpg://", "postgresql://")
+        self.hub = hub
+        self.channel = channel
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._connect = connect
+        self._task: Optional[asyncio.Task] = None
+        self._listening = asyncio.Event()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the listen loop is currently scheduled."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Schedule the listen loop on the running event loop."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="realtime:pg-listen")
+        logger.info(f"Started realtime listener on channel {self.channel}")
+
+    async def stop(self) -> None:
+        """Cancel the listen loop and close its connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._listening.clear()
+        logger.info("Stopped realtime listener")
+
+    async def wait_listening(self, timeout: float = 5.0) -> None:
+        """Wait until LISTEN is active (used by tests and startup checks)."""
+        await asyncio.wait_for(self._listening.wait(), timeout)
+
+    def handle_payload(self, payload: str) -> None:
+        """Decode a NOTIFY payload and publish it to local subscribers."""
+        try:
+            envelope = json.loads(payload)
+            self.hub.publish(
+                envelope["to"], envelope["event"], topic=envelope.get("topic")
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Dropping malformed realtime payload: {e}")
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        self.handle_payload(payload)
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await self._connect(self.dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(self.channel, self._on_notification)
+                self._listening.set()
+                await lost.wait()
+                logger.warning("Realtime listener connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Realtime listener failed: {e}", exc_info=True)
+            finally:
+                self._listening.clear()
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.reconnect_delay_seconds)
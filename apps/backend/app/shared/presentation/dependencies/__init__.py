@@ -11,6 +11,7 @@ from app.shared.presentation.dependencies.auth import (
 )
 from app.shared.presentation.dependencies.services import (
     get_profile_service,
+    get_profile_summary_loader,
     get_subscription_service,
 )
 
@@ -19,5 +20,6 @@ __all__ = [
     "get_current_user",
     "get_optional_current_user_id",
     "get_profile_service",
+    "get_profile_summary_loader",
     "get_subscription_service",
 ]
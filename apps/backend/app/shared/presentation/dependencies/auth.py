@@ -8,7 +8,7 @@ Moved from Identity module to shared layer for proper separation of concerns.
 from typing import Optional
 from uuid import UUID
 
-from fastapi import Cookie, Depends, HTTPException, status
+from fastapi import Cookie, Depends, HTTPException, WebSocket, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 
@@ -143,3 +143,36 @@ async def get_optional_current_user_id(
         return UUID(user_id_str)
     except (JWTError, ValueError):
         return None
+
+
+def get_websocket_user_id(websocket: WebSocket) -> Optional[UUID]:
+    """
+    Resolve the user of a WebSocket handshake from its access token.
+
+    Browsers cannot set an Authorization header on WebSocket connections, so
+    the token is read from the httpOnly cookie, falling back to a `token`
+    query parameter.
+
+    Args:
+        websocket: WebSocket connection (not yet accepted)
+
+    Returns:
+        User ID (UUID) or None if the token is missing or invalid
+    """
+    token = websocket.cookies.get(settings.ACCESS_COOKIE_NAME)
+    if not token:
+        token = websocket.query_params.get("token")
+
+    if not token:
+        return None
+
+    try:
+        payload = JWTService().verify_token(token, expected_type="access")
+        user_id_str = payload.get("sub")
+
+        if user_id_str is None:
+            return None
+
+        return UUID(user_id_str)
+    except (JWTError, ValueError):
+        return None
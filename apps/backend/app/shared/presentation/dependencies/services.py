@@ -14,6 +14,9 @@ from app.shared.domain.contracts.i_subscription_query_service import (
     ISubscriptionQueryService,
 )
 from app.shared.infrastructure.database.connection import get_db_session
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
+)
 
 
 async def get_subscription_service(
@@ -48,9 +51,26 @@ async def get_profile_service(
     from app.modules.identity.application.services.profile_query_service_impl import (
         ProfileQueryServiceImpl,
     )
+    from app.modules.identity.application.services.profile_summary_cache import (
+        profile_summary_cache,
+    )
     from app.modules.identity.infrastructure.repositories.profile_repository_impl import (
         ProfileRepositoryImpl,
     )
 
     profile_repo = ProfileRepositoryImpl(session)
-    return ProfileQueryServiceImpl(profile_repository=profile_repo)
+    return ProfileQueryServiceImpl(
+        profile_repository=profile_repo, summary_cache=profile_summary_cache
+    )
+
+
+async def get_profile_summary_loader(
+    profile_service: Annotated[IProfileQueryService, Depends(get_profile_service)],
+) -> ProfileSummaryLoader:
+    """
+    Get the request-scoped profile summary loader.
+
+    FastAPI caches dependencies per request, so every consumer within one
+    request shares the same loader and its memoized summaries.
+    """
+    return ProfileSummaryLoader(profile_service)
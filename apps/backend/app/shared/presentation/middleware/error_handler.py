@@ -90,6 +90,7 @@ async def http_exception_handler(
             message=str(exc.detail) if exc.detail else "HTTP error occurred",
             details={},
         ),
+        headers=getattr(exc, "headers", None),
     )
 
 
@@ -36,6 +36,15 @@ storage_service_factory.storage_service = MockGCSStorageService(
 )
 
 from app.main import app  # noqa: E402
+from app.modules.identity.application.services.profile_summary_cache import (  # noqa: E402
+    profile_summary_cache,
+)
+from app.modules.posts.application.services.post_feed_cache import (  # noqa: E402
+    post_feed_cache,
+)
+from app.modules.social.application.services.chat_access_cache import (  # noqa: E402
+    chat_access_cache,
+)
 from app.shared.infrastructure.database.connection import get_db_session  # noqa: E402
 
 
@@ -172,6 +181,30 @@ async def cleanup_db(test_engine):
             await connection.execute(text(f"TRUNCATE TABLE {table_list} CASCADE"))
 
 
+@pytest.fixture(autouse=True)
+def clear_post_feed_cache():
+    """Drop cached feed pages so truncated posts never leak into the next test."""
+    post_feed_cache.clear()
+    yield
+    post_feed_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_chat_access_cache():
+    """Forget cached rooms and friendships, whose rows every test recreates."""
+    chat_access_cache.clear()
+    yield
+    chat_access_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_profile_summary_cache():
+    """Forget cached profiles, so a truncated or edited one never leaks."""
+    profile_summary_cache.clear()
+    yield
+    profile_summary_cache.clear()
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def ensure_gallery_cards_table(test_engine) -> None:
     """Ensure gallery_cards table exists for integration tests."""
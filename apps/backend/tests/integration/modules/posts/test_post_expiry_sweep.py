@@ -0,0 +1,91 @@
+"""
+Integration tests for post expiry
+
+The sweeper flips open posts past expires_at in capped chunks, and feed
+queries exclude such posts in SQL so pages stay full before the sweep runs.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.posts.application.use_cases.expire_posts_use_case import (
+    ExpirePostsUseCase,
+)
+from app.modules.posts.domain.entities.post import PostStatus
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+
+
+async def _insert_posts(
+    db_session: AsyncSession, owner_id, expires_in: timedelta, count: int
+) -> None:
+    now = datetime.now(timezone.utc)
+    for i in range(count):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO posts (
+                    id, owner_id, scope, city_code, category, title, content,
+                    status, expires_at, created_at, updated_at
+                )
+                VALUES (
+                    :id, :owner_id, 'city', 'TPE', 'trade', 'Expiry', 'Expiry',
+                    'open', :expires_at, :created_at, :created_at
+                )
+                """
+            ),
+            {
+                "id": str(uuid.uuid4()),
+                "owner_id": str(owner_id),
+                "expires_at": now + expires_in,
+                "created_at": now - timedelta(seconds=i),
+            },
+        )
+    await db_session.commit()
+
+
+async def _count_by_status(db_session: AsyncSession, status: str) -> int:
+    result = await db_session.execute(
+        text("SELECT count(*) FROM posts WHERE status = :status"), {"status": status}
+    )
+    return result.scalar()
+
+
+@pytest.mark.asyncio
+async def test_sweep_expires_in_capped_chunks(db_session: AsyncSession, user1_id):
+    """Test a capped run leaves the backlog for the next run"""
+    await _insert_posts(db_session, user1_id, timedelta(hours=-1), 5)
+    await _insert_posts(db_session, user1_id, timedelta(days=1), 2)
+    use_case = ExpirePostsUseCase(post_repository=PostRepositoryImpl(db_session))
+
+    first = await use_case.execute(batch_size=2, max_batches=2)
+    await db_session.commit()
+    second = await use_case.execute(batch_size=2, max_batches=2)
+    await db_session.commit()
+
+    assert (first["expired_count"], first["capped"]) == (4, True)
+    assert (second["expired_count"], second["capped"]) == (1, False)
+    assert await _count_by_status(db_session, "expired") == 5
+    assert await _count_by_status(db_session, "open") == 2
+
+
+@pytest.mark.asyncio
+async def test_feed_excludes_unswept_expired_posts_in_sql(
+    db_session: AsyncSession, user1_id
+):
+    """Test pages are filled with live posts even before the sweeper runs"""
+    await _insert_posts(db_session, user1_id, timedelta(hours=-1), 3)
+    await _insert_posts(db_session, user1_id, timedelta(days=1), 3)
+    repo = PostRepositoryImpl(db_session)
+
+    feed = await repo.list_posts(status=PostStatus.OPEN, limit=3)
+    board = await repo.list_by_city(city_code="TPE", status=PostStatus.OPEN, limit=3)
+
+    assert len(feed) == 3
+    assert all(not post.is_expired() for post in feed)
+    assert [post.id for post in board] == [post.id for post in feed]
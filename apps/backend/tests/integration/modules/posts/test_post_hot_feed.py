@@ -0,0 +1,194 @@
+"""
+Integration tests for the hot posts feed (GET /posts?sort=hot)
+
+Covers the precomputed post_hot_scores table: incremental updates from likes
+and comments, unlike floors, closing/expiry, and score cursors.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
+from app.modules.posts.infrastructure.repositories.post_hot_score_repository_impl import (
+    PostHotScoreRepositoryImpl,
+)
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+async def _create_post(
+    db_session: AsyncSession,
+    owner_id,
+    title: str,
+    city_code: str = None,
+    age: timedelta = timedelta(0),
+) -> str:
+    """Insert an open post and its hot score row, as CreatePostUseCase does"""
+    post_id = str(uuid.uuid4())
+    created_at = datetime.now(timezone.utc) - age
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO posts (
+                id, owner_id, scope, city_code, category, title, content,
+                status, expires_at, created_at, updated_at
+            )
+            VALUES (
+                :id, :owner_id, :scope, :city_code, 'trade', :title, 'content',
+                'open', :expires_at, :created_at, :created_at
+            )
+            """
+        ),
+        {
+            "id": post_id,
+            "owner_id": str(owner_id),
+            "scope": "city" if city_code else "global",
+            "city_code": city_code,
+            "title": title,
+            "expires_at": created_at + timedelta(days=14),
+            "created_at": created_at,
+        },
+    )
+    post = await PostRepositoryImpl(db_session).get_by_id(post_id)
+    await _service(db_session).on_post_created(post)
+    await db_session.commit()
+    return post_id
+
+
+def _service(db_session: AsyncSession) -> PostHotScoreService:
+    return PostHotScoreService(PostHotScoreRepositoryImpl(db_session))
+
+
+@pytest.mark.asyncio
+async def test_likes_and_comments_reorder_hot_feed(
+    client: AsyncClient,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    user1_id,
+):
+    """Test engagement through the API lifts an older post above newer ones"""
+    older = await _create_post(db_session, user1_id, "Older", age=timedelta(hours=3))
+    newer = await _create_post(db_session, user1_id, "Newer")
+
+    before = await client.get(
+        "/api/v1/posts", params={"sort": "hot"}, headers=auth_headers_user2
+    )
+    assert before.status_code == 200
+    assert [p["id"] for p in before.json()["data"]["posts"]] == [newer, older]
+
+    like = await client.post(
+        f"/api/v1/posts/{older}/like", headers=auth_headers_user2
+    )
+    assert like.status_code == 200
+    comment = await client.post(
+        f"/api/v1/posts/{older}/comments",
+        json={"content": "Still available?"},
+        headers=auth_headers_user2,
+    )
+    assert comment.status_code in (200, 201)
+
+    after = await client.get(
+        "/api/v1/posts", params={"sort": "hot"}, headers=auth_headers_user2
+    )
+    assert after.status_code == 200
+    assert [p["id"] for p in after.json()["data"]["posts"]] == [older, newer]
+
+    latest = await client.get("/api/v1/posts", headers=auth_headers_user2)
+    assert [p["id"] for p in latest.json()["data"]["posts"]] == [newer, older]
+
+
+@pytest.mark.asyncio
+async def test_unlike_returns_to_base_score(db_session: AsyncSession, user1_id):
+    """Test removing every event restores the base score and never goes below it"""
+    post_id = await _create_post(db_session, user1_id, "Solo")
+    repo = PostHotScoreRepositoryImpl(db_session)
+    service = _service(db_session)
+    [(_, base_score)] = await repo.list_hot()
+    liked_at = datetime.now(timezone.utc)
+
+    await service.on_like_added(post_id, liked_at)
+    [(_, liked_score)] = await repo.list_hot()
+    await service.on_like_removed(post_id, liked_at)
+    [(_, unliked_score)] = await repo.list_hot()
+    await service.on_like_removed(post_id, liked_at)
+    [(_, floored_score)] = await repo.list_hot()
+
+    assert liked_score > base_score
+    assert unliked_score == pytest.approx(base_score)
+    assert floored_score == pytest.approx(base_score)
+
+
+@pytest.mark.asyncio
+async def test_hot_feed_filters_city_and_hides_inactive_posts(
+    db_session: AsyncSession, user1_id
+):
+    """Test city filtering, closed/expired exclusion and pruning of stale rows"""
+    taipei = await _create_post(db_session, user1_id, "TPE", city_code="TPE")
+    await _create_post(db_session, user1_id, "KHH", city_code="KHH")
+    global_post = await _create_post(db_session, user1_id, "Global")
+    closed = await _create_post(db_session, user1_id, "Closed", city_code="TPE")
+    await db_session.execute(
+        text("UPDATE posts SET status = 'closed' WHERE id = :id"), {"id": closed}
+    )
+    await db_session.execute(
+        text("UPDATE posts SET expires_at = now() - interval '1 hour' WHERE id = :id"),
+        {"id": global_post},
+    )
+    repo = PostHotScoreRepositoryImpl(db_session)
+
+    city_feed = await repo.list_hot(city_code="TPE")
+    global_feed = await repo.list_hot()
+    pruned = await repo.delete_inactive()
+
+    assert [post.id for post, _ in city_feed] == [taipei]
+    assert len(global_feed) == 2
+    assert pruned == 2
+
+
+@pytest.mark.asyncio
+async def test_hot_cursor_pages_without_gaps(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+):
+    """Test score cursors walk the hot feed exactly once; latest cursors are a 400"""
+    for i in range(5):
+        await _create_post(db_session, user1_id, f"Post {i}", age=timedelta(minutes=i))
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"sort": "hot", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/api/v1/posts", params=params, headers=auth_headers_user1
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen.extend(p["id"] for p in data["posts"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+
+    latest_cursor = KeysetCursor.from_row(
+        datetime.now(timezone.utc), uuid.uuid4()
+    ).encode()
+    response = await client.get(
+        "/api/v1/posts",
+        params={"sort": "hot", "cursor": latest_cursor},
+        headers=auth_headers_user1,
+    )
+    assert response.status_code == 400
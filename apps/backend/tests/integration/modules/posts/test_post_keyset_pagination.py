@@ -0,0 +1,130 @@
+"""
+Integration tests for keyset (cursor) pagination of post listings
+
+Posts sharing the same created_at must still be paged without gaps or
+duplicates, and GET /posts must hand back a usable next_cursor.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.posts.domain.entities.post import PostStatus
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+async def _insert_posts(db_session: AsyncSession, owner_id, created_ats) -> None:
+    expires_at = datetime.now(timezone.utc) + timedelta(days=14)
+    for created_at in created_ats:
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO posts (
+                    id, owner_id, scope, city_code, category, title, content,
+                    status, expires_at, created_at, updated_at
+                )
+                VALUES (
+                    :id, :owner_id, 'city', 'TPE', 'trade', 'Paged', 'Paged',
+                    'open', :expires_at, :created_at, :created_at
+                )
+                """
+            ),
+            {
+                "id": str(uuid.uuid4()),
+                "owner_id": str(owner_id),
+                "expires_at": expires_at,
+                "created_at": created_at,
+            },
+        )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_every_post_once(
+    db_session: AsyncSession, user1_id
+):
+    """Test cursor pages walk ties on created_at without skipping or repeating"""
+    base = datetime.now(timezone.utc) - timedelta(hours=1)
+    # Two groups of identical timestamps straddle page boundaries
+    await _insert_posts(db_session, user1_id, [base] * 3 + [base + timedelta(minutes=1)] * 4)
+    repo = PostRepositoryImpl(db_session)
+
+    expected = await repo.list_posts(status=PostStatus.OPEN, limit=100)
+    seen = []
+    cursor = None
+    while True:
+        page = await repo.list_posts(status=PostStatus.OPEN, limit=2, cursor=cursor)
+        seen.extend(post.id for post in page)
+        if len(page) < 2:
+            break
+        cursor = KeysetCursor.from_row(page[-1].created_at, page[-1].id)
+
+    assert seen == [post.id for post in expected]
+    assert len(seen) == 7
+
+    # Board and owner listings share the same keyset ordering
+    board_first = await repo.list_by_city(
+        city_code="TPE", status=PostStatus.OPEN, limit=4
+    )
+    board_cursor = KeysetCursor.from_row(board_first[-1].created_at, board_first[-1].id)
+    board_rest = await repo.list_by_city(
+        city_code="TPE", status=PostStatus.OPEN, limit=4, cursor=board_cursor
+    )
+    owned_rest = await repo.get_by_owner_id(str(user1_id), limit=4, cursor=board_cursor)
+    assert [post.id for post in board_first + board_rest] == seen
+    assert [post.id for post in owned_rest] == seen[4:]
+
+
+@pytest.mark.asyncio
+async def test_list_posts_returns_next_cursor(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+):
+    """Test GET /posts exposes next_cursor and accepts it back"""
+    base = datetime.now(timezone.utc) - timedelta(hours=1)
+    await _insert_posts(
+        db_session, user1_id, [base + timedelta(seconds=i) for i in range(3)]
+    )
+
+    first = await client.get(
+        "/api/v1/posts", params={"limit": 2}, headers=auth_headers_user1
+    )
+    assert first.status_code == 200
+    first_data = first.json()["data"]
+    assert len(first_data["posts"]) == 2
+    assert first_data["next_cursor"]
+
+    second = await client.get(
+        "/api/v1/posts",
+        params={"limit": 2, "cursor": first_data["next_cursor"]},
+        headers=auth_headers_user1,
+    )
+    assert second.status_code == 200
+    second_data = second.json()["data"]
+    assert len(second_data["posts"]) == 1
+    assert second_data["next_cursor"] is None
+    first_ids = {post["id"] for post in first_data["posts"]}
+    assert second_data["posts"][0]["id"] not in first_ids
+
+
+@pytest.mark.asyncio
+async def test_list_posts_rejects_malformed_cursor(
+    client: AsyncClient, auth_headers_user1: dict
+):
+    """Test a tampered cursor is a 400, not a 500"""
+    response = await client.get(
+        "/api/v1/posts",
+        params={"cursor": "not-a-cursor"},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 400
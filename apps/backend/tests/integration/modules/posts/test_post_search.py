@@ -0,0 +1,181 @@
+"""
+Integration tests for post search (GET /posts/search)
+
+Covers full-text matching over the generated search_vector column, the
+trigram fallback for misspelled idol names, ranking and score cursors.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+async def _insert_post(
+    db_session: AsyncSession,
+    owner_id,
+    title: str,
+    content: str = "",
+    idol: str = None,
+    idol_group: str = None,
+    status: str = "open",
+    expires_in: timedelta = timedelta(days=14),
+) -> str:
+    post_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO posts (
+                id, owner_id, scope, category, title, content, idol, idol_group,
+                status, expires_at, created_at, updated_at
+            )
+            VALUES (
+                :id, :owner_id, 'global', 'trade', :title, :content, :idol,
+                :idol_group, :status, :expires_at, :now, :now
+            )
+            """
+        ),
+        {
+            "id": post_id,
+            "owner_id": str(owner_id),
+            "title": title,
+            "content": content,
+            "idol": idol,
+            "idol_group": idol_group,
+            "status": status,
+            "expires_at": now + expires_in,
+            "now": now,
+        },
+    )
+    await db_session.commit()
+    return post_id
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_idol_matches_and_skips_closed_posts(
+    db_session: AsyncSession, user1_id
+):
+    """Test idol matches rank above content mentions; closed/expired posts are hidden"""
+    idol_post = await _insert_post(
+        db_session, user1_id, "Selling photocards", idol="Wonyoung", idol_group="IVE"
+    )
+    content_post = await _insert_post(
+        db_session, user1_id, "Random lot", content="includes one wonyoung card"
+    )
+    await _insert_post(db_session, user1_id, "Other", idol="Karina", idol_group="aespa")
+    await _insert_post(db_session, user1_id, "Closed", idol="Wonyoung", status="closed")
+    await _insert_post(
+        db_session,
+        user1_id,
+        "Expired",
+        idol="Wonyoung",
+        expires_in=timedelta(hours=-1),
+    )
+    repo = PostRepositoryImpl(db_session)
+
+    results = await repo.search_posts(query="wonyoung", limit=10)
+
+    assert [post.id for post, _ in results] == [idol_post, content_post]
+    assert results[0][1] > results[1][1]
+
+
+@pytest.mark.asyncio
+async def test_search_trigram_matches_misspelled_idol(
+    db_session: AsyncSession, user1_id
+):
+    """Test a misspelled idol name still finds the post via trigram similarity"""
+    post_id = await _insert_post(
+        db_session, user1_id, "WTS", idol="Wonyoung", idol_group="IVE"
+    )
+    repo = PostRepositoryImpl(db_session)
+
+    results = await repo.search_posts(query="wonyong", limit=10)
+
+    assert [post.id for post, _ in results] == [post_id]
+
+
+@pytest.mark.asyncio
+async def test_search_score_cursor_pages_without_gaps(
+    db_session: AsyncSession, user1_id
+):
+    """Test (score, created_at, id) cursors walk ranked results exactly once"""
+    for i in range(5):
+        await _insert_post(db_session, user1_id, f"Karina card {i}", idol="Karina")
+    await _insert_post(db_session, user1_id, "Lot", content="karina")
+    repo = PostRepositoryImpl(db_session)
+
+    expected = await repo.search_posts(query="karina", limit=100)
+    seen = []
+    cursor = None
+    while True:
+        page = await repo.search_posts(query="karina", limit=2, cursor=cursor)
+        seen.extend(post.id for post, _ in page)
+        if len(page) < 2:
+            break
+        last_post, last_score = page[-1]
+        cursor = KeysetCursor.from_row(
+            last_post.created_at, last_post.id, score=last_score
+        )
+
+    assert seen == [post.id for post, _ in expected]
+    assert len(seen) == 6
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint_returns_feed_items(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+):
+    """Test GET /posts/search returns feed-shaped items and a working cursor"""
+    for i in range(3):
+        await _insert_post(db_session, user1_id, f"Minji set {i}", idol="Minji")
+
+    first = await client.get(
+        "/api/v1/posts/search",
+        params={"q": "minji", "limit": 2},
+        headers=auth_headers_user1,
+    )
+    assert first.status_code == 200
+    first_data = first.json()["data"]
+    assert len(first_data["posts"]) == 2
+    assert {"like_count", "liked_by_me", "can_message", "media_asset_ids"} <= set(
+        first_data["posts"][0]
+    )
+    assert first_data["next_cursor"]
+
+    second = await client.get(
+        "/api/v1/posts/search",
+        params={"q": "minji", "limit": 2, "cursor": first_data["next_cursor"]},
+        headers=auth_headers_user1,
+    )
+    assert second.status_code == 200
+    second_data = second.json()["data"]
+    assert len(second_data["posts"]) == 1
+    assert second_data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint_rejects_feed_cursor(
+    client: AsyncClient, auth_headers_user1: dict
+):
+    """Test a cursor without a score is a 400"""
+    cursor = KeysetCursor.from_row(datetime.now(timezone.utc), uuid.uuid4()).encode()
+
+    response = await client.get(
+        "/api/v1/posts/search",
+        params={"q": "minji", "cursor": cursor},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,147 @@
+"""
+Integration tests for GET /posts hydration and the shared first-page cache
+
+The feed must issue a fixed number of queries regardless of page size:
+media attachments and owner profiles are fetched once per page. Cached first
+pages must not hide posts created through the API.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.posts.application.services.post_feed_cache import post_feed_cache
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _insert_post_with_media(db_session: AsyncSession, owner_id) -> str:
+    post_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO posts (
+                id, owner_id, scope, category, title, content,
+                status, expires_at, created_at, updated_at
+            )
+            VALUES (
+                :id, :owner_id, 'global', 'trade', 'Feed', 'Feed',
+                'open', :expires_at, :now, :now
+            )
+            """
+        ),
+        {
+            "id": post_id,
+            "owner_id": str(owner_id),
+            "expires_at": now + timedelta(days=14),
+            "now": now,
+        },
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO media_assets (
+                id, owner_id, gcs_blob_name, content_type, file_size_bytes,
+                status, target_type, target_id, created_at, updated_at
+            )
+            VALUES (
+                :id, :owner_id, :blob, 'image/jpeg', 1024,
+                'attached', 'post', :post_id, NOW(), NOW()
+            )
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "owner_id": str(owner_id),
+            "blob": f"posts/{post_id}.jpg",
+            "post_id": post_id,
+        },
+    )
+    await db_session.commit()
+    return post_id
+
+
+@pytest.mark.asyncio
+async def test_feed_query_count_is_independent_of_page_size(
+    client: AsyncClient,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    user1_id,
+):
+    """Test GET /posts hydrates media for the page without per-post queries"""
+    post_ids = [await _insert_post_with_media(db_session, user1_id) for _ in range(2)]
+
+    with _count_queries() as small_page:
+        response = await client.get("/api/v1/posts", headers=auth_headers_user2)
+    assert response.status_code == 200
+    posts = response.json()["data"]["posts"]
+    assert {post["id"] for post in posts} == set(post_ids)
+    assert all(len(post["media_asset_ids"]) == 1 for post in posts)
+
+    for _ in range(4):
+        await _insert_post_with_media(db_session, user1_id)
+    # Rows were inserted behind the feed cache's back; measure a cold page again
+    post_feed_cache.clear()
+
+    with _count_queries() as large_page:
+        response = await client.get("/api/v1/posts", headers=auth_headers_user2)
+    assert response.status_code == 200
+    assert len(response.json()["data"]["posts"]) == 6
+
+    assert len(large_page) == len(small_page)
+
+
+@pytest.mark.asyncio
+async def test_created_post_invalidates_cached_first_page(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    user1_id,
+):
+    """Test a second viewer is served from cache until a new post invalidates it"""
+    await _insert_post_with_media(db_session, user1_id)
+    first = await client.get("/api/v1/posts", headers=auth_headers_user1)
+    assert len(first.json()["data"]["posts"]) == 1
+
+    with _count_queries() as cached_page:
+        second = await client.get("/api/v1/posts", headers=auth_headers_user2)
+    assert len(second.json()["data"]["posts"]) == 1
+    assert not any("FROM posts" in statement for statement in cached_page)
+
+    created = await client.post(
+        "/api/v1/posts",
+        json={
+            "scope": "city",
+            "city_code": "TPE",
+            "category": "trade",
+            "title": "Fresh post",
+            "content": "Fresh content",
+        },
+        headers=auth_headers_user2,
+    )
+    assert created.status_code == 201
+
+    third = await client.get("/api/v1/posts", headers=auth_headers_user1)
+    titles = [post["title"] for post in third.json()["data"]["posts"]]
+    assert titles[0] == "Fresh post"
+    assert len(titles) == 2
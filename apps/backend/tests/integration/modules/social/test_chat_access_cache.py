@@ -0,0 +1,110 @@
+"""
+Integration tests for the chat access cache on message polls
+
+A warm poll reuses the room and friendship checks and only queries the
+messages; blocking drops the pair's cached state at once.
+"""
+
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _access_queries(statements):
+    """Statements reading the room or the friendship of its participants"""
+    return [s for s in statements if "chat_rooms" in s or "friendships" in s]
+
+
+async def _create_room(db_session: AsyncSession, user_a, user_b) -> str:
+    room_id = str(uuid.uuid4())
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO friendships (id, user_id, friend_id, status)
+            VALUES (:id, :user_id, :friend_id, 'accepted')
+            """
+        ),
+        {"id": str(uuid.uuid4()), "user_id": str(user_a), "friend_id": str(user_b)},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO chat_rooms (id, participant_ids, created_at)
+            VALUES (:id, ARRAY[CAST(:a AS uuid), CAST(:b AS uuid)], NOW())
+            """
+        ),
+        {"id": room_id, "a": str(user_a), "b": str(user_b)},
+    )
+    await db_session.commit()
+    return room_id
+
+
+@pytest.mark.asyncio
+async def test_warm_poll_only_queries_messages(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test the second poll skips the room and friendship lookups"""
+    room_id = await _create_room(db_session, user1_id, user2_id)
+    url = f"/api/v1/chats/{room_id}/messages"
+
+    with _count_queries() as cold:
+        response = await client.get(url, headers=auth_headers_user1)
+    assert response.status_code == 200
+    assert len(_access_queries(cold)) == 2
+
+    with _count_queries() as warm:
+        response = await client.get(url, headers=auth_headers_user1)
+    assert response.status_code == 200
+    assert _access_queries(warm) == []
+    assert len([s for s in warm if "messages" in s]) == 1
+
+
+@pytest.mark.asyncio
+async def test_block_takes_effect_on_the_next_poll(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test a block by the other participant is not hidden by the cache"""
+    room_id = await _create_room(db_session, user1_id, user2_id)
+    url = f"/api/v1/chats/{room_id}/messages"
+    response = await client.get(url, headers=auth_headers_user1)
+    assert response.status_code == 200
+
+    response = await client.post(
+        "/api/v1/friends/block",
+        json={"user_id": str(user1_id)},
+        headers=auth_headers_user2,
+    )
+    assert response.status_code == 200
+
+    # The accepted friendship became the block, so the poll is refused
+    response = await client.get(url, headers=auth_headers_user1)
+    assert response.status_code == 422
+    assert "must be friends" in response.json()["error"]["message"]
@@ -0,0 +1,139 @@
+"""
+Integration tests for long-polling chat messages (GET /chats/{room_id}/messages?wait=)
+
+A request that finds nothing new is parked on the room's waiter and answered
+as soon as a message is sent to the room, or with an empty page on timeout.
+"""
+
+import asyncio
+import time
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.infrastructure.realtime.event_hub import event_hub
+from app.shared.infrastructure.realtime.pg_notify import PgNotifyListener
+
+
+@pytest_asyncio.fixture
+async def realtime_listener(test_database_url):
+    listener = PgNotifyListener(dsn=test_database_url, hub=event_hub)
+    listener.start()
+    await listener.wait_listening()
+    yield listener
+    await listener.stop()
+
+
+async def _create_room(db_session: AsyncSession, user_a, user_b) -> str:
+    """Insert an accepted friendship and a chat room for two users"""
+    room_id = str(uuid.uuid4())
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO friendships (id, user_id, friend_id, status)
+            VALUES (:id, :user_id, :friend_id, 'accepted')
+            """
+        ),
+        {"id": str(uuid.uuid4()), "user_id": str(user_a), "friend_id": str(user_b)},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO chat_rooms (id, participant_ids, created_at)
+            VALUES (:id, ARRAY[CAST(:a AS uuid), CAST(:b AS uuid)], NOW())
+            """
+        ),
+        {"id": room_id, "a": str(user_a), "b": str(user_b)},
+    )
+    await db_session.commit()
+    return room_id
+
+
+async def _wait_until_parked(count: int = 1) -> None:
+    while event_hub.waiter_count < count:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_parked_request_returns_when_a_message_is_sent(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    realtime_listener,
+    user1_id,
+    user2_id,
+):
+    """Test the waiting request is answered by the send, not the timeout"""
+    room_id = await _create_room(db_session, user1_id, user2_id)
+    url = f"/api/v1/chats/{room_id}/messages"
+
+    started = time.monotonic()
+    poll = asyncio.create_task(
+        client.get(url, params={"wait": 10}, headers=auth_headers_user1)
+    )
+    await asyncio.wait_for(_wait_until_parked(), timeout=5)
+
+    sent = await client.post(
+        url, json={"content": "wake up"}, headers=auth_headers_user2
+    )
+    assert sent.status_code == 201
+
+    response = await asyncio.wait_for(poll, timeout=5)
+    assert time.monotonic() - started < 5
+    assert response.status_code == 200
+    messages = response.json()["data"]["messages"]
+    assert [m["content"] for m in messages] == ["wake up"]
+    assert event_hub.waiter_count == 0
+
+
+@pytest.mark.asyncio
+async def test_parked_request_times_out_empty(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    realtime_listener,
+    user1_id,
+    user2_id,
+):
+    """Test an idle room answers with an empty page after `wait` seconds"""
+    room_id = await _create_room(db_session, user1_id, user2_id)
+
+    started = time.monotonic()
+    response = await client.get(
+        f"/api/v1/chats/{room_id}/messages",
+        params={"wait": 1},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["messages"] == []
+    assert time.monotonic() - started >= 1
+    assert event_hub.waiter_count == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_cap_answers_503(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    monkeypatch,
+    user1_id,
+    user2_id,
+):
+    """Test requests beyond the per-worker cap are told to retry later"""
+    room_id = await _create_room(db_session, user1_id, user2_id)
+    monkeypatch.setattr(event_hub, "max_waiters", 0)
+
+    response = await client.get(
+        f"/api/v1/chats/{room_id}/messages",
+        params={"wait": 5},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
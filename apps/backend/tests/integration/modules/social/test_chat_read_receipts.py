@@ -0,0 +1,144 @@
+"""
+Integration tests for batched chat read receipts (POST /chats/read)
+
+Receipts for several rooms are applied by one set-based UPDATE: only the
+messages the caller received, up to the acknowledged message, in rooms the
+caller takes part in.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _create_room(db_session: AsyncSession, user_a, user_b, senders) -> tuple:
+    """Insert a chat room and one message per sender, one second apart"""
+    room_id = str(uuid.uuid4())
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO chat_rooms (id, participant_ids, created_at)
+            VALUES (:id, ARRAY[CAST(:a AS uuid), CAST(:b AS uuid)], NOW())
+            """
+        ),
+        {"id": room_id, "a": str(user_a), "b": str(user_b)},
+    )
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    message_ids = []
+    for i, sender in enumerate(senders):
+        message_ids.append(str(uuid.uuid4()))
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO messages (id, room_id, sender_id, content, created_at)
+                VALUES (:id, :room_id, :sender_id, :content, :created_at)
+                """
+            ),
+            {
+                "id": message_ids[-1],
+                "room_id": room_id,
+                "sender_id": str(sender),
+                "content": f"Message {i}",
+                "created_at": start + timedelta(seconds=i),
+            },
+        )
+    await db_session.commit()
+    return room_id, message_ids
+
+
+async def _statuses(db_session: AsyncSession, room_id: str) -> list:
+    result = await db_session.execute(
+        text("SELECT status FROM messages WHERE room_id = :id ORDER BY created_at"),
+        {"id": room_id},
+    )
+    return list(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_receipts_for_several_rooms_in_one_update(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    create_user,
+):
+    """Test whole-room and up-to receipts, own messages and foreign rooms"""
+    user3_id = await create_user(prefix="user3")
+    whole_room, _ = await _create_room(
+        db_session, user1_id, user2_id, [user2_id, user1_id, user2_id]
+    )
+    partial_room, partial_ids = await _create_room(
+        db_session, user1_id, user3_id, [user3_id, user3_id, user3_id]
+    )
+    foreign_room, _ = await _create_room(
+        db_session, user2_id, user3_id, [user2_id, user3_id]
+    )
+
+    with _count_queries() as statements:
+        response = await client.post(
+            "/api/v1/chats/read",
+            json={
+                "receipts": [
+                    {"room_id": whole_room},
+                    {"room_id": partial_room, "up_to_message_id": partial_ids[1]},
+                    {"room_id": foreign_room},
+                ]
+            },
+            headers=auth_headers_user1,
+        )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["marked"] == {whole_room: 2, partial_room: 2, foreign_room: 0}
+    assert data["total_marked"] == 4
+    assert len([s for s in statements if "UPDATE messages" in s]) == 1
+
+    db_session.expire_all()
+    # My own message keeps its status
+    assert await _statuses(db_session, whole_room) == ["read", "sent", "read"]
+    assert await _statuses(db_session, partial_room) == ["read", "read", "sent"]
+    assert await _statuses(db_session, foreign_room) == ["sent", "sent"]
+
+    # Acknowledging again is a no-op
+    response = await client.post(
+        "/api/v1/chats/read",
+        json={"receipts": [{"room_id": whole_room}]},
+        headers=auth_headers_user1,
+    )
+    assert response.json()["data"]["marked"] == {whole_room: 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [0, 101])
+async def test_receipt_batch_size_is_validated(
+    client: AsyncClient, auth_headers_user1: dict, count
+):
+    """Test empty and oversized batches are rejected"""
+    response = await client.post(
+        "/api/v1/chats/read",
+        json={"receipts": [{"room_id": str(uuid.uuid4())} for _ in range(count)]},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,140 @@
+"""
+Integration tests for the chat room list (GET /chats)
+
+Each room carries its participants' profiles, the last message and the
+caller's unread count, all from one query; rooms with recent messages come
+first.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _insert_profile(db_session: AsyncSession, user_id, nickname: str):
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO profiles (id, user_id, nickname, avatar_url, privacy_flags)
+            VALUES (:id, :user_id, :nickname, :avatar_url, '{}')
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": str(user_id),
+            "nickname": nickname,
+            "avatar_url": f"https://example.com/{nickname}.jpg",
+        },
+    )
+
+
+async def _create_room(db_session: AsyncSession, user_a, user_b, messages, start):
+    """Insert a room and its (sender, content, status) messages a minute apart"""
+    room_id = str(uuid.uuid4())
+    a, b = sorted([str(user_a), str(user_b)])
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO chat_rooms (id, participant_ids, created_at)
+            VALUES (:id, ARRAY[CAST(:a AS uuid), CAST(:b AS uuid)], :start)
+            """
+        ),
+        {"id": room_id, "a": a, "b": b, "start": start},
+    )
+    for i, (sender, content, status) in enumerate(messages, start=1):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO messages (id, room_id, sender_id, content, status, created_at)
+                VALUES (:id, :room_id, :sender_id, :content, :status, :created_at)
+                """
+            ),
+            {
+                "id": str(uuid.uuid4()),
+                "room_id": room_id,
+                "sender_id": str(sender),
+                "content": content,
+                "status": status,
+                "created_at": start + timedelta(minutes=i),
+            },
+        )
+    await db_session.commit()
+    return room_id
+
+
+@pytest.mark.asyncio
+async def test_room_list_carries_profiles_last_message_and_unread_count(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    create_user,
+):
+    """Test previews, unread counts, missing profiles and activity ordering"""
+    now = datetime.now(timezone.utc)
+    user3_id = await create_user(prefix="user3")
+    await _insert_profile(db_session, user1_id, "Me")
+    await _insert_profile(db_session, user2_id, "Bob")
+
+    # Created first, but its last message is the most recent activity
+    bob_room = await _create_room(
+        db_session,
+        user1_id,
+        user2_id,
+        [
+            (user2_id, "hi", "read"),
+            (user1_id, "hello", "sent"),
+            (user2_id, "still there?", "sent"),
+            (user2_id, "ping", "delivered"),
+        ],
+        start=now - timedelta(hours=2),
+    )
+    # No messages and no profile for user3
+    quiet_room = await _create_room(
+        db_session, user1_id, user3_id, [], start=now - timedelta(minutes=118)
+    )
+
+    with _count_queries() as statements:
+        response = await client.get("/api/v1/chats", headers=auth_headers_user1)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 2
+    assert [room["id"] for room in data["rooms"]] == [bob_room, quiet_room]
+
+    bob, quiet = data["rooms"]
+    assert quiet["last_message"] is None
+    assert quiet["unread_count"] == 0
+    nicknames = {p["user_id"]: p["nickname"] for p in quiet["participants"]}
+    assert nicknames == {str(user1_id): "Me", str(user3_id): None}
+
+    assert bob["last_message"]["content"] == "ping"
+    assert bob["last_message"]["status"] == "delivered"
+    assert bob["unread_count"] == 2
+    avatars = {p["user_id"]: p["avatar_url"] for p in bob["participants"]}
+    assert avatars[str(user2_id)] == "https://example.com/Bob.jpg"
+
+    room_queries = [s for s in statements if "chat_rooms" in s]
+    assert len(room_queries) == 1
+    assert not [s for s in statements if "profiles" in s and "chat_rooms" not in s]
@@ -0,0 +1,141 @@
+"""
+Integration tests for FriendshipRepositoryImpl.get_pair_state(s)
+
+The one friendship row of each pair is read from the viewer's side,
+whichever user created it, in a single query.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
+from app.modules.social.infrastructure.repositories.friendship_repository_impl import (
+    FriendshipRepositoryImpl,
+)
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _insert_friendship(
+    db_session: AsyncSession, user_id, friend_id, status, blocked_by=()
+):
+    """Insert a friendship row; blocked_by lists the blocking users"""
+    user_a_id = min(uuid.UUID(str(user_id)), uuid.UUID(str(friend_id)))
+    blockers = {uuid.UUID(str(blocker)) for blocker in blocked_by}
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO friendships (
+                id, user_id, friend_id, status, blocked_by_a, blocked_by_b
+            )
+            VALUES (:id, :user_id, :friend_id, :status, :blocked_by_a, :blocked_by_b)
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": str(user_id),
+            "friend_id": str(friend_id),
+            "status": status,
+            "blocked_by_a": user_a_id in blockers,
+            "blocked_by_b": bool(blockers - {user_a_id}),
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_pair_states_in_single_query(db_session: AsyncSession, create_user):
+    """Test each flag is reported from the viewer's side, strangers included"""
+    viewer = await create_user(prefix="viewer")
+    friend = await create_user(prefix="friend")
+    requested = await create_user(prefix="requested")
+    blocked = await create_user(prefix="blocked")
+    blocker = await create_user(prefix="blocker")
+    mutual = await create_user(prefix="mutual")
+    stranger = await create_user(prefix="stranger")
+    unrelated = await create_user(prefix="unrelated")
+
+    await _insert_friendship(db_session, friend, viewer, "accepted")
+    await _insert_friendship(db_session, viewer, requested, "pending")
+    await _insert_friendship(db_session, viewer, blocked, "blocked", [viewer])
+    await _insert_friendship(db_session, blocker, viewer, "blocked", [blocker])
+    # Both users blocked each other on the same row
+    await _insert_friendship(db_session, mutual, viewer, "blocked", [mutual, viewer])
+    # Rows not involving the viewer are ignored
+    await _insert_friendship(db_session, stranger, unrelated, "blocked", [stranger])
+    await db_session.flush()
+
+    repo = FriendshipRepositoryImpl(db_session)
+    others = [friend, requested, blocked, blocker, mutual, stranger, friend]
+    with _count_queries() as statements:
+        states = await repo.get_pair_states(str(viewer), [str(u) for u in others])
+
+    assert len(statements) == 1
+    assert states == {
+        str(friend): FriendshipPairState(user_id=str(friend), are_friends=True),
+        str(requested): FriendshipPairState(
+            user_id=str(requested), request_pending=True
+        ),
+        str(blocked): FriendshipPairState(user_id=str(blocked), blocked_by_me=True),
+        str(blocker): FriendshipPairState(user_id=str(blocker), blocked_by_them=True),
+        str(mutual): FriendshipPairState(
+            user_id=str(mutual), blocked_by_me=True, blocked_by_them=True
+        ),
+        str(stranger): FriendshipPairState(user_id=str(stranger)),
+    }
+
+    # The blocked user sees the same block from the other side
+    state = await repo.get_pair_state(str(blocked), str(viewer))
+    assert state.blocked_by_them and not state.blocked_by_me
+    assert state.is_blocked
+
+    assert await repo.get_pair_states(str(viewer), []) == {}
+
+
+@pytest.mark.asyncio
+async def test_create_returns_row_of_concurrent_opposite_request(
+    db_session: AsyncSession, create_user
+):
+    """Test B -> A losing the pair index to A -> B returns A's row"""
+    user_a = await create_user(prefix="sender")
+    user_b = await create_user(prefix="receiver")
+    # A's request committed after B checked the pair state
+    await _insert_friendship(db_session, user_a, user_b, "pending")
+    await db_session.flush()
+
+    repo = FriendshipRepositoryImpl(db_session)
+    created = await repo.create(
+        Friendship(
+            id=str(uuid.uuid4()),
+            user_id=str(user_b),
+            friend_id=str(user_a),
+            status=FriendshipStatus.PENDING,
+            created_at=datetime.utcnow(),
+        )
+    )
+
+    assert created.user_id == str(user_a)
+    assert created.status == FriendshipStatus.PENDING
+    # The savepoint kept the transaction usable
+    state = await repo.get_pair_state(str(user_b), str(user_a))
+    assert state.request_pending
@@ -0,0 +1,213 @@
+"""
+Integration tests for keyset paging of chat and thread message history
+
+The first page is the newest window (returned oldest first); `before` walks
+back through history and `after` polls for newer messages. Cursors are
+(created_at, id) pairs, so messages sharing a timestamp are neither skipped
+nor repeated at a page boundary.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MESSAGE_COUNT = 9
+
+
+def _rows(start: datetime):
+    """
+    Three messages per second, so every page boundary lands on a tie
+
+    IDs are sorted so that "Message i" is also the i-th message in
+    (created_at, id) order.
+    """
+    ids = sorted(str(uuid.uuid4()) for _ in range(MESSAGE_COUNT))
+    return [(ids[i], start + timedelta(seconds=i // 3)) for i in range(MESSAGE_COUNT)]
+
+
+async def _create_room(db_session: AsyncSession, user_a, user_b, start) -> str:
+    room_id = str(uuid.uuid4())
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO friendships (id, user_id, friend_id, status)
+            VALUES (:id, :user_id, :friend_id, 'accepted')
+            """
+        ),
+        {"id": str(uuid.uuid4()), "user_id": str(user_a), "friend_id": str(user_b)},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO chat_rooms (id, participant_ids, created_at)
+            VALUES (:id, ARRAY[CAST(:a AS uuid), CAST(:b AS uuid)], :start)
+            """
+        ),
+        {"id": room_id, "a": str(user_a), "b": str(user_b), "start": start},
+    )
+    for i, (message_id, created_at) in enumerate(_rows(start)):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO messages (id, room_id, sender_id, content, created_at)
+                VALUES (:id, :room_id, :sender_id, :content, :created_at)
+                """
+            ),
+            {
+                "id": message_id,
+                "room_id": room_id,
+                "sender_id": str(user_a if i % 2 == 0 else user_b),
+                "content": f"Message {i}",
+                "created_at": created_at,
+            },
+        )
+    await db_session.commit()
+    return room_id
+
+
+async def _create_thread(db_session: AsyncSession, user_a, user_b, start) -> str:
+    thread_id = str(uuid.uuid4())
+    a, b = sorted([str(user_a), str(user_b)])
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_threads (id, user_a_id, user_b_id, created_at, updated_at)
+            VALUES (:id, :a, :b, :start, :start)
+            """
+        ),
+        {"id": thread_id, "a": a, "b": b, "start": start},
+    )
+    for i, (message_id, created_at) in enumerate(_rows(start)):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO thread_messages (id, thread_id, sender_id, content, created_at)
+                VALUES (:id, :thread_id, :sender_id, :content, :created_at)
+                """
+            ),
+            {
+                "id": message_id,
+                "thread_id": thread_id,
+                "sender_id": str(user_a if i % 2 == 0 else user_b),
+                "content": f"Message {i}",
+                "created_at": created_at,
+            },
+        )
+    await db_session.commit()
+    return thread_id
+
+
+async def _walk_back(client: AsyncClient, url: str, headers: dict):
+    """Page from the newest window back to the start, oldest message first"""
+    pages = []
+    params = {"limit": 4}
+    while True:
+        response = await client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        page = response.json()["data"]
+        pages.append(page)
+        if not page["has_more"]:
+            break
+        params = {"limit": 4, "before": page["before_cursor"]}
+    return pages
+
+
+def _assert_history(pages):
+    newest = [m["content"] for m in pages[0]["messages"]]
+    assert newest == [f"Message {i}" for i in range(5, 9)]
+
+    history = [m["content"] for page in reversed(pages) for m in page["messages"]]
+    assert history == [f"Message {i}" for i in range(MESSAGE_COUNT)]
+
+
+@pytest.mark.asyncio
+async def test_chat_history_pages_back_and_polls_forward(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test chat history: newest window, before paging, after polling"""
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    room_id = await _create_room(db_session, user1_id, user2_id, start)
+    url = f"/api/v1/chats/{room_id}/messages"
+
+    pages = await _walk_back(client, url, auth_headers_user1)
+    _assert_history(pages)
+
+    # Polling from an older window returns what came after it, oldest first
+    oldest_page = pages[-1]
+    response = await client.get(
+        url,
+        params={"limit": 3, "after": oldest_page["after_cursor"]},
+        headers=auth_headers_user1,
+    )
+    assert response.status_code == 200
+    newer = [m["content"] for m in response.json()["data"]["messages"]]
+    assert newer == ["Message 1", "Message 2", "Message 3"]
+
+    # Nothing newer than the newest window: the cursor is echoed back
+    response = await client.get(
+        url, params={"after": pages[0]["after_cursor"]}, headers=auth_headers_user1
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["messages"] == []
+    assert data["after_cursor"] == pages[0]["after_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_thread_history_pages_back_and_polls_forward(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test thread history: newest window, before paging, after polling"""
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    thread_id = await _create_thread(db_session, user1_id, user2_id, start)
+    url = f"/api/v1/threads/{thread_id}/messages"
+
+    pages = await _walk_back(client, url, auth_headers_user1)
+    _assert_history(pages)
+
+    response = await client.get(
+        url,
+        params={"limit": 2, "after": pages[-1]["after_cursor"]},
+        headers=auth_headers_user1,
+    )
+    assert response.status_code == 200
+    newer = [m["content"] for m in response.json()["data"]["messages"]]
+    assert newer == ["Message 1", "Message 2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [{"before": "garbage"}, {"after": "garbage"}, {"before": "x", "after": "y"}],
+)
+async def test_invalid_history_cursor_is_bad_request(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    params,
+):
+    """Test malformed or conflicting cursors are a 400 on both endpoints"""
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    room_id = await _create_room(db_session, user1_id, user2_id, start)
+    thread_id = await _create_thread(db_session, user1_id, user2_id, start)
+
+    for url in (
+        f"/api/v1/chats/{room_id}/messages",
+        f"/api/v1/threads/{thread_id}/messages",
+    ):
+        response = await client.get(url, params=params, headers=auth_headers_user1)
+        assert response.status_code == 400, url
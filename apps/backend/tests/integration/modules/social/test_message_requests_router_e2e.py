@@ -8,6 +8,7 @@ Tests the message requests endpoints:
 - POST /message-requests/{request_id}/decline - Decline request
 """
 
+from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -17,6 +18,10 @@ from sqlalchemy import text
 
 from app.main import app
 from app.shared.infrastructure.database.connection import get_db_session
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
+)
+from app.shared.presentation.dependencies.services import get_profile_summary_loader
 from app.shared.presentation.deps.require_user import require_user
 
 
@@ -93,6 +98,39 @@ class TestMessageRequestsRouterE2E:
         await db_session.commit()
         return user_id
 
+    @pytest_asyncio.fixture
+    async def private_user(self, db_session) -> UUID:
+        """Create a user who does not accept messages from strangers"""
+        user_id = uuid4()
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO users (id, google_id, email, role)
+                VALUES (:id, :google_id, :email, 'user')
+                """
+            ),
+            {
+                "id": str(user_id),
+                "google_id": f"test_msgreq3_{user_id}",
+                "email": f"msgreq3_{user_id}@test.com",
+            },
+        )
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO profiles (id, user_id, nickname, privacy_flags)
+                VALUES (:id, :user_id, 'Private User', :privacy_flags)
+                """
+            ),
+            {
+                "id": str(uuid4()),
+                "user_id": str(user_id),
+                "privacy_flags": '{"allow_stranger_chat": false}',
+            },
+        )
+        await db_session.commit()
+        return user_id
+
     @pytest.fixture
     def authenticated_client_user1(self, test_user1, app_db_session_override):
         """Provide authenticated test client for user1"""
@@ -238,6 +276,23 @@ class TestMessageRequestsRouterE2E:
 
         assert response.status_code == 400
 
+    def test_create_message_request_privacy_does_not_rely_on_summaries(
+        self, authenticated_client_user1, private_user
+    ):
+        """Test FR-013 still holds when profile summaries cannot be loaded"""
+        profile_service = AsyncMock()
+        profile_service.get_profile_summaries.side_effect = RuntimeError("down")
+        app.dependency_overrides[get_profile_summary_loader] = (
+            lambda: ProfileSummaryLoader(profile_service)
+        )
+        payload = {"recipient_id": str(private_user), "initial_message": "Hello"}
+
+        response = authenticated_client_user1.post(
+            "/api/v1/message-requests", json=payload
+        )
+
+        assert response.status_code == 400
+
     def test_create_message_request_unauthorized(
         self, unauthenticated_client, test_user2
     ):
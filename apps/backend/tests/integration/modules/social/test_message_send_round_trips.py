@@ -0,0 +1,252 @@
+"""
+Integration tests for the single-statement message send path
+
+Sending a thread or chat message authorizes, inserts and updates the
+conversation in one statement; a refused send writes nothing and still
+reports which rule it broke.
+"""
+
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _message_queries(statements):
+    """Statements touching a message table, other than the realtime NOTIFY"""
+    return [s for s in statements if "messages" in s and "pg_notify" not in s]
+
+
+async def _create_thread(db_session: AsyncSession, user_a, user_b) -> str:
+    thread_id = str(uuid.uuid4())
+    a, b = sorted([str(user_a), str(user_b)])
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_threads (id, user_a_id, user_b_id, created_at, updated_at)
+            VALUES (:id, :a, :b, NOW(), NOW())
+            """
+        ),
+        {"id": thread_id, "a": a, "b": b},
+    )
+    await db_session.commit()
+    return thread_id
+
+
+async def _create_room(db_session: AsyncSession, user_a, user_b, *statuses) -> str:
+    """
+    Insert a chat room for two users
+
+    The status becomes the pair's friendship row; "blocked" is user_b blocking
+    user_a.
+    """
+    room_id = str(uuid.uuid4())
+    user_b_first = uuid.UUID(str(user_b)) < uuid.UUID(str(user_a))
+    for status in statuses:
+        blocked = status == "blocked"
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO friendships (
+                    id, user_id, friend_id, status, blocked_by_a, blocked_by_b
+                )
+                VALUES (:id, :user_id, :friend_id, :status, :blocked_by_a, :blocked_by_b)
+                """
+            ),
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": str(user_b if blocked else user_a),
+                "friend_id": str(user_a if blocked else user_b),
+                "status": status,
+                "blocked_by_a": blocked and user_b_first,
+                "blocked_by_b": blocked and not user_b_first,
+            },
+        )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO chat_rooms (id, participant_ids, created_at)
+            VALUES (:id, ARRAY[CAST(:a AS uuid), CAST(:b AS uuid)], NOW())
+            """
+        ),
+        {"id": room_id, "a": str(user_a), "b": str(user_b)},
+    )
+    await db_session.commit()
+    return room_id
+
+
+async def _count(db_session: AsyncSession, table: str, column: str, value) -> int:
+    result = await db_session.execute(
+        text(f"SELECT count(*) FROM {table} WHERE {column} = :value"),
+        {"value": value},
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_thread_send_is_one_statement(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test the message, last_message_at and read cursor come from one query"""
+    thread_id = await _create_thread(db_session, user1_id, user2_id)
+
+    with _count_queries() as statements:
+        response = await client.post(
+            f"/api/v1/threads/{thread_id}/messages",
+            json={"content": "Hello!"},
+            headers=auth_headers_user1,
+        )
+
+    assert response.status_code == 201
+    message = response.json()["data"]
+    message_queries = _message_queries(statements)
+    assert len(message_queries) == 1
+
+    db_session.expire_all()
+    thread = (
+        await db_session.execute(
+            text("SELECT last_message_at FROM message_threads WHERE id = :id"),
+            {"id": thread_id},
+        )
+    ).one()
+    cursor = (
+        await db_session.execute(
+            text(
+                """
+                SELECT last_read_at, last_read_message_id FROM thread_read_cursors
+                WHERE thread_id = :thread_id AND user_id = :user_id
+                """
+            ),
+            {"thread_id": thread_id, "user_id": str(user1_id)},
+        )
+    ).one()
+    assert thread.last_message_at == cursor.last_read_at
+    assert str(cursor.last_read_message_id) == message["id"]
+
+
+@pytest.mark.asyncio
+async def test_thread_send_by_outsider_writes_nothing(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user2_id,
+    create_user,
+):
+    """Test a non-participant is refused and the thread is left untouched"""
+    thread_id = await _create_thread(
+        db_session, user2_id, await create_user(prefix="user3")
+    )
+
+    response = await client.post(
+        f"/api/v1/threads/{thread_id}/messages",
+        json={"content": "Hello!"},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 403
+    assert "not authorized" in response.json()["error"]["message"]
+    assert await _count(db_session, "thread_messages", "thread_id", thread_id) == 0
+    assert await _count(db_session, "thread_read_cursors", "thread_id", thread_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_chat_send_is_one_statement(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test room membership and friendship are checked by the insert itself"""
+    room_id = await _create_room(db_session, user1_id, user2_id, "accepted")
+
+    with _count_queries() as statements:
+        response = await client.post(
+            f"/api/v1/chats/{room_id}/messages",
+            json={"content": "Hello!"},
+            headers=auth_headers_user1,
+        )
+
+    assert response.status_code == 201
+    assert response.json()["data"]["room_id"] == room_id
+    message_queries = _message_queries(statements)
+    assert len(message_queries) == 1
+    assert "friendships" in message_queries[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "friendships, detail",
+    [
+        ((), "must be friends"),
+        (("pending",), "must be friends"),
+        # Blocking ends the friendship
+        (("blocked",), "must be friends"),
+    ],
+)
+async def test_chat_send_refused_writes_nothing(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    friendships,
+    detail,
+):
+    """Test non-friends and blocked senders are refused with the right error"""
+    room_id = await _create_room(db_session, user1_id, user2_id, *friendships)
+
+    response = await client.post(
+        f"/api/v1/chats/{room_id}/messages",
+        json={"content": "Hello!"},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 422
+    assert detail in response.json()["error"]["message"]
+    assert await _count(db_session, "messages", "room_id", room_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_chat_send_by_outsider_is_forbidden(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user2_id,
+    create_user,
+):
+    """Test a user outside the room gets a 403, not a friendship error"""
+    room_id = await _create_room(
+        db_session, user2_id, await create_user(prefix="user3"), "accepted"
+    )
+
+    response = await client.post(
+        f"/api/v1/chats/{room_id}/messages",
+        json={"content": "Hello!"},
+        headers=auth_headers_user1,
+    )
+
+    assert response.status_code == 403
+    assert await _count(db_session, "messages", "room_id", room_id) == 0
@@ -0,0 +1,161 @@
+"""
+Integration tests for request-scoped profile loading in social endpoints
+
+Rendering a page of messages or threads must look up sender profiles with a
+fixed number of queries, no matter how many rows the page holds, and repeat
+reads are served by the process-wide profile summary cache.
+"""
+
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _profile_queries(statements):
+    return [s for s in statements if "FROM profiles" in s]
+
+
+async def _insert_profile(db_session: AsyncSession, user_id, nickname: str):
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO profiles (id, user_id, nickname, privacy_flags)
+            VALUES (:id, :user_id, :nickname, '{}')
+            """
+        ),
+        {"id": str(uuid.uuid4()), "user_id": str(user_id), "nickname": nickname},
+    )
+
+
+async def _create_thread(db_session: AsyncSession, user_a, user_b, messages: int):
+    thread_id = str(uuid.uuid4())
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_threads (id, user_a_id, user_b_id, created_at, updated_at)
+            VALUES (:id, :user_a_id, :user_b_id, NOW(), NOW())
+            """
+        ),
+        {"id": thread_id, "user_a_id": str(user_a), "user_b_id": str(user_b)},
+    )
+    for i in range(messages):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO thread_messages (id, thread_id, sender_id, content, created_at)
+                VALUES (:id, :thread_id, :sender_id, :content, NOW())
+                """
+            ),
+            {
+                "id": str(uuid.uuid4()),
+                "thread_id": thread_id,
+                "sender_id": str(user_a if i % 2 == 0 else user_b),
+                "content": f"Message {i}",
+            },
+        )
+    await db_session.commit()
+    return thread_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message_count", [2, 12])
+async def test_thread_messages_load_profiles_once(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    message_count,
+):
+    """Test every sender on the page is resolved by one profiles query"""
+    await _insert_profile(db_session, user1_id, "Alice")
+    await _insert_profile(db_session, user2_id, "Bob")
+    thread_id = await _create_thread(db_session, user1_id, user2_id, message_count)
+
+    with _count_queries() as statements:
+        response = await client.get(
+            f"/api/v1/threads/{thread_id}/messages", headers=auth_headers_user1
+        )
+
+    assert response.status_code == 200
+    messages = response.json()["data"]["messages"]
+    assert len(messages) == message_count
+    assert {m["sender_nickname"] for m in messages} == {"Alice", "Bob"}
+    assert len(_profile_queries(statements)) == 1
+
+
+@pytest.mark.asyncio
+async def test_threads_list_loads_profiles_once(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    create_user,
+):
+    """Test a list of threads with distinct partners costs one profiles query"""
+    await _insert_profile(db_session, user1_id, "Alice")
+    for i in range(4):
+        partner = await create_user(prefix=f"partner{i}")
+        await _insert_profile(db_session, partner, f"Partner {i}")
+        await _create_thread(db_session, user1_id, partner, messages=0)
+
+    with _count_queries() as statements:
+        response = await client.get("/api/v1/threads", headers=auth_headers_user1)
+
+    assert response.status_code == 200
+    assert len(_profile_queries(statements)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_summaries_skip_profiles_until_profile_update(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test repeat reads come from the summary cache and edits show up at once"""
+    await _insert_profile(db_session, user1_id, "Alice")
+    await _insert_profile(db_session, user2_id, "Bob")
+    thread_id = await _create_thread(db_session, user1_id, user2_id, messages=2)
+    url = f"/api/v1/threads/{thread_id}/messages"
+
+    await client.get(url, headers=auth_headers_user1)
+    with _count_queries() as statements:
+        cached = await client.get(url, headers=auth_headers_user1)
+    assert len(_profile_queries(statements)) == 0
+    assert {m["sender_nickname"] for m in cached.json()["data"]["messages"]} == {
+        "Alice",
+        "Bob",
+    }
+
+    updated = await client.put(
+        "/api/v1/profile/me", json={"nickname": "Bobby"}, headers=auth_headers_user2
+    )
+    assert updated.status_code == 200
+
+    response = await client.get(url, headers=auth_headers_user1)
+    assert {m["sender_nickname"] for m in response.json()["data"]["messages"]} == {
+        "Alice",
+        "Bobby",
+    }
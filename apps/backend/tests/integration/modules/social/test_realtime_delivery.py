@@ -0,0 +1,103 @@
+"""
+Integration tests for realtime message delivery
+
+Sending a message NOTIFYs the realtime channel inside the request's
+transaction; a worker's PgNotifyListener receives it after commit and fans it
+out to the participants' subscriptions.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.infrastructure.realtime.event_hub import event_hub
+from app.shared.infrastructure.realtime.pg_notify import PgNotifyListener, notify
+
+
+@pytest_asyncio.fixture
+async def realtime_listener(test_database_url):
+    listener = PgNotifyListener(dsn=test_database_url, hub=event_hub)
+    listener.start()
+    await listener.wait_listening()
+    yield listener
+    await listener.stop()
+
+
+async def _create_thread(db_session: AsyncSession, user_a, user_b) -> str:
+    thread_id = str(uuid.uuid4())
+    a, b = sorted([str(user_a), str(user_b)])
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_threads (id, user_a_id, user_b_id, created_at, updated_at)
+            VALUES (:id, :a, :b, NOW(), NOW())
+            """
+        ),
+        {"id": thread_id, "a": a, "b": b},
+    )
+    await db_session.commit()
+    return thread_id
+
+
+@pytest.mark.asyncio
+async def test_thread_message_is_pushed_to_both_participants(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    realtime_listener,
+    user1_id,
+    user2_id,
+    create_user,
+):
+    """Test a sent thread message reaches both participants and nobody else"""
+    outsider_id = await create_user(prefix="outsider")
+    thread_id = await _create_thread(db_session, user1_id, user2_id)
+
+    with event_hub.subscription(str(user1_id)) as sender, event_hub.subscription(
+        str(user2_id)
+    ) as recipient, event_hub.subscription(str(outsider_id)) as outsider:
+        response = await client.post(
+            f"/api/v1/threads/{thread_id}/messages",
+            json={"content": "still available?"},
+            headers=auth_headers_user1,
+        )
+        assert response.status_code == 201
+
+        received = await asyncio.wait_for(recipient.get(), timeout=5)
+        echoed = await asyncio.wait_for(sender.get(), timeout=5)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(outsider.get(), timeout=0.2)
+
+    assert received == echoed
+    assert received["type"] == "thread.message"
+    assert received["data"]["id"] == response.json()["data"]["id"]
+    assert received["data"]["thread_id"] == thread_id
+    assert received["data"]["content"] == "still available?"
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_events_are_never_delivered(
+    db_session: AsyncSession, realtime_listener, user1_id
+):
+    """Test NOTIFY is transactional: only committed events reach subscribers"""
+    with event_hub.subscription(str(user1_id)) as subscription:
+        await notify(db_session, [str(user1_id)], {"type": "test", "data": {"n": 1}})
+        await db_session.rollback()
+        await notify(db_session, [str(user1_id)], {"type": "test", "data": {"n": 2}})
+        await db_session.commit()
+
+        event = await asyncio.wait_for(subscription.get(), timeout=5)
+
+    assert event["data"] == {"n": 2}
+
+
+@pytest.mark.asyncio
+async def test_event_stream_requires_authentication(client: AsyncClient):
+    """Test the SSE endpoint rejects anonymous clients before streaming"""
+    response = await client.get("/api/v1/realtime/events")
+    assert response.status_code == 401
@@ -0,0 +1,143 @@
+"""
+Integration tests for RelationshipQueryServiceImpl
+
+Verifies thread, pending request, block (either direction), friendship and
+allow_stranger_chat are resolved per user in one query.
+"""
+
+import json
+import uuid
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.social.infrastructure.services.relationship_query_service_impl import (
+    RelationshipQueryServiceImpl,
+)
+
+
+async def _insert_profile(db_session: AsyncSession, user_id, privacy_flags=None):
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO profiles (id, user_id, nickname, privacy_flags, stealth_mode)
+            VALUES (:id, :user_id, 'nick', CAST(:flags AS JSON), false)
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": str(user_id),
+            "flags": json.dumps(privacy_flags) if privacy_flags is not None else None,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_relationship_states_in_single_query(
+    db_session: AsyncSession, create_user
+):
+    """Test each relationship flag is reported for the right user only"""
+    viewer = await create_user(prefix="viewer")
+    threaded = await create_user(prefix="threaded")
+    requested = await create_user(prefix="requested")
+    blocker = await create_user(prefix="blocker")
+    friend = await create_user(prefix="friend")
+    private = await create_user(prefix="private")
+    no_profile = await create_user(prefix="noprofile")
+
+    for user_id in (threaded, requested, blocker, friend):
+        await _insert_profile(db_session, user_id)
+    await _insert_profile(db_session, private, {"allow_stranger_chat": False})
+
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_threads (id, user_a_id, user_b_id, created_at, updated_at)
+            VALUES (:id, :a, :b, NOW(), NOW())
+            """
+        ),
+        {"id": str(uuid.uuid4()), "a": str(threaded), "b": str(viewer)},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_requests (
+                id, sender_id, recipient_id, initial_message, status, created_at, updated_at
+            )
+            VALUES (:id, :sender, :recipient, 'hi', 'pending', NOW(), NOW())
+            """
+        ),
+        {"id": str(uuid.uuid4()), "sender": str(requested), "recipient": str(viewer)},
+    )
+    for user_id, friend_id, status in (
+        (blocker, viewer, "blocked"),
+        (viewer, friend, "accepted"),
+    ):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO friendships (
+                    id, user_id, friend_id, status, blocked_by_a, blocked_by_b, created_at
+                )
+                VALUES (
+                    :id, :user_id, :friend_id, :status, :blocked_by_a, :blocked_by_b, NOW()
+                )
+                """
+            ),
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": str(user_id),
+                "friend_id": str(friend_id),
+                "status": status,
+                # user_id is the blocker of a blocked row
+                "blocked_by_a": status == "blocked"
+                and UUID(str(user_id)) < UUID(str(friend_id)),
+                "blocked_by_b": status == "blocked"
+                and UUID(str(user_id)) > UUID(str(friend_id)),
+            },
+        )
+    await db_session.commit()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    others = [UUID(str(u)) for u in (threaded, requested, blocker, friend, private, no_profile)]
+    service = RelationshipQueryServiceImpl(db_session)
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        states = await service.get_relationship_states(UUID(str(viewer)), others + others[:2])
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(statements) == 1
+    assert set(states) == set(others)
+
+    def flags(user_id):
+        state = states[UUID(str(user_id))]
+        return (
+            state.has_thread,
+            state.has_pending_request,
+            state.is_blocked,
+            state.is_friend,
+            state.allow_stranger_chat,
+        )
+
+    assert flags(threaded) == (True, False, False, False, True)
+    assert flags(requested) == (False, True, False, False, True)
+    assert flags(blocker) == (False, False, True, False, True)
+    assert flags(friend) == (False, False, False, True, True)
+    assert flags(private) == (False, False, False, False, False)
+    assert flags(no_profile) == (False, False, False, False, None)
+
+
+@pytest.mark.asyncio
+async def test_empty_input_runs_no_query(db_session: AsyncSession):
+    """Test that asking about nobody returns an empty dict"""
+    service = RelationshipQueryServiceImpl(db_session)
+
+    assert await service.get_relationship_states(uuid.uuid4(), []) == {}
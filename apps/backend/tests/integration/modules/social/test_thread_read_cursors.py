@@ -0,0 +1,162 @@
+"""
+Integration tests for thread read cursors
+
+Covers POST /threads/{id}/read, GET /threads/unread-counts, the sender's
+cursor advancing on send and the inbox unread count following the cursor.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _create_thread(db_session: AsyncSession, user_a, user_b) -> str:
+    thread_id = str(uuid.uuid4())
+    a, b = sorted([str(user_a), str(user_b)])
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_threads (id, user_a_id, user_b_id, created_at, updated_at)
+            VALUES (:id, :a, :b, NOW() - interval '1 day', NOW() - interval '1 day')
+            """
+        ),
+        {"id": thread_id, "a": a, "b": b},
+    )
+    await db_session.commit()
+    return thread_id
+
+
+async def _send(client: AsyncClient, thread_id: str, headers: dict, content: str):
+    response = await client.post(
+        f"/api/v1/threads/{thread_id}/messages",
+        json={"content": content},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()["data"]
+
+
+@pytest.mark.asyncio
+async def test_mark_read_moves_cursor_forward_only(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+):
+    """Test explicit and default read positions; older positions are ignored"""
+    thread_id = await _create_thread(db_session, user1_id, user2_id)
+    first = await _send(client, thread_id, auth_headers_user2, "one")
+    await _send(client, thread_id, auth_headers_user2, "two")
+    await _send(client, thread_id, auth_headers_user2, "three")
+    url = f"/api/v1/threads/{thread_id}/read"
+
+    partial = await client.post(
+        url, json={"message_id": first["id"]}, headers=auth_headers_user1
+    )
+    assert partial.status_code == 200
+    assert partial.json()["data"]["unread_count"] == 2
+    assert partial.json()["data"]["last_read_message_id"] == first["id"]
+
+    latest = await client.post(url, headers=auth_headers_user1)
+    assert latest.json()["data"]["unread_count"] == 0
+
+    rewind = await client.post(
+        url, json={"message_id": first["id"]}, headers=auth_headers_user1
+    )
+    assert rewind.status_code == 200
+    assert rewind.json()["data"]["unread_count"] == 0
+    assert rewind.json()["data"]["last_read_at"] == latest.json()["data"][
+        "last_read_at"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mark_read_rejects_outsiders_and_foreign_messages(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    create_user,
+):
+    """Test non-participants and messages of other threads are refused"""
+    user3_id = await create_user(prefix="user3")
+    own_thread = await _create_thread(db_session, user1_id, user2_id)
+    other_thread = await _create_thread(db_session, user2_id, user3_id)
+
+    outsider = await client.post(
+        f"/api/v1/threads/{other_thread}/read", headers=auth_headers_user1
+    )
+    assert outsider.status_code == 403
+
+    foreign = await client.post(
+        f"/api/v1/threads/{own_thread}/read",
+        json={"message_id": str(uuid.uuid4())},
+        headers=auth_headers_user1,
+    )
+    assert foreign.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_unread_counts_follow_cursors_and_replies(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    auth_headers_user2: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    create_user,
+):
+    """Test bulk counts, the inbox count and replies clearing the sender's unread"""
+    user3_id = await create_user(prefix="user3")
+    with_user2 = await _create_thread(db_session, user1_id, user2_id)
+    with_user3 = await _create_thread(db_session, user1_id, user3_id)
+    await _send(client, with_user2, auth_headers_user2, "hi")
+    await _send(client, with_user2, auth_headers_user2, "are you there?")
+    # Someone else's message in a thread user1 is not part of never counts
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO thread_messages (id, thread_id, sender_id, content, created_at)
+            VALUES (:id, :thread_id, :sender_id, 'hey', :created_at)
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "thread_id": with_user3,
+            "sender_id": str(user3_id),
+            "created_at": datetime.now(timezone.utc) - timedelta(minutes=1),
+        },
+    )
+    await db_session.commit()
+
+    counts = await client.get(
+        "/api/v1/threads/unread-counts", headers=auth_headers_user1
+    )
+    assert counts.status_code == 200
+    assert counts.json()["data"] == {
+        "counts": {with_user2: 2, with_user3: 1},
+        "total": 3,
+    }
+
+    inbox = await client.get("/api/v1/threads/inbox", headers=auth_headers_user1)
+    unread = {t["id"]: t["unread_count"] for t in inbox.json()["data"]["threads"]}
+    assert unread == {with_user2: 2, with_user3: 1}
+
+    # Replying advances user1's cursor past user2's messages
+    await _send(client, with_user2, auth_headers_user1, "yes!")
+    counts = await client.get(
+        "/api/v1/threads/unread-counts", headers=auth_headers_user1
+    )
+    assert counts.json()["data"] == {"counts": {with_user3: 1}, "total": 1}
+
+    other_side = await client.get(
+        "/api/v1/threads/unread-counts", headers=auth_headers_user2
+    )
+    assert other_side.json()["data"] == {"counts": {with_user2: 1}, "total": 1}
@@ -0,0 +1,201 @@
+"""
+Integration tests for the inbox (GET /threads/inbox)
+
+Each row carries the last message, the other participant's profile and the
+unread count, all from one query; pages are walked by cursor.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _insert_profile(db_session: AsyncSession, user_id, nickname: str):
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO profiles (id, user_id, nickname, avatar_url, privacy_flags)
+            VALUES (:id, :user_id, :nickname, :avatar_url, '{}')
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": str(user_id),
+            "nickname": nickname,
+            "avatar_url": f"https://example.com/{nickname}.jpg",
+        },
+    )
+
+
+async def _create_thread(db_session: AsyncSession, user_a, user_b, messages, start):
+    """Insert a thread and its (sender, content) messages one minute apart"""
+    thread_id = str(uuid.uuid4())
+    a, b = sorted([str(user_a), str(user_b)])
+    last_message_at = start + timedelta(minutes=len(messages)) if messages else None
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO message_threads (
+                id, user_a_id, user_b_id, created_at, updated_at, last_message_at
+            )
+            VALUES (:id, :a, :b, :start, :start, :last_message_at)
+            """
+        ),
+        {
+            "id": thread_id,
+            "a": a,
+            "b": b,
+            "start": start,
+            "last_message_at": last_message_at,
+        },
+    )
+    for i, (sender, content) in enumerate(messages, start=1):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO thread_messages (id, thread_id, sender_id, content, created_at)
+                VALUES (:id, :thread_id, :sender_id, :content, :created_at)
+                """
+            ),
+            {
+                "id": str(uuid.uuid4()),
+                "thread_id": thread_id,
+                "sender_id": str(sender),
+                "content": content,
+                "created_at": start + timedelta(minutes=i),
+            },
+        )
+    await db_session.commit()
+    return thread_id
+
+
+@pytest.mark.asyncio
+async def test_inbox_rows_carry_preview_profile_and_unread_count(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    user2_id,
+    create_user,
+):
+    """Test previews, unread counts and activity ordering"""
+    now = datetime.now(timezone.utc)
+    user3_id = await create_user(prefix="user3")
+    await _insert_profile(db_session, user1_id, "Me")
+    await _insert_profile(db_session, user2_id, "Bob")
+    await _insert_profile(db_session, user3_id, "Carol")
+
+    # No read cursors yet: all of Bob's messages are unread, mine never are
+    bob_thread = await _create_thread(
+        db_session,
+        user1_id,
+        user2_id,
+        [
+            (user2_id, "hi"),
+            (user1_id, "hello"),
+            (user2_id, "still there?"),
+            (user2_id, "ping"),
+        ],
+        start=now - timedelta(hours=2),
+    )
+    carol_thread = await _create_thread(
+        db_session, user1_id, user3_id, [], start=now - timedelta(hours=1)
+    )
+    replied_thread = await _create_thread(
+        db_session,
+        user1_id,
+        await create_user(prefix="user4"),
+        [(user1_id, "deal?")],
+        start=now - timedelta(hours=3),
+    )
+
+    with _count_queries() as statements:
+        response = await client.get("/api/v1/threads/inbox", headers=auth_headers_user1)
+
+    assert response.status_code == 200
+    threads = response.json()["data"]["threads"]
+    assert [t["id"] for t in threads] == [carol_thread, bob_thread, replied_thread]
+
+    carol, bob, replied = threads
+    assert carol["other_nickname"] == "Carol"
+    assert carol["last_message"] is None
+    assert carol["unread_count"] == 0
+
+    assert bob["other_user_id"] == str(user2_id)
+    assert bob["other_avatar_url"] == "https://example.com/Bob.jpg"
+    assert bob["last_message"]["content"] == "ping"
+    assert bob["last_message"]["sender_nickname"] == "Bob"
+    assert bob["unread_count"] == 3
+
+    assert replied["other_nickname"] is None
+    assert replied["last_message"]["sender_nickname"] == "Me"
+    assert replied["unread_count"] == 0
+
+    thread_queries = [s for s in statements if "thread" in s]
+    assert len(thread_queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_inbox_cursor_pages_without_gaps(
+    client: AsyncClient,
+    auth_headers_user1: dict,
+    db_session: AsyncSession,
+    user1_id,
+    create_user,
+):
+    """Test cursors walk every thread exactly once; bad cursors are a 400"""
+    now = datetime.now(timezone.utc)
+    for i in range(5):
+        partner = await create_user(prefix=f"partner{i}")
+        await _create_thread(
+            db_session,
+            user1_id,
+            partner,
+            [(partner, f"msg {i}")] if i % 2 else [],
+            start=now - timedelta(hours=i),
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/api/v1/threads/inbox", params=params, headers=auth_headers_user1
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen.extend(t["id"] for t in data["threads"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+
+    response = await client.get(
+        "/api/v1/threads/inbox",
+        params={"cursor": "garbage"},
+        headers=auth_headers_user1,
+    )
+    assert response.status_code == 400
@@ -0,0 +1,357 @@
+"""
+Fixtures for query-plan regression tests.
+
+`seeded_engine` fills the test database once per module with production-like
+volumes (deterministic ids via md5, so tests can address specific rows),
+refreshes planner statistics and truncates everything when the module is done.
+Each test gets a `seeded_db` session that is rolled back afterwards, so
+statements that write (e.g. the expiry sweep) never leak into the next case.
+`explain` runs a repository call, captures every SQL statement it issues and
+returns the EXPLAIN (FORMAT JSON) plan of each one. Scans of a partition are
+reported under the index name of the partitioned table.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Set
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.shared.infrastructure.database.partitions import MonthlyPartitionManager
+
+# Row counts large enough that a sequential scan is never the cheapest plan
+# for a selective lookup, small enough to seed in about a second.
+SEED_USERS = 2_000
+SEED_POSTS = 20_000
+SEED_FRIENDSHIPS = 10_000
+SEED_THREADS = 5_000
+SEED_THREAD_MESSAGES_PER_THREAD = 6
+SEED_CHAT_ROOMS = 3_000
+SEED_MESSAGES_PER_ROOM = 15
+SEED_MEDIA_ASSETS = 10_000
+SEED_POST_LIKES = 20_000
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (id, email, role, created_at, updated_at)
+    SELECT md5('user' || i)::uuid, 'plan' || i || '@example.com', 'user', now(), now()
+    FROM generate_series(1, {SEED_USERS}) AS i
+    """,
+    f"""
+    INSERT INTO profiles (id, user_id, nickname, stealth_mode, created_at, updated_at)
+    SELECT md5('profile' || i)::uuid, md5('user' || i)::uuid, 'user' || i, false,
+           now(), now()
+    FROM generate_series(1, {SEED_USERS}) AS i
+    """,
+    # 70% open (1 in 50 of those already past expires_at), 20% closed, 10% expired
+    f"""
+    INSERT INTO posts (
+        id, owner_id, scope, city_code, category, title, content, idol, idol_group,
+        status, expires_at, like_count, comment_count, created_at, updated_at
+    )
+    SELECT
+        md5('post' || i)::uuid,
+        md5('user' || (i % {SEED_USERS} + 1))::uuid,
+        CASE WHEN i % 3 = 0 THEN 'global' ELSE 'city' END,
+        CASE WHEN i % 3 = 0 THEN NULL
+             ELSE (ARRAY['TPE', 'KHH', 'TXG', 'TNN'])[i % 4 + 1] END,
+        (ARRAY['trade', 'giveaway', 'group', 'showcase', 'help'])[i % 5 + 1],
+        'Post ' || i,
+        'Photocard listing number ' || i,
+        (ARRAY['Wonyoung', 'Karina', 'Minji', 'Jennie', 'Sana', 'Yuna', 'Ningning',
+               'Hanni', 'Yujin', 'Winter'])[i % 10 + 1],
+        (ARRAY['IVE', 'aespa', 'NewJeans', 'BLACKPINK', 'TWICE'])[i % 5 + 1],
+        CASE WHEN i % 10 < 7 THEN 'open' WHEN i % 10 < 9 THEN 'closed'
+             ELSE 'expired' END,
+        CASE WHEN i % 10 = 9 OR i % 50 = 0 THEN now() - interval '1 day'
+             ELSE now() + interval '14 days' END,
+        0, 0,
+        now() - i * interval '1 minute',
+        now() - i * interval '1 minute'
+    FROM generate_series(1, {SEED_POSTS}) AS i
+    """,
+    f"""
+    INSERT INTO media_assets (
+        id, owner_id, gcs_blob_name, content_type, file_size_bytes, status,
+        target_type, target_id, created_at, updated_at
+    )
+    SELECT md5('media' || i)::uuid, md5('user' || (i % {SEED_USERS} + 1))::uuid,
+           'posts/' || i || '.jpg', 'image/jpeg', 1024, 'attached',
+           'post', md5('post' || (i * 2 % {SEED_POSTS} + 1))::uuid, now(), now()
+    FROM generate_series(1, {SEED_MEDIA_ASSETS}) AS i
+    """,
+    f"""
+    INSERT INTO post_likes (id, post_id, user_id, created_at)
+    SELECT md5('like' || i)::uuid, md5('post' || (i % {SEED_POSTS} + 1))::uuid,
+           md5('user' || (i / 10 % {SEED_USERS} + 1))::uuid, now()
+    FROM generate_series(1, {SEED_POST_LIKES}) AS i
+    """,
+    # Hot scores for open posts: base score by age plus a spread of engagement
+    """
+    INSERT INTO post_hot_scores (
+        post_id, city_code, category, score, base_score, created_at, updated_at
+    )
+    SELECT id, CASE WHEN scope = 'city' THEN city_code END, category,
+           base + ln(1 + (hashtext(id::text) & 63)) / ln(2), base, created_at, now()
+    FROM (
+        SELECT *, extract(epoch FROM created_at - '2025-01-01+00'::timestamptz)
+                  / 43200 AS base
+        FROM posts WHERE status = 'open'
+    ) AS open_posts
+    """,
+    f"""
+    INSERT INTO friendships (id, user_id, friend_id, status, created_at, updated_at)
+    SELECT md5('friendship' || i)::uuid,
+           md5('user' || (i % {SEED_USERS} + 1))::uuid,
+           md5('user' || ((i + i / {SEED_USERS} * 7 + 1) % {SEED_USERS} + 1))::uuid,
+           CASE WHEN i % 10 < 8 THEN 'accepted' WHEN i % 10 = 8 THEN 'pending'
+                ELSE 'blocked' END,
+           now() - i * interval '1 minute', now()
+    FROM generate_series(1, {SEED_FRIENDSHIPS}) AS i
+    ON CONFLICT (user_a_id, user_b_id) DO NOTHING
+    """,
+    # The requester is the blocker of a blocked pair
+    """
+    UPDATE friendships
+    SET blocked_by_a = (user_id = user_a_id), blocked_by_b = (user_id = user_b_id)
+    WHERE status = 'blocked'
+    """,
+    # Threads store the smaller user id in user_a_id
+    f"""
+    INSERT INTO message_threads (
+        id, user_a_id, user_b_id, created_at, updated_at, last_message_at
+    )
+    SELECT md5('thread' || i)::uuid, LEAST(a, b), GREATEST(a, b),
+           now(), now(), now() - i * interval '1 minute'
+    FROM (
+        SELECT i,
+               md5('user' || (i % {SEED_USERS} + 1))::uuid AS a,
+               md5('user' || ((i + i / {SEED_USERS} + 1) % {SEED_USERS} + 1))::uuid AS b
+        FROM generate_series(1, {SEED_THREADS}) AS i
+    ) AS pairs
+    """,
+    f"""
+    INSERT INTO thread_messages (id, thread_id, sender_id, content, created_at)
+    SELECT gen_random_uuid(), t.id, t.user_a_id, 'hello ' || n,
+           t.last_message_at - n * interval '1 minute'
+    FROM message_threads AS t
+    CROSS JOIN generate_series(1, {SEED_THREAD_MESSAGES_PER_THREAD}) AS n
+    """,
+    # user_a has read all but the last two messages of each thread, user_b none
+    """
+    INSERT INTO thread_read_cursors (
+        thread_id, user_id, last_read_at, last_read_message_id, updated_at
+    )
+    SELECT id, user_a_id, last_message_at - interval '2 minutes', NULL, now()
+    FROM message_threads
+    """,
+    f"""
+    INSERT INTO chat_rooms (id, participant_ids, created_at)
+    SELECT md5('room' || i)::uuid, ARRAY[LEAST(a, b), GREATEST(a, b)],
+           now() - i * interval '1 minute'
+    FROM (
+        SELECT i,
+               md5('user' || (i % {SEED_USERS} + 1))::uuid AS a,
+               md5('user' || ((i + i / {SEED_USERS} + 2) % {SEED_USERS} + 1))::uuid AS b
+        FROM generate_series(1, {SEED_CHAT_ROOMS}) AS i
+    ) AS pairs
+    """,
+    f"""
+    INSERT INTO messages (id, room_id, sender_id, content, status, created_at, updated_at)
+    SELECT gen_random_uuid(), r.id, r.participant_ids[n % 2 + 1], 'hi ' || n,
+           CASE WHEN n < {SEED_MESSAGES_PER_ROOM} - 2 THEN 'read' ELSE 'sent' END,
+           r.created_at + n * interval '1 second', now()
+    FROM chat_rooms AS r
+    CROSS JOIN generate_series(1, {SEED_MESSAGES_PER_ROOM}) AS n
+    """,
+]
+
+# Seeded messages reach a few days back, possibly into last month
+PARTITIONED_TABLES = ["thread_messages", "messages"]
+SEED_HISTORY = timedelta(days=7)
+
+# Month partitions, e.g. messages_2026_10
+MONTHLY_PARTITION = re.compile(r"^\w+_\d{4}_\d{2}$")
+
+SEEDED_TABLES = [
+    "users",
+    "profiles",
+    "posts",
+    "media_assets",
+    "friendships",
+    "message_threads",
+    "thread_messages",
+    "thread_read_cursors",
+    "chat_rooms",
+    "messages",
+    "post_likes",
+    "post_hot_scores",
+]
+
+
+def seed_id(kind: str, index: int) -> str:
+    """Id of the `index`-th seeded row of `kind` (mirrors md5(kind || i)::uuid)"""
+    return str(uuid.UUID(hashlib.md5(f"{kind}{index}".encode()).hexdigest()))
+
+
+@dataclass
+class QueryPlan:
+    """EXPLAIN (FORMAT JSON) output of one statement"""
+
+    statement: str
+    plan: Dict[str, Any]
+    # Partition index name -> index name on the partitioned table
+    parent_indexes: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def total_cost(self) -> float:
+        return self.plan["Total Cost"]
+
+    def nodes(self) -> List[Dict[str, Any]]:
+        """All plan nodes, depth first"""
+        stack, nodes = [self.plan], []
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.get("Plans", []))
+        return nodes
+
+    @property
+    def index_names(self) -> Set[str]:
+        return {
+            self.parent_indexes.get(node["Index Name"], node["Index Name"])
+            for node in self.nodes()
+            if "Index Name" in node
+        }
+
+    @property
+    def seq_scanned_tables(self) -> Set[str]:
+        """
+        Tables read sequentially
+
+        Zero-cost scans of monthly partitions are left out: the planner only
+        estimates those for months it knows to be empty (future months).
+        """
+        return {
+            node["Relation Name"]
+            for node in self.nodes()
+            if node["Node Type"] == "Seq Scan"
+            and not (
+                node["Total Cost"] == 0
+                and MONTHLY_PARTITION.match(node["Relation Name"])
+            )
+        }
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """Module-wide event loop so the seeded engine outlives single tests"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_engine(test_database_url: str):
+    """Seed production-like volumes once per module and refresh planner statistics"""
+    engine = create_async_engine(test_database_url, echo=False, pool_pre_ping=True)
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        manager = MonthlyPartitionManager(connection)
+        for table in PARTITIONED_TABLES:
+            await manager.ensure_partitions(
+                table, months_ahead=1, now=datetime.now(timezone.utc) - SEED_HISTORY
+            )
+    async with engine.begin() as connection:
+        for statement in SEED_SQL:
+            await connection.execute(text(statement))
+    # VACUUM also flushes the GIN pending lists, which would otherwise make the
+    # freshly bulk-loaded full-text/trigram indexes look far too expensive
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text(f"VACUUM ANALYZE {', '.join(SEEDED_TABLES)}"))
+
+    yield engine
+
+    async with engine.begin() as connection:
+        await connection.execute(
+            text(f"TRUNCATE TABLE {', '.join(SEEDED_TABLES)} CASCADE")
+        )
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def cleanup_db():
+    """Override the per-test truncation: seeded rows are shared by the module"""
+    yield
+
+
+@pytest_asyncio.fixture
+async def seeded_db(seeded_engine) -> AsyncGenerator[AsyncSession, None]:
+    """Session over the seeded data, rolled back after each test"""
+    session_factory = async_sessionmaker(
+        seeded_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+        await session.rollback()
+
+
+@pytest.fixture
+def explain(seeded_db: AsyncSession) -> Callable[..., Awaitable[List[QueryPlan]]]:
+    """Run a repository call and return the plans of the statements it issued"""
+
+    async def _explain(call: Callable[[], Awaitable[Any]]) -> List[QueryPlan]:
+        captured = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        engine = seeded_db.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            await call()
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        connection = await seeded_db.connection()
+        parent_indexes = dict(
+            (
+                await connection.execute(
+                    text(
+                        """
+                        SELECT child.relname, parent.relname
+                        FROM pg_inherits
+                        JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+                        JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+                        WHERE child.relkind = 'i'
+                        """
+                    )
+                )
+            ).all()
+        )
+        plans = []
+        for statement, parameters in captured:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            raw = result.scalar_one()
+            document = json.loads(raw) if isinstance(raw, str) else raw
+            plans.append(
+                QueryPlan(
+                    statement=statement,
+                    plan=document[0]["Plan"],
+                    parent_indexes=parent_indexes,
+                )
+            )
+        return plans
+
+    return _explain
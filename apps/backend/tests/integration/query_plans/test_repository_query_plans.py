@@ -0,0 +1,384 @@
+"""
+Query-plan regression tests for hot repository queries
+
+Every case runs the real repository method against a seeded database, then
+checks the EXPLAIN plan of the SQL it issued: the expected index is used, no
+sequential scan touches a large table, and the estimated cost stays under a
+ceiling. A failing case usually means an index was dropped or changed, or the
+query was rewritten in a way the planner can no longer serve from an index.
+
+Cost ceilings are roughly 3x the plan cost measured on the seed data; raise
+them deliberately (and say why) when a query legitimately gets more expensive.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, FrozenSet, Optional
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.media.infrastructure.repositories.media_repository_impl import (
+    MediaRepositoryImpl,
+)
+from app.modules.posts.domain.entities.post import PostStatus
+from app.modules.posts.domain.entities.post_enums import PostCategory
+from app.modules.posts.infrastructure.repositories.post_hot_score_repository_impl import (
+    PostHotScoreRepositoryImpl,
+)
+from app.modules.posts.infrastructure.repositories.post_like_repository_impl import (
+    PostLikeRepositoryImpl,
+)
+from app.modules.posts.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from app.modules.social.domain.entities.message import Message, MessageStatus
+from app.modules.social.domain.entities.thread_message import ThreadMessage
+from app.modules.social.infrastructure.repositories.chat_room_repository_impl import (
+    ChatRoomRepositoryImpl,
+)
+from app.modules.social.infrastructure.repositories.friendship_repository_impl import (
+    FriendshipRepositoryImpl,
+)
+from app.modules.social.infrastructure.repositories.message_repository_impl import (
+    MessageRepositoryImpl,
+)
+from app.modules.social.infrastructure.repositories.thread_message_repository import (
+    ThreadMessageRepository,
+)
+from app.modules.social.infrastructure.repositories.thread_read_cursor_repository import (
+    ThreadReadCursorRepository,
+)
+from app.modules.social.infrastructure.repositories.thread_repository import (
+    ThreadRepository,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+from tests.integration.query_plans.conftest import seed_id
+
+USER = seed_id("user", 1)
+OTHER_USER = seed_id("user", 2)
+
+
+@dataclass(frozen=True)
+class PlanCase:
+    """Expectations for the plans of one repository call"""
+
+    call: Callable[[AsyncSession], Awaitable[Any]]
+    # The plan must use at least one of these (the planner may legitimately
+    # pick between equivalent indexes depending on statistics)
+    indexes: FrozenSet[str]
+    max_cost: float
+    # Documented, not yet fixed: the case is a strict xfail and starts failing
+    # (as a reminder to drop this marker) once the query is fixed
+    known_regression: Optional[str] = None
+
+
+CASES = {
+    "posts.list_posts.global": PlanCase(
+        call=lambda s: PostRepositoryImpl(s).list_posts(
+            status=PostStatus.OPEN, limit=20
+        ),
+        indexes=frozenset({"idx_posts_status_created_at"}),
+        max_cost=25,
+    ),
+    "posts.list_posts.city_category": PlanCase(
+        call=lambda s: PostRepositoryImpl(s).list_posts(
+            city_code="TPE", category=PostCategory.TRADE, limit=20
+        ),
+        indexes=frozenset({"idx_posts_city_status_created_at"}),
+        max_cost=650,
+    ),
+    "posts.list_posts.cursor": PlanCase(
+        call=lambda s: PostRepositoryImpl(s).list_posts(
+            status=PostStatus.OPEN,
+            limit=20,
+            cursor=KeysetCursor.from_row(
+                datetime.now(timezone.utc) - timedelta(days=7), seed_id("post", 1)
+            ),
+        ),
+        indexes=frozenset({"idx_posts_status_created_at"}),
+        max_cost=30,
+    ),
+    "posts.list_by_city": PlanCase(
+        call=lambda s: PostRepositoryImpl(s).list_by_city(
+            city_code="KHH", status=PostStatus.OPEN, limit=20
+        ),
+        indexes=frozenset({"idx_posts_city_status_created_at"}),
+        max_cost=90,
+    ),
+    "posts.get_by_owner_id": PlanCase(
+        call=lambda s: PostRepositoryImpl(s).get_by_owner_id(USER, limit=20),
+        indexes=frozenset({"idx_posts_owner_created_at"}),
+        max_cost=125,
+    ),
+    "posts.search_posts": PlanCase(
+        call=lambda s: PostRepositoryImpl(s).search_posts("12345", limit=20),
+        indexes=frozenset({"idx_posts_search_vector"}),
+        max_cost=1200,
+    ),
+    "posts.search_posts.misspelled_idol": PlanCase(
+        call=lambda s: PostRepositoryImpl(s).search_posts("wonyong", limit=20),
+        indexes=frozenset({"idx_posts_idol_trgm"}),
+        max_cost=3000,
+    ),
+    "posts.mark_expired_posts": PlanCase(
+        # Chunk kept proportional to the seed size: 50 of 20k rows is roughly
+        # what the default 1000-row chunk is against a production posts table
+        call=lambda s: PostRepositoryImpl(s).mark_expired_posts(limit=50),
+        indexes=frozenset({"idx_posts_open_expires_at"}),
+        max_cost=1250,
+    ),
+    "post_hot_scores.list_hot.global": PlanCase(
+        call=lambda s: PostHotScoreRepositoryImpl(s).list_hot(limit=20),
+        indexes=frozenset({"idx_post_hot_scores_score"}),
+        max_cost=60,
+    ),
+    "post_hot_scores.list_hot.city_category": PlanCase(
+        call=lambda s: PostHotScoreRepositoryImpl(s).list_hot(
+            city_code="TPE", category=PostCategory.TRADE, limit=20
+        ),
+        indexes=frozenset({"idx_post_hot_scores_city_category"}),
+        max_cost=350,
+    ),
+    "post_hot_scores.list_hot.cursor": PlanCase(
+        call=lambda s: PostHotScoreRepositoryImpl(s).list_hot(
+            category=PostCategory.GIVEAWAY,
+            limit=20,
+            cursor=KeysetCursor.from_row(
+                datetime.now(timezone.utc), seed_id("post", 1), score=100.0
+            ),
+        ),
+        indexes=frozenset({"idx_post_hot_scores_category"}),
+        max_cost=40,
+    ),
+    "post_likes.get_liked_post_ids": PlanCase(
+        call=lambda s: PostLikeRepositoryImpl(s).get_liked_post_ids(
+            [seed_id("post", i) for i in range(1, 51)], USER
+        ),
+        indexes=frozenset({"uq_post_likes_post_user", "ix_post_likes_user_id"}),
+        max_cost=120,
+    ),
+    "media.get_by_targets": PlanCase(
+        call=lambda s: MediaRepositoryImpl(s).get_by_targets(
+            "post", [seed_id("post", i) for i in range(1, 51)]
+        ),
+        indexes=frozenset({"ix_media_assets_target_type_target_id"}),
+        max_cost=500,
+    ),
+    "friendships.are_friends": PlanCase(
+        call=lambda s: FriendshipRepositoryImpl(s).are_friends(USER, OTHER_USER),
+        indexes=frozenset({"uq_friendship_pair", "idx_friendship_user_b"}),
+        max_cost=40,
+    ),
+    "friendships.get_by_users": PlanCase(
+        call=lambda s: FriendshipRepositoryImpl(s).get_by_users(USER, OTHER_USER),
+        indexes=frozenset({"uq_friendship_pair", "idx_friendship_user_b"}),
+        max_cost=40,
+    ),
+    "friendships.get_pair_state": PlanCase(
+        call=lambda s: FriendshipRepositoryImpl(s).get_pair_state(USER, OTHER_USER),
+        indexes=frozenset({"uq_friendship_pair", "idx_friendship_user_b"}),
+        max_cost=40,
+    ),
+    "friendships.get_pair_states": PlanCase(
+        call=lambda s: FriendshipRepositoryImpl(s).get_pair_states(
+            USER, [seed_id("user", i) for i in range(2, 52)]
+        ),
+        indexes=frozenset({"uq_friendship_pair"}),
+        max_cost=125,
+    ),
+    "friendships.get_friends_by_user_id": PlanCase(
+        call=lambda s: FriendshipRepositoryImpl(s).get_friends_by_user_id(USER),
+        indexes=frozenset({"uq_friendship_pair", "idx_friendship_user_b"}),
+        max_cost=125,
+    ),
+    "threads.get_threads_for_user": PlanCase(
+        call=lambda s: ThreadRepository(s).get_threads_for_user(USER, limit=20),
+        indexes=frozenset({"idx_thread_user_a", "idx_thread_user_b"}),
+        max_cost=85,
+    ),
+    "threads.get_inbox_for_user": PlanCase(
+        call=lambda s: ThreadRepository(s).get_inbox_for_user(USER, limit=20),
+        indexes=frozenset({"idx_thread_message_thread_created"}),
+        max_cost=850,
+    ),
+    "threads.find_by_users": PlanCase(
+        call=lambda s: ThreadRepository(s).find_by_users(USER, OTHER_USER),
+        indexes=frozenset({"uq_thread_users"}),
+        max_cost=25,
+    ),
+    "thread_messages.get_messages_by_thread": PlanCase(
+        call=lambda s: ThreadMessageRepository(s).get_messages_by_thread(
+            seed_id("thread", 1), limit=50
+        ),
+        indexes=frozenset(
+            {"idx_thread_message_thread_created", "ix_thread_messages_thread_id"}
+        ),
+        max_cost=80,
+    ),
+    "thread_messages.get_messages_by_thread.before": PlanCase(
+        call=lambda s: ThreadMessageRepository(s).get_messages_by_thread(
+            seed_id("thread", 1),
+            limit=50,
+            before=KeysetCursor.from_row(
+                datetime.now(timezone.utc) - timedelta(minutes=30),
+                seed_id("message", 1),
+            ),
+        ),
+        indexes=frozenset(
+            {"idx_thread_message_thread_created", "ix_thread_messages_thread_id"}
+        ),
+        max_cost=80,
+    ),
+    "thread_messages.get_messages_by_thread.after": PlanCase(
+        call=lambda s: ThreadMessageRepository(s).get_messages_by_thread(
+            seed_id("thread", 1),
+            limit=50,
+            after=KeysetCursor.from_row(
+                datetime.now(timezone.utc) - timedelta(minutes=30),
+                seed_id("message", 1),
+            ),
+        ),
+        indexes=frozenset({"idx_thread_message_thread_created"}),
+        max_cost=80,
+    ),
+    "thread_messages.create_in_thread": PlanCase(
+        call=lambda s: ThreadMessageRepository(s).create_in_thread(
+            ThreadMessage(
+                id=str(uuid4()),
+                thread_id=seed_id("thread", 1),
+                sender_id=USER,
+                content="hello",
+                post_id=None,
+                created_at=datetime.now(timezone.utc),
+            )
+        ),
+        indexes=frozenset({"message_threads_pkey"}),
+        max_cost=25,
+    ),
+    "thread_read_cursors.count_unread": PlanCase(
+        call=lambda s: ThreadReadCursorRepository(s).count_unread(
+            seed_id("thread", 1), USER
+        ),
+        indexes=frozenset({"idx_thread_message_thread_created"}),
+        max_cost=60,
+    ),
+    "thread_read_cursors.count_unread_for_user": PlanCase(
+        call=lambda s: ThreadReadCursorRepository(s).count_unread_for_user(USER),
+        indexes=frozenset({"idx_thread_message_thread_created"}),
+        max_cost=340,
+    ),
+    "messages.get_messages_by_room_id": PlanCase(
+        call=lambda s: MessageRepositoryImpl(s).get_messages_by_room_id(
+            seed_id("room", 1), limit=50
+        ),
+        indexes=frozenset(
+            {"idx_message_room_created", "idx_message_room_id", "ix_messages_room_id"}
+        ),
+        max_cost=175,
+    ),
+    "messages.get_messages_by_room_id.before": PlanCase(
+        call=lambda s: MessageRepositoryImpl(s).get_messages_by_room_id(
+            seed_id("room", 1),
+            limit=50,
+            before=KeysetCursor.from_row(
+                datetime.now(timezone.utc), seed_id("message", 1)
+            ),
+        ),
+        indexes=frozenset(
+            {"idx_message_room_created", "idx_message_room_id", "ix_messages_room_id"}
+        ),
+        max_cost=175,
+    ),
+    "messages.get_messages_by_room_id.after": PlanCase(
+        call=lambda s: MessageRepositoryImpl(s).get_messages_by_room_id(
+            seed_id("room", 1),
+            limit=50,
+            after=KeysetCursor.from_row(
+                datetime.now(timezone.utc) - timedelta(minutes=1),
+                seed_id("message", 1),
+            ),
+        ),
+        indexes=frozenset({"idx_message_room_created"}),
+        max_cost=175,
+    ),
+    "messages.create_in_room": PlanCase(
+        call=lambda s: MessageRepositoryImpl(s).create_in_room(
+            Message(
+                id=str(uuid4()),
+                room_id=seed_id("room", 1),
+                sender_id=USER,
+                content="hi",
+                status=MessageStatus.SENT,
+                created_at=datetime.now(timezone.utc),
+            )
+        ),
+        indexes=frozenset({"chat_rooms_pkey"}),
+        max_cost=110,
+    ),
+    "messages.get_unread_count_by_room_id": PlanCase(
+        call=lambda s: MessageRepositoryImpl(s).get_unread_count_by_room_id(
+            seed_id("room", 1), USER
+        ),
+        indexes=frozenset({"idx_message_status_sender", "ix_messages_room_id"}),
+        max_cost=175,
+    ),
+    "messages.mark_rooms_as_read": PlanCase(
+        # A typical batch; with many receipts against the small seeded
+        # chat_rooms table the planner rightly prefers scanning it whole
+        call=lambda s: MessageRepositoryImpl(s).mark_rooms_as_read(
+            USER, {seed_id("room", i): None for i in range(1, 6)}
+        ),
+        indexes=frozenset(
+            {"idx_message_status_sender", "idx_message_room_id", "ix_messages_room_id"}
+        ),
+        max_cost=375,
+    ),
+    "chat_rooms.get_by_participants": PlanCase(
+        call=lambda s: ChatRoomRepositoryImpl(s).get_by_participants(
+            USER, OTHER_USER
+        ),
+        indexes=frozenset({"idx_chat_room_participants"}),
+        max_cost=25,
+    ),
+    "chat_rooms.get_rooms_by_user_id": PlanCase(
+        call=lambda s: ChatRoomRepositoryImpl(s).get_rooms_by_user_id(USER),
+        indexes=frozenset({"idx_chat_room_participant_ids_gin"}),
+        max_cost=60,
+    ),
+    "chat_rooms.get_room_summaries_for_user": PlanCase(
+        call=lambda s: ChatRoomRepositoryImpl(s).get_room_summaries_for_user(USER),
+        indexes=frozenset({"idx_chat_room_participant_ids_gin"}),
+        max_cost=375,
+    ),
+}
+
+
+def _params():
+    for name, case in CASES.items():
+        marks = []
+        if case.known_regression:
+            marks.append(pytest.mark.xfail(reason=case.known_regression, strict=True))
+        yield pytest.param(name, id=name, marks=marks)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(_params()))
+async def test_repository_query_plan(name, explain, seeded_db):
+    """Test the query uses its index, never seq-scans a table and stays cheap"""
+    case = CASES[name]
+
+    plans = await explain(lambda: case.call(seeded_db))
+
+    assert plans, f"{name} issued no SQL"
+    for plan in plans:
+        details = f"{name}\n{plan.statement}\n{plan.plan}"
+        assert not plan.seq_scanned_tables, f"sequential scan in {details}"
+        assert plan.index_names & case.indexes, (
+            f"expected one of {sorted(case.indexes)}, got "
+            f"{sorted(plan.index_names)} in {details}"
+        )
+        assert plan.total_cost <= case.max_cost, (
+            f"estimated cost {plan.total_cost} exceeds {case.max_cost} in {details}"
+        )
@@ -0,0 +1,158 @@
+"""
+Integration tests for monthly partition maintenance
+
+Runs MonthlyPartitionManager against a throwaway table partitioned like
+messages, so the real message partitions are left alone.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.modules.social.infrastructure.jobs.message_partition_maintenance_job import (
+    MAINTENANCE_LOCK_KEY,
+    MessagePartitionMaintenanceJob,
+)
+from app.shared.infrastructure.database.partitions import MonthlyPartitionManager
+
+TABLE = "partition_probe"
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def connection(test_engine):
+    """AUTOCOMMIT connection, as the maintenance job uses"""
+    async with test_engine.connect() as conn:
+        yield await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+
+@pytest_asyncio.fixture
+async def probe_table(connection: AsyncConnection):
+    """Partitioned table with only September"""
+    for statement in (
+        f"""
+        CREATE TABLE {TABLE} (
+            id UUID NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """,
+        f"""
+        CREATE TABLE {TABLE}_2026_09 PARTITION OF {TABLE}
+        FOR VALUES FROM ('2026-09-01+00') TO ('2026-10-01+00')
+        """,
+    ):
+        await connection.execute(text(statement))
+
+    yield TABLE
+
+    await connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    await connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}_2026_09"))
+
+
+async def _insert(connection: AsyncConnection, *timestamps: str) -> None:
+    for created_at in timestamps:
+        await connection.execute(
+            text(f"INSERT INTO {TABLE} (id, created_at) VALUES (:id, :created_at)"),
+            {"id": str(uuid.uuid4()), "created_at": datetime.fromisoformat(created_at)},
+        )
+
+
+async def _rows_by_partition(connection: AsyncConnection) -> dict:
+    result = await connection.execute(
+        text(
+            f"""
+            SELECT tableoid::regclass::text, count(*) FROM {TABLE}
+            GROUP BY 1
+            """
+        )
+    )
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_is_idempotent(
+    connection: AsyncConnection, probe_table
+):
+    """Test missing months are created once and a leftover table is reused"""
+    # Left behind by a run that died between CREATE TABLE and ATTACH
+    await connection.execute(
+        text(f"CREATE TABLE {TABLE}_2026_11 (LIKE {TABLE} INCLUDING DEFAULTS)")
+    )
+    manager = MonthlyPartitionManager(connection)
+
+    created = await manager.ensure_partitions(TABLE, months_ahead=2, now=NOW)
+
+    assert created == [f"{TABLE}_2026_10", f"{TABLE}_2026_11", f"{TABLE}_2026_12"]
+    assert await manager.ensure_partitions(TABLE, months_ahead=2, now=NOW) == []
+
+    await _insert(
+        connection,
+        "2026-09-15T00:00:00+00:00",
+        "2026-10-02T00:00:00+00:00",
+        "2026-12-31T23:59:59+00:00",
+    )
+    assert await _rows_by_partition(connection) == {
+        f"{TABLE}_2026_09": 1,
+        f"{TABLE}_2026_10": 1,
+        f"{TABLE}_2026_12": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_retention_detaches_and_drops_whole_expired_months(
+    connection: AsyncConnection, probe_table
+):
+    """Test a month is dropped only once all of it is past the retention"""
+    manager = MonthlyPartitionManager(connection)
+    await manager.ensure_partitions(TABLE, months_ahead=0, now=NOW)
+    await _insert(
+        connection,
+        "2026-09-30T23:00:00+00:00",
+        "2026-09-20T00:00:00+00:00",
+        "2026-10-01T00:00:00+00:00",
+    )
+
+    # Cutoff Sep 17: September still holds rows inside the retention
+    assert await manager.drop_expired_partitions(TABLE, 30, now=NOW) == []
+
+    # Cutoff Oct 7: all of September has expired
+    assert await manager.drop_expired_partitions(TABLE, 10, now=NOW) == [
+        f"{TABLE}_2026_09"
+    ]
+    assert await _rows_by_partition(connection) == {f"{TABLE}_2026_10": 1}
+    dropped = await connection.scalar(text(f"SELECT to_regclass('{TABLE}_2026_09')"))
+    assert dropped is None
+
+
+@pytest.mark.asyncio
+async def test_maintenance_job_skips_while_another_worker_runs_it(
+    connection: AsyncConnection, test_engine, probe_table
+):
+    """Test only the worker holding the advisory lock maintains partitions"""
+    job = MessagePartitionMaintenanceJob(months_ahead=1, tables=(TABLE,))
+    await connection.execute(
+        text("SELECT pg_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+    )
+    try:
+        with patch(
+            "app.modules.social.infrastructure.jobs."
+            "message_partition_maintenance_job.db_connection"
+        ) as db_connection:
+            db_connection.async_engine = test_engine
+            skipped = await job.run()
+    finally:
+        await connection.execute(
+            text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+        )
+
+    assert skipped["skipped"] is True
+    assert job.metrics.skipped_runs == 1
+    assert set(await MonthlyPartitionManager(connection).list_partitions(TABLE)) == {
+        datetime(2026, 9, 1, tzinfo=timezone.utc)
+    }
@@ -0,0 +1,60 @@
+"""
+Integration tests for after-commit callbacks on a real session
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.infrastructure.database.transaction_hooks import (
+    after_commit,
+    after_commit_of,
+)
+
+
+@pytest.mark.asyncio
+async def test_callback_runs_only_after_commit(db_session: AsyncSession):
+    """Test a callback waits for the commit and runs once"""
+    calls = []
+    await db_session.execute(text("SELECT 1"))
+    after_commit(db_session, lambda: calls.append("first"))
+    after_commit_of(db_session)(lambda: calls.append("second"))
+
+    assert calls == []
+
+    await db_session.commit()
+    assert calls == ["first", "second"]
+
+    await db_session.execute(text("SELECT 1"))
+    await db_session.commit()
+    assert calls == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_callback_is_dropped_on_rollback(db_session: AsyncSession):
+    """Test a rolled back transaction discards its callbacks"""
+    calls = []
+    await db_session.execute(text("SELECT 1"))
+    after_commit(db_session, lambda: calls.append("rolled back"))
+
+    await db_session.rollback()
+    await db_session.execute(text("SELECT 1"))
+    await db_session.commit()
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_break_commit(db_session: AsyncSession):
+    """Test later callbacks still run when one raises"""
+    calls = []
+
+    def _fail():
+        raise RuntimeError("cache unavailable")
+
+    after_commit(db_session, _fail)
+    after_commit(db_session, lambda: calls.append("after failure"))
+
+    await db_session.commit()
+
+    assert calls == ["after failure"]
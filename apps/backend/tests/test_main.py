@@ -33,4 +33,8 @@ def test_api_health_check():
     assert response.status_code == 200
     data = response.json()
     assert data["data"]["status"] == "healthy"
+    assert "hit_rate" in data["data"]["caches"]["profile_summaries"]
+    assert data["data"]["realtime"]["connections"] == 0
+    assert "avg_latency_ms" in data["data"]["push"]
+    assert "expired_total" in data["data"]["jobs"]["post_expiry_sweep"]
     assert data["error"] is None
@@ -0,0 +1,109 @@
+"""
+Unit tests for ProfileSummaryCache and its use in ProfileQueryServiceImpl
+
+Tests hit/miss accounting, invalidation and that only cache misses reach the
+profile repository.
+"""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.identity.application.services.profile_query_service_impl import (
+    ProfileQueryServiceImpl,
+)
+from app.modules.identity.application.services.profile_summary_cache import (
+    ProfileSummaryCache,
+)
+from app.modules.identity.domain.entities.profile import Profile
+from app.shared.domain.contracts.i_profile_query_service import ProfileSummary
+
+
+class TestProfileSummaryCache:
+    """Test ProfileSummaryCache"""
+
+    def test_get_many_counts_hits_and_misses(self):
+        cache = ProfileSummaryCache(ttl_seconds=60)
+        cached, missing = uuid4(), uuid4()
+        cache.set_many({cached: ProfileSummary(user_id=cached, nickname="A")})
+
+        found = cache.get_many([cached, missing])
+
+        assert list(found) == [cached]
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 1}
+
+    def test_invalidate_accepts_string_ids(self):
+        cache = ProfileSummaryCache(ttl_seconds=60)
+        user_id = uuid4()
+        cache.set_many({user_id: ProfileSummary(user_id=user_id)})
+
+        cache.invalidate(str(user_id))
+
+        assert cache.get_many([user_id]) == {}
+
+    def test_zero_ttl_disables_caching(self):
+        cache = ProfileSummaryCache(ttl_seconds=0)
+        user_id = uuid4()
+        cache.set_many({user_id: ProfileSummary(user_id=user_id)})
+
+        assert cache.get_many([user_id]) == {}
+        assert cache.stats()["size"] == 0
+
+    def test_clear_resets_counters(self):
+        cache = ProfileSummaryCache(ttl_seconds=60)
+        cache.get_many([uuid4()])
+
+        cache.clear()
+
+        assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0}
+
+
+class TestCachedProfileSummaries:
+    """Test ProfileQueryServiceImpl.get_profile_summaries with a cache"""
+
+    @pytest.fixture
+    def mock_profile_repo(self):
+        return AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_queried_and_then_cached(self, mock_profile_repo):
+        """Test a second lookup of the same users never reaches the repository"""
+        # Arrange
+        cache = ProfileSummaryCache(ttl_seconds=60)
+        service = ProfileQueryServiceImpl(mock_profile_repo, summary_cache=cache)
+        known, no_profile = uuid4(), uuid4()
+        mock_profile_repo.get_by_user_ids.return_value = [
+            Profile(user_id=known, nickname="Known", privacy_flags={"x": True})
+        ]
+
+        # Act
+        first = await service.get_profile_summaries([known, no_profile])
+        mock_profile_repo.get_by_user_ids.reset_mock()
+        mock_profile_repo.get_by_user_ids.return_value = []
+        second = await service.get_profile_summaries([known])
+
+        # Assert
+        assert first[known].nickname == "Known"
+        assert no_profile not in first
+        assert second[known].privacy_flags == {"x": True}
+        mock_profile_repo.get_by_user_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_partial_hit_queries_remaining_users(self, mock_profile_repo):
+        """Test cached users are merged with freshly loaded ones"""
+        # Arrange
+        cache = ProfileSummaryCache(ttl_seconds=60)
+        service = ProfileQueryServiceImpl(mock_profile_repo, summary_cache=cache)
+        cached, fresh = uuid4(), uuid4()
+        cache.set_many({cached: ProfileSummary(user_id=cached, nickname="Cached")})
+        mock_profile_repo.get_by_user_ids.return_value = [
+            Profile(user_id=fresh, nickname="Fresh")
+        ]
+
+        # Act
+        result = await service.get_profile_summaries([cached, fresh])
+
+        # Assert
+        mock_profile_repo.get_by_user_ids.assert_awaited_once_with([fresh])
+        assert {s.nickname for s in result.values()} == {"Cached", "Fresh"}
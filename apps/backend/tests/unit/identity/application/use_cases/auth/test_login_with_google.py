@@ -0,0 +1,117 @@
+"""
+Unit tests for GoogleLoginUseCase
+Testing profile fill-in for returning users
+"""
+
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.identity.application.use_cases.auth.login_with_google import (
+    GoogleLoginUseCase,
+)
+from app.modules.identity.domain.entities.profile import Profile
+from app.modules.identity.domain.entities.user import User
+
+
+class TestGoogleLoginUseCase:
+    """Test Google login use case"""
+
+    @pytest.fixture
+    def user(self):
+        """Returning user"""
+        return User(email="user@example.com", google_id="google-123", id=uuid4())
+
+    @pytest.fixture
+    def mock_user_repo(self, user):
+        """Mock user repository finding the returning user"""
+        repo = AsyncMock()
+        repo.get_by_google_id.return_value = user
+        return repo
+
+    @pytest.fixture
+    def mock_profile_repo(self):
+        """Mock profile repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_google_oauth(self):
+        """Mock Google OAuth service"""
+        service = AsyncMock()
+        service.verify_google_token.return_value = {
+            "google_id": "google-123",
+            "email": "user@example.com",
+            "name": "Google Name",
+            "picture": "https://example.com/avatar.png",
+        }
+        return service
+
+    @pytest.fixture
+    def summary_cache(self):
+        """Mock profile summary cache"""
+        return Mock()
+
+    @pytest.fixture
+    def pending(self):
+        """Callbacks waiting for the commit"""
+        return []
+
+    @pytest.fixture
+    def use_case(
+        self,
+        mock_user_repo,
+        mock_profile_repo,
+        mock_google_oauth,
+        summary_cache,
+        pending,
+    ):
+        """Create Google login use case with mocked dependencies"""
+        return GoogleLoginUseCase(
+            user_repo=mock_user_repo,
+            profile_repo=mock_profile_repo,
+            refresh_token_repo=AsyncMock(),
+            google_oauth_service=mock_google_oauth,
+            jwt_service=Mock(),
+            summary_cache=summary_cache,
+            after_commit=pending.append,
+        )
+
+    @pytest.mark.asyncio
+    async def test_filled_in_profile_invalidates_summary_after_commit(
+        self, use_case, user, mock_profile_repo, summary_cache, pending
+    ):
+        """Test a blank nickname/avatar filled from Google drops the cached summary"""
+        # Arrange
+        profile = Profile(user_id=user.id)
+        mock_profile_repo.get_by_user_id.return_value = profile
+
+        # Act
+        await use_case.execute("google-token")
+
+        # Assert
+        assert profile.nickname == "Google Name"
+        mock_profile_repo.save.assert_awaited_once_with(profile)
+        summary_cache.invalidate.assert_not_called()
+        for callback in pending:
+            callback()
+        summary_cache.invalidate.assert_called_once_with(user.id)
+
+    @pytest.mark.asyncio
+    async def test_complete_profile_keeps_cached_summary(
+        self, use_case, user, mock_profile_repo, pending
+    ):
+        """Test a login that changes no profile field schedules no invalidation"""
+        # Arrange
+        mock_profile_repo.get_by_user_id.return_value = Profile(
+            user_id=user.id,
+            nickname="Chosen Name",
+            avatar_url="https://example.com/mine.png",
+        )
+
+        # Act
+        await use_case.execute("google-token")
+
+        # Assert
+        mock_profile_repo.save.assert_not_called()
+        assert pending == []
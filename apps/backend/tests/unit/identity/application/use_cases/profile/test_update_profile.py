@@ -4,7 +4,7 @@ Unit tests for UpdateProfileUseCase
 Tests the update profile use case with mocked dependencies.
 """
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
@@ -208,3 +208,50 @@ class TestUpdateProfileUseCase:
         # Assert
         assert result is not None
         mock_profile_repo.save.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_profile_summary_cache(
+        self, mock_profile_repo, sample_profile
+    ):
+        """Test saving a profile drops its cached nickname/avatar/privacy flags"""
+        # Arrange
+        summary_cache = Mock()
+        use_case = UpdateProfileUseCase(
+            profile_repo=mock_profile_repo, summary_cache=summary_cache
+        )
+        mock_profile_repo.get_by_user_id.return_value = sample_profile
+        mock_profile_repo.save.return_value = sample_profile
+
+        # Act
+        await use_case.execute(user_id=sample_profile.user_id, nickname="Renamed")
+
+        # Assert
+        summary_cache.invalidate.assert_called_once_with(sample_profile.user_id)
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidation_waits_for_commit(
+        self, mock_profile_repo, sample_profile
+    ):
+        """Test the cached summary is only dropped by the after-commit hook"""
+        # Arrange
+        summary_cache = Mock()
+        pending = []
+        use_case = UpdateProfileUseCase(
+            profile_repo=mock_profile_repo,
+            summary_cache=summary_cache,
+            after_commit=pending.append,
+        )
+        mock_profile_repo.get_by_user_id.return_value = sample_profile
+        mock_profile_repo.save.return_value = sample_profile
+
+        # Act
+        await use_case.execute(
+            user_id=sample_profile.user_id,
+            privacy_flags={"allow_stranger_chat": False},
+        )
+
+        # Assert
+        summary_cache.invalidate.assert_not_called()
+        for callback in pending:
+            callback()
+        summary_cache.invalidate.assert_called_once_with(sample_profile.user_id)
@@ -0,0 +1,77 @@
+"""
+Unit tests for PostFeedCache
+
+Tests key normalization, truncation to smaller limits and invalidation.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.modules.posts.application.services.post_feed_cache import (
+    FeedPageSkeleton,
+    PostFeedCache,
+)
+from app.modules.posts.domain.entities.post import Post, PostStatus
+from app.modules.posts.domain.entities.post_enums import PostCategory, PostScope
+
+
+def _post(city_code=None, category=PostCategory.TRADE) -> Post:
+    return Post(
+        id=str(uuid4()),
+        owner_id=str(uuid4()),
+        scope=PostScope.CITY if city_code else PostScope.GLOBAL,
+        city_code=city_code,
+        category=category,
+        title="Test Post",
+        content="Test content",
+        status=PostStatus.OPEN,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=14),
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _skeleton(posts, limit=50) -> FeedPageSkeleton:
+    return FeedPageSkeleton(posts=posts, owner_profiles={}, limit=limit)
+
+
+class TestPostFeedCache:
+    """Test PostFeedCache"""
+
+    def test_enum_and_string_category_share_a_key(self):
+        """Test that PostCategory.TRADE and "trade" hit the same entry"""
+        cache = PostFeedCache(ttl_seconds=60)
+        posts = [_post()]
+
+        cache.set(None, PostCategory.TRADE, _skeleton(posts))
+
+        assert cache.get(None, "trade", 50).posts == posts
+        assert cache.get(None, None, 50) is None
+
+    def test_smaller_limit_is_served_from_larger_page(self):
+        """Test truncation to the requested limit and misses for larger ones"""
+        cache = PostFeedCache(ttl_seconds=60)
+        posts = [_post() for _ in range(3)]
+        cache.set("TPE", None, _skeleton(posts, limit=3))
+
+        hit = cache.get("TPE", None, 2)
+
+        assert hit.posts == posts[:2]
+        assert hit.limit == 2
+        assert cache.get("TPE", None, 4) is None
+
+    def test_invalidate_city_post_drops_city_and_global_feeds(self):
+        """Test a city post invalidates every feed it can appear in"""
+        cache = PostFeedCache(ttl_seconds=60)
+        for city_code in (None, "TPE", "KHH"):
+            for category in (None, PostCategory.TRADE, PostCategory.GIVEAWAY):
+                cache.set(city_code, category, _skeleton([]))
+
+        cache.invalidate_post(_post(city_code="TPE", category=PostCategory.TRADE))
+
+        assert cache.get(None, None, 50) is None
+        assert cache.get(None, PostCategory.TRADE, 50) is None
+        assert cache.get("TPE", None, 50) is None
+        assert cache.get("TPE", PostCategory.TRADE, 50) is None
+        assert cache.get(None, PostCategory.GIVEAWAY, 50) is not None
+        assert cache.get("TPE", PostCategory.GIVEAWAY, 50) is not None
+        assert cache.get("KHH", None, 50) is not None
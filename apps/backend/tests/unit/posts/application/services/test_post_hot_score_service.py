@@ -0,0 +1,137 @@
+"""
+Unit tests for PostHotScoreService
+
+Tests the log-space score terms and how engagement events map to repository
+updates.
+"""
+
+import math
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.posts.application.services.post_hot_score_service import (
+    PostHotScoreService,
+)
+from app.modules.posts.domain.entities.post import Post, PostStatus
+from app.modules.posts.domain.entities.post_enums import PostCategory, PostScope
+
+
+def _decayed_sum(terms, now):
+    """Reference: the decayed engagement sum the log-space score stands for"""
+    half_lives_now = PostHotScoreService.term(1.0, now)
+    return sum(2 ** (term - half_lives_now) for term in terms)
+
+
+class TestPostHotScoreService:
+    """Test PostHotScoreService"""
+
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock hot score repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(self, mock_repository):
+        """Create service instance"""
+        return PostHotScoreService(hot_score_repository=mock_repository)
+
+    def test_term_grows_by_one_per_half_life(self):
+        """Test an event one half-life later is worth twice as much"""
+        at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        later = at + timedelta(hours=PostHotScoreService.HALF_LIFE_HOURS)
+
+        assert PostHotScoreService.term(1.0, later) - PostHotScoreService.term(
+            1.0, at
+        ) == pytest.approx(1.0)
+        assert PostHotScoreService.term(4.0, at) - PostHotScoreService.term(
+            1.0, at
+        ) == pytest.approx(2.0)
+
+    def test_term_treats_naive_datetimes_as_utc(self):
+        """Test naive timestamps score like their UTC equivalents"""
+        aware = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+
+        assert PostHotScoreService.term(1.0, aware.replace(tzinfo=None)) == (
+            PostHotScoreService.term(1.0, aware)
+        )
+
+    def test_log_space_order_matches_decayed_sum(self):
+        """Test ranking by log2-sum equals ranking by the decayed sum at any time"""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        term = PostHotScoreService.term
+        # Old post with lots of early likes vs. new post with a few fresh ones
+        old_terms = [term(1.0, start)] + [term(1.0, start) for _ in range(20)]
+        new_terms = [term(1.0, start + timedelta(hours=48))] + [
+            term(3.0, start + timedelta(hours=48)) for _ in range(2)
+        ]
+
+        for now in (start + timedelta(hours=48), start + timedelta(days=7)):
+            old_score = math.log2(sum(2**t for t in old_terms))
+            new_score = math.log2(sum(2**t for t in new_terms))
+            assert (new_score > old_score) == (
+                _decayed_sum(new_terms, now) > _decayed_sum(old_terms, now)
+            )
+
+    @pytest.mark.asyncio
+    async def test_post_created_starts_at_base_score(self, service, mock_repository):
+        """Test a new post is inserted with its own weight as base score"""
+        # Arrange
+        post = Post(
+            id=str(uuid4()),
+            owner_id=str(uuid4()),
+            scope=PostScope.CITY,
+            city_code="TPE",
+            category=PostCategory.TRADE,
+            title="WTS",
+            content="content",
+            status=PostStatus.OPEN,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=14),
+            created_at=datetime.now(timezone.utc),
+        )
+
+        # Act
+        await service.on_post_created(post)
+
+        # Assert
+        mock_repository.create.assert_awaited_once_with(
+            post, PostHotScoreService.term(1.0, post.created_at)
+        )
+
+    @pytest.mark.asyncio
+    async def test_unlike_subtracts_the_term_the_like_added(
+        self, service, mock_repository
+    ):
+        """Test removing a like uses the like's own timestamp"""
+        # Arrange
+        post_id = str(uuid4())
+        liked_at = datetime.now(timezone.utc) - timedelta(hours=5)
+
+        # Act
+        await service.on_like_added(post_id, liked_at)
+        await service.on_like_removed(post_id, liked_at)
+
+        # Assert
+        added_term = mock_repository.add.call_args.args[1]
+        mock_repository.subtract.assert_awaited_once_with(post_id, added_term)
+
+    @pytest.mark.asyncio
+    async def test_event_weights(self, service, mock_repository):
+        """Test comments and interests weigh more than likes"""
+        # Arrange
+        post_id = str(uuid4())
+        at = datetime.now(timezone.utc)
+
+        # Act
+        await service.on_like_added(post_id, at)
+        await service.on_comment_added(post_id, at)
+        await service.on_interest_added(post_id, at)
+
+        # Assert
+        like, comment, interest = (
+            call.args[1] for call in mock_repository.add.call_args_list
+        )
+        assert comment - like == pytest.approx(1.0)
+        assert interest - like == pytest.approx(math.log2(3))
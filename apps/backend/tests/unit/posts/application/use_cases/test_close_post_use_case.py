@@ -5,7 +5,7 @@ Tests the close post use case implementation with mocked repositories.
 """
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -63,6 +63,72 @@ class TestClosePostUseCase:
         mock_post_repository.update.assert_called_once()
         assert sample_open_post.status == PostStatus.CLOSED
 
+    @pytest.mark.asyncio
+    async def test_close_post_invalidates_feed_cache(
+        self, mock_post_repository, sample_open_post
+    ):
+        """Test closing a post drops it from cached feeds"""
+        # Arrange
+        feed_cache = MagicMock()
+        use_case = ClosePostUseCase(
+            post_repository=mock_post_repository, feed_cache=feed_cache
+        )
+        mock_post_repository.get_by_id.return_value = sample_open_post
+
+        # Act
+        await use_case.execute(
+            post_id=sample_open_post.id, current_user_id=sample_open_post.owner_id
+        )
+
+        # Assert
+        feed_cache.invalidate_post.assert_called_once_with(sample_open_post)
+
+    @pytest.mark.asyncio
+    async def test_close_post_invalidates_feed_cache_after_commit(
+        self, mock_post_repository, sample_open_post
+    ):
+        """Test cached feeds keep the post until the close is committed"""
+        # Arrange
+        feed_cache = MagicMock()
+        pending = []
+        use_case = ClosePostUseCase(
+            post_repository=mock_post_repository,
+            feed_cache=feed_cache,
+            after_commit=pending.append,
+        )
+        mock_post_repository.get_by_id.return_value = sample_open_post
+
+        # Act
+        await use_case.execute(
+            post_id=sample_open_post.id, current_user_id=sample_open_post.owner_id
+        )
+
+        # Assert
+        feed_cache.invalidate_post.assert_not_called()
+        for callback in pending:
+            callback()
+        feed_cache.invalidate_post.assert_called_once_with(sample_open_post)
+
+    @pytest.mark.asyncio
+    async def test_close_post_removes_hot_score(
+        self, mock_post_repository, sample_open_post
+    ):
+        """Test closing a post takes it out of the hot feed"""
+        # Arrange
+        hot_score_service = AsyncMock()
+        use_case = ClosePostUseCase(
+            post_repository=mock_post_repository, hot_score_service=hot_score_service
+        )
+        mock_post_repository.get_by_id.return_value = sample_open_post
+
+        # Act
+        await use_case.execute(
+            post_id=sample_open_post.id, current_user_id=sample_open_post.owner_id
+        )
+
+        # Assert
+        hot_score_service.on_post_closed.assert_awaited_once_with(sample_open_post.id)
+
     @pytest.mark.asyncio
     async def test_close_post_not_found(self, use_case, mock_post_repository):
         """Test closing fails when post not found"""
@@ -5,7 +5,7 @@ Tests the create post use case implementation with mocked repositories.
 """
 
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -377,3 +377,32 @@ class TestCreatePostUseCase:
         assert result is not None
         assert result.idol == idol
         assert result.idol_group == idol_group
+
+    @pytest.mark.asyncio
+    async def test_create_post_invalidates_feed_cache(
+        self, mock_post_repository, mock_subscription_repository
+    ):
+        """Test the created post's feeds are dropped from the feed cache"""
+        # Arrange
+        feed_cache = MagicMock()
+        use_case = CreatePostUseCase(
+            post_repository=mock_post_repository,
+            subscription_repository=mock_subscription_repository,
+            feed_cache=feed_cache,
+        )
+        mock_subscription_repository.get_subscription_info.return_value = None
+        mock_post_repository.count_user_posts_today.return_value = 0
+        mock_post_repository.create.side_effect = lambda post: post
+
+        # Act
+        result = await use_case.execute(
+            owner_id=str(uuid4()),
+            scope=PostScope.CITY,
+            category=PostCategory.TRADE,
+            city_code="TPE",
+            title="Test Post",
+            content="Test content",
+        )
+
+        # Assert
+        feed_cache.invalidate_post.assert_called_once_with(result)
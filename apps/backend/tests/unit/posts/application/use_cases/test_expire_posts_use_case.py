@@ -0,0 +1,114 @@
+"""
+Unit tests for ExpirePostsUseCase
+
+Tests the capped batch loop and feed cache invalidation with a mocked
+post repository.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.modules.posts.application.use_cases.expire_posts_use_case import (
+    ExpirePostsUseCase,
+)
+
+
+class TestExpirePostsUseCase:
+    """Test ExpirePostsUseCase"""
+
+    @pytest.fixture
+    def mock_post_repository(self):
+        """Create mock post repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_feed_cache(self):
+        """Create mock feed cache"""
+        return MagicMock()
+
+    @pytest.fixture
+    def use_case(self, mock_post_repository, mock_feed_cache):
+        """Create use case instance"""
+        return ExpirePostsUseCase(
+            post_repository=mock_post_repository, feed_cache=mock_feed_cache
+        )
+
+    @pytest.mark.asyncio
+    async def test_stops_on_short_batch(
+        self, use_case, mock_post_repository, mock_feed_cache
+    ):
+        """Test that a batch smaller than batch_size ends the run"""
+        # Arrange
+        mock_post_repository.mark_expired_posts.side_effect = [100, 40]
+
+        # Act
+        result = await use_case.execute(batch_size=100, max_batches=5)
+
+        # Assert
+        assert result["expired_count"] == 140
+        assert result["batches"] == 2
+        assert result["capped"] is False
+        mock_post_repository.mark_expired_posts.assert_called_with(limit=100)
+        mock_feed_cache.clear.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stops_at_row_cap(self, use_case, mock_post_repository):
+        """Test that a run never issues more than max_batches updates"""
+        # Arrange
+        mock_post_repository.mark_expired_posts.return_value = 50
+
+        # Act
+        result = await use_case.execute(batch_size=50, max_batches=3)
+
+        # Assert
+        assert result["expired_count"] == 150
+        assert result["batches"] == 3
+        assert result["capped"] is True
+        assert mock_post_repository.mark_expired_posts.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_nothing_expired_keeps_feed_cache(
+        self, use_case, mock_post_repository, mock_feed_cache
+    ):
+        """Test that an idle sweep does not drop cached feeds"""
+        # Arrange
+        mock_post_repository.mark_expired_posts.return_value = 0
+
+        # Act
+        result = await use_case.execute()
+
+        # Assert
+        assert result["expired_count"] == 0
+        assert result["batches"] == 1
+        mock_feed_cache.clear.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_commits_each_batch_before_clearing_feed_cache(
+        self, mock_post_repository, mock_feed_cache
+    ):
+        """Test every chunk is committed and feeds are cleared only afterwards"""
+        # Arrange
+        calls = MagicMock()
+        calls.attach_mock(mock_post_repository.mark_expired_posts, "mark_expired")
+        calls.attach_mock(mock_feed_cache.clear, "clear_feeds")
+        commit = AsyncMock()
+        calls.attach_mock(commit, "commit")
+        mock_post_repository.mark_expired_posts.side_effect = [100, 40]
+        use_case = ExpirePostsUseCase(
+            post_repository=mock_post_repository,
+            feed_cache=mock_feed_cache,
+            commit=commit,
+        )
+
+        # Act
+        await use_case.execute(batch_size=100, max_batches=5)
+
+        # Assert
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "mark_expired",
+            "commit",
+            "mark_expired",
+            "commit",
+            "clear_feeds",
+        ]
@@ -85,6 +85,32 @@ class TestExpressInterestUseCase:
         assert result.user_id == user_id
         mock_post_interest_repository.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_express_interest_bumps_hot_score(
+        self, mock_post_repository, mock_post_interest_repository, sample_open_post
+    ):
+        """Test a new interest is added to the post's hot score at its timestamp"""
+        # Arrange
+        hot_score_service = AsyncMock()
+        use_case = ExpressInterestUseCase(
+            post_repository=mock_post_repository,
+            post_interest_repository=mock_post_interest_repository,
+            hot_score_service=hot_score_service,
+        )
+        mock_post_repository.get_by_id.return_value = sample_open_post
+        mock_post_interest_repository.get_by_post_and_user.return_value = None
+        mock_post_interest_repository.create.side_effect = lambda interest: interest
+
+        # Act
+        result = await use_case.execute(
+            post_id=sample_open_post.id, user_id=str(uuid4())
+        )
+
+        # Assert
+        hot_score_service.on_interest_added.assert_awaited_once_with(
+            sample_open_post.id, result.created_at
+        )
+
     @pytest.mark.asyncio
     async def test_express_interest_post_not_found(
         self, use_case, mock_post_repository, mock_post_interest_repository
@@ -80,6 +80,7 @@ class TestListBoardPostsUseCase:
             idol_group=None,
             limit=50,
             offset=0,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -125,6 +126,7 @@ class TestListBoardPostsUseCase:
             idol_group=None,
             limit=50,
             offset=0,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -150,6 +152,7 @@ class TestListBoardPostsUseCase:
             idol_group=idol_group,
             limit=50,
             offset=0,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -174,6 +177,7 @@ class TestListBoardPostsUseCase:
             idol_group=None,
             limit=limit,
             offset=offset,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -0,0 +1,276 @@
+"""
+Unit tests for ListPostsV2UseCase
+
+Tests the V2 list posts use case with mocked repositories and profile service.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.posts.application.services.post_feed_cache import PostFeedCache
+from app.modules.posts.application.use_cases.list_posts_v2_use_case import (
+    ListPostsV2UseCase,
+)
+from app.modules.posts.domain.entities.post import Post, PostStatus
+from app.modules.posts.domain.entities.post_enums import (
+    PostCategory,
+    PostScope,
+    PostSort,
+)
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+class TestListPostsV2UseCase:
+    """Test ListPostsV2UseCase"""
+
+    @pytest.fixture
+    def mock_post_repository(self):
+        """Create mock post repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_like_repository(self):
+        """Create mock like repository"""
+        repo = AsyncMock()
+        repo.get_liked_post_ids.return_value = set()
+        return repo
+
+    @pytest.fixture
+    def mock_profile_service(self):
+        """Create mock profile service returning no profiles"""
+        service = AsyncMock()
+        service.get_profile_summaries.return_value = {}
+        return service
+
+    @pytest.fixture
+    def use_case(self, mock_post_repository, mock_like_repository, mock_profile_service):
+        """Create use case instance"""
+        return ListPostsV2UseCase(
+            post_repository=mock_post_repository,
+            like_repository=mock_like_repository,
+            profile_service=mock_profile_service,
+        )
+
+    def _create_test_post(
+        self, expires_at: datetime = None, like_count: int = 0
+    ) -> Post:
+        """Helper to create a test post"""
+        if expires_at is None:
+            expires_at = datetime.now(timezone.utc) + timedelta(days=14)
+
+        return Post(
+            id=str(uuid4()),
+            owner_id=str(uuid4()),
+            city_code=None,
+            title="Test Post",
+            content="Test content",
+            status=PostStatus.OPEN,
+            scope=PostScope.GLOBAL,
+            category=PostCategory.TRADE,
+            expires_at=expires_at,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+            like_count=like_count,
+        )
+
+    @pytest.mark.asyncio
+    async def test_like_info_uses_counters_and_single_liked_lookup(
+        self, use_case, mock_post_repository, mock_like_repository
+    ):
+        """Test like_count comes from the post and liked_by_me from one bulk call"""
+        # Arrange
+        viewer_id = str(uuid4())
+        liked_post = self._create_test_post(like_count=3)
+        other_post = self._create_test_post(like_count=1)
+        unliked_post = self._create_test_post()
+        mock_post_repository.list_posts.return_value = [
+            liked_post,
+            other_post,
+            unliked_post,
+        ]
+        mock_like_repository.get_liked_post_ids.return_value = {liked_post.id}
+
+        # Act
+        result = await use_case.execute(current_user_id=viewer_id)
+
+        # Assert
+        mock_like_repository.get_liked_post_ids.assert_called_once_with(
+            [liked_post.id, other_post.id, unliked_post.id], viewer_id
+        )
+        mock_like_repository.count_by_post.assert_not_called()
+        mock_like_repository.get_by_post_and_user.assert_not_called()
+        assert [(r.like_count, r.liked_by_me) for r in result.posts] == [
+            (3, True),
+            (1, False),
+            (0, False),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_anonymous_viewer_skips_liked_lookup(
+        self, use_case, mock_post_repository, mock_like_repository
+    ):
+        """Test that no like query runs without a current user"""
+        # Arrange
+        valid_post = self._create_test_post(like_count=2)
+        expired_post = self._create_test_post(
+            expires_at=datetime.now(timezone.utc) - timedelta(days=1)
+        )
+        mock_post_repository.list_posts.return_value = [valid_post, expired_post]
+
+        # Act
+        result = await use_case.execute()
+
+        # Assert
+        assert [r.post.id for r in result.posts] == [valid_post.id]
+        assert result.posts[0].like_count == 2
+        assert result.posts[0].liked_by_me is False
+        mock_like_repository.get_liked_post_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_page_returns_cursor_of_last_fetched_post(
+        self, use_case, mock_post_repository
+    ):
+        """Test next_cursor points past the last fetched row, even if expired"""
+        # Arrange
+        valid_post = self._create_test_post()
+        expired_post = self._create_test_post(
+            expires_at=datetime.now(timezone.utc) - timedelta(days=1)
+        )
+        mock_post_repository.list_posts.return_value = [valid_post, expired_post]
+
+        # Act
+        result = await use_case.execute(limit=2)
+
+        # Assert
+        assert len(result.posts) == 1
+        assert KeysetCursor.decode(result.next_cursor) == KeysetCursor.from_row(
+            expired_post.created_at, expired_post.id
+        )
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_decoded_and_passed_to_repository(
+        self, use_case, mock_post_repository
+    ):
+        """Test the opaque cursor reaches the repository and a short page ends paging"""
+        # Arrange
+        cursor = KeysetCursor.from_row(datetime.now(timezone.utc), str(uuid4()))
+        mock_post_repository.list_posts.return_value = [self._create_test_post()]
+
+        # Act
+        result = await use_case.execute(limit=2, cursor=cursor.encode())
+
+        # Assert
+        assert mock_post_repository.list_posts.call_args.kwargs["cursor"] == cursor
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_raises_value_error(self, use_case):
+        """Test that a tampered cursor is rejected before querying"""
+        with pytest.raises(ValueError):
+            await use_case.execute(cursor="garbage")
+
+    @pytest.mark.asyncio
+    async def test_first_page_is_shared_between_viewers(
+        self, mock_post_repository, mock_like_repository, mock_profile_service
+    ):
+        """Test the cached first page skips post/profile queries but not liked_by_me"""
+        # Arrange
+        use_case = ListPostsV2UseCase(
+            post_repository=mock_post_repository,
+            like_repository=mock_like_repository,
+            profile_service=mock_profile_service,
+            feed_cache=PostFeedCache(ttl_seconds=60),
+        )
+        post = self._create_test_post(like_count=4)
+        mock_post_repository.list_posts.return_value = [post]
+        viewer_a, viewer_b = str(uuid4()), str(uuid4())
+        mock_like_repository.get_liked_post_ids.side_effect = [set(), {post.id}]
+
+        # Act
+        first = await use_case.execute(current_user_id=viewer_a, city_code="TPE")
+        second = await use_case.execute(current_user_id=viewer_b, city_code="TPE")
+
+        # Assert
+        mock_post_repository.list_posts.assert_called_once()
+        mock_profile_service.get_profile_summaries.assert_awaited_once()
+        assert first.posts[0].liked_by_me is False
+        assert second.posts[0].liked_by_me is True
+        assert second.posts[0].like_count == 4
+
+    @pytest.mark.asyncio
+    async def test_later_pages_bypass_cache(
+        self, mock_post_repository, mock_like_repository, mock_profile_service
+    ):
+        """Test that cursor and offset pages are always read from the database"""
+        # Arrange
+        use_case = ListPostsV2UseCase(
+            post_repository=mock_post_repository,
+            like_repository=mock_like_repository,
+            profile_service=mock_profile_service,
+            feed_cache=PostFeedCache(ttl_seconds=60),
+        )
+        mock_post_repository.list_posts.return_value = [self._create_test_post()]
+        cursor = KeysetCursor.from_row(datetime.now(timezone.utc), str(uuid4()))
+
+        # Act
+        await use_case.execute(offset=10)
+        await use_case.execute(offset=10)
+        await use_case.execute(cursor=cursor.encode())
+
+        # Assert
+        assert mock_post_repository.list_posts.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_hot_sort_reads_score_table_and_bypasses_cache(
+        self, mock_post_repository, mock_like_repository, mock_profile_service
+    ):
+        """Test sort=hot pages come from the hot score repository with score cursors"""
+        # Arrange
+        feed_cache = MagicMock()
+        hot_score_repository = AsyncMock()
+        use_case = ListPostsV2UseCase(
+            post_repository=mock_post_repository,
+            like_repository=mock_like_repository,
+            profile_service=mock_profile_service,
+            feed_cache=feed_cache,
+            hot_score_repository=hot_score_repository,
+        )
+        hot_post, warm_post = self._create_test_post(), self._create_test_post()
+        hot_score_repository.list_hot.return_value = [
+            (hot_post, 42.5),
+            (warm_post, 41.0),
+        ]
+
+        # Act
+        result = await use_case.execute(city_code="TPE", limit=2, sort=PostSort.HOT)
+
+        # Assert
+        assert [pwl.post.id for pwl in result.posts] == [hot_post.id, warm_post.id]
+        assert KeysetCursor.decode(result.next_cursor).score == 41.0
+        assert hot_score_repository.list_hot.call_args.kwargs["city_code"] == "TPE"
+        mock_post_repository.list_posts.assert_not_called()
+        feed_cache.get.assert_not_called()
+        feed_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cursor_must_match_sort(
+        self, mock_post_repository, mock_like_repository, mock_profile_service
+    ):
+        """Test latest cursors are rejected by sort=hot and vice versa"""
+        use_case = ListPostsV2UseCase(
+            post_repository=mock_post_repository,
+            like_repository=mock_like_repository,
+            profile_service=mock_profile_service,
+            hot_score_repository=AsyncMock(),
+        )
+        now = datetime.now(timezone.utc)
+        latest_cursor = KeysetCursor.from_row(now, str(uuid4())).encode()
+        hot_cursor = KeysetCursor.from_row(now, str(uuid4()), score=3.0).encode()
+
+        with pytest.raises(ValueError):
+            await use_case.execute(cursor=latest_cursor, sort=PostSort.HOT)
+        with pytest.raises(ValueError):
+            await use_case.execute(cursor=hot_cursor, sort=PostSort.LATEST)
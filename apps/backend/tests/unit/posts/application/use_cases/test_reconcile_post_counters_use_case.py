@@ -0,0 +1,95 @@
+"""
+Unit tests for ReconcilePostCountersUseCase
+
+Tests the bounded batch walk with a mocked post repository.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.modules.posts.application.use_cases.reconcile_post_counters_use_case import (
+    ReconcilePostCountersUseCase,
+)
+
+
+class TestReconcilePostCountersUseCase:
+    """Test ReconcilePostCountersUseCase"""
+
+    @pytest.fixture
+    def mock_post_repository(self):
+        """Create mock post repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def use_case(self, mock_post_repository):
+        """Create use case instance"""
+        return ReconcilePostCountersUseCase(post_repository=mock_post_repository)
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_batches(self, use_case, mock_post_repository):
+        """Test that a run never processes more than max_batches batches"""
+        # Arrange
+        mock_post_repository.reconcile_counters.side_effect = [
+            ("id-1", 2),
+            ("id-2", 0),
+            ("id-3", 1),
+        ]
+
+        # Act
+        result = await use_case.execute(batch_size=100, max_batches=2)
+
+        # Assert
+        assert result["scanned_batches"] == 2
+        assert result["repaired_count"] == 2
+        assert result["next_cursor"] == "id-2"
+        assert mock_post_repository.reconcile_counters.call_count == 2
+        mock_post_repository.reconcile_counters.assert_any_call(
+            after_id="id-1", limit=100
+        )
+
+    @pytest.mark.asyncio
+    async def test_wraps_cursor_at_end_of_table(self, use_case, mock_post_repository):
+        """Test that reaching the end resets the cursor to None"""
+        # Arrange
+        mock_post_repository.reconcile_counters.side_effect = [
+            ("id-9", 3),
+            (None, 0),
+        ]
+
+        # Act
+        result = await use_case.execute(after_id="id-8", max_batches=5)
+
+        # Assert
+        assert result["scanned_batches"] == 1
+        assert result["repaired_count"] == 3
+        assert result["next_cursor"] is None
+        mock_post_repository.reconcile_counters.assert_any_call(
+            after_id="id-8", limit=500
+        )
+
+    @pytest.mark.asyncio
+    async def test_commits_each_batch(self, use_case, mock_post_repository):
+        """Test every repaired batch is committed before the next one starts"""
+        # Arrange
+        calls = MagicMock()
+        calls.attach_mock(mock_post_repository.reconcile_counters, "reconcile")
+        commit = AsyncMock()
+        calls.attach_mock(commit, "commit")
+        mock_post_repository.reconcile_counters.side_effect = [
+            ("id-1", 2),
+            ("id-2", 1),
+            (None, 0),
+        ]
+
+        # Act
+        await use_case.execute(max_batches=5, commit=commit)
+
+        # Assert
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "reconcile",
+            "commit",
+            "reconcile",
+            "commit",
+            "reconcile",
+        ]
@@ -0,0 +1,151 @@
+"""
+Unit tests for SearchPostsUseCase
+
+Tests query validation, score cursors and feed-style hydration with mocked
+repositories and profile service.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.posts.application.use_cases.search_posts_use_case import (
+    SearchPostsUseCase,
+)
+from app.modules.posts.domain.entities.post import Post, PostStatus
+from app.modules.posts.domain.entities.post_enums import PostCategory, PostScope
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+class TestSearchPostsUseCase:
+    """Test SearchPostsUseCase"""
+
+    @pytest.fixture
+    def mock_post_repository(self):
+        """Create mock post repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_like_repository(self):
+        """Create mock like repository"""
+        repo = AsyncMock()
+        repo.get_liked_post_ids.return_value = set()
+        return repo
+
+    @pytest.fixture
+    def mock_profile_service(self):
+        """Create mock profile service returning no profiles"""
+        service = AsyncMock()
+        service.get_profile_summaries.return_value = {}
+        return service
+
+    @pytest.fixture
+    def use_case(self, mock_post_repository, mock_like_repository, mock_profile_service):
+        """Create use case instance"""
+        return SearchPostsUseCase(
+            post_repository=mock_post_repository,
+            like_repository=mock_like_repository,
+            profile_service=mock_profile_service,
+        )
+
+    def _create_test_post(self, like_count: int = 0) -> Post:
+        """Helper to create a test post"""
+        return Post(
+            id=str(uuid4()),
+            owner_id=str(uuid4()),
+            city_code=None,
+            title="Test Post",
+            content="Test content",
+            status=PostStatus.OPEN,
+            scope=PostScope.GLOBAL,
+            category=PostCategory.TRADE,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=14),
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+            like_count=like_count,
+        )
+
+    @pytest.mark.asyncio
+    async def test_full_page_returns_score_cursor(
+        self, use_case, mock_post_repository, mock_like_repository
+    ):
+        """Test results are hydrated like the feed and next_cursor carries the score"""
+        # Arrange
+        posts = [self._create_test_post(like_count=3), self._create_test_post()]
+        mock_post_repository.search_posts.return_value = [
+            (posts[0], 0.9),
+            (posts[1], 0.4),
+        ]
+        mock_like_repository.get_liked_post_ids.return_value = {posts[0].id}
+
+        # Act
+        page = await use_case.execute(
+            query="  winter  ", current_user_id=str(uuid4()), limit=2
+        )
+
+        # Assert
+        assert [pwl.post.id for pwl in page.posts] == [p.id for p in posts]
+        assert page.posts[0].like_count == 3
+        assert page.posts[0].liked_by_me is True
+        assert page.posts[1].liked_by_me is False
+        cursor = KeysetCursor.decode(page.next_cursor)
+        assert cursor.id == posts[1].id
+        assert cursor.score == 0.4
+        assert mock_post_repository.search_posts.call_args.kwargs["query"] == "winter"
+
+    @pytest.mark.asyncio
+    async def test_short_page_has_no_cursor(self, use_case, mock_post_repository):
+        """Test that a partial page ends pagination"""
+        # Arrange
+        mock_post_repository.search_posts.return_value = [
+            (self._create_test_post(), 0.5)
+        ]
+
+        # Act
+        page = await use_case.execute(query="winter", limit=20)
+
+        # Assert
+        assert len(page.posts) == 1
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_passed_to_repository(
+        self, use_case, mock_post_repository
+    ):
+        """Test that the decoded score cursor is forwarded"""
+        # Arrange
+        mock_post_repository.search_posts.return_value = []
+        cursor = KeysetCursor.from_row(
+            datetime.now(timezone.utc), uuid4(), score=0.25
+        )
+
+        # Act
+        await use_case.execute(query="winter", cursor=cursor.encode())
+
+        # Assert
+        assert mock_post_repository.search_posts.call_args.kwargs["cursor"] == cursor
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ["", " a ", "x" * 101])
+    async def test_invalid_query_raises_value_error(
+        self, use_case, mock_post_repository, query
+    ):
+        """Test that too short or too long queries are rejected"""
+        with pytest.raises(ValueError):
+            await use_case.execute(query=query)
+
+        mock_post_repository.search_posts.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_feed_cursor_without_score_is_rejected(
+        self, use_case, mock_post_repository
+    ):
+        """Test that a GET /posts cursor cannot be replayed against search"""
+        cursor = KeysetCursor.from_row(datetime.now(timezone.utc), uuid4())
+
+        with pytest.raises(ValueError):
+            await use_case.execute(query="winter", cursor=cursor.encode())
+
+        mock_post_repository.search_posts.assert_not_called()
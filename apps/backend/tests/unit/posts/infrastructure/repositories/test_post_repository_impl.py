@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.posts.domain.entities.post import Post, PostStatus
@@ -223,25 +224,24 @@ class TestPostRepositoryImpl:
 
     @pytest.mark.asyncio
     async def test_mark_expired_posts(self, repository, mock_session):
-        """Test marking expired posts"""
+        """Test marking expired posts with a single capped UPDATE"""
         # Arrange
         expected_count = 3
-
-        # Create mock expired post models
-        mock_posts = []
-        for _ in range(expected_count):
-            mock_post = MagicMock()
-            mock_post.status = PostStatus.OPEN.value
-            mock_posts.append(mock_post)
-
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_posts
+        mock_result.scalars.return_value.all.return_value = [
+            uuid4() for _ in range(expected_count)
+        ]
         mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.flush = AsyncMock()
 
         # Act
-        result = await repository.mark_expired_posts()
+        result = await repository.mark_expired_posts(limit=10)
 
         # Assert
         assert result == expected_count
-        mock_session.flush.assert_called_once()
+        mock_session.execute.assert_called_once()
+        statement = str(
+            mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert statement.startswith("UPDATE posts")
+        assert "FOR UPDATE SKIP LOCKED" in statement
+        assert "RETURNING posts.id" in statement
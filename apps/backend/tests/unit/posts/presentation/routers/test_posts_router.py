@@ -11,8 +11,12 @@ from uuid import UUID, uuid4
 import pytest
 from fastapi import HTTPException
 
+from app.modules.posts.application.use_cases.list_posts_v2_use_case import (
+    PostListPage,
+)
 from app.modules.posts.domain.entities.post_enums import PostCategory, PostScope
 from app.modules.posts.presentation.routers.posts_router import (
+    _can_message_from_state,
     close_post,
     create_post,
     list_posts,
@@ -21,6 +25,9 @@ from app.modules.posts.presentation.routers.posts_router import (
 from app.modules.posts.presentation.schemas.post_schemas import (
     CreatePostRequest,
 )
+from app.shared.domain.contracts.i_relationship_query_service import (
+    RelationshipStateDTO,
+)
 
 
 class TestPostsRouter:
@@ -271,7 +278,9 @@ class TestPostsRouter:
     ):
         """Test successful post listing"""
         # Arrange
-        mock_list_use_case.execute.return_value = [mock_post_with_likes]
+        mock_list_use_case.execute.return_value = PostListPage(
+            posts=[mock_post_with_likes]
+        )
 
         # Act
         response = await list_posts(
@@ -303,7 +312,9 @@ class TestPostsRouter:
     ):
         """Test post listing with city filter"""
         # Arrange
-        mock_list_use_case.execute.return_value = [mock_post_with_likes]
+        mock_list_use_case.execute.return_value = PostListPage(
+            posts=[mock_post_with_likes]
+        )
 
         # Act
         response = await list_posts(
@@ -324,6 +335,7 @@ class TestPostsRouter:
             category=None,
             limit=50,
             offset=0,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -336,7 +348,9 @@ class TestPostsRouter:
     ):
         """Test post listing with category filter"""
         # Arrange
-        mock_list_use_case.execute.return_value = [mock_post_with_likes]
+        mock_list_use_case.execute.return_value = PostListPage(
+            posts=[mock_post_with_likes]
+        )
 
         # Act
         response = await list_posts(
@@ -357,6 +371,7 @@ class TestPostsRouter:
             category=PostCategory.TRADE,
             limit=50,
             offset=0,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -369,7 +384,9 @@ class TestPostsRouter:
     ):
         """Test post listing with pagination"""
         # Arrange
-        mock_list_use_case.execute.return_value = [mock_post_with_likes]
+        mock_list_use_case.execute.return_value = PostListPage(
+            posts=[mock_post_with_likes]
+        )
 
         # Act
         response = await list_posts(
@@ -390,6 +407,7 @@ class TestPostsRouter:
             category=None,
             limit=20,
             offset=40,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -401,7 +419,7 @@ class TestPostsRouter:
     ):
         """Test post listing with no posts"""
         # Arrange
-        mock_list_use_case.execute.return_value = []
+        mock_list_use_case.execute.return_value = PostListPage(posts=[])
 
         # Act
         response = await list_posts(
@@ -743,3 +761,30 @@ class TestPostsRouter:
         # Assert
         assert response1.data.like_count == 1
         assert response2.data.like_count == 2
+
+
+class TestCanMessageRules:
+    """Test the can_message rules applied to a relationship state"""
+
+    @pytest.mark.parametrize(
+        "overrides, expected",
+        [
+            ({}, True),
+            ({"has_thread": True}, False),
+            ({"has_pending_request": True}, False),
+            ({"is_blocked": True, "is_friend": True}, False),
+            ({"allow_stranger_chat": False}, False),
+            ({"allow_stranger_chat": False, "is_friend": True}, True),
+            ({"allow_stranger_chat": None, "is_friend": True}, False),
+        ],
+    )
+    def test_rules(self, overrides, expected):
+        """Test each rule in isolation"""
+        fields = {"allow_stranger_chat": True, **overrides}
+        state = RelationshipStateDTO(user_id=uuid4(), **fields)
+
+        assert _can_message_from_state(state) is expected
+
+    def test_missing_state_cannot_message(self):
+        """Test that an unknown owner defaults to no messaging"""
+        assert _can_message_from_state(None) is False
@@ -0,0 +1,84 @@
+"""
+Unit tests for KeysetCursor Value Object
+Testing encode/decode round trips and rejection of malformed tokens
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.shared.domain.keyset_cursor import KeysetCursor, decode_window_cursors
+
+
+class TestKeysetCursor:
+    """Test keyset cursor encoding"""
+
+    def test_round_trip_preserves_position(self):
+        """Test that decode(encode()) returns the same cursor"""
+        cursor = KeysetCursor(
+            created_at=datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            id=str(uuid4()),
+        )
+
+        decoded = KeysetCursor.decode(cursor.encode())
+
+        assert decoded == cursor
+        assert decoded.created_at.tzinfo is not None
+
+    def test_round_trip_preserves_score(self):
+        """Test that ranked cursors keep their relevance score exactly"""
+        cursor = KeysetCursor.from_row(
+            datetime(2026, 1, 2, tzinfo=timezone.utc), uuid4(), score=0.1 + 0.2
+        )
+
+        decoded = KeysetCursor.decode(cursor.encode())
+
+        assert decoded.score == 0.1 + 0.2
+        assert decoded == cursor
+
+    def test_token_is_url_safe(self):
+        """Test that tokens can be used as query parameters unescaped"""
+        token = KeysetCursor.from_row(datetime.now(timezone.utc), uuid4()).encode()
+
+        assert "=" not in token
+        assert "+" not in token
+        assert "/" not in token
+
+    @pytest.mark.parametrize(
+        "token",
+        ["", "not-a-cursor", "!!!", "MjAyNi0wMS0wMnxub3QtYS11dWlk"],
+    )
+    def test_malformed_token_raises_value_error(self, token):
+        """Test that garbage and tampered tokens raise ValueError"""
+        with pytest.raises(ValueError):
+            KeysetCursor.decode(token)
+
+
+class TestDecodeWindowCursors:
+    """Test decoding the before/after pair of a message history request"""
+
+    def test_decodes_either_side(self):
+        """Test that a single before or after token decodes on its side"""
+        cursor = KeysetCursor.from_row(datetime.now(timezone.utc), uuid4())
+        token = cursor.encode()
+
+        assert decode_window_cursors(None, None) == (None, None)
+        assert decode_window_cursors(token, None) == (cursor, None)
+        assert decode_window_cursors(None, token) == (None, cursor)
+
+    def test_both_sides_raise_value_error(self):
+        """Test that a window cannot be bounded on both sides at once"""
+        token = KeysetCursor.from_row(datetime.now(timezone.utc), uuid4()).encode()
+
+        with pytest.raises(ValueError, match="cursor"):
+            decode_window_cursors(token, token)
+
+    def test_ranked_cursor_raises_value_error(self):
+        """Test that search cursors are not accepted for history paging"""
+        token = KeysetCursor.from_row(
+            datetime.now(timezone.utc), uuid4(), score=1.5
+        ).encode()
+
+        with pytest.raises(ValueError, match="cursor"):
+            decode_window_cursors(token, None)
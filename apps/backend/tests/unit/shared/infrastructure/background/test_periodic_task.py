@@ -0,0 +1,67 @@
+"""
+Unit tests for PeriodicTask
+
+Tests start/stop lifecycle and failure isolation of the in-process scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from app.shared.infrastructure.background.periodic_task import PeriodicTask
+
+
+class TestPeriodicTask:
+    """Test PeriodicTask"""
+
+    @pytest.mark.asyncio
+    async def test_runs_repeatedly_until_stopped(self):
+        """Test the job runs on every interval and stops cleanly"""
+        # Arrange
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        task = PeriodicTask(name="test", interval_seconds=0.01, func=job)
+
+        # Act
+        task.start()
+        await asyncio.sleep(0.05)
+        await task.stop()
+        calls_after_stop = len(calls)
+        await asyncio.sleep(0.03)
+
+        # Assert
+        assert calls_after_stop >= 2
+        assert len(calls) == calls_after_stop
+        assert task.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_loop(self):
+        """Test a failing run is logged and the loop keeps going"""
+        # Arrange
+        calls = []
+
+        async def job():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        task = PeriodicTask(name="failing", interval_seconds=0.01, func=job)
+
+        # Act
+        task.start()
+        await asyncio.sleep(0.05)
+        await task.stop()
+
+        # Assert
+        assert len(calls) >= 2
+
+    @pytest.mark.asyncio
+    async def test_stop_without_start_is_noop(self):
+        """Test stopping a task that was never started"""
+        task = PeriodicTask(name="idle", interval_seconds=1, func=lambda: None)
+
+        await task.stop()
+
+        assert task.is_running is False
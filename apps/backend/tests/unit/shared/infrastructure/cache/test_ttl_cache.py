@@ -0,0 +1,69 @@
+"""
+Unit tests for TTLCache
+
+Tests expiry, LRU eviction and the disabled (ttl=0) mode with a fake clock.
+"""
+
+from app.shared.infrastructure.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test TTLCache"""
+
+    def test_entry_expires_after_ttl(self):
+        """Test values are returned until the TTL elapses"""
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, clock=clock)
+
+        cache.set("key", "value")
+        clock.now = 9.9
+        assert cache.get("key") == "value"
+
+        clock.now = 10.0
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that reading an entry protects it from eviction"""
+        cache = TTLCache(ttl_seconds=10, max_entries=2, clock=FakeClock())
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that ttl_seconds=0 never stores anything"""
+        cache = TTLCache(ttl_seconds=0)
+
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+    def test_delete_and_clear(self):
+        """Test explicit invalidation"""
+        cache = TTLCache(ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0
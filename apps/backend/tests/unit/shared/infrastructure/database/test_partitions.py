@@ -0,0 +1,46 @@
+"""
+Unit tests for monthly partition helpers
+Testing month arithmetic and partition naming across year boundaries
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.shared.infrastructure.database.partitions import (
+    add_months,
+    month_start,
+    partition_name,
+)
+
+
+class TestMonthlyPartitionHelpers:
+    """Test month boundaries used for partition bounds"""
+
+    def test_month_start_is_utc(self):
+        """Test that local times are bucketed by their UTC month"""
+        taipei = timezone(timedelta(hours=8))
+        moment = datetime(2026, 11, 1, 5, 30, tzinfo=taipei)  # Oct 31 21:30 UTC
+
+        assert month_start(moment) == datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize(
+        "months, expected",
+        [
+            (0, datetime(2026, 11, 1, tzinfo=timezone.utc)),
+            (2, datetime(2027, 1, 1, tzinfo=timezone.utc)),
+            (-11, datetime(2025, 12, 1, tzinfo=timezone.utc)),
+            (14, datetime(2028, 1, 1, tzinfo=timezone.utc)),
+        ],
+    )
+    def test_add_months_crosses_years(self, months, expected):
+        """Test shifting a month start forward and back"""
+        start = datetime(2026, 11, 1, tzinfo=timezone.utc)
+
+        assert add_months(start, months) == expected
+
+    def test_partition_name_is_zero_padded(self):
+        """Test names sort in month order"""
+        start = datetime(2027, 3, 1, tzinfo=timezone.utc)
+
+        assert partition_name("messages", start) == "messages_2027_03"
@@ -5,11 +5,26 @@ Tests the Firebase Cloud Messaging service implementation with mocked
 Firebase Admin SDK.
 """
 
+import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.shared.infrastructure.external.fcm_service import FCMService
+from app.shared.infrastructure.external.fcm_service import FCMService, PushMetrics
+
+
+def _batch_response(*successes):
+    """BatchResponse stand-in with one SendResponse per token"""
+    responses = [
+        MagicMock(success=success, exception=None if success else Exception("failed"))
+        for success in successes
+    ]
+    return MagicMock(
+        responses=responses,
+        success_count=sum(successes),
+        failure_count=len(successes) - sum(successes),
+    )
 
 
 class TestFCMService:
@@ -354,7 +369,9 @@ class TestFCMService:
             # Create exception classes first
             mock_messaging.UnregisteredError = type("UnregisteredError", (Exception,), {})
             mock_messaging.SenderIdMismatchError = type("SenderIdMismatchError", (Exception,), {})
-            mock_messaging.send.return_value = "message-id"
+            mock_messaging.send_each_for_multicast.return_value = _batch_response(
+                True, True, True
+            )
             service = FCMService()
 
             user_tokens = {
@@ -376,7 +393,11 @@ class TestFCMService:
             assert results["user-1"] is True
             assert results["user-2"] is True
             assert results["user-3"] is True
-            assert mock_messaging.send.call_count == 3
+            # One multicast request instead of one send per user
+            mock_messaging.send.assert_not_called()
+            mock_messaging.send_each_for_multicast.assert_called_once()
+            tokens = mock_messaging.MulticastMessage.call_args[1]["tokens"]
+            assert tokens == ["token-1", "token-2", "token-3"]
 
     @pytest.mark.asyncio
     async def test_send_notification_to_multiple_partial_failure(
@@ -401,12 +422,10 @@ class TestFCMService:
             mock_messaging.UnregisteredError = type("UnregisteredError", (Exception,), {})
             mock_messaging.SenderIdMismatchError = type("SenderIdMismatchError", (Exception,), {})
 
-            # First call succeeds, second fails, third succeeds
-            mock_messaging.send.side_effect = [
-                "message-id-1",
-                Exception("Send failed"),
-                "message-id-3",
-            ]
+            # First token succeeds, second fails, third succeeds
+            mock_messaging.send_each_for_multicast.return_value = _batch_response(
+                True, False, True
+            )
             service = FCMService()
 
             user_tokens = {
@@ -450,6 +469,200 @@ class TestFCMService:
             # Assert
             assert results == {}
 
+    @pytest.mark.asyncio
+    async def test_send_notification_to_multiple_splits_batches(
+        self, mock_credentials_path
+    ):
+        """Test tokens beyond the batch size go into further multicast requests"""
+        # Arrange
+        with (
+            patch(
+                "app.shared.infrastructure.external.fcm_service.FIREBASE_AVAILABLE",
+                True,
+            ),
+            patch("app.shared.infrastructure.external.fcm_service.config") as mock_config,
+            patch("app.shared.infrastructure.external.fcm_service.credentials"),
+            patch("app.shared.infrastructure.external.fcm_service.firebase_admin"),
+            patch(
+                "app.shared.infrastructure.external.fcm_service.messaging"
+            ) as mock_messaging,
+        ):
+            mock_config.FCM_CREDENTIALS_PATH = mock_credentials_path
+            mock_messaging.MulticastMessage.side_effect = lambda **kwargs: kwargs
+            mock_messaging.send_each_for_multicast.side_effect = (
+                lambda message: _batch_response(*[True] * len(message["tokens"]))
+            )
+            service = FCMService(batch_size=2)
+
+            user_tokens = {f"user-{i}": f"token-{i}" for i in range(5)}
+
+            # Act
+            results = await service.send_notification_to_multiple(
+                user_tokens=user_tokens, title="Test", body="Message"
+            )
+
+            # Assert
+            assert all(results.values()) and len(results) == 5
+            batches = [
+                call.args[0]["tokens"]
+                for call in mock_messaging.send_each_for_multicast.call_args_list
+            ]
+            assert sorted(map(len, batches)) == [1, 2, 2]
+            assert service.metrics.calls == 3
+            assert service.metrics.messages_sent == 5
+
+    @pytest.mark.asyncio
+    async def test_send_runs_off_the_event_loop_and_records_metrics(
+        self, mock_credentials_path
+    ):
+        """Test the blocking SDK call runs on the FCM thread pool and is timed"""
+        # Arrange
+        with (
+            patch(
+                "app.shared.infrastructure.external.fcm_service.FIREBASE_AVAILABLE",
+                True,
+            ),
+            patch("app.shared.infrastructure.external.fcm_service.config") as mock_config,
+            patch("app.shared.infrastructure.external.fcm_service.credentials"),
+            patch("app.shared.infrastructure.external.fcm_service.firebase_admin"),
+            patch(
+                "app.shared.infrastructure.external.fcm_service.messaging"
+            ) as mock_messaging,
+        ):
+            mock_config.FCM_CREDENTIALS_PATH = mock_credentials_path
+            mock_messaging.UnregisteredError = type("UnregisteredError", (Exception,), {})
+            mock_messaging.SenderIdMismatchError = type(
+                "SenderIdMismatchError", (Exception,), {}
+            )
+            threads = []
+
+            def send(message):
+                threads.append(threading.current_thread().name)
+                if len(threads) == 2:
+                    raise Exception("Unexpected error")
+                return "message-id"
+
+            mock_messaging.send.side_effect = send
+            service = FCMService()
+
+            # Act
+            first = await service.send_notification(
+                user_id="user-1", title="Test", body="Message", fcm_token="token-1"
+            )
+            second = await service.send_notification(
+                user_id="user-2", title="Test", body="Message", fcm_token="token-2"
+            )
+
+            # Assert
+            assert (first, second) == (True, False)
+            assert all(name.startswith("fcm") for name in threads)
+            stats = service.stats()
+            assert stats["calls"] == 2
+            assert stats["failed_calls"] == 1
+            assert stats["messages_sent"] == 1
+            assert stats["messages_failed"] == 1
+            assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_schedule_notification_does_not_wait(self, mock_credentials_path):
+        """Test a scheduled send completes in the background"""
+        # Arrange
+        with (
+            patch(
+                "app.shared.infrastructure.external.fcm_service.FIREBASE_AVAILABLE",
+                True,
+            ),
+            patch("app.shared.infrastructure.external.fcm_service.config") as mock_config,
+            patch("app.shared.infrastructure.external.fcm_service.credentials"),
+            patch("app.shared.infrastructure.external.fcm_service.firebase_admin"),
+            patch(
+                "app.shared.infrastructure.external.fcm_service.messaging"
+            ) as mock_messaging,
+        ):
+            mock_config.FCM_CREDENTIALS_PATH = mock_credentials_path
+            release = threading.Event()
+            mock_messaging.send.side_effect = lambda message: release.wait(5)
+            service = FCMService()
+
+            # Act
+            task = service.schedule_notification(
+                user_id="user-1", title="Test", body="Message", fcm_token="token-1"
+            )
+
+            # Assert: the caller got control back while FCM is still busy
+            assert not task.done()
+            assert service.stats()["pending"] == 1
+            release.set()
+            assert await task is True
+            assert service.stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_scheduled_sends(self, mock_credentials_path):
+        """Test close lets sends finish, abandons slow ones, then stops the pool"""
+        # Arrange
+        with (
+            patch(
+                "app.shared.infrastructure.external.fcm_service.FIREBASE_AVAILABLE",
+                True,
+            ),
+            patch("app.shared.infrastructure.external.fcm_service.config") as mock_config,
+            patch("app.shared.infrastructure.external.fcm_service.credentials"),
+            patch("app.shared.infrastructure.external.fcm_service.firebase_admin"),
+            patch(
+                "app.shared.infrastructure.external.fcm_service.messaging"
+            ) as mock_messaging,
+        ):
+            mock_config.FCM_CREDENTIALS_PATH = mock_credentials_path
+            release = threading.Event()
+            mock_messaging.send.side_effect = lambda message: (
+                message == "slow" and release.wait(5)
+            )
+            mock_messaging.Message.side_effect = lambda token, **kwargs: (
+                "slow" if token == "token-slow" else "fast"
+            )
+            service = FCMService(max_workers=1)
+            fast = service.schedule_notification(
+                user_id="user-1", title="Test", body="Message", fcm_token="token-1"
+            )
+            await fast
+
+            slow = service.schedule_notification(
+                user_id="user-2", title="Test", body="Message", fcm_token="token-slow"
+            )
+            queued = service.schedule_notification(
+                user_id="user-3", title="Test", body="Message", fcm_token="token-3"
+            )
+
+            # Act
+            await service.close(timeout=0.1)
+
+            # Assert: the pool no longer accepts work and its queue was dropped
+            assert not slow.done()
+            with pytest.raises(RuntimeError):
+                service._executor.submit(lambda: None)
+            release.set()
+            assert await slow is True
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+    def test_push_metrics_stats(self):
+        """Test mean and max latency over recorded calls"""
+        metrics = PushMetrics()
+        assert metrics.stats()["avg_latency_ms"] == 0.0
+
+        metrics.record_call(10.0)
+        metrics.record_call(30.0, failed=True)
+        metrics.record_messages(sent=3, failed=1)
+
+        assert metrics.stats() == {
+            "calls": 2,
+            "failed_calls": 1,
+            "messages_sent": 3,
+            "messages_failed": 1,
+            "avg_latency_ms": 20.0,
+            "max_latency_ms": 30.0,
+        }
+
     # Test get_fcm_service singleton
     def test_get_fcm_service_singleton(self):
         """Test get_fcm_service returns singleton"""
@@ -464,6 +677,8 @@ class TestFCMService:
             patch("app.shared.infrastructure.external.fcm_service.config") as mock_config,
         ):
             mock_config.FCM_CREDENTIALS_PATH = None
+            mock_config.FCM_MAX_WORKERS = 2
+            mock_config.FCM_BATCH_SIZE = 500
 
             # Reset singleton
             import app.shared.infrastructure.external.fcm_service as fcm_module
@@ -0,0 +1,103 @@
+"""
+Unit tests for ProfileSummaryLoader
+
+Tests batching of concurrent loads, per-request memoization and tolerance of
+bad ids and lookup failures.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.shared.domain.contracts.i_profile_query_service import ProfileSummary
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
+)
+
+
+class TestProfileSummaryLoader:
+    """Test ProfileSummaryLoader"""
+
+    @pytest.fixture
+    def user_ids(self):
+        return [uuid4() for _ in range(3)]
+
+    @pytest.fixture
+    def profile_service(self, user_ids):
+        """Profile service knowing every user but the last"""
+        service = AsyncMock()
+        service.get_profile_summaries.return_value = {
+            uid: ProfileSummary(user_id=uid, nickname=f"user-{i}")
+            for i, uid in enumerate(user_ids[:-1])
+        }
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_lookup(self, profile_service, user_ids):
+        """Test loads issued together are resolved by a single bulk call"""
+        # Arrange
+        loader = ProfileSummaryLoader(profile_service)
+
+        # Act
+        results = await asyncio.gather(
+            *(loader.load(str(uid)) for uid in user_ids), loader.load(user_ids[0])
+        )
+
+        # Assert
+        profile_service.get_profile_summaries.assert_awaited_once()
+        requested = profile_service.get_profile_summaries.call_args.args[0]
+        assert sorted(requested) == sorted(user_ids)
+        assert [r.nickname if r else None for r in results] == [
+            "user-0",
+            "user-1",
+            None,
+            "user-0",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_load_many_then_load_is_memoized(self, profile_service, user_ids):
+        """Test primed users (found or not) never trigger another query"""
+        # Arrange
+        loader = ProfileSummaryLoader(profile_service)
+
+        # Act
+        loaded = await loader.load_many(str(uid) for uid in user_ids)
+        again = [await loader.load(uid) for uid in user_ids]
+
+        # Assert
+        profile_service.get_profile_summaries.assert_awaited_once()
+        assert loaded[str(user_ids[1])].nickname == "user-1"
+        assert loaded[str(user_ids[2])] is None
+        assert again[2] is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_ids_resolve_to_none_without_query(self, profile_service):
+        """Test None and malformed ids are skipped"""
+        loader = ProfileSummaryLoader(profile_service)
+
+        assert await loader.load(None) is None
+        assert await loader.load("not-a-uuid") is None
+        assert await loader.load_many(["nope", None]) == {}
+        profile_service.get_profile_summaries.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_resolves_to_none_and_is_retried(
+        self, profile_service, user_ids
+    ):
+        """Test a failed batch renders without profiles and is not memoized"""
+        # Arrange
+        loader = ProfileSummaryLoader(profile_service)
+        profile_service.get_profile_summaries.side_effect = [
+            RuntimeError("db down"),
+            {user_ids[0]: ProfileSummary(user_id=user_ids[0], nickname="back")},
+        ]
+
+        # Act
+        first = await loader.load(user_ids[0])
+        second = await loader.load(user_ids[0])
+
+        # Assert
+        assert first is None
+        assert second.nickname == "back"
@@ -0,0 +1,120 @@
+"""
+Unit tests for EventHub
+
+Tests per-user fan-out, bounded queues, the heartbeat/resync stream and
+long-poll waiters.
+"""
+
+import asyncio
+
+import pytest
+
+from app.shared.infrastructure.realtime.event_hub import (
+    HEARTBEAT_EVENT,
+    RESYNC_EVENT,
+    EventHub,
+    WaiterLimitExceededError,
+)
+
+
+class TestEventHub:
+    """Test EventHub"""
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_only_recipients(self):
+        """Test events go to every connection of the listed users only"""
+        # Arrange
+        hub = EventHub()
+        phone = hub.subscribe("alice")
+        laptop = hub.subscribe("alice")
+        bob = hub.subscribe("bob")
+        event = {"type": "thread.message", "data": {"id": "m1"}}
+
+        # Act
+        delivered = hub.publish(["alice", "carol"], event)
+
+        # Assert
+        assert delivered == 2
+        assert await phone.get() == event
+        assert await laptop.get() == event
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(bob.get(), 0.01)
+
+    def test_unsubscribe_removes_connection(self):
+        """Test closed connections are dropped from the registry"""
+        # Arrange
+        hub = EventHub()
+
+        # Act
+        with hub.subscription("alice"):
+            during = hub.stats()
+        after = hub.stats()
+
+        # Assert
+        assert during == {"users": 1, "connections": 1, "waiters": 0}
+        assert after == {"users": 0, "connections": 0, "waiters": 0}
+        assert hub.publish(["alice"], {"type": "ping"}) == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_overflows_to_resync(self):
+        """Test a full queue drops the backlog and ends the stream with resync"""
+        # Arrange
+        hub = EventHub(max_pending=2)
+        subscription = hub.subscribe("alice")
+
+        # Act
+        for i in range(3):
+            hub.publish(["alice"], {"type": "chat.message", "data": {"id": i}})
+        events = [event async for event in subscription.stream(heartbeat_seconds=1)]
+
+        # Assert
+        assert subscription.overflowed is True
+        assert events == [RESYNC_EVENT]
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_heartbeat_while_idle(self):
+        """Test idle streams yield a ping, then deliver the next event"""
+        # Arrange
+        hub = EventHub()
+        subscription = hub.subscribe("alice")
+        stream = subscription.stream(heartbeat_seconds=0.01)
+        event = {"type": "chat.message", "data": {"id": "m1"}}
+
+        # Act
+        first = await stream.__anext__()
+        hub.publish(["alice"], event)
+        second = await stream.__anext__()
+
+        # Assert
+        assert first == HEARTBEAT_EVENT
+        assert second == event
+
+    @pytest.mark.asyncio
+    async def test_waiter_is_woken_by_its_topic_only(self):
+        """Test publishing to a topic sets its waiters and no others"""
+        # Arrange
+        hub = EventHub()
+
+        # Act
+        with hub.waiter("chat:1") as room_1, hub.waiter("chat:2") as room_2:
+            parked = hub.waiter_count
+            hub.publish(["alice"], {"type": "chat.message"}, topic="chat:1")
+
+        # Assert
+        assert parked == 2
+        assert room_1.is_set()
+        assert not room_2.is_set()
+        assert hub.waiter_count == 0
+
+    def test_waiter_cap(self):
+        """Test a worker refuses to park more than max_waiters"""
+        # Arrange
+        hub = EventHub(max_waiters=1)
+
+        # Act / Assert
+        with hub.waiter("chat:1"):
+            with pytest.raises(WaiterLimitExceededError):
+                with hub.waiter("chat:2"):
+                    pass
+        with hub.waiter("chat:2"):
+            assert hub.stats()["waiters"] == 1
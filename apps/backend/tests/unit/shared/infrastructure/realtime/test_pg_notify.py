@@ -0,0 +1,90 @@
+"""
+Unit tests for the LISTEN/NOTIFY bridge
+
+Tests payload encoding limits and decoding into the local hub.
+"""
+
+import json
+
+from app.shared.infrastructure.realtime.event_hub import EventHub
+from app.shared.infrastructure.realtime.pg_notify import (
+    MAX_PAYLOAD_BYTES,
+    PgNotifyListener,
+    encode_event,
+)
+
+
+class TestEncodeEvent:
+    """Test encode_event"""
+
+    def test_round_trips_recipients_and_event(self):
+        """Test recipients are deduplicated and the event is kept whole"""
+        # Arrange
+        event = {"type": "thread.message", "data": {"id": "m1", "content": "hi"}}
+
+        # Act
+        envelope = json.loads(encode_event(["b", "a", "b"], event))
+
+        # Assert
+        assert envelope == {"to": ["a", "b"], "event": event}
+
+    def test_oversized_content_is_dropped(self):
+        """Test events over the NOTIFY limit are sent without content"""
+        # Arrange
+        event = {
+            "type": "thread.message",
+            "data": {"id": "m1", "content": "字" * 5000},
+        }
+
+        # Act
+        payload = encode_event(["a"], event)
+        envelope = json.loads(payload)
+
+        # Assert
+        assert len(payload.encode()) < MAX_PAYLOAD_BYTES
+        assert envelope["event"]["truncated"] is True
+        assert envelope["event"]["data"] == {"id": "m1"}
+
+
+class TestPgNotifyListener:
+    """Test PgNotifyListener payload handling"""
+
+    def test_handle_payload_publishes_to_hub(self):
+        """Test a notification is fanned out to local subscribers"""
+        # Arrange
+        hub = EventHub()
+        subscription = hub.subscribe("a")
+        listener = PgNotifyListener(dsn="postgresql+asyncpg://db/test", hub=hub)
+        event = {"type": "chat.message", "data": {"id": "m1"}}
+
+        # Act
+        listener.handle_payload(encode_event(["a"], event))
+
+        # Assert
+        assert listener.dsn == "postgresql://db/test"
+        assert subscription._queue.get_nowait() == event
+
+    def test_handle_payload_wakes_topic_waiters(self):
+        """Test the envelope topic wakes long-poll waiters"""
+        # Arrange
+        hub = EventHub()
+        listener = PgNotifyListener(dsn="postgresql://db/test", hub=hub)
+
+        # Act
+        with hub.waiter("chat:room-1") as woken:
+            listener.handle_payload(
+                encode_event(["a"], {"type": "chat.message"}, topic="chat:room-1")
+            )
+
+            # Assert
+            assert woken.is_set()
+
+    def test_malformed_payload_is_ignored(self):
+        """Test garbage on the channel is logged, not raised"""
+        # Arrange
+        hub = EventHub()
+        listener = PgNotifyListener(dsn="postgresql://db/test", hub=hub)
+
+        # Act / Assert
+        listener.handle_payload("not json")
+        listener.handle_payload(json.dumps({"event": {}}))
@@ -0,0 +1,87 @@
+"""
+Unit tests for ChatAccessCache
+
+Tests hit/miss accounting, one-sided pair state and pair invalidation.
+"""
+
+from datetime import datetime
+
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
+from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
+
+
+def _room(room_id="room-1"):
+    return ChatRoom(
+        id=room_id, participant_ids=["user-a", "user-b"], created_at=datetime.utcnow()
+    )
+
+
+def _friends(other_user_id):
+    return FriendshipPairState(user_id=other_user_id, are_friends=True)
+
+
+class TestChatAccessCache:
+    """Test ChatAccessCache"""
+
+    def test_rooms_count_hits_and_misses(self):
+        cache = ChatAccessCache(ttl_seconds=60)
+        cache.set_room(_room())
+
+        assert cache.get_room("room-1").participant_ids == ["user-a", "user-b"]
+        assert cache.get_room("room-2") is None
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "rooms": 1,
+            "pairs": 0,
+        }
+
+    def test_pair_state_is_per_viewer(self):
+        cache = ChatAccessCache(ttl_seconds=60)
+        cache.set_pair(
+            "user-a", FriendshipPairState(user_id="user-b", blocked_by_them=True)
+        )
+
+        assert cache.get_pair("user-a", "user-b").blocked_by_them
+        assert cache.get_pair("user-b", "user-a") is None
+
+    def test_invalidate_pair_drops_both_directions(self):
+        cache = ChatAccessCache(ttl_seconds=60)
+        cache.set_pair("user-a", _friends("user-b"))
+        cache.set_pair("user-b", _friends("user-a"))
+        cache.set_pair("user-a", _friends("user-c"))
+
+        cache.invalidate_pair("user-b", "user-a")
+
+        assert cache.get_pair("user-a", "user-b") is None
+        assert cache.get_pair("user-b", "user-a") is None
+        assert cache.get_pair("user-a", "user-c") == _friends("user-c")
+
+    def test_zero_ttl_disables_caching(self):
+        cache = ChatAccessCache(ttl_seconds=0)
+        cache.set_room(_room())
+        cache.set_pair("user-a", _friends("user-b"))
+
+        assert cache.get_room("room-1") is None
+        assert cache.get_pair("user-a", "user-b") is None
+
+    def test_clear_resets_counters(self):
+        cache = ChatAccessCache(ttl_seconds=60)
+        cache.set_room(_room())
+        cache.get_room("room-1")
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+            "rooms": 0,
+            "pairs": 0,
+        }
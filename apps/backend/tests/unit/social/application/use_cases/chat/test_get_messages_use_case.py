@@ -2,16 +2,31 @@
 Unit tests for GetMessagesUseCase
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pytest
 
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
 from app.modules.social.application.use_cases.chat.get_messages_use_case import (
     GetMessagesUseCase,
 )
 from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 from app.modules.social.domain.entities.message import Message, MessageStatus
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+def _pair(are_friends=True, blocked_by_them=False):
+    """Friendship state of user-123 towards user-456"""
+    return FriendshipPairState(
+        user_id="user-456", are_friends=are_friends, blocked_by_them=blocked_by_them
+    )
 
 
 class TestGetMessagesUseCase:
@@ -69,8 +84,7 @@ class TestGetMessagesUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
+        mock_friendship_repository.get_pair_state.return_value = _pair()
 
         # Mock messages
         messages = [
@@ -105,14 +119,15 @@ class TestGetMessagesUseCase:
 
         # Verify repository calls
         mock_chat_room_repository.get_by_id.assert_called_once_with(room_id)
-        mock_friendship_repository.are_friends.assert_called_once_with(
-            user_id, other_user_id
-        )
-        mock_friendship_repository.is_blocked.assert_called_once_with(
+        mock_friendship_repository.get_pair_state.assert_called_once_with(
             user_id, other_user_id
         )
         mock_message_repository.get_messages_by_room_id.assert_called_once_with(
-            room_id=room_id, after_message_id=None, limit=50
+            room_id=room_id,
+            after_message_id=None,
+            limit=50,
+            before=None,
+            after=None,
         )
 
     @pytest.mark.asyncio
@@ -139,8 +154,7 @@ class TestGetMessagesUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
+        mock_friendship_repository.get_pair_state.return_value = _pair()
 
         # Mock new messages after cursor
         messages = [
@@ -169,7 +183,11 @@ class TestGetMessagesUseCase:
 
         # Verify repository calls with cursor
         mock_message_repository.get_messages_by_room_id.assert_called_once_with(
-            room_id=room_id, after_message_id=after_message_id, limit=50
+            room_id=room_id,
+            after_message_id=after_message_id,
+            limit=50,
+            before=None,
+            after=None,
         )
 
     @pytest.mark.asyncio
@@ -196,8 +214,7 @@ class TestGetMessagesUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
+        mock_friendship_repository.get_pair_state.return_value = _pair()
 
         # Mock limited messages
         mock_message_repository.get_messages_by_room_id.return_value = []
@@ -216,7 +233,11 @@ class TestGetMessagesUseCase:
 
         # Verify repository calls with custom limit
         mock_message_repository.get_messages_by_room_id.assert_called_once_with(
-            room_id=room_id, after_message_id=None, limit=limit
+            room_id=room_id,
+            after_message_id=None,
+            limit=limit,
+            before=None,
+            after=None,
         )
 
     @pytest.mark.asyncio
@@ -293,7 +314,8 @@ class TestGetMessagesUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are not friends
-        mock_friendship_repository.are_friends.return_value = False
+        pair = _pair(are_friends=False)
+        mock_friendship_repository.get_pair_state.return_value = pair
 
         # Act & Assert
         with pytest.raises(ValueError, match="Users must be friends to access messages"):
@@ -327,8 +349,7 @@ class TestGetMessagesUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends but blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = True
+        mock_friendship_repository.get_pair_state.return_value = _pair(blocked_by_them=True)
 
         # Act & Assert
         with pytest.raises(ValueError, match="Cannot access messages - user is blocked"):
@@ -362,8 +383,7 @@ class TestGetMessagesUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
+        mock_friendship_repository.get_pair_state.return_value = _pair()
 
         # Mock no messages
         mock_message_repository.get_messages_by_room_id.return_value = []
@@ -377,3 +397,127 @@ class TestGetMessagesUseCase:
         assert result is not None
         assert isinstance(result, list)
         assert len(result) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_messages_before_keyset_cursor(
+        self,
+        use_case,
+        mock_message_repository,
+        mock_chat_room_repository,
+        mock_friendship_repository,
+    ):
+        """Test that a before token is decoded and passed to the repository"""
+        # Arrange
+        room_id = "room-123"
+        user_id = "user-123"
+        cursor = KeysetCursor.from_row(datetime.now(timezone.utc), uuid4())
+        mock_chat_room_repository.get_by_id.return_value = ChatRoom(
+            id=room_id,
+            participant_ids=[user_id, "user-456"],
+            created_at=datetime.utcnow(),
+        )
+        mock_friendship_repository.get_pair_state.return_value = _pair()
+        mock_message_repository.get_messages_by_room_id.return_value = []
+
+        # Act
+        await use_case.execute(
+            room_id=room_id, requesting_user_id=user_id, before=cursor.encode()
+        )
+
+        # Assert
+        mock_message_repository.get_messages_by_room_id.assert_called_once_with(
+            room_id=room_id,
+            after_message_id=None,
+            limit=50,
+            before=cursor,
+            after=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_messages_invalid_cursor(
+        self, use_case, mock_message_repository, mock_chat_room_repository
+    ):
+        """Test that a malformed token fails before any query runs"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="cursor"):
+            await use_case.execute(
+                room_id="room-123", requesting_user_id="user-123", after="garbage"
+            )
+
+        mock_chat_room_repository.get_by_id.assert_not_called()
+        mock_message_repository.get_messages_by_room_id.assert_not_called()
+
+
+class TestCachedChatAccess:
+    """Test GetMessagesUseCase with a ChatAccessCache"""
+
+    @pytest.fixture
+    def repositories(self):
+        message_repo, chat_room_repo, friendship_repo = (
+            AsyncMock(),
+            AsyncMock(),
+            AsyncMock(),
+        )
+        chat_room_repo.get_by_id.return_value = ChatRoom(
+            id="room-123",
+            participant_ids=["user-123", "user-456"],
+            created_at=datetime.utcnow(),
+        )
+        friendship_repo.get_pair_state.return_value = _pair()
+        message_repo.get_messages_by_room_id.return_value = []
+        return message_repo, chat_room_repo, friendship_repo
+
+    @pytest.mark.asyncio
+    async def test_warm_poll_only_queries_messages(self, repositories):
+        """Test a second poll reuses the room and friendship checks"""
+        # Arrange
+        message_repo, chat_room_repo, friendship_repo = repositories
+        use_case = GetMessagesUseCase(
+            *repositories, access_cache=ChatAccessCache(ttl_seconds=60)
+        )
+
+        # Act
+        await use_case.execute(room_id="room-123", requesting_user_id="user-123")
+        await use_case.execute(room_id="room-123", requesting_user_id="user-123")
+
+        # Assert
+        chat_room_repo.get_by_id.assert_awaited_once_with("room-123")
+        friendship_repo.get_pair_state.assert_awaited_once()
+        assert message_repo.get_messages_by_room_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidated_pair_is_checked_again(self, repositories):
+        """Test a block seen after invalidation denies the next poll"""
+        # Arrange
+        _, chat_room_repo, friendship_repo = repositories
+        cache = ChatAccessCache(ttl_seconds=60)
+        use_case = GetMessagesUseCase(*repositories, access_cache=cache)
+        await use_case.execute(room_id="room-123", requesting_user_id="user-123")
+
+        # Act
+        friendship_repo.get_pair_state.return_value = _pair(blocked_by_them=True)
+        cache.invalidate_pair("user-456", "user-123")
+
+        # Assert
+        with pytest.raises(ValueError, match="blocked"):
+            await use_case.execute(room_id="room-123", requesting_user_id="user-123")
+        chat_room_repo.get_by_id.assert_awaited_once()
+        assert friendship_repo.get_pair_state.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_room_is_not_cached(self, repositories):
+        """Test a room that does not exist yet is looked up on every poll"""
+        # Arrange
+        _, chat_room_repo, _ = repositories
+        chat_room_repo.get_by_id.return_value = None
+        use_case = GetMessagesUseCase(
+            *repositories, access_cache=ChatAccessCache(ttl_seconds=60)
+        )
+
+        # Act & Assert
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Chat room not found"):
+                await use_case.execute(
+                    room_id="room-123", requesting_user_id="user-123"
+                )
+        assert chat_room_repo.get_by_id.await_count == 2
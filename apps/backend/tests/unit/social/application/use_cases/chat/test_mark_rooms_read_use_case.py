@@ -0,0 +1,60 @@
+"""
+Unit tests for MarkRoomsReadUseCase
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.modules.social.application.use_cases.chat.mark_rooms_read_use_case import (
+    MarkRoomsReadUseCase,
+)
+
+
+class TestMarkRoomsReadUseCase:
+    """Test MarkRoomsReadUseCase"""
+
+    @pytest.fixture
+    def mock_message_repository(self):
+        """Create mock message repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def use_case(self, mock_message_repository):
+        """Create use case instance"""
+        return MarkRoomsReadUseCase(message_repository=mock_message_repository)
+
+    @pytest.mark.asyncio
+    async def test_applies_all_receipts_in_one_call(
+        self, use_case, mock_message_repository
+    ):
+        """Test every receipt goes to the repository in a single batch"""
+        # Arrange
+        receipts = {"room-1": "message-9", "room-2": None}
+        mock_message_repository.mark_rooms_as_read.return_value = {
+            "room-1": 4,
+            "room-2": 2,
+        }
+
+        # Act
+        result = await use_case.execute("user-123", receipts)
+
+        # Assert
+        assert result == {"room-1": 4, "room-2": 2}
+        mock_message_repository.mark_rooms_as_read.assert_awaited_once_with(
+            "user-123", receipts
+        )
+
+    @pytest.mark.asyncio
+    async def test_reports_zero_for_rooms_without_changes(
+        self, use_case, mock_message_repository
+    ):
+        """Test rooms that had nothing to mark (or are foreign) report 0"""
+        # Arrange
+        mock_message_repository.mark_rooms_as_read.return_value = {"room-1": 1}
+
+        # Act
+        result = await use_case.execute("user-123", {"room-1": None, "room-2": None})
+
+        # Assert
+        assert result == {"room-1": 1, "room-2": 0}
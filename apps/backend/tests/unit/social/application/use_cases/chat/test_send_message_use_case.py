@@ -11,9 +11,19 @@ from app.modules.social.application.use_cases.chat.send_message_use_case import
     SendMessageUseCase,
 )
 from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 from app.modules.social.domain.entities.message import MessageStatus
 
 
+def _pair(are_friends=True, blocked_by_them=False):
+    """Friendship state of user-123 towards user-456"""
+    return FriendshipPairState(
+        user_id="user-456", are_friends=are_friends, blocked_by_them=blocked_by_them
+    )
+
+
 class TestSendMessageUseCase:
     """Test SendMessageUseCase"""
 
@@ -61,23 +71,17 @@ class TestSendMessageUseCase:
         recipient_id = "user-456"
         content = "Hello, friend!"
 
-        # Mock chat room exists with both participants
         chat_room = ChatRoom(
             id=room_id,
             participant_ids=[sender_id, recipient_id],
             created_at=datetime.utcnow(),
         )
-        mock_chat_room_repository.get_by_id.return_value = chat_room
-
-        # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
 
-        # Mock create to return message
-        def create_side_effect(message):
-            return message
-
-        mock_message_repository.create.side_effect = create_side_effect
+        # Mock the authorized insert succeeds
+        mock_message_repository.create_in_room.side_effect = lambda message: (
+            message,
+            chat_room,
+        )
 
         # Act
         result = await use_case.execute(room_id, sender_id, content)
@@ -89,15 +93,10 @@ class TestSendMessageUseCase:
         assert result.content == content
         assert result.status == MessageStatus.SENT
 
-        # Verify repository calls
-        mock_chat_room_repository.get_by_id.assert_called_once_with(room_id)
-        mock_friendship_repository.are_friends.assert_called_once_with(
-            sender_id, recipient_id
-        )
-        mock_friendship_repository.is_blocked.assert_called_once_with(
-            sender_id, recipient_id
-        )
-        mock_message_repository.create.assert_called_once()
+        # Verify the send was a single repository call
+        mock_message_repository.create_in_room.assert_called_once()
+        mock_chat_room_repository.get_by_id.assert_not_called()
+        mock_friendship_repository.get_pair_state.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_send_message_chat_room_not_found(
@@ -109,14 +108,16 @@ class TestSendMessageUseCase:
         sender_id = "user-123"
         content = "Hello!"
 
-        # Mock no chat room found
+        # Mock the insert is refused and no chat room found
+        mock_message_repository.create_in_room.return_value = None
         mock_chat_room_repository.get_by_id.return_value = None
 
         # Act & Assert
         with pytest.raises(ValueError, match="Chat room not found"):
             await use_case.execute(room_id, sender_id, content)
 
-        # Verify no message was created
+        # Verify the refused insert was the only write attempted
+        mock_message_repository.create_in_room.assert_called_once()
         mock_message_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
@@ -134,7 +135,8 @@ class TestSendMessageUseCase:
         third_user = "user-789"
         content = "Hello!"
 
-        # Mock chat room with different participants
+        # Mock the insert is refused: chat room has different participants
+        mock_message_repository.create_in_room.return_value = None
         chat_room = ChatRoom(
             id=room_id,
             participant_ids=[other_user, third_user],
@@ -148,7 +150,8 @@ class TestSendMessageUseCase:
         ):
             await use_case.execute(room_id, sender_id, content)
 
-        # Verify no message was created
+        # Verify the refused insert was the only write attempted
+        mock_message_repository.create_in_room.assert_called_once()
         mock_message_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
@@ -174,14 +177,17 @@ class TestSendMessageUseCase:
         )
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
-        # Mock users are not friends
-        mock_friendship_repository.are_friends.return_value = False
+        # Mock the insert is refused: users are not friends
+        mock_message_repository.create_in_room.return_value = None
+        pair = _pair(are_friends=False)
+        mock_friendship_repository.get_pair_state.return_value = pair
 
         # Act & Assert
         with pytest.raises(ValueError, match="Users must be friends to send messages"):
             await use_case.execute(room_id, sender_id, content)
 
-        # Verify no message was created
+        # Verify the refused insert was the only write attempted
+        mock_message_repository.create_in_room.assert_called_once()
         mock_message_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
@@ -207,15 +213,16 @@ class TestSendMessageUseCase:
         )
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
-        # Mock users are friends but blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = True
+        # Mock the insert is refused: users are friends but blocked
+        mock_message_repository.create_in_room.return_value = None
+        mock_friendship_repository.get_pair_state.return_value = _pair(blocked_by_them=True)
 
         # Act & Assert
         with pytest.raises(ValueError, match="Cannot send message - user is blocked"):
             await use_case.execute(room_id, sender_id, content)
 
-        # Verify no message was created
+        # Verify the refused insert was the only write attempted
+        mock_message_repository.create_in_room.assert_called_once()
         mock_message_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
@@ -242,8 +249,7 @@ class TestSendMessageUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
+        mock_friendship_repository.get_pair_state.return_value = _pair()
 
         # Act & Assert
         # The Message entity itself validates empty content
@@ -274,14 +280,12 @@ class TestSendMessageUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
-
-        # Mock create to return message
-        def create_side_effect(message):
-            return message
+        mock_friendship_repository.get_pair_state.return_value = _pair()
 
-        mock_message_repository.create.side_effect = create_side_effect
+        mock_message_repository.create_in_room.side_effect = lambda message: (
+            message,
+            chat_room,
+        )
 
         # Act
         result = await use_case.execute(room_id, sender_id, content)
@@ -314,9 +318,66 @@ class TestSendMessageUseCase:
         mock_chat_room_repository.get_by_id.return_value = chat_room
 
         # Mock users are friends and not blocked
-        mock_friendship_repository.are_friends.return_value = True
-        mock_friendship_repository.is_blocked.return_value = False
+        mock_friendship_repository.get_pair_state.return_value = _pair()
 
         # Act & Assert
         with pytest.raises(ValueError, match="Message content exceeds maximum length"):
             await use_case.execute(room_id, sender_id, content)
+
+    @pytest.mark.asyncio
+    async def test_send_message_publishes_event(
+        self,
+        mock_message_repository,
+        mock_chat_room_repository,
+        mock_friendship_repository,
+    ):
+        """Test the created message is published to the room's participants"""
+        # Arrange
+        event_publisher = AsyncMock()
+        use_case = SendMessageUseCase(
+            message_repository=mock_message_repository,
+            chat_room_repository=mock_chat_room_repository,
+            friendship_repository=mock_friendship_repository,
+            event_publisher=event_publisher,
+        )
+        chat_room = ChatRoom(
+            id="room-123",
+            participant_ids=["user-123", "user-456"],
+            created_at=datetime.utcnow(),
+        )
+        mock_chat_room_repository.get_by_id.return_value = chat_room
+        mock_friendship_repository.get_pair_state.return_value = _pair()
+        mock_message_repository.create_in_room.side_effect = lambda message: (
+            message,
+            chat_room,
+        )
+
+        # Act
+        result = await use_case.execute("room-123", "user-123", "Hello!")
+
+        # Assert
+        event_publisher.publish_chat_message.assert_awaited_once_with(
+            chat_room, result
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_message_refused_without_failed_rule(
+        self,
+        use_case,
+        mock_message_repository,
+        mock_chat_room_repository,
+        mock_friendship_repository,
+    ):
+        """Test a refusal whose rule no longer fails still raises"""
+        # Arrange: the friendship was accepted between insert and re-check
+        mock_message_repository.create_in_room.return_value = None
+        mock_chat_room_repository.get_by_id.return_value = ChatRoom(
+            id="room-123",
+            participant_ids=["user-123", "user-456"],
+            created_at=datetime.utcnow(),
+        )
+        mock_friendship_repository.get_pair_state.return_value = _pair()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="could not be sent"):
+            await use_case.execute("room-123", "user-123", "Hello!")
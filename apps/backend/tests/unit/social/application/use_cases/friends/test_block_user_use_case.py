@@ -7,10 +7,16 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
 from app.modules.social.application.use_cases.friends.block_user_use_case import (
     BlockUserUseCase,
 )
 from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 
 
 class TestBlockUserUseCase:
@@ -177,6 +183,34 @@ class TestBlockUserUseCase:
         mock_friendship_repository.update.assert_called_once()
         mock_friendship_repository.create.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_block_user_blocked_by_other_records_both(
+        self, use_case, mock_friendship_repository
+    ):
+        """Test blocking back someone who blocked you keeps both blocks on one row"""
+        # Arrange
+        blocker_user_id = "user-123"
+        blocked_user_id = "user-456"
+
+        # user-456 already blocked user-123
+        existing_friendship = Friendship(
+            id="friendship-1",
+            user_id=blocked_user_id,
+            friend_id=blocker_user_id,
+            status=FriendshipStatus.BLOCKED,
+            created_at=datetime.utcnow(),
+        )
+        mock_friendship_repository.get_by_users.return_value = existing_friendship
+        mock_friendship_repository.update.side_effect = lambda friendship: friendship
+
+        # Act
+        result = await use_case.execute(blocker_user_id, blocked_user_id)
+
+        # Assert
+        assert result.blocked_by == {blocker_user_id, blocked_user_id}
+        mock_friendship_repository.update.assert_called_once()
+        mock_friendship_repository.create.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_block_user_cannot_block_self(
         self, use_case, mock_friendship_repository
@@ -193,3 +227,57 @@ class TestBlockUserUseCase:
         mock_friendship_repository.get_by_users.assert_not_called()
         mock_friendship_repository.create.assert_not_called()
         mock_friendship_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_block_user_invalidates_chat_access(
+        self, mock_friendship_repository
+    ):
+        """Test the pair's cached chat access is dropped in both directions"""
+        # Arrange
+        cache = ChatAccessCache(ttl_seconds=60)
+        cache.set_pair(
+            "user-123", FriendshipPairState(user_id="user-456", are_friends=True)
+        )
+        cache.set_pair(
+            "user-456", FriendshipPairState(user_id="user-123", are_friends=True)
+        )
+        mock_friendship_repository.get_by_users.return_value = None
+        mock_friendship_repository.create.side_effect = lambda friendship: friendship
+        use_case = BlockUserUseCase(
+            friendship_repository=mock_friendship_repository, access_cache=cache
+        )
+
+        # Act
+        await use_case.execute("user-123", "user-456")
+
+        # Assert
+        assert cache.get_pair("user-123", "user-456") is None
+        assert cache.get_pair("user-456", "user-123") is None
+
+    @pytest.mark.asyncio
+    async def test_block_keeps_cached_access_until_commit(
+        self, mock_friendship_repository
+    ):
+        """Test the invalidation waits for the block to be committed"""
+        # Arrange
+        cache = ChatAccessCache(ttl_seconds=60)
+        cache.set_pair(
+            "user-123", FriendshipPairState(user_id="user-456", are_friends=True)
+        )
+        mock_friendship_repository.get_by_users.return_value = None
+        mock_friendship_repository.create.side_effect = lambda friendship: friendship
+        pending = []
+        use_case = BlockUserUseCase(
+            friendship_repository=mock_friendship_repository,
+            access_cache=cache,
+            after_commit=pending.append,
+        )
+
+        # Act
+        await use_case.execute("user-123", "user-456")
+
+        # Assert
+        assert cache.get_pair("user-123", "user-456") is not None
+        for callback in pending:
+            callback()
+        assert cache.get_pair("user-123", "user-456") is None
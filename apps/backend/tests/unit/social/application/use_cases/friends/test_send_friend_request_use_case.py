@@ -2,6 +2,7 @@
 Unit tests for SendFriendRequestUseCase
 """
 
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
@@ -10,6 +11,9 @@ from app.modules.social.application.use_cases.friends.send_friend_request_use_ca
     SendFriendRequestUseCase,
 )
 from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 
 
 class TestSendFriendRequestUseCase:
@@ -37,8 +41,9 @@ class TestSendFriendRequestUseCase:
         friend_id = "user-456"
 
         # Mock no existing friendship
-        mock_friendship_repository.get_by_users.return_value = None
-        mock_friendship_repository.is_blocked.return_value = False
+        mock_friendship_repository.get_pair_state.return_value = FriendshipPairState(
+            user_id=friend_id
+        )
 
         # Mock create to return a friendship with the expected status
         def create_side_effect(friendship):
@@ -56,10 +61,9 @@ class TestSendFriendRequestUseCase:
         assert result.status == FriendshipStatus.PENDING
 
         # Verify repository calls
-        mock_friendship_repository.get_by_users.assert_called_once_with(
+        mock_friendship_repository.get_pair_state.assert_called_once_with(
             user_id, friend_id
         )
-        mock_friendship_repository.is_blocked.assert_called_once_with(user_id, friend_id)
         mock_friendship_repository.create.assert_called_once()
 
     @pytest.mark.asyncio
@@ -75,7 +79,7 @@ class TestSendFriendRequestUseCase:
             await use_case.execute(user_id, user_id)
 
         # Verify no repository calls were made
-        mock_friendship_repository.get_by_users.assert_not_called()
+        mock_friendship_repository.get_pair_state.assert_not_called()
         mock_friendship_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
@@ -88,21 +92,16 @@ class TestSendFriendRequestUseCase:
         friend_id = "user-456"
 
         # Mock existing accepted friendship
-        existing_friendship = Friendship(
-            id="friendship-1",
-            user_id=user_id,
-            friend_id=friend_id,
-            status=FriendshipStatus.ACCEPTED,
-            created_at=None,
+        mock_friendship_repository.get_pair_state.return_value = FriendshipPairState(
+            user_id=friend_id, are_friends=True
         )
-        mock_friendship_repository.get_by_users.return_value = existing_friendship
 
         # Act & Assert
         with pytest.raises(ValueError, match="Users are already friends"):
             await use_case.execute(user_id, friend_id)
 
         # Verify repository calls
-        mock_friendship_repository.get_by_users.assert_called_once_with(
+        mock_friendship_repository.get_pair_state.assert_called_once_with(
             user_id, friend_id
         )
         mock_friendship_repository.create.assert_not_called()
@@ -117,25 +116,45 @@ class TestSendFriendRequestUseCase:
         friend_id = "user-456"
 
         # Mock existing pending friendship
-        existing_friendship = Friendship(
-            id="friendship-1",
-            user_id=user_id,
-            friend_id=friend_id,
-            status=FriendshipStatus.PENDING,
-            created_at=None,
+        mock_friendship_repository.get_pair_state.return_value = FriendshipPairState(
+            user_id=friend_id, request_pending=True
         )
-        mock_friendship_repository.get_by_users.return_value = existing_friendship
 
         # Act & Assert
         with pytest.raises(ValueError, match="Friend request already pending"):
             await use_case.execute(user_id, friend_id)
 
         # Verify repository calls
-        mock_friendship_repository.get_by_users.assert_called_once_with(
+        mock_friendship_repository.get_pair_state.assert_called_once_with(
             user_id, friend_id
         )
         mock_friendship_repository.create.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_send_friend_request_opposite_request_created_concurrently(
+        self, use_case, mock_friendship_repository
+    ):
+        """Test the other user's concurrent request is reported as pending"""
+        # Arrange
+        user_id = "user-123"
+        friend_id = "user-456"
+
+        mock_friendship_repository.get_pair_state.return_value = FriendshipPairState(
+            user_id=friend_id
+        )
+        # The repository returns the row the other request created
+        mock_friendship_repository.create.return_value = Friendship(
+            id="friendship-other",
+            user_id=friend_id,
+            friend_id=user_id,
+            status=FriendshipStatus.PENDING,
+            created_at=datetime.utcnow(),
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Friend request already pending"):
+            await use_case.execute(user_id, friend_id)
+
     @pytest.mark.asyncio
     async def test_send_friend_request_user_blocked(
         self, use_case, mock_friendship_repository
@@ -146,14 +165,9 @@ class TestSendFriendRequestUseCase:
         friend_id = "user-456"
 
         # Mock existing blocked relationship
-        existing_friendship = Friendship(
-            id="friendship-1",
-            user_id=user_id,
-            friend_id=friend_id,
-            status=FriendshipStatus.BLOCKED,
-            created_at=None,
+        mock_friendship_repository.get_pair_state.return_value = FriendshipPairState(
+            user_id=friend_id, blocked_by_me=True
         )
-        mock_friendship_repository.get_by_users.return_value = existing_friendship
 
         # Act & Assert
         with pytest.raises(
@@ -162,7 +176,7 @@ class TestSendFriendRequestUseCase:
             await use_case.execute(user_id, friend_id)
 
         # Verify repository calls
-        mock_friendship_repository.get_by_users.assert_called_once_with(
+        mock_friendship_repository.get_pair_state.assert_called_once_with(
             user_id, friend_id
         )
         mock_friendship_repository.create.assert_not_called()
@@ -176,10 +190,10 @@ class TestSendFriendRequestUseCase:
         user_id = "user-123"
         friend_id = "user-456"
 
-        # Mock no existing friendship in one direction
-        mock_friendship_repository.get_by_users.return_value = None
         # Mock blocked in reverse direction
-        mock_friendship_repository.is_blocked.return_value = True
+        mock_friendship_repository.get_pair_state.return_value = FriendshipPairState(
+            user_id=friend_id, blocked_by_them=True
+        )
 
         # Act & Assert
         with pytest.raises(
@@ -188,8 +202,7 @@ class TestSendFriendRequestUseCase:
             await use_case.execute(user_id, friend_id)
 
         # Verify repository calls
-        mock_friendship_repository.get_by_users.assert_called_once_with(
+        mock_friendship_repository.get_pair_state.assert_called_once_with(
             user_id, friend_id
         )
-        mock_friendship_repository.is_blocked.assert_called_once_with(user_id, friend_id)
         mock_friendship_repository.create.assert_not_called()
@@ -7,10 +7,16 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from app.modules.social.application.services.chat_access_cache import (
+    ChatAccessCache,
+)
 from app.modules.social.application.use_cases.friends.unblock_user_use_case import (
     UnblockUserUseCase,
 )
 from app.modules.social.domain.entities.friendship import Friendship, FriendshipStatus
+from app.modules.social.domain.entities.friendship_pair_state import (
+    FriendshipPairState,
+)
 
 
 class TestUnblockUserUseCase:
@@ -170,6 +176,34 @@ class TestUnblockUserUseCase:
         )
         mock_friendship_repository.delete.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_unblock_user_mutual_block_keeps_other_block(
+        self, use_case, mock_friendship_repository
+    ):
+        """Test unblocking leaves the row when the other user still blocks"""
+        # Arrange
+        unblocker_user_id = "user-123"
+        unblocked_user_id = "user-456"
+
+        existing_friendship = Friendship(
+            id="friendship-1",
+            user_id=unblocked_user_id,
+            friend_id=unblocker_user_id,
+            status=FriendshipStatus.BLOCKED,
+            created_at=datetime.utcnow(),
+            blocked_by=[unblocker_user_id, unblocked_user_id],
+        )
+        mock_friendship_repository.get_by_users.return_value = existing_friendship
+
+        # Act
+        await use_case.execute(unblocker_user_id, unblocked_user_id)
+
+        # Assert
+        mock_friendship_repository.update.assert_called_once_with(existing_friendship)
+        mock_friendship_repository.delete.assert_not_called()
+        assert existing_friendship.blocked_by == {unblocked_user_id}
+        assert existing_friendship.is_blocked()
+
     @pytest.mark.asyncio
     async def test_unblock_user_cannot_unblock_self(
         self, use_case, mock_friendship_repository
@@ -185,3 +219,30 @@ class TestUnblockUserUseCase:
         # Verify no repository calls
         mock_friendship_repository.get_by_users.assert_not_called()
         mock_friendship_repository.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unblock_user_invalidates_chat_access(
+        self, mock_friendship_repository
+    ):
+        """Test the blocked user's cached chat access is dropped"""
+        # Arrange
+        cache = ChatAccessCache(ttl_seconds=60)
+        cache.set_pair(
+            "user-456", FriendshipPairState(user_id="user-123", blocked_by_them=True)
+        )
+        mock_friendship_repository.get_by_users.return_value = Friendship(
+            id="friendship-1",
+            user_id="user-123",
+            friend_id="user-456",
+            status=FriendshipStatus.BLOCKED,
+            created_at=datetime.utcnow(),
+        )
+        use_case = UnblockUserUseCase(
+            friendship_repository=mock_friendship_repository, access_cache=cache
+        )
+
+        # Act
+        await use_case.execute("user-123", "user-456")
+
+        # Assert
+        assert cache.get_pair("user-456", "user-123") is None
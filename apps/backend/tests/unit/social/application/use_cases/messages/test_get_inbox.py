@@ -0,0 +1,106 @@
+"""
+Unit tests for GetInboxUseCase
+
+Tests cursor decoding and next_cursor generation.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.social.application.use_cases.messages.get_inbox import (
+    GetInboxUseCase,
+)
+from app.modules.social.domain.entities.inbox_thread import InboxThread
+from app.modules.social.domain.entities.thread import MessageThread
+from app.shared.domain.keyset_cursor import KeysetCursor
+
+
+def _inbox_thread(last_message_at=None) -> InboxThread:
+    created_at = datetime.now(timezone.utc) - timedelta(days=1)
+    return InboxThread(
+        thread=MessageThread(
+            id=str(uuid4()),
+            user_a_id=str(uuid4()),
+            user_b_id=str(uuid4()),
+            created_at=created_at,
+            updated_at=created_at,
+            last_message_at=last_message_at,
+        ),
+        other_user_id=str(uuid4()),
+        other_nickname="Other",
+        other_avatar_url=None,
+        last_message=None,
+        unread_count=0,
+    )
+
+
+class TestGetInboxUseCase:
+    """Test GetInboxUseCase"""
+
+    @pytest.fixture
+    def mock_thread_repo(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def use_case(self, mock_thread_repo):
+        return GetInboxUseCase(mock_thread_repo)
+
+    @pytest.mark.asyncio
+    async def test_full_page_returns_cursor_of_last_row(
+        self, use_case, mock_thread_repo
+    ):
+        """Test next_cursor points at the last thread's activity time"""
+        # Arrange
+        empty = _inbox_thread(last_message_at=None)
+        active = _inbox_thread(last_message_at=datetime.now(timezone.utc))
+        mock_thread_repo.get_inbox_for_user.return_value = [active, empty]
+
+        # Act
+        page = await use_case.execute(user_id=str(uuid4()), limit=2)
+
+        # Assert
+        cursor = KeysetCursor.decode(page.next_cursor)
+        assert cursor.id == empty.thread.id
+        assert cursor.created_at == empty.thread.created_at
+
+    @pytest.mark.asyncio
+    async def test_short_page_has_no_cursor(self, use_case, mock_thread_repo):
+        """Test the last page ends pagination"""
+        mock_thread_repo.get_inbox_for_user.return_value = [_inbox_thread()]
+
+        page = await use_case.execute(user_id=str(uuid4()), limit=20)
+
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_decoded_for_repository(self, use_case, mock_thread_repo):
+        """Test the opaque cursor reaches the repository as a KeysetCursor"""
+        # Arrange
+        position = KeysetCursor.from_row(datetime.now(timezone.utc), uuid4())
+        mock_thread_repo.get_inbox_for_user.return_value = []
+        user_id = str(uuid4())
+
+        # Act
+        await use_case.execute(user_id=user_id, limit=5, cursor=position.encode())
+
+        # Assert
+        mock_thread_repo.get_inbox_for_user.assert_awaited_once_with(
+            user_id, limit=5, cursor=position
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            KeysetCursor.from_row(datetime.now(timezone.utc), uuid4(), 1.5).encode(),
+        ],
+    )
+    async def test_invalid_cursor_raises(self, use_case, mock_thread_repo, cursor):
+        """Test malformed and score cursors are rejected"""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await use_case.execute(user_id=str(uuid4()), cursor=cursor)
+        mock_thread_repo.get_inbox_for_user.assert_not_called()
@@ -0,0 +1,123 @@
+"""
+Unit tests for MarkThreadReadUseCase
+
+Tests read positions, membership checks and message ownership.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.social.application.use_cases.messages.mark_thread_read import (
+    MarkThreadReadUseCase,
+)
+from app.modules.social.domain.entities.thread import MessageThread
+from app.modules.social.domain.entities.thread_message import ThreadMessage
+from app.modules.social.domain.entities.thread_read_cursor import ThreadReadCursor
+
+
+class TestMarkThreadReadUseCase:
+    """Test MarkThreadReadUseCase"""
+
+    @pytest.fixture
+    def user_id(self):
+        return str(uuid4())
+
+    @pytest.fixture
+    def thread(self, user_id):
+        now = datetime.utcnow()
+        return MessageThread(
+            id=str(uuid4()),
+            user_a_id=user_id,
+            user_b_id=str(uuid4()),
+            created_at=now - timedelta(days=1),
+            updated_at=now,
+            last_message_at=now,
+        )
+
+    @pytest.fixture
+    def repos(self, thread, user_id):
+        thread_repo = AsyncMock()
+        thread_repo.get_by_id.return_value = thread
+        message_repo = AsyncMock()
+        cursor_repo = AsyncMock()
+        cursor_repo.mark_read.side_effect = (
+            lambda thread_id, uid, read_at, message_id=None: ThreadReadCursor(
+                thread_id=thread_id,
+                user_id=uid,
+                last_read_at=read_at,
+                last_read_message_id=message_id,
+            )
+        )
+        cursor_repo.count_unread.return_value = 0
+        return thread_repo, message_repo, cursor_repo
+
+    @pytest.fixture
+    def use_case(self, repos):
+        return MarkThreadReadUseCase(*repos)
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_latest_message(self, use_case, repos, thread, user_id):
+        """Test omitting message_id reads up to the thread's last message"""
+        _, _, cursor_repo = repos
+
+        state = await use_case.execute(thread.id, user_id)
+
+        cursor_repo.mark_read.assert_awaited_once_with(
+            thread.id, user_id, read_at=thread.last_message_at, message_id=None
+        )
+        assert state.unread_count == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_up_to_given_message(self, use_case, repos, thread, user_id):
+        """Test an explicit message sets the cursor at its creation time"""
+        # Arrange
+        _, message_repo, cursor_repo = repos
+        message = ThreadMessage(
+            id=str(uuid4()),
+            thread_id=thread.id,
+            sender_id=thread.user_b_id,
+            content="hello",
+            post_id=None,
+            created_at=thread.last_message_at - timedelta(minutes=5),
+        )
+        message_repo.get_by_id.return_value = message
+        cursor_repo.count_unread.return_value = 3
+
+        # Act
+        state = await use_case.execute(thread.id, user_id, message_id=message.id)
+
+        # Assert
+        assert state.cursor.last_read_at == message.created_at
+        assert state.cursor.last_read_message_id == message.id
+        assert state.unread_count == 3
+
+    @pytest.mark.asyncio
+    async def test_message_of_another_thread_is_rejected(
+        self, use_case, repos, thread, user_id
+    ):
+        """Test a message id from a different thread raises ValueError"""
+        _, message_repo, cursor_repo = repos
+        message_repo.get_by_id.return_value = ThreadMessage(
+            id=str(uuid4()),
+            thread_id=str(uuid4()),
+            sender_id=thread.user_b_id,
+            content="elsewhere",
+            post_id=None,
+            created_at=datetime.utcnow(),
+        )
+
+        with pytest.raises(ValueError, match="Message not found"):
+            await use_case.execute(thread.id, user_id, message_id=str(uuid4()))
+        cursor_repo.mark_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_participant_is_rejected(self, use_case, repos, thread):
+        """Test users outside the thread cannot move a cursor"""
+        _, _, cursor_repo = repos
+
+        with pytest.raises(ValueError, match="not authorized"):
+            await use_case.execute(thread.id, str(uuid4()))
+        cursor_repo.mark_read.assert_not_called()
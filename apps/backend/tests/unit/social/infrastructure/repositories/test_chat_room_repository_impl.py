@@ -6,6 +6,7 @@ to ensure correct method implementations and entity conversions.
 """
 
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
@@ -13,6 +14,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.social.domain.entities.chat_room import ChatRoom
+from app.modules.social.domain.entities.message import MessageStatus
 from app.modules.social.infrastructure.database.models.chat_room_model import (
     ChatRoomModel,
 )
@@ -220,6 +222,66 @@ class TestChatRoomRepositoryImpl:
         assert len(result) == 0
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_room_summaries_for_user_maps_rows(
+        self, repository, mock_session, sample_user_ids
+    ):
+        """Test summaries keep participant order and tolerate missing profiles"""
+        # Arrange
+        user_a, user_b = sorted(UUID(uid) for uid in sample_user_ids.values())
+        room_model = ChatRoomModel(
+            id=uuid4(), participant_ids=[user_a, user_b], created_at=datetime.utcnow()
+        )
+        message_id = uuid4()
+        rows = [
+            SimpleNamespace(
+                ChatRoomModel=room_model,
+                profile_user_ids=[user_b],
+                nicknames=["Bob"],
+                avatar_urls=[None],
+                last_message_id=message_id,
+                last_sender_id=user_b,
+                last_content="hi",
+                last_status="sent",
+                last_created_at=datetime.utcnow(),
+                last_updated_at=None,
+                unread_count=2,
+            ),
+            SimpleNamespace(
+                ChatRoomModel=room_model,
+                profile_user_ids=None,
+                nicknames=None,
+                avatar_urls=None,
+                last_message_id=None,
+                last_sender_id=None,
+                last_content=None,
+                last_status=None,
+                last_created_at=None,
+                last_updated_at=None,
+                unread_count=0,
+            ),
+        ]
+        mock_session.execute = AsyncMock(return_value=rows)
+
+        # Act
+        with_message, empty = await repository.get_room_summaries_for_user(
+            str(user_a)
+        )
+
+        # Assert
+        assert [p.user_id for p in with_message.participants] == [
+            str(user_a),
+            str(user_b),
+        ]
+        assert [p.nickname for p in with_message.participants] == [None, "Bob"]
+        assert with_message.last_message.id == str(message_id)
+        assert with_message.last_message.status == MessageStatus.SENT
+        assert with_message.unread_count == 2
+        assert empty.last_message is None
+        assert empty.activity_at == room_model.created_at
+        assert all(p.nickname is None for p in empty.participants)
+        mock_session.execute.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_delete_existing_room(
         self, repository, mock_session, sample_room_id, sample_chat_room_model
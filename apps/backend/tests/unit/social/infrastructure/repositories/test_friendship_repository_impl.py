@@ -72,6 +72,53 @@ class TestFriendshipRepositoryImpl:
         assert result.status == sample_friendship.status
         mock_session.add.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_blocked_friendship_sets_blocker_side(
+        self, repository, mock_session
+    ):
+        """Test the blocker's side flag is set on the normalized pair"""
+        # Arrange
+        mock_session.add = MagicMock()
+        mock_session.flush = AsyncMock()
+        mock_session.refresh = AsyncMock()
+        low, high = sorted([uuid4(), uuid4()])
+        friendship = Friendship(
+            id=str(uuid4()),
+            user_id=str(high),
+            friend_id=str(low),
+            status=FriendshipStatus.BLOCKED,
+            created_at=datetime.utcnow(),
+        )
+
+        # Act
+        await repository.create(friendship)
+
+        # Assert: user_id (the blocker) holds the larger id, so it is user_b
+        model = mock_session.add.call_args[0][0]
+        assert (model.blocked_by_a, model.blocked_by_b) == (False, True)
+
+    def test_to_entity_reads_blockers_from_flags(self, repository):
+        """Test both side flags become the entity's blockers"""
+        # Arrange
+        low, high = sorted([uuid4(), uuid4()])
+        model = FriendshipModel(
+            id=uuid4(),
+            user_id=low,
+            friend_id=high,
+            user_a_id=low,
+            user_b_id=high,
+            status=FriendshipStatus.BLOCKED.value,
+            blocked_by_a=True,
+            blocked_by_b=True,
+            created_at=datetime.utcnow(),
+        )
+
+        # Act
+        entity = repository._to_entity(model)
+
+        # Assert
+        assert entity.blocked_by == {str(low), str(high)}
+
     @pytest.mark.asyncio
     async def test_get_by_id_found(
         self, repository, mock_session, sample_friendship_model
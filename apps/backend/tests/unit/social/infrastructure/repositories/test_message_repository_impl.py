@@ -216,21 +216,49 @@ class TestMessageRepositoryImpl:
 
     @pytest.mark.asyncio
     async def test_mark_messages_as_read(self, repository, mock_session):
-        """Test marking messages as read"""
+        """Test marking messages as read is a single UPDATE"""
         # Arrange
         room_id = str(uuid4())
         user_id = str(uuid4())
         expected_count = 3
 
-        # Mock the select query to return messages
-        mock_messages = [MagicMock() for _ in range(expected_count)]
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_messages
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.flush = AsyncMock()
+        # The UPDATE ... RETURNING is counted per room in the database
+        mock_session.execute = AsyncMock(
+            return_value=[(UUID(room_id), expected_count)]
+        )
 
         # Act
         result = await repository.mark_messages_as_read(room_id, user_id)
 
         # Assert
         assert result == expected_count
+        mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_mark_messages_as_read_nothing_unread(
+        self, repository, mock_session
+    ):
+        """Test a room with nothing to mark reports zero"""
+        # Arrange
+        mock_session.execute = AsyncMock(return_value=[])
+
+        # Act
+        result = await repository.mark_messages_as_read(str(uuid4()), str(uuid4()))
+
+        # Assert
+        assert result == 0
+
+    @pytest.mark.asyncio
+    async def test_mark_rooms_as_read_without_receipts(
+        self, repository, mock_session
+    ):
+        """Test an empty batch issues no query"""
+        # Arrange
+        mock_session.execute = AsyncMock()
+
+        # Act
+        result = await repository.mark_rooms_as_read(str(uuid4()), {})
+
+        # Assert
+        assert result == {}
+        mock_session.execute.assert_not_called()
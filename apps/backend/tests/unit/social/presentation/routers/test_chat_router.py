@@ -11,18 +11,37 @@ from uuid import UUID, uuid4
 import pytest
 from fastapi import HTTPException
 
+from app.modules.social.domain.entities.chat_room_summary import (
+    ChatRoomParticipant,
+    ChatRoomSummary,
+)
 from app.modules.social.domain.entities.message import MessageStatus
 from app.modules.social.presentation.routers.chat_router import (
+    acknowledge_read_receipts,
     get_chat_rooms,
     get_messages,
     mark_message_read,
     send_message,
 )
 from app.modules.social.presentation.schemas.chat_schemas import (
+    ReadReceipt,
+    ReadReceiptsRequest,
     SendMessageRequest,
 )
 
 
+def _summary(room, last_message=None, unread_count=0):
+    """Room list row for a chat room; the first participant has a profile"""
+    first, *others = room.participant_ids
+    return ChatRoomSummary(
+        room=room,
+        participants=[ChatRoomParticipant(first, "Me", "https://example.com/me.jpg")]
+        + [ChatRoomParticipant(uid, None, None) for uid in others],
+        last_message=last_message,
+        unread_count=unread_count,
+    )
+
+
 class TestChatRouter:
     """Test Chat Router endpoints"""
 
@@ -82,14 +101,17 @@ class TestChatRouter:
         mock_session,
         sample_user_id,
         mock_chat_room,
+        mock_message,
     ):
-        """Test successful retrieval of chat rooms"""
+        """Test rooms come back with participants, last message and unread count"""
         # Arrange
         with patch(
             "app.modules.social.presentation.routers.chat_router.ChatRoomRepositoryImpl"
         ) as mock_repo_class:
             mock_repo = AsyncMock()
-            mock_repo.get_rooms_by_user_id.return_value = [mock_chat_room]
+            mock_repo.get_room_summaries_for_user.return_value = [
+                _summary(mock_chat_room, last_message=mock_message, unread_count=3)
+            ]
             mock_repo_class.return_value = mock_repo
 
             # Act
@@ -101,10 +123,16 @@ class TestChatRouter:
             # Assert
             assert response.data is not None
             assert response.data.total == 1
-            assert len(response.data.rooms) == 1
-            assert response.data.rooms[0].id == UUID(mock_chat_room.id)
+            room = response.data.rooms[0]
+            assert room.id == UUID(mock_chat_room.id)
+            assert [p.nickname for p in room.participants] == ["Me", None]
+            assert room.last_message.id == UUID(mock_message.id)
+            assert room.last_message.status == "sent"
+            assert room.unread_count == 3
             assert response.error is None
-            mock_repo.get_rooms_by_user_id.assert_called_once_with(str(sample_user_id))
+            mock_repo.get_room_summaries_for_user.assert_called_once_with(
+                str(sample_user_id)
+            )
 
     @pytest.mark.asyncio
     async def test_get_chat_rooms_empty_list(
@@ -118,7 +146,7 @@ class TestChatRouter:
             "app.modules.social.presentation.routers.chat_router.ChatRoomRepositoryImpl"
         ) as mock_repo_class:
             mock_repo = AsyncMock()
-            mock_repo.get_rooms_by_user_id.return_value = []
+            mock_repo.get_room_summaries_for_user.return_value = []
             mock_repo_class.return_value = mock_repo
 
             # Act
@@ -151,7 +179,10 @@ class TestChatRouter:
             "app.modules.social.presentation.routers.chat_router.ChatRoomRepositoryImpl"
         ) as mock_repo_class:
             mock_repo = AsyncMock()
-            mock_repo.get_rooms_by_user_id.return_value = [mock_chat_room, room2]
+            mock_repo.get_room_summaries_for_user.return_value = [
+                _summary(mock_chat_room),
+                _summary(room2),
+            ]
             mock_repo_class.return_value = mock_repo
 
             # Act
@@ -164,6 +195,7 @@ class TestChatRouter:
             assert response.data is not None
             assert response.data.total == 2
             assert len(response.data.rooms) == 2
+            assert response.data.rooms[1].last_message is None
 
     @pytest.mark.asyncio
     async def test_get_chat_rooms_error_handling(
@@ -177,7 +209,9 @@ class TestChatRouter:
             "app.modules.social.presentation.routers.chat_router.ChatRoomRepositoryImpl"
         ) as mock_repo_class:
             mock_repo = AsyncMock()
-            mock_repo.get_rooms_by_user_id.side_effect = Exception("Database error")
+            mock_repo.get_room_summaries_for_user.side_effect = Exception(
+                "Database error"
+            )
             mock_repo_class.return_value = mock_repo
 
             # Act & Assert
@@ -261,6 +295,8 @@ class TestChatRouter:
                 requesting_user_id=str(sample_user_id),
                 after_message_id=str(after_message_id),
                 limit=20,
+                before=None,
+                after=None,
             )
 
     @pytest.mark.asyncio
@@ -379,7 +415,7 @@ class TestChatRouter:
             mock_repo.get_by_id.return_value = mock_chat_room
             mock_repo_class.return_value = mock_repo
 
-            mock_fcm = AsyncMock()
+            mock_fcm = MagicMock()
             mock_fcm_service.return_value = mock_fcm
 
             # Act
@@ -498,7 +534,7 @@ class TestChatRouter:
         mock_chat_room,
         sample_friend_id,
     ):
-        """Test that FCM notification is sent after message creation"""
+        """Test that an FCM notification is scheduled after message creation"""
         # Arrange
         request = SendMessageRequest(content="Hello, friend!")
 
@@ -517,7 +553,7 @@ class TestChatRouter:
             mock_repo.get_by_id.return_value = mock_chat_room
             mock_repo_class.return_value = mock_repo
 
-            mock_fcm = AsyncMock()
+            mock_fcm = MagicMock()
             mock_fcm_service.return_value = mock_fcm
 
             # Act
@@ -529,8 +565,8 @@ class TestChatRouter:
             )
 
             # Assert
-            mock_fcm.send_notification.assert_called_once()
-            call_args = mock_fcm.send_notification.call_args[1]
+            mock_fcm.schedule_notification.assert_called_once()
+            call_args = mock_fcm.schedule_notification.call_args[1]
             assert call_args["user_id"] == str(sample_friend_id)
             assert call_args["title"] == "New message"
             # The body uses the actual message content from mock_message
@@ -564,8 +600,8 @@ class TestChatRouter:
             mock_repo.get_by_id.return_value = mock_chat_room
             mock_repo_class.return_value = mock_repo
 
-            mock_fcm = AsyncMock()
-            mock_fcm.send_notification.side_effect = Exception("FCM error")
+            mock_fcm = MagicMock()
+            mock_fcm.schedule_notification.side_effect = Exception("FCM error")
             mock_fcm_service.return_value = mock_fcm
 
             # Act - Should not raise exception
@@ -802,3 +838,74 @@ class TestChatRouter:
             assert result is None  # Still returns success
             mock_message.mark_read.assert_not_called()  # But doesn't update
             mock_msg_repo.update.assert_not_called()
+
+    # Tests for POST /chats/read
+    @pytest.mark.asyncio
+    async def test_acknowledge_read_receipts_success(
+        self, mock_session, sample_user_id, sample_room_id, sample_message_id
+    ):
+        """Test receipts are applied as one batch and totalled"""
+        # Arrange
+        other_room_id = uuid4()
+        request = ReadReceiptsRequest(
+            receipts=[
+                ReadReceipt(room_id=sample_room_id, up_to_message_id=sample_message_id),
+                ReadReceipt(room_id=other_room_id),
+            ]
+        )
+
+        with patch(
+            "app.modules.social.presentation.routers.chat_router.MarkRoomsReadUseCase"
+        ) as mock_use_case_class:
+            mock_use_case = AsyncMock()
+            mock_use_case.execute.return_value = {
+                str(sample_room_id): 3,
+                str(other_room_id): 0,
+            }
+            mock_use_case_class.return_value = mock_use_case
+
+            # Act
+            result = await acknowledge_read_receipts(
+                request=request,
+                current_user_id=sample_user_id,
+                session=mock_session,
+            )
+
+            # Assert
+            assert result.data.marked == {
+                str(sample_room_id): 3,
+                str(other_room_id): 0,
+            }
+            assert result.data.total_marked == 3
+            mock_use_case.execute.assert_awaited_once_with(
+                user_id=str(sample_user_id),
+                receipts={
+                    str(sample_room_id): str(sample_message_id),
+                    str(other_room_id): None,
+                },
+            )
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_read_receipts_error(
+        self, mock_session, sample_user_id, sample_room_id
+    ):
+        """Test unexpected errors surface as 500"""
+        # Arrange
+        request = ReadReceiptsRequest(receipts=[ReadReceipt(room_id=sample_room_id)])
+
+        with patch(
+            "app.modules.social.presentation.routers.chat_router.MarkRoomsReadUseCase"
+        ) as mock_use_case_class:
+            mock_use_case = AsyncMock()
+            mock_use_case.execute.side_effect = Exception("Database error")
+            mock_use_case_class.return_value = mock_use_case
+
+            # Act & Assert
+            with pytest.raises(HTTPException) as exc_info:
+                await acknowledge_read_receipts(
+                    request=request,
+                    current_user_id=sample_user_id,
+                    session=mock_session,
+                )
+
+            assert exc_info.value.status_code == 500
@@ -25,6 +25,26 @@ from app.modules.social.presentation.routers.message_requests_router import (
 from app.modules.social.presentation.schemas.message_schemas import (
     CreateMessageRequestRequest,
 )
+from app.shared.domain.contracts.i_profile_query_service import ProfileSummary
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
+)
+
+
+def _profile_repo(privacy_flags=None):
+    """Profile repository returning a recipient with the given privacy flags"""
+    profile = MagicMock()
+    profile.privacy_flags = privacy_flags
+    profile_repo = AsyncMock()
+    profile_repo.get_by_user_id.return_value = profile
+    return profile_repo
+
+
+def _profile_loader(summaries=None):
+    """Profile summary loader over a mocked profile service"""
+    profile_service = AsyncMock()
+    profile_service.get_profile_summaries.return_value = summaries or {}
+    return ProfileSummaryLoader(profile_service)
 
 
 class TestMessageRequestsRouter:
@@ -108,22 +128,18 @@ class TestMessageRequestsRouter:
                 from unittest.mock import patch
                 with patch("app.modules.social.presentation.routers.message_requests_router.MessageRequestRepository"):
                     with patch("app.modules.social.presentation.routers.message_requests_router.ThreadRepository"):
-                        with patch("app.modules.social.presentation.routers.message_requests_router.FriendshipRepositoryImpl"):
-                            with patch("app.modules.social.presentation.routers.message_requests_router.ProfileRepositoryImpl") as mock_profile_repo_class:
-                                with patch("app.modules.social.presentation.routers.message_requests_router.ThreadUniquenessService"):
-                                    with patch("app.modules.social.presentation.routers.message_requests_router.CreateMessageRequestUseCase") as mock_use_case_class:
-                                        mock_profile_repo_inst = AsyncMock()
-                                        mock_profile_repo_inst.get_by_user_id.return_value = mock_profile
-                                        mock_profile_repo_class.return_value = mock_profile_repo_inst
-
-                                        mock_use_case_class.return_value = mock_use_case
-
-                                        # Act
-                                        response = await create_message_request(
-                                            request=request,
-                                            user_id=sample_user_id,
-                                            session=mock_session,
-                                        )
+                        with patch("app.modules.social.presentation.routers.message_requests_router.FriendshipRepositoryImpl"), patch("app.modules.social.presentation.routers.message_requests_router.ProfileRepositoryImpl", return_value=_profile_repo({"allow_stranger_chat": True})):
+                            with patch("app.modules.social.presentation.routers.message_requests_router.ThreadUniquenessService"):
+                                with patch("app.modules.social.presentation.routers.message_requests_router.CreateMessageRequestUseCase") as mock_use_case_class:
+                                    mock_use_case_class.return_value = mock_use_case
+
+                                    # Act
+                                    response = await create_message_request(
+                                        request=request,
+                                        user_id=sample_user_id,
+                                        session=mock_session,
+                                        profiles=_profile_loader(),
+                                    )
 
         # Assert
         assert response.sender_id == str(sample_user_id)
@@ -157,26 +173,29 @@ class TestMessageRequestsRouter:
         from unittest.mock import patch
         with patch("app.modules.social.presentation.routers.message_requests_router.MessageRequestRepository"):
             with patch("app.modules.social.presentation.routers.message_requests_router.ThreadRepository"):
-                with patch("app.modules.social.presentation.routers.message_requests_router.FriendshipRepositoryImpl"):
-                    with patch("app.modules.social.presentation.routers.message_requests_router.ProfileRepositoryImpl") as mock_profile_repo_class:
-                        with patch("app.modules.social.presentation.routers.message_requests_router.ThreadUniquenessService"):
-                            with patch("app.modules.social.presentation.routers.message_requests_router.CreateMessageRequestUseCase") as mock_use_case_class:
-                                mock_profile_repo_inst = AsyncMock()
-                                mock_profile = MagicMock()
-                                mock_profile.privacy_flags = {"allow_stranger_chat": True}
-                                mock_profile_repo_inst.get_by_user_id.return_value = mock_profile
-                                mock_profile_repo_class.return_value = mock_profile_repo_inst
-
-                                mock_use_case = AsyncMock()
-                                mock_use_case.execute.return_value = message_request
-                                mock_use_case_class.return_value = mock_use_case
-
-                                # Act
-                                response = await create_message_request(
-                                    request=request,
-                                    user_id=sample_user_id,
-                                    session=mock_session,
-                                )
+                with patch("app.modules.social.presentation.routers.message_requests_router.FriendshipRepositoryImpl"), patch("app.modules.social.presentation.routers.message_requests_router.ProfileRepositoryImpl", return_value=_profile_repo({"allow_stranger_chat": True})):
+                    with patch("app.modules.social.presentation.routers.message_requests_router.ThreadUniquenessService"):
+                        with patch("app.modules.social.presentation.routers.message_requests_router.CreateMessageRequestUseCase") as mock_use_case_class:
+                            profiles = _profile_loader(
+                                {
+                                    sample_recipient_id: ProfileSummary(
+                                        user_id=sample_recipient_id,
+                                        privacy_flags={"allow_stranger_chat": True},
+                                    )
+                                }
+                            )
+
+                            mock_use_case = AsyncMock()
+                            mock_use_case.execute.return_value = message_request
+                            mock_use_case_class.return_value = mock_use_case
+
+                            # Act
+                            response = await create_message_request(
+                                request=request,
+                                user_id=sample_user_id,
+                                session=mock_session,
+                                profiles=profiles,
+                            )
 
         # Assert
         assert response.post_id == sample_post_id
@@ -195,30 +214,33 @@ class TestMessageRequestsRouter:
         from unittest.mock import patch
         with patch("app.modules.social.presentation.routers.message_requests_router.MessageRequestRepository"):
             with patch("app.modules.social.presentation.routers.message_requests_router.ThreadRepository"):
-                with patch("app.modules.social.presentation.routers.message_requests_router.FriendshipRepositoryImpl"):
-                    with patch("app.modules.social.presentation.routers.message_requests_router.ProfileRepositoryImpl") as mock_profile_repo_class:
-                        with patch("app.modules.social.presentation.routers.message_requests_router.ThreadUniquenessService"):
-                            with patch("app.modules.social.presentation.routers.message_requests_router.CreateMessageRequestUseCase") as mock_use_case_class:
-                                mock_profile_repo_inst = AsyncMock()
-                                mock_profile = MagicMock()
-                                mock_profile.privacy_flags = {"allow_stranger_chat": False}
-                                mock_profile_repo_inst.get_by_user_id.return_value = mock_profile
-                                mock_profile_repo_class.return_value = mock_profile_repo_inst
-
-                                mock_use_case = AsyncMock()
-                                mock_use_case.execute.side_effect = ValueError(
-                                    "Recipient does not allow stranger messages"
-                                )
-                                mock_use_case_class.return_value = mock_use_case
-
-                                # Act & Assert
-                                with pytest.raises(HTTPException) as exc_info:
-                                    await create_message_request(
-                                        request=request,
-                                        user_id=sample_user_id,
-                                        session=mock_session,
+                with patch("app.modules.social.presentation.routers.message_requests_router.FriendshipRepositoryImpl"), patch("app.modules.social.presentation.routers.message_requests_router.ProfileRepositoryImpl", return_value=_profile_repo({"allow_stranger_chat": False})):
+                    with patch("app.modules.social.presentation.routers.message_requests_router.ThreadUniquenessService"):
+                        with patch("app.modules.social.presentation.routers.message_requests_router.CreateMessageRequestUseCase") as mock_use_case_class:
+                            profiles = _profile_loader(
+                                {
+                                    sample_recipient_id: ProfileSummary(
+                                        user_id=sample_recipient_id,
+                                        privacy_flags={"allow_stranger_chat": False},
                                     )
-                                assert exc_info.value.status_code == 400
+                                }
+                            )
+
+                            mock_use_case = AsyncMock()
+                            mock_use_case.execute.side_effect = ValueError(
+                                "Recipient does not allow stranger messages"
+                            )
+                            mock_use_case_class.return_value = mock_use_case
+
+                            # Act & Assert
+                            with pytest.raises(HTTPException) as exc_info:
+                                await create_message_request(
+                                    request=request,
+                                    user_id=sample_user_id,
+                                    session=mock_session,
+                                    profiles=profiles,
+                                )
+                            assert exc_info.value.status_code == 400
 
     # Tests for GET /message-requests/inbox
     @pytest.mark.asyncio
@@ -239,6 +261,7 @@ class TestMessageRequestsRouter:
                     status_filter="pending",
                     user_id=sample_user_id,
                     session=mock_session,
+                    profiles=_profile_loader(),
                 )
 
         # Assert
@@ -263,6 +286,7 @@ class TestMessageRequestsRouter:
                     status_filter="all",
                     user_id=sample_user_id,
                     session=mock_session,
+                    profiles=_profile_loader(),
                 )
 
         # Assert
@@ -291,6 +315,7 @@ class TestMessageRequestsRouter:
                         request_id=sample_request_id,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
 
         # Assert
@@ -317,6 +342,7 @@ class TestMessageRequestsRouter:
                             request_id=sample_request_id,
                             user_id=sample_user_id,
                             session=mock_session,
+                            profiles=_profile_loader(),
                         )
                     assert exc_info.value.status_code == 400
 
@@ -340,6 +366,7 @@ class TestMessageRequestsRouter:
                             request_id=sample_request_id,
                             user_id=sample_user_id,
                             session=mock_session,
+                            profiles=_profile_loader(),
                         )
                     assert exc_info.value.status_code == 400
 
@@ -364,6 +391,7 @@ class TestMessageRequestsRouter:
                     request_id=sample_request_id,
                     user_id=sample_user_id,
                     session=mock_session,
+                    profiles=_profile_loader(),
                 )
 
         # Assert
@@ -388,6 +416,7 @@ class TestMessageRequestsRouter:
                         request_id=sample_request_id,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
                 assert exc_info.value.status_code == 400
 
@@ -410,5 +439,6 @@ class TestMessageRequestsRouter:
                         request_id=sample_request_id,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
                 assert exc_info.value.status_code == 400
@@ -0,0 +1,81 @@
+"""
+Unit tests for Realtime Router
+
+Tests the WebSocket handshake and event forwarding with a mocked socket.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import WebSocketDisconnect, status
+
+from app.modules.social.presentation.routers.realtime_router import (
+    realtime_websocket,
+)
+from app.shared.infrastructure.realtime.event_hub import event_hub
+
+
+def _websocket(disconnected: asyncio.Event = None):
+    """WebSocket mock whose receive loop ends once `disconnected` is set"""
+    websocket = MagicMock()
+    websocket.cookies = {}
+    websocket.query_params = {}
+    websocket.accept = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.send_json = AsyncMock()
+
+    async def receive_text():
+        await (disconnected or asyncio.Event()).wait()
+        raise WebSocketDisconnect()
+
+    websocket.receive_text = receive_text
+    return websocket
+
+
+class TestRealtimeRouter:
+    """Test Realtime Router endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_websocket_without_token_is_rejected(self):
+        """Test the handshake is closed with a policy violation"""
+        # Arrange
+        websocket = _websocket()
+
+        # Act
+        await realtime_websocket(websocket)
+
+        # Assert
+        websocket.accept.assert_not_awaited()
+        websocket.close.assert_awaited_once_with(
+            code=status.WS_1008_POLICY_VIOLATION
+        )
+
+    @pytest.mark.asyncio
+    async def test_websocket_forwards_events_until_disconnect(self):
+        """Test the user's events are sent and the subscription is released"""
+        # Arrange
+        user_id = uuid4()
+        disconnected = asyncio.Event()
+        websocket = _websocket(disconnected)
+        event = {"type": "thread.message", "data": {"id": "m1"}}
+
+        # Act
+        with patch(
+            "app.modules.social.presentation.routers.realtime_router"
+            ".get_websocket_user_id",
+            return_value=user_id,
+        ):
+            task = asyncio.create_task(realtime_websocket(websocket))
+            while event_hub.publish([str(user_id)], event) == 0:
+                await asyncio.sleep(0)
+            while not websocket.send_json.await_count:
+                await asyncio.sleep(0)
+            disconnected.set()
+            await asyncio.wait_for(task, timeout=1)
+
+        # Assert
+        websocket.accept.assert_awaited_once()
+        websocket.send_json.assert_awaited_once_with(event)
+        assert event_hub.publish([str(user_id)], event) == 0
@@ -21,6 +21,16 @@ from app.modules.social.presentation.routers.threads_router import (
 from app.modules.social.presentation.schemas.message_schemas import (
     SendMessageRequest,
 )
+from app.shared.infrastructure.loaders.profile_summary_loader import (
+    ProfileSummaryLoader,
+)
+
+
+def _profile_loader(summaries=None):
+    """Profile summary loader over a mocked profile service"""
+    profile_service = AsyncMock()
+    profile_service.get_profile_summaries.return_value = summaries or {}
+    return ProfileSummaryLoader(profile_service)
 
 
 class TestThreadsRouter:
@@ -99,6 +109,7 @@ class TestThreadsRouter:
                     offset=0,
                     user_id=sample_user_id,
                     session=mock_session,
+                    profiles=_profile_loader(),
                 )
 
         # Assert
@@ -124,6 +135,7 @@ class TestThreadsRouter:
                     offset=0,
                     user_id=sample_user_id,
                     session=mock_session,
+                    profiles=_profile_loader(),
                 )
 
         # Assert
@@ -150,6 +162,7 @@ class TestThreadsRouter:
                     offset=5,
                     user_id=sample_user_id,
                     session=mock_session,
+                    profiles=_profile_loader(),
                 )
 
         # Assert
@@ -193,6 +206,7 @@ class TestThreadsRouter:
                     offset=0,
                     user_id=sample_user_id,
                     session=mock_session,
+                    profiles=_profile_loader(),
                 )
 
         # Assert
@@ -219,6 +233,7 @@ class TestThreadsRouter:
                         offset=0,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
 
         # Assert
@@ -246,6 +261,7 @@ class TestThreadsRouter:
                         offset=0,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
 
         # Assert
@@ -272,6 +288,7 @@ class TestThreadsRouter:
                             offset=0,
                             user_id=sample_user_id,
                             session=mock_session,
+                            profiles=_profile_loader(),
                         )
                     assert exc_info.value.status_code == 403
 
@@ -293,8 +310,11 @@ class TestThreadsRouter:
                         thread_id=sample_thread_id,
                         limit=20,
                         offset=10,
+                        before=None,
+                        after=None,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
 
         # Assert
@@ -303,6 +323,8 @@ class TestThreadsRouter:
             user_id=str(sample_user_id),
             limit=20,
             offset=10,
+            before=None,
+            after=None,
         )
 
     # Tests for POST /threads/{thread_id}/messages
@@ -327,6 +349,7 @@ class TestThreadsRouter:
                         request=request,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
 
         # Assert
@@ -363,6 +386,7 @@ class TestThreadsRouter:
                         request=request,
                         user_id=sample_user_id,
                         session=mock_session,
+                        profiles=_profile_loader(),
                     )
 
         # Assert
@@ -390,6 +414,7 @@ class TestThreadsRouter:
                             request=request,
                             user_id=sample_user_id,
                             session=mock_session,
+                            profiles=_profile_loader(),
                         )
                     assert exc_info.value.status_code == 403
 
@@ -415,6 +440,7 @@ class TestThreadsRouter:
                             request=request,
                             user_id=sample_user_id,
                             session=mock_session,
+                            profiles=_profile_loader(),
                         )
                     assert exc_info.value.status_code == 403
 
@@ -440,5 +466,6 @@ class TestThreadsRouter:
                             request=request,
                             user_id=sample_user_id,
                             session=mock_session,
+                            profiles=_profile_loader(),
                         )
                     assert exc_info.value.status_code == 403